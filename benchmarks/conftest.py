@@ -0,0 +1,64 @@
+"""pymonzo benchmark suite configuration.
+
+Benchmarks run against an in-process mock Monzo API (built with `respx`), with
+configurable injected latency and payload sizes, so their results only depend
+on pymonzo itself and can be compared across commits:
+
+    pytest benchmarks/ --benchmark-autosave
+    pytest benchmarks/ --benchmark-compare
+
+Usage:
+    pytest benchmarks/ [--mock-latency 0] [--transaction-counts 100,10000,100000]
+"""
+
+from collections.abc import Iterator
+
+import pytest
+from mock_api import MockMonzoAPI
+
+from pymonzo import MonzoAPI
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add benchmark suite options."""
+    group = parser.getgroup("pymonzo benchmarks")
+    group.addoption(
+        "--mock-latency",
+        type=float,
+        default=0.0,
+        help="Latency (in milliseconds) injected into every mock API response.",
+    )
+    group.addoption(
+        "--transaction-counts",
+        default="100,10000,100000",
+        help="Comma separated 'list transactions' response sizes.",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize benchmarks with the configured payload sizes."""
+    if "transaction_count" in metafunc.fixturenames:
+        counts = metafunc.config.getoption("--transaction-counts")
+        metafunc.parametrize(
+            "transaction_count",
+            [int(count) for count in counts.split(",")],
+        )
+
+
+@pytest.fixture(scope="session")
+def mock_api(pytestconfig: pytest.Config) -> MockMonzoAPI:
+    """Initialize mock Monzo API."""
+    return MockMonzoAPI(latency=pytestconfig.getoption("--mock-latency") / 1000)
+
+
+@pytest.fixture()
+def monzo_api(mock_api: MockMonzoAPI) -> Iterator[MonzoAPI]:
+    """Initialize `MonzoAPI` talking to the mock Monzo API."""
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=mock_api.transport(),
+    )
+
+    yield monzo_api
+
+    monzo_api.session.close()
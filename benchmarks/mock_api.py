@@ -0,0 +1,171 @@
+"""In-process mock Monzo API used by the benchmark suite."""
+
+import json
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import respx
+
+from pymonzo import MonzoAPI
+
+ACCOUNTS_COUNT = 4
+POTS_COUNT = 10
+
+CATEGORIES = ["groceries", "eating_out", "transport", "bills", "shopping"]
+
+
+def make_transaction(i: int) -> dict:
+    """Return a realistic (expanded merchant) API transaction dict."""
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i)
+    return {
+        "id": f"tx_{i:016d}",
+        "amount": -((i * 37) % 10_000),
+        "created": created.isoformat().replace("+00:00", "Z"),
+        "currency": "GBP",
+        "description": f"MERCHANT {i % 500} LONDON GBR",
+        "merchant": {
+            "id": f"merch_{i % 500:08d}",
+            "group_id": f"grp_{i % 500:08d}",
+            "name": f"Merchant {i % 500}",
+            "logo": "https://example.com/logo.png",
+            "emoji": "🛒",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "address": {
+                "address": "1 High Street",
+                "city": "London",
+                "country": "GBR",
+                "latitude": 51.5,
+                "longitude": -0.12,
+                "postcode": "E1 6AN",
+                "region": "Greater London",
+            },
+        },
+        "metadata": {"notes": ""},
+        "notes": "",
+        "is_load": False,
+        "settled": (created + timedelta(days=1)).isoformat().replace("+00:00", "Z"),
+        "category": CATEGORIES[i % len(CATEGORIES)],
+        "counterparty": {},
+    }
+
+
+def make_pot(i: int) -> dict:
+    """Return a realistic API pot dict."""
+    return {
+        "id": f"pot_{i:016d}",
+        "name": f"Pot {i}",
+        "style": "beach_ball",
+        "balance": i * 100,
+        "currency": "GBP",
+        "created": "2024-01-01T00:00:00.000Z",
+        "updated": "2024-01-02T00:00:00.000Z",
+        "deleted": False,
+    }
+
+
+def make_account(i: int) -> dict:
+    """Return a realistic API account dict."""
+    return {
+        "id": f"acc_{i:016d}",
+        "description": f"user_{i}",
+        "created": "2024-01-01T00:00:00.000Z",
+        "closed": False,
+        "type": "uk_retail",
+        "currency": "GBP",
+        "country_code": "GB",
+        "owners": [{"user_id": f"user_{i}", "preferred_name": "Jane Doe"}],
+    }
+
+
+class MockMonzoAPI:
+    """In-process mock Monzo API with injected latency and payload sizes.
+
+    Response bodies are built (and cached) up front, so the benchmarks only
+    measure pymonzo.
+
+    Attributes:
+        latency: Number of seconds every response is delayed by.
+        router: `respx` router handling the requests.
+        accounts: Mocked accounts.
+        pots: Mocked pots.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize the mock API and its routes."""
+        self.latency = latency
+        self.accounts = [make_account(i) for i in range(ACCOUNTS_COUNT)]
+        self.pots = [make_pot(i) for i in range(POTS_COUNT)]
+        self.transaction_count = 100
+
+        self._transactions: dict[int, bytes] = {}
+
+        self.router = respx.Router(base_url=MonzoAPI.api_url, assert_all_called=False)
+        self.router.get("/accounts").mock(
+            side_effect=self._respond(json.dumps({"accounts": self.accounts}))
+        )
+        self.router.get("/pots").mock(
+            side_effect=self._respond(json.dumps({"pots": self.pots}))
+        )
+        self.router.get("/balance").mock(
+            side_effect=self._respond(
+                json.dumps(
+                    {
+                        "balance": 5000,
+                        "total_balance": 6000,
+                        "currency": "GBP",
+                        "spend_today": 0,
+                        "local_currency": "",
+                        "local_exchange_rate": 0,
+                        "local_spend": [],
+                    }
+                )
+            )
+        )
+        self.router.put(url__regex=r"/pots/[^/]+/(deposit|withdraw)").mock(
+            side_effect=self._respond(json.dumps(self.pots[0]))
+        )
+        self.router.get("/transactions").mock(side_effect=self._list_transactions)
+
+    def transport(self) -> httpx.MockTransport:
+        """Return `httpx` transport backed by the mock API."""
+        return httpx.MockTransport(self.router.handler)
+
+    def transactions_content(self, count: int) -> bytes:
+        """Return (cached) 'list transactions' response body.
+
+        Arguments:
+            count: Number of transactions.
+
+        Returns:
+            Response body.
+        """
+        if count not in self._transactions:
+            self._transactions[count] = json.dumps(
+                {"transactions": [make_transaction(i) for i in range(count)]}
+            ).encode()
+
+        return self._transactions[count]
+
+    def _respond(self, content: str) -> Callable[[httpx.Request], httpx.Response]:
+        """Return route side effect responding with passed body."""
+        body = content.encode()
+
+        def side_effect(request: httpx.Request) -> httpx.Response:
+            self._sleep()
+            return httpx.Response(200, content=body)
+
+        return side_effect
+
+    def _list_transactions(self, request: httpx.Request) -> httpx.Response:
+        """Respond with `transaction_count` transactions."""
+        self._sleep()
+        return httpx.Response(
+            200, content=self.transactions_content(self.transaction_count)
+        )
+
+    def _sleep(self) -> None:
+        """Inject configured latency."""
+        if self.latency:
+            time.sleep(self.latency)
@@ -0,0 +1,99 @@
+"""Benchmark API calls against the mock Monzo API."""
+
+import pytest
+from mock_api import MockMonzoAPI
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pymonzo import MonzoAPI
+
+
+@pytest.mark.parametrize("validate", [True, False], ids=["validated", "trusted"])
+def test_transactions_list(
+    benchmark: BenchmarkFixture,
+    mock_api: MockMonzoAPI,
+    monzo_api: MonzoAPI,
+    transaction_count: int,
+    validate: bool,
+) -> None:
+    """Benchmark `transactions.list` (request and parsing) by response size."""
+    mock_api.transaction_count = transaction_count
+    # Build the response body outside of the benchmark
+    mock_api.transactions_content(transaction_count)
+    account_id = mock_api.accounts[0]["id"]
+
+    benchmark.extra_info["transactions"] = transaction_count
+    transactions = benchmark(monzo_api.transactions.list, account_id, validate=validate)
+
+    assert len(transactions) == transaction_count
+
+
+def test_transactions_list_frame(
+    benchmark: BenchmarkFixture,
+    mock_api: MockMonzoAPI,
+    monzo_api: MonzoAPI,
+    transaction_count: int,
+) -> None:
+    """Benchmark `transactions.list_frame` by response size."""
+    mock_api.transaction_count = transaction_count
+    mock_api.transactions_content(transaction_count)
+    account_id = mock_api.accounts[0]["id"]
+
+    benchmark.extra_info["transactions"] = transaction_count
+    frame = benchmark(monzo_api.transactions.list_frame, account_id)
+
+    assert len(frame) == transaction_count
+
+
+def test_accounts_list(
+    benchmark: BenchmarkFixture,
+    mock_api: MockMonzoAPI,
+    monzo_api: MonzoAPI,
+) -> None:
+    """Benchmark `accounts.list`, skipping the response cache."""
+    accounts = benchmark(monzo_api.accounts.list, refresh=True)
+
+    assert len(accounts) == len(mock_api.accounts)
+
+
+def test_pots_list(
+    benchmark: BenchmarkFixture,
+    mock_api: MockMonzoAPI,
+    monzo_api: MonzoAPI,
+) -> None:
+    """Benchmark `pots.list`, skipping the response cache."""
+    account_id = mock_api.accounts[0]["id"]
+
+    pots = benchmark(monzo_api.pots.list, account_id, refresh=True)
+
+    assert len(pots) == len(mock_api.pots)
+
+
+@pytest.mark.parametrize("operation", ["deposit", "withdraw"])
+def test_pots_move_money(
+    benchmark: BenchmarkFixture,
+    mock_api: MockMonzoAPI,
+    monzo_api: MonzoAPI,
+    operation: str,
+) -> None:
+    """Benchmark pot deposits and withdrawals."""
+    account_id = mock_api.accounts[0]["id"]
+    pot_id = mock_api.pots[0]["id"]
+
+    pot = benchmark(
+        getattr(monzo_api.pots, operation), 100, pot_id, account_id=account_id
+    )
+
+    assert pot.id == pot_id
+
+
+def test_balance_get_many(
+    benchmark: BenchmarkFixture,
+    mock_api: MockMonzoAPI,
+    monzo_api: MonzoAPI,
+) -> None:
+    """Benchmark concurrent multi-account balance fetching (throughput)."""
+    account_ids = [account["id"] for account in mock_api.accounts]
+
+    balances = benchmark(monzo_api.balance.get_many, account_ids)
+
+    assert len(balances) == len(account_ids)
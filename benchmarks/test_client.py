@@ -0,0 +1,67 @@
+"""Benchmark `MonzoAPI` client construction and `pymonzo` import time."""
+
+import statistics
+import subprocess
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pymonzo import MonzoAPI
+
+STATEMENTS = [
+    "pass",
+    "import pymonzo",
+    "from pymonzo.transactions.schemas import MonzoTransaction",
+    "from pymonzo import MonzoAPI",
+]
+
+
+def measure(statement: str) -> float:
+    """Return the time (in seconds) it takes to run passed import statement."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; "
+        "print(time.perf_counter() - start)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code])  # noqa: S603
+    return float(output)
+
+
+def construct() -> MonzoAPI:
+    """Construct `MonzoAPI` client."""
+    return MonzoAPI(access_token="TEST_ACCESS_TOKEN")  # noqa: S106
+
+
+def construct_and_use() -> MonzoAPI:
+    """Construct `MonzoAPI` client and mount one of its resources."""
+    monzo_api = construct()
+    monzo_api.balance  # noqa: B018
+    return monzo_api
+
+
+@pytest.mark.parametrize(
+    "func",
+    [construct, construct_and_use],
+    ids=["construct", "construct_and_use"],
+)
+def test_client_construction(benchmark: BenchmarkFixture, func: object) -> None:
+    """Benchmark client construction."""
+    benchmark(func)
+
+
+@pytest.mark.parametrize("statement", STATEMENTS)
+def test_import_time(benchmark: BenchmarkFixture, statement: str) -> None:
+    """Benchmark import time, each time in a fresh interpreter.
+
+    The benchmark itself includes the interpreter startup (compare against the
+    `pass` statement), while the import time alone is saved in `extra_info`.
+    """
+    timings: list[float] = []
+
+    def run() -> None:
+        timings.append(measure(statement))
+
+    benchmark.pedantic(run, rounds=10, iterations=1)
+
+    benchmark.extra_info["import_time_median"] = statistics.median(timings)
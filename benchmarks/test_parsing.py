@@ -0,0 +1,72 @@
+"""Benchmark API response parsing."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from mock_api import make_account, make_pot, make_transaction
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pymonzo.accounts import MonzoAccount
+from pymonzo.parsing import parse_records, parse_response
+from pymonzo.pots import MonzoPot
+from pymonzo.transactions import MonzoTransaction, TransactionFrame
+
+SIZE = 10_000
+
+CASES: list[tuple[str, type[BaseModel], Callable[[int], dict]]] = [
+    ("transactions", MonzoTransaction, make_transaction),
+    ("pots", MonzoPot, make_pot),
+    ("accounts", MonzoAccount, make_account),
+]
+
+
+def parse_legacy(content: bytes, model: type[BaseModel], key: str) -> list:
+    """Parse API response the way it was done before validating raw bytes."""
+    return [model(**item) for item in json.loads(content)[key]]
+
+
+def parse_validated(content: bytes, model: type[BaseModel], key: str) -> list:
+    """Validate raw API response bytes (the default)."""
+    return parse_response(content, list[model], key)  # type: ignore
+
+
+def parse_trusted(content: bytes, model: type[BaseModel], key: str) -> list:
+    """Build trusted records from raw API response bytes (`validate=False`)."""
+    return parse_records(content, list[model], key)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "parse",
+    [parse_legacy, parse_validated, parse_trusted],
+    ids=["legacy", "validated", "trusted"],
+)
+@pytest.mark.parametrize(("key", "model", "factory"), CASES, ids=[c[0] for c in CASES])
+def test_parse_response(
+    benchmark: BenchmarkFixture,
+    parse: Callable[[bytes, type[BaseModel], str], list],
+    key: str,
+    model: type[BaseModel],
+    factory: Callable[[int], Any],
+) -> None:
+    """Benchmark parsing a 'list' API response, by parsing approach."""
+    content = json.dumps({key: [factory(i) for i in range(SIZE)]}).encode()
+
+    benchmark.extra_info["size"] = len(content)
+    parsed = benchmark(parse, content, model, key)
+
+    assert len(parsed) == SIZE
+
+
+def test_transaction_frame_from_json(benchmark: BenchmarkFixture) -> None:
+    """Benchmark loading a 'list transactions' response into a frame."""
+    content = json.dumps(
+        {"transactions": [make_transaction(i) for i in range(SIZE)]}
+    ).encode()
+
+    benchmark.extra_info["size"] = len(content)
+    frame = benchmark(TransactionFrame.from_json, content)
+
+    assert len(frame) == SIZE
@@ -7,7 +7,7 @@ import nox
 nox.options.reuse_existing_virtualenvs = True
 nox.options.error_on_external_run = True
 
-DEFAULT_PATHS = ["src/", "tests/", "noxfile.py"]
+DEFAULT_PATHS = ["src/", "tests/", "benchmarks/", "noxfile.py"]
 
 
 @nox.session(python=["3.9", "3.10", "3.11", "3.12", "3.13"])
@@ -23,6 +23,14 @@ def tests(session: nox.Session) -> None:
         session.notify("coverage_report")
 
 
+@nox.session(default=False)
+def benchmarks(session: nox.Session) -> None:
+    """Run benchmarks against the mock Monzo API."""
+    session.install(".[benchmarks]")
+
+    session.run("pytest", "benchmarks/", "--benchmark-autosave", *session.posargs)
+
+
 @nox.session()
 def coverage_report(session: nox.Session) -> None:
     """Report coverage. Can only be run after `tests` session."""
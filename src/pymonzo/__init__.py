@@ -1,8 +1,9 @@
 """Modern Python API client for [Monzo] public [API][Monzo API].
 
-It exposes a [`pymonzo.MonzoAPI`][] class that can be used to access implemented
-endpoints. HTTP requests are made with [httpx], data parsing and validation is done
-with [pydantic].
+It exposes a [`pymonzo.MonzoAPI`][] class (and its async counterpart,
+[`pymonzo.AsyncMonzoAPI`][]) that can be used to access implemented endpoints.
+HTTP requests are made with [httpx], data parsing and validation is done with
+[pydantic].
 
 [Monzo API]: https://docs.monzo.com/
 [Monzo]: https://monzo.com/
@@ -10,7 +11,11 @@ with [pydantic].
 [pydantic]: https://github.com/pydantic/pydantic
 """
 
-from pymonzo.client import MonzoAPI  # noqa
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pymonzo.client import AsyncMonzoAPI, MonzoAPI  # noqa
 
 __title__ = "pymonzo"
 __description__ = "Modern Python API client for Monzo public API."
@@ -19,3 +24,27 @@ __url__ = "https://github.com/pawelad/pymonzo"
 __author__ = "Paweł Adamczak"
 __email__ = "pawel.ad@gmail.com"
 __license__ = "MPL-2.0"
+
+# Importing the client pulls in `httpx`, `authlib` and all API resources, so it's
+# only done on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "AsyncMonzoAPI": "pymonzo.client",
+    "MonzoAPI": "pymonzo.client",
+}
+
+__all__ = ["AsyncMonzoAPI", "MonzoAPI"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public attributes."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,7 @@
+"""Run pymonzo command line interface with `python -m pymonzo`."""
+
+import sys
+
+from pymonzo.cli import main
+
+sys.exit(main())
@@ -5,5 +5,5 @@ Note:
 """
 
 from .enums import MonzoAccountCurrency, MonzoAccountType  # noqa
-from .resources import AccountsResource  # noqa
+from .resources import AccountsResource, AsyncAccountsResource  # noqa
 from .schemas import MonzoAccount, MonzoAccountOwner  # noqa
@@ -1,13 +1,10 @@
 """Monzo API 'accounts' resource."""
 
-from dataclasses import dataclass, field
-
 from pymonzo.accounts.schemas import MonzoAccount
 from pymonzo.exceptions import CannotDetermineDefaultAccount
-from pymonzo.resources import BaseResource
+from pymonzo.resources import AsyncBaseResource, BaseResource
 
 
-@dataclass
 class AccountsResource(BaseResource):
     """Monzo API 'accounts' resource.
 
@@ -15,8 +12,6 @@ class AccountsResource(BaseResource):
         Monzo API docs: https://docs.monzo.com/#accounts
     """
 
-    _cached_accounts: list[MonzoAccount] = field(default_factory=list)
-
     def get_default_account(self) -> MonzoAccount:
         """If the user has only one active account, treat it as the default account.
 
@@ -43,11 +38,25 @@ class AccountsResource(BaseResource):
             "You need to explicitly pass an 'account_id' argument."
         )
 
+    def list_active(self, *, refresh: bool = False) -> list[MonzoAccount]:
+        """Return a list of user's active (non-closed) Monzo accounts.
+
+        Arguments:
+            refresh: Whether to refresh the cached list of accounts.
+
+        Returns:
+            A list of user's active Monzo accounts.
+        """
+        accounts = self.list(refresh=refresh)
+
+        return [account for account in accounts if not account.closed]
+
     def list(self, *, refresh: bool = False) -> list[MonzoAccount]:
         """Return a list of user's Monzo accounts.
 
         It's often used when deciding whether to require explicit account ID
-        or use the only active one, so we cache the response by default.
+        or use the only active one, so the response is cached by default (in the
+        `accounts` cache namespace).
 
         Note:
             Monzo API docs: https://docs.monzo.com/#list-accounts
@@ -58,13 +67,89 @@ class AccountsResource(BaseResource):
         Returns:
             A list of user's Monzo accounts.
         """
-        if not refresh and self._cached_accounts:
-            return self._cached_accounts
-
         endpoint = "/accounts"
-        response = self._get_response(method="get", endpoint=endpoint)
+        accounts = self._get_cached(
+            endpoint,
+            list[MonzoAccount],
+            "accounts",
+            namespace="accounts",
+            refresh=refresh,
+        )
+
+        return accounts
+
+
+class AsyncAccountsResource(AsyncBaseResource):
+    """Monzo API 'accounts' async resource.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/#accounts
+    """
+
+    async def get_default_account(self) -> MonzoAccount:
+        """If the user has only one active account, treat it as the default account.
+
+        Async version of [`pymonzo.accounts.AccountsResource.get_default_account`][].
+
+        Returns:
+            User's active account.
+
+        Raises:
+            CannotDetermineDefaultAccount: If user has more than one active account.
+        """
+        accounts = await self.list()
+
+        # If there is only one account, return it
+        if len(accounts) == 1:
+            return accounts[0]
 
-        accounts = [MonzoAccount(**account) for account in response.json()["accounts"]]
-        self._cached_accounts = accounts
+        # Otherwise check if there is only one active (non-closed) account
+        active_accounts = [account for account in accounts if not account.closed]
+
+        if len(active_accounts) == 1:
+            return active_accounts[0]
+
+        raise CannotDetermineDefaultAccount(
+            "Cannot determine default account. "
+            "You need to explicitly pass an 'account_id' argument."
+        )
+
+    async def list_active(self, *, refresh: bool = False) -> list[MonzoAccount]:
+        """Return a list of user's active (non-closed) Monzo accounts.
+
+        Async version of [`pymonzo.accounts.AccountsResource.list_active`][].
+
+        Arguments:
+            refresh: Whether to refresh the cached list of accounts.
+
+        Returns:
+            A list of user's active Monzo accounts.
+        """
+        accounts = await self.list(refresh=refresh)
+
+        return [account for account in accounts if not account.closed]
+
+    async def list(self, *, refresh: bool = False) -> list[MonzoAccount]:
+        """Return a list of user's Monzo accounts.
+
+        Async version of [`pymonzo.accounts.AccountsResource.list`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#list-accounts
+
+        Arguments:
+            refresh: Whether to refresh the cached list of accounts.
+
+        Returns:
+            A list of user's Monzo accounts.
+        """
+        endpoint = "/accounts"
+        accounts = await self._get_cached(
+            endpoint,
+            list[MonzoAccount],
+            "accounts",
+            namespace="accounts",
+            refresh=refresh,
+        )
 
         return accounts
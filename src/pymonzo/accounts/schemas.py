@@ -1,29 +1,17 @@
 """Monzo API 'accounts' related schemas."""
 
 from datetime import datetime
-from typing import Optional, Union
+from textwrap import wrap
+from typing import TYPE_CHECKING, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from pymonzo.accounts.enums import MonzoAccountCurrency, MonzoAccountType
+from pymonzo.formatting import RICH_AVAILABLE, format_datetime
 
-# Optional `rich` support
-try:
-    from textwrap import wrap
-
+if TYPE_CHECKING:
     from rich.table import Table
 
-    # Optional `babel` support
-    try:
-        from babel.dates import format_datetime
-    except ImportError:
-        from pymonzo.utils import format_datetime  # type: ignore
-
-except ImportError:
-    RICH_AVAILABLE = False
-else:
-    RICH_AVAILABLE = True
-
 
 class MonzoAccountOwner(BaseModel):
     """API schema for an 'account owner' object.
@@ -93,8 +81,10 @@ class MonzoAccount(BaseModel):
 
     if RICH_AVAILABLE:
 
-        def __rich__(self) -> Table:
+        def __rich__(self) -> "Table":
             """Pretty printing support for `rich`."""
+            from rich.table import Table
+
             grid = Table.grid(padding=(0, 5))
             grid.title = f"Account '{self.id}' ({self.country_code})"
             grid.title_style = "bold green"
@@ -4,5 +4,5 @@ Note:
     Monzo API docs: https://docs.monzo.com/#attachments
 """
 
-from .resources import AttachmentsResource  # noqa
+from .resources import AsyncAttachmentsResource, AttachmentsResource  # noqa
 from .schemas import MonzoAttachment, MonzoAttachmentResponse  # noqa
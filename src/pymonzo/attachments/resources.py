@@ -1,7 +1,8 @@
 """Monzo API 'attachments' resource."""
 
 from pymonzo.attachments.schemas import MonzoAttachment, MonzoAttachmentResponse
-from pymonzo.resources import BaseResource
+from pymonzo.parsing import loads
+from pymonzo.resources import AsyncBaseResource, BaseResource
 
 
 class AttachmentsResource(BaseResource):
@@ -44,7 +45,7 @@ class AttachmentsResource(BaseResource):
         }
         response = self._get_response(method="post", endpoint=endpoint, data=data)
 
-        attachment_response = MonzoAttachmentResponse(**response.json())
+        attachment_response = self._parse_response(response, MonzoAttachmentResponse)
 
         return attachment_response
 
@@ -76,7 +77,7 @@ class AttachmentsResource(BaseResource):
         }
         response = self._get_response(method="post", endpoint=endpoint, data=data)
 
-        attachment = MonzoAttachment(**response.json()["attachment"])
+        attachment = self._parse_response(response, MonzoAttachment, "attachment")
 
         return attachment
 
@@ -96,4 +97,102 @@ class AttachmentsResource(BaseResource):
         data = {"id": attachment_id}
         response = self._get_response(method="post", endpoint=endpoint, data=data)
 
-        return response.json()
+        return loads(response.content)
+
+
+class AsyncAttachmentsResource(AsyncBaseResource):
+    """Monzo API 'attachments' async resource.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/#attachments
+    """
+
+    async def upload(
+        self,
+        *,
+        file_name: str,
+        file_type: str,
+        content_length: int,
+    ) -> MonzoAttachmentResponse:
+        """Upload an attachment.
+
+        Async version of [`pymonzo.attachments.AttachmentsResource.upload`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#upload-attachment
+
+        Arguments:
+            file_name: The name of the file to be uploaded.
+            file_type: The content type of the file.
+            content_length: The HTTP Content-Length of the upload request body,
+                in bytes.
+
+        Returns:
+            Response with `file_url` which will be the URL of the resulting file,
+            and an `upload_url` to which the file should be uploaded to.
+        """
+        endpoint = "/attachment/upload"
+        data = {
+            "file_name": file_name,
+            "file_type": file_type,
+            "content_length": content_length,
+        }
+        response = await self._get_response(method="post", endpoint=endpoint, data=data)
+
+        attachment_response = self._parse_response(response, MonzoAttachmentResponse)
+
+        return attachment_response
+
+    async def register(
+        self,
+        transaction_id: str,
+        *,
+        file_url: str,
+        file_type: str,
+    ) -> MonzoAttachment:
+        """Register uploaded image to an attachment.
+
+        Async version of [`pymonzo.attachments.AttachmentsResource.register`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#register-attachment
+
+        Arguments:
+            transaction_id: The ID of the transaction to associate the attachment with.
+            file_url: The URL of the uploaded attachment.
+            file_type: The content type of the attachment.
+
+        Returns:
+            A Monzo attachment.
+        """
+        endpoint = "/attachment/register"
+        data = {
+            "external_id": transaction_id,
+            "file_url": file_url,
+            "file_type": file_type,
+        }
+        response = await self._get_response(method="post", endpoint=endpoint, data=data)
+
+        attachment = self._parse_response(response, MonzoAttachment, "attachment")
+
+        return attachment
+
+    async def deregister(self, attachment_id: str) -> dict:
+        """Deregister an attachment.
+
+        Async version of [`pymonzo.attachments.AttachmentsResource.deregister`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#deregister-attachment
+
+        Arguments:
+            attachment_id: The ID of the attachment to deregister.
+
+        Returns:
+            API response.
+        """
+        endpoint = "/attachment/deregister"
+        data = {"id": attachment_id}
+        response = await self._get_response(method="post", endpoint=endpoint, data=data)
+
+        return loads(response.content)
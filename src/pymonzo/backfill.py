@@ -0,0 +1,363 @@
+"""pymonzo full transaction history backfill.
+
+Monzo API only allows fetching the full transaction history within 5 minutes of
+authentication (after that, only the last 90 days are available). Paging through
+a long-lived account one page at a time often takes longer than that, so the
+account lifetime is split into time windows instead, which are fetched
+concurrently. Windows with more transactions than fit on a single page are split
+further, and transactions are streamed into a sink as soon as they're fetched.
+"""
+
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from pymonzo.transactions import MonzoTransaction
+from pymonzo.transactions.resources import MAX_PAGE_SIZE
+from pymonzo.utils import as_utc, utc_now
+
+if TYPE_CHECKING:
+    from pymonzo.client import MonzoAPI
+
+FULL_HISTORY_WINDOW = timedelta(minutes=5)
+"""How long after authentication the full transaction history is available."""
+
+RECENT_HISTORY = timedelta(days=90)
+"""How far back transactions are available after `FULL_HISTORY_WINDOW`."""
+
+Sink = Callable[[list[MonzoTransaction]], Any]
+
+
+@dataclass(frozen=True)
+class BackfillWindow:
+    """Time window of account transactions.
+
+    Attributes:
+        start: Window start time (inclusive).
+        end: Window end time (exclusive).
+        since: Transaction ID to continue paging from, for windows that were too
+            short to be split any further.
+    """
+
+    start: datetime
+    end: datetime
+    since: Optional[str] = None
+
+    def split(self, at: datetime, parts: int = 2) -> list["BackfillWindow"]:
+        """Split the rest of the window (starting at passed time) into equal parts.
+
+        Arguments:
+            at: Time from which the window still needs to be fetched.
+            parts: Number of parts.
+
+        Returns:
+            Shorter windows covering the rest of the window.
+        """
+        step = (self.end - at) / parts
+        bounds = [at + step * i for i in range(parts)] + [self.end]
+
+        return [BackfillWindow(start, end) for start, end in zip(bounds, bounds[1:])]
+
+
+@dataclass
+class BackfillProgress:
+    """Backfill progress.
+
+    Attributes:
+        windows: Number of scheduled time windows (including the split ones).
+        windows_done: Number of fetched time windows.
+        splits: Number of time windows that were split, because they had more
+            transactions than fit on a single page.
+        transactions: Number of unique fetched transactions.
+        duplicates: Number of fetched transactions that were already seen.
+        time_left: Number of seconds left until the full transaction history
+            stops being available, or `None` if the authentication time is
+            unknown.
+        errors: Exceptions raised while fetching time windows, keyed by window.
+    """
+
+    windows: int = 0
+    windows_done: int = 0
+    splits: int = 0
+    transactions: int = 0
+    duplicates: int = 0
+    time_left: Optional[float] = None
+    errors: dict[BackfillWindow, Exception] = field(default_factory=dict)
+
+    @property
+    def done(self) -> bool:
+        """Whether all scheduled time windows were fetched (or failed)."""
+        return self.windows_done + len(self.errors) >= self.windows
+
+
+def get_authenticated_at(token: dict) -> Optional[datetime]:
+    """Return when passed OAuth token was issued, based on its expiry.
+
+    Arguments:
+        token: OAuth token.
+
+    Returns:
+        Token issue time, or `None` if it can't be determined.
+    """
+    expires_at = token.get("expires_at")
+    expires_in = token.get("expires_in")
+    if expires_at is None or expires_in is None:
+        return None
+
+    return datetime.fromtimestamp(
+        int(expires_at) - int(expires_in),
+        tz=timezone.utc,
+    )
+
+
+class Backfill:
+    """Concurrent full transaction history backfill of a single account.
+
+    The account lifetime (starting at its creation date) is split into time
+    windows, which are fetched concurrently, oldest first (as they're the ones
+    that stop being available once the 5 minutes after authentication pass). A
+    window that returns a full page is adaptively split, and the rest of it is
+    fetched as (concurrent) shorter windows, down to `min_window`, after which
+    it's paged through. Transactions are deduplicated by their ID and passed to
+    the sink in batches, from the calling thread.
+
+    Attributes:
+        client: Monzo API client instance.
+        window: Initial time window length.
+        min_window: Shortest time window that's still split further.
+        max_concurrency: Maximum number of concurrent API calls.
+        authenticated_at: Authentication time, used to calculate how much of the
+            full history window is left.
+    """
+
+    def __init__(
+        self,
+        client: "MonzoAPI",
+        *,
+        window: timedelta = timedelta(days=30),
+        min_window: timedelta = timedelta(hours=1),
+        max_concurrency: int = 4,
+        authenticated_at: Optional[datetime] = None,
+        expand_merchant: bool = False,
+    ) -> None:
+        """Initialize the backfill.
+
+        Arguments:
+            client: Monzo API client instance.
+            window: Initial time window length.
+            min_window: Shortest time window that's still split further.
+            max_concurrency: Maximum number of concurrent API calls.
+            authenticated_at: Authentication time. Defaults to the issue time of
+                the client access token.
+            expand_merchant: Whether to return expanded merchant information.
+        """
+        self.client = client
+        self.window = window
+        self.min_window = min_window
+        self.max_concurrency = max_concurrency
+        self.authenticated_at = authenticated_at or get_authenticated_at(
+            client.session.token
+        )
+
+        self._expand_merchant = expand_merchant
+
+    @property
+    def time_left(self) -> Optional[float]:
+        """Number of seconds left until the full history stops being available."""
+        if self.authenticated_at is None:
+            return None
+
+        deadline = as_utc(self.authenticated_at) + FULL_HISTORY_WINDOW
+        return max((deadline - utc_now()).total_seconds(), 0.0)
+
+    def plan(self, start: datetime, end: datetime) -> list[BackfillWindow]:
+        """Split passed time range into initial time windows, oldest first.
+
+        Arguments:
+            start: Time range start.
+            end: Time range end.
+
+        Returns:
+            Time windows.
+        """
+        windows = []
+        while start < end:
+            windows.append(BackfillWindow(start, min(start + self.window, end)))
+            start += self.window
+
+        return windows
+
+    def fetch(self, account_id: str, window: BackfillWindow) -> list[MonzoTransaction]:
+        """Fetch a single page of time window transactions.
+
+        Arguments:
+            account_id: The ID of the account.
+            window: Time window.
+
+        Returns:
+            Monzo transactions, oldest first.
+        """
+        return self.client.transactions.list(
+            account_id,
+            expand_merchant=self._expand_merchant,
+            since=window.since or window.start,
+            before=window.end,
+            limit=MAX_PAGE_SIZE,
+        )
+
+    def follow_up(
+        self,
+        window: BackfillWindow,
+        transactions: list[MonzoTransaction],
+    ) -> list[BackfillWindow]:
+        """Return time windows that still need to be fetched after passed page.
+
+        Arguments:
+            window: Fetched time window.
+            transactions: Fetched time window transactions.
+
+        Returns:
+            Time windows covering the rest of the fetched window.
+        """
+        if len(transactions) < MAX_PAGE_SIZE:
+            return []
+
+        last = transactions[-1]
+        created = as_utc(last.created)
+        if window.since is None and window.end - created > self.min_window:
+            return window.split(max(created, window.start))
+
+        return [replace(window, since=last.id)]
+
+    def run(
+        self,
+        sink: Sink,
+        account_id: Optional[str] = None,
+        *,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        on_progress: Optional[Callable[[BackfillProgress], Any]] = None,
+    ) -> BackfillProgress:
+        """Fetch account transaction history and pass it to the sink.
+
+        Arguments:
+            sink: Callable that's passed batches of fetched (unique) transactions,
+                e.g. `partial(store.upsert, account_id)`.
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            since: Backfill start time. Defaults to the account creation date.
+            before: Backfill end time. Defaults to now.
+            on_progress: Callback called with the backfill progress after each
+                fetched time window.
+
+        Returns:
+            Final backfill progress, including the time windows that failed.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+            ValueError: If `since` wasn't passed and the account doesn't exist.
+        """
+        if not account_id:
+            account_id = self.client.accounts.get_default_account().id
+
+        if since is None:
+            accounts = {account.id: account for account in self.client.accounts.list()}
+            if account_id not in accounts:
+                raise ValueError(f"Account '{account_id}' not found.")
+            since = accounts[account_id].created
+
+        windows = self.plan(as_utc(since), as_utc(before or utc_now()))
+        progress = BackfillProgress(windows=len(windows), time_left=self.time_left)
+        seen: set[str] = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="pymonzo-backfill",
+        ) as executor:
+            pending: dict[Future, BackfillWindow] = {
+                executor.submit(self.fetch, account_id, window): window
+                for window in windows
+            }
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    window = pending.pop(future)
+                    follow_up = self._process(window, future, progress, seen, sink)
+                    for next_window in follow_up:
+                        next_future = executor.submit(
+                            self.fetch, account_id, next_window
+                        )
+                        pending[next_future] = next_window
+
+                    progress.time_left = self.time_left
+                    if on_progress:
+                        on_progress(progress)
+
+        return progress
+
+    def _process(
+        self,
+        window: BackfillWindow,
+        future: "Future[list[MonzoTransaction]]",
+        progress: BackfillProgress,
+        seen: set[str],
+        sink: Sink,
+    ) -> list[BackfillWindow]:
+        """Pass fetched time window transactions to the sink and update progress.
+
+        Arguments:
+            window: Fetched time window.
+            future: Time window fetch future.
+            progress: Backfill progress. It's updated in place.
+            seen: IDs of already seen transactions. It's updated in place.
+            sink: Callable that's passed fetched (unique) transactions.
+
+        Returns:
+            Time windows that still need to be fetched.
+        """
+        try:
+            transactions = future.result()
+        except Exception as e:
+            progress.errors[window] = e
+            return []
+
+        follow_up = self.follow_up(window, transactions)
+        progress.windows += len(follow_up)
+        if len(follow_up) > 1:
+            progress.splits += 1
+        progress.windows_done += 1
+
+        unique = _dedupe(transactions, seen)
+        progress.transactions += len(unique)
+        progress.duplicates += len(transactions) - len(unique)
+        if unique:
+            sink(unique)
+
+        return follow_up
+
+
+def _dedupe(
+    transactions: Iterable[MonzoTransaction],
+    seen: set[str],
+) -> list[MonzoTransaction]:
+    """Drop already seen transactions and remember the new ones.
+
+    Arguments:
+        transactions: Monzo transactions.
+        seen: IDs of already seen transactions. It's updated in place.
+
+    Returns:
+        Unseen Monzo transactions.
+    """
+    unique = []
+    for transaction in transactions:
+        if transaction.id not in seen:
+            seen.add(transaction.id)
+            unique.append(transaction)
+
+    return unique
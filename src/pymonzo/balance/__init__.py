@@ -4,5 +4,5 @@ Note:
     Monzo API docs: https://docs.monzo.com/#balance
 """
 
-from .resources import BalanceResource  # noqa
+from .resources import AsyncBalanceResource, BalanceResource  # noqa
 from .schemas import MonzoBalance  # noqa
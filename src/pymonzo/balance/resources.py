@@ -1,9 +1,17 @@
 """Monzo API 'balance' resource."""
 
+from collections.abc import Iterable
+from functools import partial
 from typing import Optional
 
 from pymonzo.balance.schemas import MonzoBalance
-from pymonzo.resources import BaseResource
+from pymonzo.fanout import (
+    DEFAULT_MAX_CONCURRENCY,
+    AccountResults,
+    async_fan_out,
+    fan_out,
+)
+from pymonzo.resources import AsyncBaseResource, BaseResource
 
 
 class BalanceResource(BaseResource):
@@ -13,7 +21,12 @@ class BalanceResource(BaseResource):
         Monzo API docs: https://docs.monzo.com/#balance
     """
 
-    def get(self, account_id: Optional[str] = None) -> MonzoBalance:
+    def get(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        refresh: bool = False,
+    ) -> MonzoBalance:
         """Return account balance information.
 
         Note:
@@ -22,6 +35,8 @@ class BalanceResource(BaseResource):
         Arguments:
             account_id: The ID of the account. Can be omitted if user has only one
                 active account.
+            refresh: Whether to skip the cached balance, if the `balance` cache
+                namespace is enabled.
 
         Returns:
              Monzo account balance information.
@@ -35,8 +50,120 @@ class BalanceResource(BaseResource):
 
         endpoint = "/balance"
         params = {"account_id": account_id}
-        response = self._get_response(method="get", endpoint=endpoint, params=params)
+        balance = self._get_cached(
+            endpoint,
+            MonzoBalance,
+            namespace="balance",
+            params=params,
+            refresh=refresh,
+        )
 
-        balance = MonzoBalance(**response.json())
+        return balance
+
+    def get_many(
+        self,
+        account_ids: Optional[Iterable[str]] = None,
+        *,
+        refresh: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AccountResults[MonzoBalance]:
+        """Return balance information of multiple accounts, concurrently.
+
+        Arguments:
+            account_ids: The IDs of the accounts. Defaults to all active accounts.
+            refresh: Whether to skip the cached balances, if the `balance` cache
+                namespace is enabled.
+            max_concurrency: Maximum number of concurrent API calls.
+
+        Returns:
+            Monzo account balance information, keyed by account ID. Errors are
+            reported per account.
+        """
+        if account_ids is None:
+            account_ids = [account.id for account in self.client.accounts.list_active()]
+
+        return fan_out(
+            partial(self.get, refresh=refresh),
+            account_ids,
+            max_concurrency=max_concurrency,
+        )
+
+
+class AsyncBalanceResource(AsyncBaseResource):
+    """Monzo API 'balance' async resource.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/#balance
+    """
+
+    async def get(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        refresh: bool = False,
+    ) -> MonzoBalance:
+        """Return account balance information.
+
+        Async version of [`pymonzo.balance.BalanceResource.get`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#read-balance
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            refresh: Whether to skip the cached balance, if the `balance` cache
+                namespace is enabled.
+
+        Returns:
+             Monzo account balance information.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        endpoint = "/balance"
+        params = {"account_id": account_id}
+        balance = await self._get_cached(
+            endpoint,
+            MonzoBalance,
+            namespace="balance",
+            params=params,
+            refresh=refresh,
+        )
 
         return balance
+
+    async def get_many(
+        self,
+        account_ids: Optional[Iterable[str]] = None,
+        *,
+        refresh: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AccountResults[MonzoBalance]:
+        """Return balance information of multiple accounts, concurrently.
+
+        Async version of [`pymonzo.balance.BalanceResource.get_many`][].
+
+        Arguments:
+            account_ids: The IDs of the accounts. Defaults to all active accounts.
+            refresh: Whether to skip the cached balances, if the `balance` cache
+                namespace is enabled.
+            max_concurrency: Maximum number of concurrent API calls.
+
+        Returns:
+            Monzo account balance information, keyed by account ID. Errors are
+            reported per account.
+        """
+        if account_ids is None:
+            accounts = await self.client.accounts.list_active()
+            account_ids = [account.id for account in accounts]
+
+        return await async_fan_out(
+            partial(self.get, refresh=refresh),
+            account_ids,
+            max_concurrency=max_concurrency,
+        )
@@ -1,23 +1,13 @@
 """Monzo API 'balance' related schemas."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pydantic import BaseModel, ConfigDict
 
-# Optional `rich` support
-try:
-    from rich.table import Table
-
-    # Optional `babel` support
-    try:
-        from babel.numbers import format_currency
-    except ImportError:
-        from pymonzo.utils import format_currency  # type: ignore
+from pymonzo.formatting import RICH_AVAILABLE, format_currency
 
-except ImportError:
-    RICH_AVAILABLE = False
-else:
-    RICH_AVAILABLE = True
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 class MonzoBalance(BaseModel):
@@ -56,8 +46,10 @@ class MonzoBalance(BaseModel):
 
     if RICH_AVAILABLE:
 
-        def __rich__(self) -> Table:
+        def __rich__(self) -> "Table":
             """Pretty printing support for `rich`."""
+            from rich.table import Table
+
             balance = format_currency(self.balance / 100, self.currency)
             total_balance = format_currency(self.total_balance / 100, self.currency)
             spend_today = format_currency(self.spend_today / 100, self.currency)
@@ -0,0 +1,228 @@
+"""pymonzo API response cache related code.
+
+Parsed responses of (some) read endpoints are kept in a thread safe, in-memory
+cache with per endpoint TTLs, LRU eviction and entry count and size limits.
+Writes made through pymonzo invalidate the entries they make stale.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+DEFAULT_TTLS: dict[str, float] = {
+    "accounts": 300.0,
+    "pots": 300.0,
+    "balance": 0.0,
+    "whoami": 0.0,
+    "transactions": 0.0,
+}
+"""Default cache TTLs (in seconds), keyed by cache namespace. `0` disables caching."""
+
+
+def make_cache_key(endpoint: str, params: Optional[dict] = None) -> CacheKey:
+    """Build cache key for passed API request.
+
+    Arguments:
+        endpoint: HTTP endpoint.
+        params: URL query parameters.
+
+    Returns:
+        Cache key.
+    """
+    if not params:
+        return endpoint, ()
+
+    return endpoint, tuple(sorted((k, str(v)) for k, v in params.items()))
+
+
+@dataclass
+class CacheStats:
+    """Response cache statistics.
+
+    Attributes:
+        hits: Number of cache hits.
+        misses: Number of cache misses (including expired entries).
+        evictions: Number of entries evicted because of the cache limits.
+        invalidations: Number of entries invalidated by writes (or explicitly).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of cache hits to all cache lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    """Cached value with its expiry time and (approximate) size."""
+
+    value: Any
+    expires_at: float
+    size: int
+
+
+class ResponseCache:
+    """In-memory LRU response cache with per namespace TTLs.
+
+    Entries are grouped into namespaces (e.g. `balance`), each with its own TTL.
+    When either the entry count or the total size (approximated by the raw
+    response size) limit is exceeded, the least recently used entries are
+    evicted.
+
+    It can be subclassed to plug in a different storage, as the resources only
+    use the public methods.
+
+    Attributes:
+        ttls: Cache TTLs (in seconds), keyed by namespace. Namespaces without a
+            (positive) TTL aren't cached.
+        max_entries: Maximum number of cached entries.
+        max_size: Maximum total size (in bytes) of cached entries.
+        stats: Cache statistics.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[dict[str, float]] = None,
+        *,
+        max_entries: int = 1024,
+        max_size: int = 16 * 1024 * 1024,
+    ) -> None:
+        """Initialize the response cache.
+
+        Arguments:
+            ttls: Cache TTLs (in seconds), keyed by namespace. They're merged with
+                [`pymonzo.cache.DEFAULT_TTLS`][].
+            max_entries: Maximum number of cached entries.
+            max_size: Maximum total size (in bytes) of cached entries.
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.stats = CacheStats()
+
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size (in bytes) of cached entries."""
+        return self._size
+
+    def is_enabled(self, namespace: str) -> bool:
+        """Return whether passed namespace is cached.
+
+        Arguments:
+            namespace: Cache namespace, e.g. `balance`.
+
+        Returns:
+            Whether passed namespace is cached.
+        """
+        return self.ttls.get(namespace, 0) > 0
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return cached value.
+
+        Arguments:
+            key: Cache key.
+
+        Returns:
+            Cached value, or `None` if it's not cached (or expired).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def set(self, key: CacheKey, value: Any, *, namespace: str, size: int = 0) -> None:
+        """Cache passed value, if its namespace is cached.
+
+        Arguments:
+            key: Cache key.
+            value: Value to cache.
+            namespace: Cache namespace, which decides the TTL.
+            size: Approximate value size (in bytes).
+        """
+        ttl = self.ttls.get(namespace, 0)
+        if ttl <= 0 or size > self.max_size:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(
+                value=value,
+                expires_at=time.monotonic() + ttl,
+                size=size,
+            )
+            self._size += size
+
+            while len(self._entries) > self.max_entries or self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, endpoint: str, params: Optional[dict] = None) -> int:
+        """Drop cached responses of passed endpoint.
+
+        Arguments:
+            endpoint: HTTP endpoint, e.g. `/balance`.
+            params: If passed, only responses of requests with these URL query
+                parameters (and possibly others) are dropped.
+
+        Returns:
+            Number of dropped entries.
+        """
+        _, items = make_cache_key(endpoint, params)
+
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == endpoint and set(items).issubset(key[1])
+            ]
+            for key in keys:
+                self._remove(key)
+
+            self.stats.invalidations += len(keys)
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove cached entry. The lock needs to be held by the caller.
+
+        Arguments:
+            key: Cache key.
+        """
+        entry = self._entries.pop(key)
+        self._size -= entry.size
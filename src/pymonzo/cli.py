@@ -0,0 +1,177 @@
+"""pymonzo command line interface.
+
+Usage:
+    pymonzo export transactions [--account-id ID] [--format {ndjson,csv}]
+        [--compression {gzip,zstd,none}] [--since DATETIME] [--before DATETIME]
+        [--expand-merchant] [--resume] [--output PATH]
+
+It uses the API access token saved on disk by [`pymonzo.MonzoAPI.authorize`][].
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Optional, Union
+
+from pymonzo.exceptions import PyMonzoError
+from pymonzo.export import COMPRESSIONS, EXPORT_FORMATS, infer_compression
+from pymonzo.parsing import parse_datetime
+
+
+def _datetime(value: str) -> datetime:
+    """Parse RFC 3339 datetime command line argument."""
+    try:
+        dt = parse_datetime(value)
+    except ValueError:
+        dt = None
+
+    if dt is None:
+        raise argparse.ArgumentTypeError(f"invalid datetime: {value!r}")
+
+    return dt
+
+
+def _since(value: str) -> Union[datetime, str]:
+    """Parse `--since` command line argument (a datetime or transaction ID)."""
+    if value.startswith("tx_"):
+        return value
+
+    return _datetime(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build command line arguments parser.
+
+    Returns:
+        Command line arguments parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pymonzo",
+        description="Modern Python API client for Monzo public API.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Export data.")
+    export_commands = export.add_subparsers(dest="export_command", required=True)
+
+    transactions = export_commands.add_parser(
+        "transactions",
+        help="Stream account transactions to a file or stdout.",
+    )
+    transactions.add_argument(
+        "--account-id",
+        help="The ID of the account. Can be omitted if you have only one active "
+        "account.",
+    )
+    transactions.add_argument(
+        "--format",
+        dest="export_format",
+        choices=EXPORT_FORMATS,
+        default="ndjson",
+        help="Export format (default: %(default)s).",
+    )
+    transactions.add_argument(
+        "--compression",
+        choices=[*COMPRESSIONS, "none"],
+        help="Export compression. Inferred from the output file extension by "
+        "default.",
+    )
+    transactions.add_argument(
+        "--since",
+        type=_since,
+        help="Only export transactions created after this RFC 3339 datetime or "
+        "transaction ID.",
+    )
+    transactions.add_argument(
+        "--before",
+        type=_datetime,
+        help="Only export transactions created before this RFC 3339 datetime.",
+    )
+    transactions.add_argument(
+        "--expand-merchant",
+        action="store_true",
+        help="Export expanded merchant information.",
+    )
+    transactions.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted (or previous) export from its resume marker.",
+    )
+    transactions.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Output file path, or '-' for stdout (default: %(default)s).",
+    )
+
+    return parser
+
+
+def run_export_transactions(args: argparse.Namespace) -> int:
+    """Run `pymonzo export transactions` command.
+
+    Arguments:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit code.
+    """
+    from pymonzo import MonzoAPI
+    from pymonzo.export import export_transactions
+
+    to_stdout = args.output == "-"
+    if args.resume and to_stdout:
+        print("pymonzo: error: --resume requires --output", file=sys.stderr)  # noqa
+        return 2
+
+    if args.compression is None:
+        compression = None if to_stdout else infer_compression(args.output)
+    elif args.compression == "none":
+        compression = None
+    else:
+        compression = args.compression
+
+    try:
+        monzo_api = MonzoAPI()
+        result = export_transactions(
+            monzo_api,
+            sys.stdout.buffer if to_stdout else args.output,
+            args.account_id,
+            export_format=args.export_format,
+            compression=compression,
+            since=args.since,
+            before=args.before,
+            expand_merchant=args.expand_merchant,
+            resume=args.resume,
+        )
+    except (PyMonzoError, ImportError, ValueError) as e:
+        print(f"pymonzo: error: {e}", file=sys.stderr)  # noqa
+        return 1
+
+    if not to_stdout:
+        action = "Resumed export" if result.resumed else "Exported"
+        print(  # noqa
+            f"{action}: {result.count} transactions written to '{args.output}' "
+            f"({result.total} in total).",
+            file=sys.stderr,
+        )
+
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run pymonzo command line interface.
+
+    Arguments:
+        argv: Command line arguments. Defaults to `sys.argv`.
+
+    Returns:
+        Exit code.
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.command == "export" and args.export_command == "transactions":
+        return run_export_transactions(args)
+
+    return 2  # pragma: no cover
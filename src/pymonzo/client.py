@@ -1,25 +1,131 @@
 """pymonzo API client code."""
 
+import ssl
 import webbrowser
+from collections.abc import Iterable
+from functools import cache
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any, Optional
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 from urllib.parse import urlparse
 
+import httpx
 from authlib.integrations.base_client import OAuthError
-from authlib.integrations.httpx_client import OAuth2Client
 
-from pymonzo.accounts import AccountsResource
-from pymonzo.attachments import AttachmentsResource
-from pymonzo.balance import BalanceResource
+from pymonzo.cache import ResponseCache
 from pymonzo.exceptions import MonzoAPIError, NoSettingsFile
-from pymonzo.feed import FeedResource
-from pymonzo.pots import PotsResource
+from pymonzo.hooks import Hook, Hooks
+from pymonzo.oauth import (
+    AsyncOAuth2Client,
+    AsyncTokenRefresher,
+    OAuth2Client,
+    TokenRefresher,
+)
+from pymonzo.resources import MountedResource
+from pymonzo.retries import RetryPolicy
 from pymonzo.settings import PyMonzoSettings
-from pymonzo.transactions import TransactionsResource
+from pymonzo.singleflight import AsyncSingleFlight, SingleFlight
 from pymonzo.utils import get_authorization_response_url
-from pymonzo.webhooks import WebhooksResource
-from pymonzo.whoami import WhoAmIResource
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    from pymonzo.accounts import AccountsResource, AsyncAccountsResource
+    from pymonzo.attachments import AsyncAttachmentsResource, AttachmentsResource
+    from pymonzo.balance import AsyncBalanceResource, BalanceResource
+    from pymonzo.feed import AsyncFeedResource, FeedResource
+    from pymonzo.pots import AsyncPotsResource, PotsResource
+    from pymonzo.transactions import AsyncTransactionsResource, TransactionsResource
+    from pymonzo.webhooks import AsyncWebhooksResource, WebhooksResource
+    from pymonzo.whoami import MonzoWhoAmI
+
+
+def _build_client_kwargs(
+    *,
+    limits: Optional[httpx.Limits] = None,
+    timeout: Union[httpx.Timeout, float, None] = None,
+    http2: bool = False,
+    transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
+) -> dict:
+    """Build `httpx` client kwargs, skipping the ones that weren't set.
+
+    Arguments:
+        limits: Connection pool limits.
+        timeout: Request timeouts.
+        http2: Whether to enable HTTP/2 support.
+        transport: Custom HTTP transport. If it's not set, the default transport
+            uses a shared SSL context (one per `http2` setting).
+
+    Returns:
+        `httpx` client kwargs.
+    """
+    client_kwargs: dict[str, Any] = {}
+
+    if limits is not None:
+        client_kwargs["limits"] = limits
+
+    if timeout is not None:
+        client_kwargs["timeout"] = timeout
+
+    if http2:
+        client_kwargs["http2"] = http2
+
+    if transport is not None:
+        client_kwargs["transport"] = transport
+    else:
+        client_kwargs["verify"] = _get_ssl_context(http2)
+
+    return client_kwargs
+
+
+@cache
+def _get_ssl_context(http2: bool) -> ssl.SSLContext:
+    """Return (cached) default SSL context.
+
+    Loading CA certificates takes the vast majority of `httpx` client construction
+    time, so the SSL context is created once and shared between clients. `httpx`
+    uses passed SSL contexts as they are, so HTTP/2 clients need their own one,
+    which advertises HTTP/2 support (via ALPN).
+
+    Arguments:
+        http2: Whether to enable HTTP/2 support.
+
+    Returns:
+        Default `httpx` SSL context.
+    """
+    return httpx.create_ssl_context(http2=http2)
+
+
+def _load_settings(
+    settings_path: Path,
+    access_token: Optional[str] = None,
+) -> PyMonzoSettings:
+    """Load pymonzo settings from passed access token or the settings file.
+
+    Arguments:
+        settings_path: Settings file path.
+        access_token: OAuth access token.
+
+    Returns:
+        Loaded pymonzo settings.
+
+    Raises:
+        NoSettingsFile: When the access token wasn't passed explicitly and the
+            settings file couldn't be loaded.
+    """
+    if access_token:
+        return PyMonzoSettings(token={"access_token": access_token})
+
+    try:
+        return PyMonzoSettings.load_from_disk(settings_path)
+    except (FileNotFoundError, JSONDecodeError) as e:
+        raise NoSettingsFile(
+            "No settings file found. You need to either run "
+            "`MonzoAPI.authorize(client_id, client_secret)` "
+            "to get the authorization token (and save it to disk), "
+            "or explicitly pass the `access_token`."
+        ) from e
 
 
 class MonzoAPI:
@@ -45,8 +151,84 @@ class MonzoAPI:
     token_endpoint = "https://api.monzo.com/oauth2/token"  # noqa
     settings_path = Path.home() / ".pymonzo"
 
-    def __init__(self, access_token: Optional[str] = None) -> None:
-        """Initialize Monzo API client and mount all resources.
+    # This is a shortcut to the underlying method
+    whoami: MountedResource["Callable[[], MonzoWhoAmI]"] = MountedResource(
+        "pymonzo.whoami:WhoAmIResource",
+        attribute="whoami",
+    )
+    """
+    Mounted Monzo `whoami` endpoint. For more information see
+    [`pymonzo.whoami.WhoAmIResource.whoami`][].
+    """
+
+    accounts: MountedResource["AccountsResource"] = MountedResource(
+        "pymonzo.accounts:AccountsResource"
+    )
+    """
+    Mounted Monzo `accounts` resource. For more information see
+    [`pymonzo.accounts.AccountsResource`][].
+    """
+
+    attachments: MountedResource["AttachmentsResource"] = MountedResource(
+        "pymonzo.attachments:AttachmentsResource"
+    )
+    """
+    Mounted Monzo `attachments` resource. For more information see
+    [`pymonzo.attachments.AttachmentsResource`][].
+    """
+
+    balance: MountedResource["BalanceResource"] = MountedResource(
+        "pymonzo.balance:BalanceResource"
+    )
+    """
+    Mounted Monzo `balance` resource. For more information see
+    [`pymonzo.balance.BalanceResource`][].
+    """
+
+    feed: MountedResource["FeedResource"] = MountedResource("pymonzo.feed:FeedResource")
+    """
+    Mounted Monzo `feed` resource. For more information see
+    [`pymonzo.feed.FeedResource`][].
+    """
+
+    pots: MountedResource["PotsResource"] = MountedResource("pymonzo.pots:PotsResource")
+    """
+    Mounted Monzo `pots` resource. For more information see
+    [`pymonzo.pots.PotsResource`][].
+    """
+
+    transactions: MountedResource["TransactionsResource"] = MountedResource(
+        "pymonzo.transactions:TransactionsResource"
+    )
+    """
+    Mounted Monzo `transactions` resource. For more information see
+    [`pymonzo.transactions.TransactionsResource`][].
+    """
+
+    webhooks: MountedResource["WebhooksResource"] = MountedResource(
+        "pymonzo.webhooks:WebhooksResource"
+    )
+    """
+    Mounted Monzo `webhooks` resource. For more information see
+    [`pymonzo.webhooks.WebhooksResource`][].
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Union[httpx.Timeout, float, None] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        hooks: Optional[Iterable[Hook]] = None,
+    ) -> None:
+        """Initialize Monzo API client.
+
+        API resources are mounted lazily, on first access.
 
         It expects [`pymonzo.MonzoAPI.authorize`][] to be called beforehand, so
         it can load the local settings file containing the API access token. You
@@ -60,86 +242,78 @@ class MonzoAPI:
                 temporary access token from the [Monzo Developer Portal].
 
                 [Monzo Developer Portal]: https://developers.monzo.com/
+            retry_policy: Policy for retrying failed (rate limited, timed out, etc.)
+                API requests. Requests aren't retried by default.
+            limits: Connection pool limits (max connections, keep-alive connections
+                and keep-alive expiry). Defaults to `httpx` defaults.
+            timeout: Request timeouts. Defaults to `httpx` defaults.
+            http2: Whether to enable HTTP/2 support. Requires the `http2` extra
+                (`pip install pymonzo[http2]`).
+            transport: Custom `httpx` transport, e.g. for testing or for fine-grained
+                connection control.
+            cache: Response cache for read endpoints. Defaults to
+                [`pymonzo.cache.ResponseCache`][] with default TTLs, which only
+                caches accounts and pots.
+            coalesce_requests: Whether identical concurrent GET requests should
+                share a single in-flight request (and its parsed result).
+            hooks: Observability hooks, which are notified about every API call.
+                For more information see [`pymonzo.hooks.Hook`][].
 
         Raises:
             NoSettingsFile: When the access token wasn't passed explicitly and the
                 settings file couldn't be loaded.
 
         """
-        if access_token:
-            self._settings = PyMonzoSettings(
-                token={"access_token": access_token},
-            )
-        else:
-            try:
-                self._settings = PyMonzoSettings.load_from_disk(self.settings_path)
-            except (FileNotFoundError, JSONDecodeError) as e:
-                raise NoSettingsFile(
-                    "No settings file found. You need to either run "
-                    "`MonzoAPI.authorize(client_id, client_secret)` "
-                    "to get the authorization token (and save it to disk), "
-                    "or explicitly pass the `access_token`."
-                ) from e
-
-        self.session = OAuth2Client(
-            client_id=self._settings.client_id,
-            client_secret=self._settings.client_secret,
-            token=self._settings.token,
-            authorization_endpoint=self.authorization_endpoint,
-            token_endpoint=self.token_endpoint,
-            token_endpoint_auth_method="client_secret_post",  # noqa
-            update_token=self._update_token,
-            base_url=self.api_url,
-        )
-
-        # This is a shortcut to the underlying method
-        self.whoami = WhoAmIResource(client=self).whoami
-        """
-        Mounted Monzo `whoami` endpoint. For more information see
-        [`pymonzo.whoami.WhoAmIResource.whoami`][].
-        """
+        self._settings = _load_settings(self.settings_path, access_token)
 
-        self.accounts = AccountsResource(client=self)
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
         """
-        Mounted Monzo `accounts` resource. For more information see
-        [`pymonzo.accounts.AccountsResource`][].
+        Policy for retrying failed API requests. For more information see
+        [`pymonzo.retries.RetryPolicy`][].
         """
 
-        self.attachments = AttachmentsResource(client=self)
+        self.cache = cache if cache is not None else ResponseCache()
         """
-        Mounted Monzo `attachments` resource. For more information see
-        [`pymonzo.attachments.AttachmentsResource`][].
+        Response cache for read endpoints. For more information see
+        [`pymonzo.cache.ResponseCache`][].
         """
 
-        self.balance = BalanceResource(client=self)
+        self.single_flight = SingleFlight() if coalesce_requests else None
         """
-        Mounted Monzo `balance` resource. For more information see
-        [`pymonzo.balance.BalanceResource`][].
+        Request coalescing for identical concurrent GET requests. For more
+        information see [`pymonzo.singleflight.SingleFlight`][].
         """
 
-        self.feed = FeedResource(client=self)
+        self.hooks = Hooks(hooks)
         """
-        Mounted Monzo `feed` resource. For more information see
-        [`pymonzo.feed.FeedResource`][].
+        Observability hooks. For more information see [`pymonzo.hooks.Hooks`][].
         """
 
-        self.pots = PotsResource(client=self)
+        self.token_refresher: Optional[TokenRefresher] = None
         """
-        Mounted Monzo `pots` resource. For more information see
-        [`pymonzo.pots.PotsResource`][].
+        Background access token refresher, if it was started. For more information
+        see [`pymonzo.MonzoAPI.start_token_refresher`][].
         """
 
-        self.transactions = TransactionsResource(client=self)
-        """
-        Mounted Monzo `transactions` resource. For more information see
-        [`pymonzo.transactions.TransactionsResource`][].
-        """
-
-        self.webhooks = WebhooksResource(client=self)
-        """
-        Mounted Monzo `webhooks` resource. For more information see
-        [`pymonzo.webhooks.WebhooksResource`][].
-        """
+        self.session = OAuth2Client(
+            client_id=self._settings.client_id,
+            client_secret=self._settings.client_secret,
+            token=self._settings.token,
+            authorization_endpoint=self.authorization_endpoint,
+            token_endpoint=self.token_endpoint,
+            token_endpoint_auth_method="client_secret_post",  # noqa
+            update_token=self._update_token,
+            base_url=self.api_url,
+            # Explicitly passed access token can't be refreshed
+            settings_path=None if access_token else self.settings_path,
+            hooks=self.hooks,
+            **_build_client_kwargs(
+                limits=limits,
+                timeout=timeout,
+                http2=http2,
+                transport=transport,
+            ),
+        )
 
     @classmethod
     def authorize(
@@ -206,6 +380,41 @@ class MonzoAPI:
 
         return token
 
+    def start_token_refresher(
+        self,
+        margin: float = 300.0,
+        *,
+        retry_interval: float = 30.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> TokenRefresher:
+        """Start refreshing the access token in a background thread.
+
+        The access token is rotated `margin` seconds before it expires (based on
+        its `expires_at`), so API requests never wait for the token refresh. It's
+        a no-op for tokens that can't be refreshed (e.g. explicitly passed access
+        tokens).
+
+        Arguments:
+            margin: Number of seconds before the expiry the token is refreshed.
+            retry_interval: Number of seconds to wait before retrying failed refresh.
+            on_error: Callback called when token refresh fails.
+
+        Returns:
+            Started token refresher. For more information see
+            [`pymonzo.oauth.TokenRefresher`][].
+        """
+        if self.token_refresher is not None:
+            self.token_refresher.stop()
+
+        self.token_refresher = TokenRefresher(
+            self.session,
+            margin=margin,
+            retry_interval=retry_interval,
+            on_error=on_error,
+        ).start()
+
+        return self.token_refresher
+
     def _update_token(self, token: dict, **kwargs: Any) -> None:
         """Update settings with refreshed access token and save it to disk.
 
@@ -213,6 +422,251 @@ class MonzoAPI:
             token: OAuth access token.
             **kwargs: Extra kwargs.
         """
+        # It's called with the refresh (file) lock held, see `pymonzo.oauth`
+        self._settings.token = token
+        if self.settings_path.exists():
+            self._settings.save_to_disk(self.settings_path)
+
+
+class AsyncMonzoAPI:
+    """Monzo public API async client.
+
+    It exposes the same resources as [`pymonzo.MonzoAPI`][], but all API calls
+    are made with `httpx.AsyncClient` and need to be awaited. It reads the same
+    settings file, so you can use [`pymonzo.MonzoAPI.authorize`][] to get (and save)
+    the API access token, which will then be automatically refreshed when expired.
+
+    The client should be closed when it's no longer needed, either explicitly with
+    [`pymonzo.AsyncMonzoAPI.aclose`][] or by using it as an async context manager.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/
+    """
+
+    api_url = MonzoAPI.api_url
+    authorization_endpoint = MonzoAPI.authorization_endpoint
+    token_endpoint = MonzoAPI.token_endpoint
+    settings_path = MonzoAPI.settings_path
+
+    # This is a shortcut to the underlying method
+    whoami: MountedResource["Callable[[], Awaitable[MonzoWhoAmI]]"] = MountedResource(
+        "pymonzo.whoami:AsyncWhoAmIResource",
+        attribute="whoami",
+    )
+    """
+    Mounted Monzo `whoami` endpoint. For more information see
+    [`pymonzo.whoami.AsyncWhoAmIResource.whoami`][].
+    """
+
+    accounts: MountedResource["AsyncAccountsResource"] = MountedResource(
+        "pymonzo.accounts:AsyncAccountsResource"
+    )
+    """
+    Mounted Monzo `accounts` resource. For more information see
+    [`pymonzo.accounts.AsyncAccountsResource`][].
+    """
+
+    attachments: MountedResource["AsyncAttachmentsResource"] = MountedResource(
+        "pymonzo.attachments:AsyncAttachmentsResource"
+    )
+    """
+    Mounted Monzo `attachments` resource. For more information see
+    [`pymonzo.attachments.AsyncAttachmentsResource`][].
+    """
+
+    balance: MountedResource["AsyncBalanceResource"] = MountedResource(
+        "pymonzo.balance:AsyncBalanceResource"
+    )
+    """
+    Mounted Monzo `balance` resource. For more information see
+    [`pymonzo.balance.AsyncBalanceResource`][].
+    """
+
+    feed: MountedResource["AsyncFeedResource"] = MountedResource(
+        "pymonzo.feed:AsyncFeedResource"
+    )
+    """
+    Mounted Monzo `feed` resource. For more information see
+    [`pymonzo.feed.AsyncFeedResource`][].
+    """
+
+    pots: MountedResource["AsyncPotsResource"] = MountedResource(
+        "pymonzo.pots:AsyncPotsResource"
+    )
+    """
+    Mounted Monzo `pots` resource. For more information see
+    [`pymonzo.pots.AsyncPotsResource`][].
+    """
+
+    transactions: MountedResource["AsyncTransactionsResource"] = MountedResource(
+        "pymonzo.transactions:AsyncTransactionsResource"
+    )
+    """
+    Mounted Monzo `transactions` resource. For more information see
+    [`pymonzo.transactions.AsyncTransactionsResource`][].
+    """
+
+    webhooks: MountedResource["AsyncWebhooksResource"] = MountedResource(
+        "pymonzo.webhooks:AsyncWebhooksResource"
+    )
+    """
+    Mounted Monzo `webhooks` resource. For more information see
+    [`pymonzo.webhooks.AsyncWebhooksResource`][].
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Union[httpx.Timeout, float, None] = None,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        hooks: Optional[Iterable[Hook]] = None,
+    ) -> None:
+        """Initialize Monzo API async client.
+
+        API resources are mounted lazily, on first access.
+
+        Arguments:
+            access_token: OAuth access token. For more information see
+                [`pymonzo.MonzoAPI`][].
+            retry_policy: Policy for retrying failed (rate limited, timed out, etc.)
+                API requests. Requests aren't retried by default.
+            limits: Connection pool limits (max connections, keep-alive connections
+                and keep-alive expiry). Defaults to `httpx` defaults.
+            timeout: Request timeouts. Defaults to `httpx` defaults.
+            http2: Whether to enable HTTP/2 support. Requires the `http2` extra
+                (`pip install pymonzo[http2]`).
+            transport: Custom `httpx` transport, e.g. for testing or for fine-grained
+                connection control.
+            cache: Response cache for read endpoints. Defaults to
+                [`pymonzo.cache.ResponseCache`][] with default TTLs, which only
+                caches accounts and pots.
+            coalesce_requests: Whether identical concurrent GET requests should
+                share a single in-flight request (and its parsed result).
+            hooks: Observability hooks, which are notified about every API call.
+                For more information see [`pymonzo.hooks.Hook`][].
+
+        Raises:
+            NoSettingsFile: When the access token wasn't passed explicitly and the
+                settings file couldn't be loaded.
+        """
+        self._settings = _load_settings(self.settings_path, access_token)
+
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        """
+        Policy for retrying failed API requests. For more information see
+        [`pymonzo.retries.RetryPolicy`][].
+        """
+
+        self.cache = cache if cache is not None else ResponseCache()
+        """
+        Response cache for read endpoints. For more information see
+        [`pymonzo.cache.ResponseCache`][].
+        """
+
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+        """
+        Request coalescing for identical concurrent GET requests. For more
+        information see [`pymonzo.singleflight.AsyncSingleFlight`][].
+        """
+
+        self.hooks = Hooks(hooks)
+        """
+        Observability hooks. For more information see [`pymonzo.hooks.Hooks`][].
+        """
+
+        self.token_refresher: Optional[AsyncTokenRefresher] = None
+        """
+        Background access token refresher, if it was started. For more information
+        see [`pymonzo.AsyncMonzoAPI.start_token_refresher`][].
+        """
+
+        self.session = AsyncOAuth2Client(
+            client_id=self._settings.client_id,
+            client_secret=self._settings.client_secret,
+            token=self._settings.token,
+            authorization_endpoint=self.authorization_endpoint,
+            token_endpoint=self.token_endpoint,
+            token_endpoint_auth_method="client_secret_post",  # noqa
+            update_token=self._update_token,
+            base_url=self.api_url,
+            # Explicitly passed access token can't be refreshed
+            settings_path=None if access_token else self.settings_path,
+            hooks=self.hooks,
+            **_build_client_kwargs(
+                limits=limits,
+                timeout=timeout,
+                http2=http2,
+                transport=transport,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncMonzoAPI":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the async context manager and close the underlying HTTP client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop the token refresher (if it's running) and close the HTTP client."""
+        if self.token_refresher is not None:
+            await self.token_refresher.stop()
+
+        await self.session.aclose()
+
+    async def start_token_refresher(
+        self,
+        margin: float = 300.0,
+        *,
+        retry_interval: float = 30.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> AsyncTokenRefresher:
+        """Start refreshing the access token in a background task.
+
+        For more information see [`pymonzo.MonzoAPI.start_token_refresher`][].
+        The task is stopped when the client is closed.
+
+        Arguments:
+            margin: Number of seconds before the expiry the token is refreshed.
+            retry_interval: Number of seconds to wait before retrying failed refresh.
+            on_error: Callback called when token refresh fails.
+
+        Returns:
+            Started token refresher. For more information see
+            [`pymonzo.oauth.AsyncTokenRefresher`][].
+        """
+        if self.token_refresher is not None:
+            await self.token_refresher.stop()
+
+        self.token_refresher = AsyncTokenRefresher(
+            self.session,
+            margin=margin,
+            retry_interval=retry_interval,
+            on_error=on_error,
+        ).start()
+
+        return self.token_refresher
+
+    async def _update_token(self, token: dict, **kwargs: Any) -> None:
+        """Update settings with refreshed access token and save it to disk.
+
+        Arguments:
+            token: OAuth access token.
+            **kwargs: Extra kwargs.
+        """
+        # It's called with the refresh (file) lock held, see `pymonzo.oauth`
         self._settings.token = token
         if self.settings_path.exists():
             self._settings.save_to_disk(self.settings_path)
@@ -1,5 +1,7 @@
 """pymonzo exceptions."""
 
+from typing import Optional
+
 
 class PyMonzoError(Exception):
     """Base pymonzo exception."""
@@ -18,8 +20,25 @@ class CannotDetermineDefaultPot(PyMonzoError):
 
 
 class MonzoAPIError(PyMonzoError):
-    """Catch all Monzo API error."""
+    """Catch all Monzo API error.
+
+    Attributes:
+        retries: How many times the request was retried before giving up.
+    """
+
+    retries: int = 0
 
 
 class MonzoAccessDenied(MonzoAPIError):
     """Access to Monzo API has been denied."""
+
+
+class MonzoRateLimitExceeded(MonzoAPIError):
+    """Monzo API rate limit has been exceeded.
+
+    Attributes:
+        retry_after: Number of seconds after which the request can be retried,
+            if the API returned it.
+    """
+
+    retry_after: Optional[float] = None
@@ -0,0 +1,552 @@
+"""pymonzo streaming transaction export.
+
+Transactions are streamed from the API one page at a time and written straight to
+a file (or any binary stream), as NDJSON or CSV, optionally compressed with
+`gzip` or `zstd`. Memory usage stays flat regardless of the history length.
+
+Exports to a file are checkpointed every few pages: the compression frame is
+finished, the file is flushed to disk, and a resume marker (next to the exported
+file) records the last written transaction ID and file size. An interrupted (or
+just older) export can then be continued from the last checkpoint, instead of
+being started from scratch.
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional, Union
+
+from pymonzo.transactions import MonzoTransaction
+from pymonzo.transactions.resources import MAX_PAGE_SIZE
+
+# Optional `zstandard` support
+try:
+    import zstandard
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+else:
+    ZSTANDARD_AVAILABLE = True
+
+if TYPE_CHECKING:
+    from pymonzo.client import MonzoAPI
+
+EXPORT_FORMATS = ("ndjson", "csv")
+COMPRESSIONS = ("gzip", "zstd")
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+CSV_FIELDS = (
+    "id",
+    "created",
+    "settled",
+    "amount",
+    "currency",
+    "description",
+    "category",
+    "merchant_id",
+    "merchant_name",
+    "notes",
+    "is_load",
+    "decline_reason",
+    "metadata",
+)
+
+
+def get_resume_marker_path(path: Path) -> Path:
+    """Return resume marker path for passed export file.
+
+    Arguments:
+        path: Export file path.
+
+    Returns:
+        Resume marker path.
+    """
+    return path.with_name(f"{path.name}.resume")
+
+
+def infer_compression(path: Union[str, Path]) -> Optional[str]:
+    """Infer export compression from the file extension.
+
+    Arguments:
+        path: Export file path.
+
+    Returns:
+        `gzip` for `.gz` files, `zstd` for `.zst` files and `None` otherwise.
+    """
+    suffix = Path(path).suffix.lower()
+
+    if suffix in {".gz", ".gzip"}:
+        return "gzip"
+
+    if suffix in {".zst", ".zstd"}:
+        return "zstd"
+
+    return None
+
+
+@dataclass
+class ExportMarker:
+    """Export resume marker.
+
+    Attributes:
+        account_id: The ID of the exported account.
+        export_format: Export format.
+        compression: Export compression.
+        last_id: The ID of the last written transaction.
+        offset: Export file size at the checkpoint, in bytes.
+        count: Number of written transactions.
+    """
+
+    account_id: str
+    export_format: str
+    compression: Optional[str]
+    last_id: Optional[str]
+    offset: int
+    count: int
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ExportMarker"]:
+        """Load resume marker from disk.
+
+        Arguments:
+            path: Resume marker path.
+
+        Returns:
+            Loaded resume marker, or `None` if it doesn't exist.
+        """
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+
+        return cls(**data)
+
+    def save(self, path: Path) -> None:
+        """Atomically save resume marker to disk.
+
+        Arguments:
+            path: Resume marker path.
+        """
+        fd, temp_path = tempfile.mkstemp(
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(self), f)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
+
+
+@dataclass
+class ExportResult:
+    """Transaction export result.
+
+    Attributes:
+        count: Number of transactions written in this run.
+        total: Total number of transactions in the export, including the ones
+            written before resuming.
+        last_id: The ID of the last written transaction.
+        resumed: Whether the export was resumed.
+    """
+
+    count: int
+    total: int
+    last_id: Optional[str]
+    resumed: bool
+
+
+def encode_ndjson(transactions: Iterable[MonzoTransaction]) -> bytes:
+    """Encode transactions as NDJSON (one JSON object per line).
+
+    Arguments:
+        transactions: Transactions to encode.
+
+    Returns:
+        Encoded transactions.
+    """
+    return b"".join(
+        transaction.model_dump_json().encode() + b"\n" for transaction in transactions
+    )
+
+
+def _csv_value(value: Any) -> Any:
+    """Return enum values as plain values, and `None` as an empty string."""
+    if isinstance(value, Enum):
+        return value.value
+
+    if value is None:
+        return ""
+
+    return value
+
+
+def _csv_row(transaction: MonzoTransaction) -> list[Any]:
+    """Return CSV row of a transaction.
+
+    Arguments:
+        transaction: Transaction.
+
+    Returns:
+        Row values, in `CSV_FIELDS` order.
+    """
+    merchant = transaction.merchant
+    if isinstance(merchant, str) or merchant is None:
+        merchant_id, merchant_name = merchant, None
+    else:
+        merchant_id, merchant_name = merchant.id, merchant.name
+
+    row = [
+        transaction.id,
+        transaction.created.isoformat(),
+        transaction.settled.isoformat() if transaction.settled else None,
+        transaction.amount,
+        transaction.currency,
+        transaction.description,
+        transaction.category,
+        merchant_id,
+        merchant_name,
+        transaction.notes,
+        transaction.is_load,
+        transaction.decline_reason,
+        json.dumps(transaction.metadata) if transaction.metadata else None,
+    ]
+
+    return [_csv_value(value) for value in row]
+
+
+def encode_csv(
+    transactions: Iterable[MonzoTransaction],
+    *,
+    header: bool = False,
+) -> bytes:
+    """Encode transactions as CSV rows.
+
+    Arguments:
+        transactions: Transactions to encode.
+        header: Whether to start with the header row.
+
+    Returns:
+        Encoded transactions.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    if header:
+        writer.writerow(CSV_FIELDS)
+
+    writer.writerows(_csv_row(transaction) for transaction in transactions)
+
+    return buffer.getvalue().encode()
+
+
+class _FrameWriter:
+    """Write (optionally compressed) data to a binary stream.
+
+    Compressed data is written in independently decodable frames (`gzip`
+    members or `zstd` frames), which can be concatenated. Finishing a frame on
+    every checkpoint makes it possible to truncate the file to the last
+    checkpoint and append new frames to it.
+    """
+
+    def __init__(self, file: BinaryIO, compression: Optional[str]) -> None:
+        """Initialize the writer.
+
+        Arguments:
+            file: Binary stream to write to.
+            compression: Compression (`gzip`, `zstd` or `None`).
+        """
+        self.file = file
+        self.compression = compression
+
+        self._compressor: Any = None
+
+    def write(self, data: bytes) -> None:
+        """Write (and compress) data.
+
+        Arguments:
+            data: Data to write.
+        """
+        if self.compression is None:
+            self.file.write(data)
+            return
+
+        if self._compressor is None:
+            if self.compression == "zstd":
+                self._compressor = zstandard.ZstdCompressor().compressobj()
+            else:
+                # `wbits=31` writes a `gzip` header and trailer
+                self._compressor = zlib.compressobj(wbits=31)
+
+        self.file.write(self._compressor.compress(data))
+
+    def finish_frame(self) -> None:
+        """Finish the current compression frame and flush the stream."""
+        if self._compressor is not None:
+            self.file.write(self._compressor.flush())
+            self._compressor = None
+
+        self.file.flush()
+
+
+def _batched(
+    transactions: Iterable[MonzoTransaction],
+    size: int,
+) -> Iterator[list[MonzoTransaction]]:
+    """Batch transactions into lists of passed size (the last one may be shorter).
+
+    Arguments:
+        transactions: Transactions to batch.
+        size: Batch size.
+
+    Yields:
+        Transaction batches.
+    """
+    iterator = iter(transactions)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def export_transactions(
+    client: "MonzoAPI",
+    output: Union[str, Path, BinaryIO],
+    account_id: Optional[str] = None,
+    *,
+    export_format: str = "ndjson",
+    compression: Optional[str] = None,
+    since: Union[datetime, str, None] = None,
+    before: Optional[datetime] = None,
+    expand_merchant: bool = False,
+    resume: bool = False,
+    checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+) -> ExportResult:
+    """Stream account transactions to a file (or a binary stream).
+
+    Transactions are fetched one page at a time, encoded, (optionally)
+    compressed and written straight to the output, so only a single page is
+    held in memory at any time.
+
+    When exporting to a file, a resume marker is saved next to it every
+    `checkpoint_interval` transactions (and at the end). With `resume=True`,
+    the file is truncated to the last checkpoint and the export continues from
+    the last written transaction, which also makes repeated exports incremental.
+
+    Arguments:
+        client: Monzo API client instance.
+        output: Export file path or binary stream (e.g. `sys.stdout.buffer`).
+        account_id: The ID of the account. Can be omitted if user has only one
+            active account.
+        export_format: Export format (`ndjson` or `csv`).
+        compression: Export compression (`gzip`, `zstd` or `None`). `zstd`
+            compression requires the `zstd` extra.
+        since: Filter transactions by start time or transaction ID. Ignored when
+            resuming from a resume marker.
+        before: Filter transactions by end time.
+        expand_merchant: Whether to export expanded merchant information.
+        resume: Whether to resume the export from its resume marker, if there is
+            one. Only supported for file exports.
+        checkpoint_interval: Number of transactions written between checkpoints.
+
+    Returns:
+        Export result.
+
+    Raises:
+        ValueError: If the format or compression isn't supported, resume was
+            requested for a stream export, or the resume marker doesn't match
+            the export arguments.
+        ImportError: If `zstd` compression was requested, but `zstandard` isn't
+            installed.
+        CannotDetermineDefaultAccount: If no account ID was passed and default
+            account cannot be determined.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    if compression == "zstd" and not ZSTANDARD_AVAILABLE:
+        raise ImportError(
+            "'zstd' compression requires the 'zstd' extra "
+            "(`pip install pymonzo[zstd]`)."
+        )
+
+    if not account_id:
+        account_id = client.accounts.get_default_account().id
+
+    if not isinstance(output, (str, Path)):
+        if resume:
+            raise ValueError("Only file exports can be resumed")
+
+        return _export(
+            client,
+            _FrameWriter(output, compression),
+            account_id,
+            export_format=export_format,
+            since=since,
+            before=before,
+            expand_merchant=expand_merchant,
+            checkpoint_interval=checkpoint_interval,
+        )
+
+    path = Path(output)
+    marker_path = get_resume_marker_path(path)
+    marker = ExportMarker.load(marker_path) if resume and path.exists() else None
+
+    if marker is not None and (
+        marker.account_id,
+        marker.export_format,
+        marker.compression,
+    ) != (account_id, export_format, compression):
+        raise ValueError(
+            f"Resume marker '{marker_path}' doesn't match the export "
+            f"(account '{marker.account_id}', format '{marker.export_format}', "
+            f"compression '{marker.compression}')"
+        )
+
+    with open(path, "r+b" if marker is not None else "wb") as f:
+        if marker is not None:
+            f.truncate(marker.offset)
+            f.seek(marker.offset)
+            since = marker.last_id or since
+        else:
+            marker = ExportMarker(
+                account_id=account_id,
+                export_format=export_format,
+                compression=compression,
+                last_id=None,
+                offset=0,
+                count=0,
+            )
+            # Don't leave a stale marker behind, if the new export gets interrupted
+            with suppress(FileNotFoundError):
+                marker_path.unlink()
+
+        return _export(
+            client,
+            _FrameWriter(f, compression),
+            account_id,
+            export_format=export_format,
+            since=since,
+            before=before,
+            expand_merchant=expand_merchant,
+            checkpoint_interval=checkpoint_interval,
+            marker=marker,
+            marker_path=marker_path,
+        )
+
+
+def _export(
+    client: "MonzoAPI",
+    writer: _FrameWriter,
+    account_id: str,
+    *,
+    export_format: str,
+    since: Union[datetime, str, None],
+    before: Optional[datetime],
+    expand_merchant: bool,
+    checkpoint_interval: int,
+    marker: Optional[ExportMarker] = None,
+    marker_path: Optional[Path] = None,
+) -> ExportResult:
+    """Stream account transactions to a writer, checkpointing the progress.
+
+    Arguments:
+        client: Monzo API client instance.
+        writer: Export writer.
+        account_id: The ID of the account.
+        export_format: Export format.
+        since: Filter transactions by start time or transaction ID.
+        before: Filter transactions by end time.
+        expand_merchant: Whether to export expanded merchant information.
+        checkpoint_interval: Number of transactions written between checkpoints.
+        marker: Resume marker, updated (and saved) on every checkpoint.
+        marker_path: Resume marker path.
+
+    Returns:
+        Export result.
+    """
+    resumed = marker is not None and marker.offset > 0
+    previous = marker.count if marker is not None else 0
+    last_id = marker.last_id if marker is not None else None
+    count = 0
+    pending = 0
+
+    if export_format == "csv" and not resumed:
+        writer.write(encode_csv([], header=True))
+        pending = 1
+
+    transactions = client.transactions.iter_all(
+        account_id,
+        expand_merchant=expand_merchant,
+        since=since,
+        before=before,
+    )
+    for page in _batched(transactions, MAX_PAGE_SIZE):
+        if export_format == "csv":
+            writer.write(encode_csv(page))
+        else:
+            writer.write(encode_ndjson(page))
+
+        count += len(page)
+        pending += len(page)
+        last_id = page[-1].id
+
+        if pending >= checkpoint_interval:
+            _checkpoint(writer, marker, marker_path, last_id, previous + count)
+            pending = 0
+
+    if pending or marker_path is not None:
+        _checkpoint(writer, marker, marker_path, last_id, previous + count)
+
+    return ExportResult(
+        count=count,
+        total=previous + count,
+        last_id=last_id,
+        resumed=resumed,
+    )
+
+
+def _checkpoint(
+    writer: _FrameWriter,
+    marker: Optional[ExportMarker],
+    marker_path: Optional[Path],
+    last_id: Optional[str],
+    count: int,
+) -> None:
+    """Finish the compression frame, sync the file and save the resume marker.
+
+    Arguments:
+        writer: Export writer.
+        marker: Resume marker.
+        marker_path: Resume marker path.
+        last_id: The ID of the last written transaction.
+        count: Total number of written transactions.
+    """
+    writer.finish_frame()
+
+    if marker is None or marker_path is None:
+        return
+
+    os.fsync(writer.file.fileno())
+
+    marker.last_id = last_id
+    marker.offset = writer.file.tell()
+    marker.count = count
+    marker.save(marker_path)
@@ -0,0 +1,173 @@
+"""pymonzo multi-account fan-out related code.
+
+Users with several accounts (e.g. personal, joint and prepaid) often need the
+same information for each of them. Instead of making the API calls one after
+another, they're made concurrently - on a bounded thread pool in the sync client
+and with `asyncio.gather` in the async client.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 4
+"""Default maximum number of concurrent API calls."""
+
+
+class AccountResults(dict[str, T], Generic[T]):
+    """Per account results of a fan-out call.
+
+    It's a dict of successful results, keyed by account ID. A failed call doesn't
+    fail the others, and its exception is available in `errors` instead.
+
+    Attributes:
+        errors: Exceptions raised for failed accounts, keyed by account ID.
+    """
+
+    def __init__(
+        self,
+        results: Optional[dict[str, T]] = None,
+        errors: Optional[dict[str, Exception]] = None,
+    ) -> None:
+        """Initialize per account results.
+
+        Arguments:
+            results: Successful results, keyed by account ID.
+            errors: Exceptions raised for failed accounts, keyed by account ID.
+        """
+        super().__init__(results or {})
+        self.errors = errors or {}
+
+    def __repr__(self) -> str:
+        """Return results representation, including errors."""
+        return f"AccountResults({dict.__repr__(self)}, errors={self.errors!r})"
+
+
+class RateLimiter:
+    """Thread safe rate limiter, spacing out the start of concurrent calls.
+
+    Attributes:
+        rate: Maximum number of calls per second.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the rate limiter.
+
+        Arguments:
+            rate: Maximum number of calls per second.
+
+        Raises:
+            ValueError: If `rate` isn't positive.
+        """
+        if rate <= 0:
+            raise ValueError("Rate limit needs to be positive.")
+
+        self.rate = rate
+
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve the next free call slot.
+
+        Returns:
+            Number of seconds to wait until the slot.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1 / self.rate
+
+        return slot - now
+
+    def wait(self) -> None:
+        """Block until the next free call slot."""
+        time.sleep(self.reserve())
+
+    async def async_wait(self) -> None:
+        """Wait (without blocking the event loop) until the next free call slot."""
+        await asyncio.sleep(self.reserve())
+
+
+def fan_out(
+    fn: Callable[[str], T],
+    account_ids: Iterable[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AccountResults[T]:
+    """Call passed function for every account, on a bounded thread pool.
+
+    Arguments:
+        fn: Function that takes an account ID.
+        account_ids: Account IDs. Duplicates are ignored.
+        max_concurrency: Maximum number of concurrent calls (threads).
+
+    Returns:
+        Per account results.
+    """
+    account_ids = list(dict.fromkeys(account_ids))
+    results: AccountResults[T] = AccountResults()
+    if not account_ids:
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(account_ids)),
+        thread_name_prefix="pymonzo-fan-out",
+    ) as executor:
+        futures = {
+            account_id: executor.submit(fn, account_id) for account_id in account_ids
+        }
+
+    for account_id, future in futures.items():
+        try:
+            results[account_id] = future.result()
+        except Exception as e:
+            results.errors[account_id] = e
+
+    return results
+
+
+async def async_fan_out(
+    fn: Callable[[str], Awaitable[T]],
+    account_ids: Iterable[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AccountResults[T]:
+    """Call passed async function for every account, with `asyncio.gather`.
+
+    Arguments:
+        fn: Async function that takes an account ID.
+        account_ids: Account IDs. Duplicates are ignored.
+        max_concurrency: Maximum number of concurrent calls.
+
+    Returns:
+        Per account results.
+    """
+    account_ids = list(dict.fromkeys(account_ids))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(account_id: str) -> T:
+        async with semaphore:
+            return await fn(account_id)
+
+    outcomes = await asyncio.gather(
+        *[call(account_id) for account_id in account_ids],
+        return_exceptions=True,
+    )
+
+    results: AccountResults[T] = AccountResults()
+    for account_id, outcome in zip(account_ids, outcomes):
+        if isinstance(outcome, Exception):
+            results.errors[account_id] = outcome
+        elif isinstance(outcome, BaseException):
+            # Don't swallow cancellation (and the like)
+            raise outcome
+        else:
+            results[account_id] = outcome
+
+    return results
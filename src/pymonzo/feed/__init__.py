@@ -4,5 +4,5 @@ Note:
     Monzo API docs: https://docs.monzo.com/#feed-items
 """
 
-from .resources import FeedResource  # noqa
+from .resources import AsyncFeedResource, FeedResource  # noqa
 from .schemas import MonzoBasicFeedItem  # noqa
@@ -3,7 +3,8 @@
 from typing import Optional
 
 from pymonzo.feed.schemas import MonzoBasicFeedItem
-from pymonzo.resources import BaseResource
+from pymonzo.parsing import loads
+from pymonzo.resources import AsyncBaseResource, BaseResource
 
 
 class FeedResource(BaseResource):
@@ -56,4 +57,59 @@ class FeedResource(BaseResource):
         endpoint = "/feed"
         response = self._get_response(method="post", endpoint=endpoint, data=data)
 
-        return response.json()
+        return loads(response.content)
+
+
+class AsyncFeedResource(AsyncBaseResource):
+    """Monzo API 'feed' async resource.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/#feed-items
+    """
+
+    async def create(
+        self,
+        feed_item: MonzoBasicFeedItem,
+        account_id: Optional[str] = None,
+        *,
+        url: Optional[str] = None,
+    ) -> dict:
+        """Create a feed item.
+
+        Async version of [`pymonzo.feed.FeedResource.create`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#create-feed-item
+
+        Arguments:
+            feed_item: Type of feed item. Currently only basic is supported.
+            account_id: The account to create a feed item for. Can be omitted if
+                user has only one active account.
+            url: A URL to open when the feed item is tapped. If no URL is provided,
+                the app will display a fallback view based on the title & body.
+
+        Returns:
+            API response.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        data = {
+            "account_id": account_id,
+            "type": "basic",
+        }
+
+        for key, value in feed_item.model_dump(exclude_none=True).items():
+            data[f"params[{key}]"] = value
+
+        if url:
+            data["url"] = url
+
+        endpoint = "/feed"
+        response = await self._get_response(method="post", endpoint=endpoint, data=data)
+
+        return loads(response.content)
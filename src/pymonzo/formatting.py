@@ -0,0 +1,56 @@
+"""pymonzo `rich` pretty printing related code.
+
+Both `rich` and `babel` are optional and relatively slow to import, so they're
+only imported once something is actually pretty printed, instead of whenever
+`pymonzo` (or any of its schemas) is imported.
+"""
+
+from datetime import datetime
+from importlib.util import find_spec
+
+from pymonzo import utils
+
+# Optional `rich` support
+RICH_AVAILABLE = find_spec("rich") is not None
+
+# Optional `babel` support
+BABEL_AVAILABLE = find_spec("babel") is not None
+
+
+def format_datetime(dt: datetime) -> str:
+    """Format passed `datetime` in user locale.
+
+    Uses `babel`, if it's available.
+
+    Arguments:
+        dt: Datetime to format.
+
+    Returns:
+        Passed `datetime` formatted in user locale.
+    """
+    if BABEL_AVAILABLE:
+        from babel.dates import format_datetime
+
+        return format_datetime(dt)
+
+    return utils.format_datetime(dt)
+
+
+def format_currency(amount: float, currency: str) -> str:
+    """Format passed amount of money in user locale.
+
+    Uses `babel`, if it's available.
+
+    Arguments:
+        amount: Amount of money.
+        currency: Money currency.
+
+    Returns:
+        Passed amount of money formatted in user locale.
+    """
+    if BABEL_AVAILABLE:
+        from babel.numbers import format_currency
+
+        return format_currency(amount, currency)
+
+    return utils.format_currency(amount, currency)
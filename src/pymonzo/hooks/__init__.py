@@ -0,0 +1,21 @@
+"""pymonzo observability hooks.
+
+Every API call emits events (request start and end, retries, token refreshes
+and response parsing), which are passed to the hooks registered in the client.
+Built-in adapters for OpenTelemetry ([`pymonzo.hooks.otel.OpenTelemetryHook`][])
+and Prometheus ([`pymonzo.hooks.prometheus.PrometheusHook`][]) are available as
+well.
+"""
+
+from pymonzo.retries import RetryEvent  # noqa
+
+from .base import (  # noqa
+    Hook,
+    Hooks,
+    ParseEvent,
+    RequestEndEvent,
+    RequestStartEvent,
+    RequestTimer,
+    TokenRefreshEvent,
+    get_endpoint_template,
+)
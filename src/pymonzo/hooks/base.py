@@ -0,0 +1,288 @@
+"""pymonzo observability hooks related code."""
+
+import itertools
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from pymonzo.retries import RetryEvent
+
+# Monzo API object IDs, e.g. `tx_00009Ab...` or `acc_00009Cd...`
+_ID_SEGMENT_PATTERN = re.compile(r"^[a-z]+_[0-9A-Za-z]{4,}$")
+
+_request_ids = itertools.count(1)
+
+
+def get_endpoint_template(endpoint: str) -> str:
+    """Replace object IDs in passed endpoint with an `{id}` placeholder.
+
+    It keeps the number of distinct endpoints (e.g. metric label values) small.
+
+    Arguments:
+        endpoint: HTTP endpoint, e.g. `/transactions/tx_00009Ab...`.
+
+    Returns:
+        Endpoint template, e.g. `/transactions/{id}`.
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT_PATTERN.match(segment) else segment
+        for segment in endpoint.split("/")
+    )
+
+
+@dataclass(frozen=True)
+class RequestStartEvent:
+    """Information about an HTTP request that is about to be sent.
+
+    Attributes:
+        request_id: Unique ID, shared with the matching
+            [`pymonzo.hooks.RequestEndEvent`][].
+        method: HTTP method.
+        endpoint: HTTP endpoint.
+        endpoint_template: HTTP endpoint with object IDs replaced with `{id}`.
+        attempt: Retry number, `0` for the first attempt.
+    """
+
+    request_id: int
+    method: str
+    endpoint: str
+    endpoint_template: str
+    attempt: int = 0
+
+
+@dataclass(frozen=True)
+class RequestEndEvent:
+    """Information about a finished (or failed) HTTP request.
+
+    Attributes:
+        request_id: Unique ID, shared with the matching
+            [`pymonzo.hooks.RequestStartEvent`][].
+        method: HTTP method.
+        endpoint: HTTP endpoint.
+        endpoint_template: HTTP endpoint with object IDs replaced with `{id}`.
+        attempt: Retry number, `0` for the first attempt.
+        latency: Number of seconds the request took.
+        status_code: HTTP status code (if there was a response).
+        size: Response body size (in bytes).
+        error: Transport error (if there was one).
+    """
+
+    request_id: int
+    method: str
+    endpoint: str
+    endpoint_template: str
+    attempt: int
+    latency: float
+    status_code: Optional[int] = None
+    size: int = 0
+    error: Optional[Exception] = None
+
+
+@dataclass(frozen=True)
+class TokenRefreshEvent:
+    """Information about an access token refresh.
+
+    Attributes:
+        latency: Number of seconds the token refresh took.
+        error: Exception raised by the token refresh (if there was one).
+    """
+
+    latency: float
+    error: Optional[Exception] = None
+
+
+@dataclass(frozen=True)
+class ParseEvent:
+    """Information about a parsed API response.
+
+    Attributes:
+        endpoint: HTTP endpoint.
+        endpoint_template: HTTP endpoint with object IDs replaced with `{id}`.
+        duration: Number of seconds the parsing took.
+        size: Response body size (in bytes).
+    """
+
+    endpoint: str
+    endpoint_template: str
+    duration: float
+    size: int
+
+
+class Hook:
+    """Base observability hook class.
+
+    Subclass it and override the methods of the events you're interested in. All
+    methods are called synchronously (also by the async client), on the thread
+    that made the API call, so they should be fast.
+    """
+
+    def on_request_start(self, event: RequestStartEvent) -> None:
+        """Called before an HTTP request (including each retry) is sent.
+
+        Arguments:
+            event: Request start information.
+        """
+
+    def on_request_end(self, event: RequestEndEvent) -> None:
+        """Called after an HTTP request finished (or failed).
+
+        Arguments:
+            event: Request end information.
+        """
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Called before a failed HTTP request is retried.
+
+        Arguments:
+            event: Retry information.
+        """
+
+    def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        """Called after the access token was refreshed (or the refresh failed).
+
+        Arguments:
+            event: Token refresh information.
+        """
+
+    def on_parse(self, event: ParseEvent) -> None:
+        """Called after an API response was parsed.
+
+        Arguments:
+            event: Parse information.
+        """
+
+
+class RequestTimer:
+    """Measures a single HTTP request and emits its start and end events.
+
+    Attributes:
+        hooks: Hooks the events are emitted to.
+        event: Request start event.
+    """
+
+    def __init__(self, hooks: "Hooks", event: RequestStartEvent) -> None:
+        """Emit the request start event and start the timer.
+
+        Arguments:
+            hooks: Hooks the events are emitted to.
+            event: Request start event.
+        """
+        self.hooks = hooks
+        self.event = event
+
+        hooks.on_request_start(event)
+        self._started = time.perf_counter()
+
+    def end(
+        self,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Emit the request end event.
+
+        Arguments:
+            response: HTTP response (if there was one).
+            error: Transport error (if there was one).
+        """
+        self.hooks.on_request_end(
+            RequestEndEvent(
+                request_id=self.event.request_id,
+                method=self.event.method,
+                endpoint=self.event.endpoint,
+                endpoint_template=self.event.endpoint_template,
+                attempt=self.event.attempt,
+                latency=time.perf_counter() - self._started,
+                status_code=response.status_code if response is not None else None,
+                size=len(response.content) if response is not None else 0,
+                error=error,
+            )
+        )
+
+
+class Hooks(Hook):
+    """Event bus, which passes every event to all registered hooks.
+
+    It's falsy when there are no registered hooks, which lets the callers skip
+    building the events altogether.
+
+    Attributes:
+        hooks: Registered hooks, in the order they're called.
+    """
+
+    def __init__(self, hooks: Optional[Iterable[Hook]] = None) -> None:
+        """Initialize the event bus.
+
+        Arguments:
+            hooks: Hooks to register.
+        """
+        self.hooks: list[Hook] = list(hooks or [])
+
+    def __bool__(self) -> bool:
+        """Return whether there are any registered hooks."""
+        return bool(self.hooks)
+
+    def add(self, hook: Hook) -> None:
+        """Register passed hook.
+
+        Arguments:
+            hook: Hook to register.
+        """
+        self.hooks = [*self.hooks, hook]
+
+    def remove(self, hook: Hook) -> None:
+        """Unregister passed hook.
+
+        Arguments:
+            hook: Hook to unregister.
+        """
+        self.hooks = [h for h in self.hooks if h is not hook]
+
+    def start_request(self, method: str, endpoint: str, attempt: int) -> RequestTimer:
+        """Emit request start event and return a timer to end the request with.
+
+        Arguments:
+            method: HTTP method.
+            endpoint: HTTP endpoint.
+            attempt: Retry number, `0` for the first attempt.
+
+        Returns:
+            Request timer.
+        """
+        event = RequestStartEvent(
+            request_id=next(_request_ids),
+            method=method,
+            endpoint=endpoint,
+            endpoint_template=get_endpoint_template(endpoint),
+            attempt=attempt,
+        )
+
+        return RequestTimer(self, event)
+
+    def on_request_start(self, event: RequestStartEvent) -> None:
+        """Pass request start event to all hooks."""
+        for hook in self.hooks:
+            hook.on_request_start(event)
+
+    def on_request_end(self, event: RequestEndEvent) -> None:
+        """Pass request end event to all hooks."""
+        for hook in self.hooks:
+            hook.on_request_end(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Pass retry event to all hooks."""
+        for hook in self.hooks:
+            hook.on_retry(event)
+
+    def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        """Pass token refresh event to all hooks."""
+        for hook in self.hooks:
+            hook.on_token_refresh(event)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        """Pass parse event to all hooks."""
+        for hook in self.hooks:
+            hook.on_parse(event)
@@ -0,0 +1,168 @@
+"""pymonzo OpenTelemetry hook.
+
+Requires the `opentelemetry` extra (`pip install pymonzo[opentelemetry]`).
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+from pymonzo.hooks.base import (
+    Hook,
+    ParseEvent,
+    RequestEndEvent,
+    RequestStartEvent,
+    TokenRefreshEvent,
+    get_endpoint_template,
+)
+from pymonzo.retries import RetryEvent
+
+# Optional `opentelemetry` support
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:
+    OPENTELEMETRY_AVAILABLE = False
+else:
+    OPENTELEMETRY_AVAILABLE = True
+
+
+def _start_time(duration: float) -> int:
+    """Return start time (in epoch nanoseconds) of something that just finished.
+
+    Arguments:
+        duration: Number of seconds it took.
+
+    Returns:
+        Start time, in epoch nanoseconds.
+    """
+    return time.time_ns() - int(duration * 1e9)
+
+
+class OpenTelemetryHook(Hook):
+    """Hook that records API calls as OpenTelemetry spans.
+
+    Every HTTP request (including each retry) becomes a client span named after
+    the HTTP method and endpoint template (e.g. `GET /transactions/{id}`).
+    Response parsing, token refreshes and retries get their own spans.
+
+    Attributes:
+        tracer: OpenTelemetry tracer.
+    """
+
+    def __init__(
+        self,
+        tracer_provider: Optional[Any] = None,
+        *,
+        tracer: Optional[Any] = None,
+    ) -> None:
+        """Initialize the hook.
+
+        Arguments:
+            tracer_provider: OpenTelemetry tracer provider. Defaults to the global
+                one.
+            tracer: OpenTelemetry tracer. Takes precedence over `tracer_provider`.
+
+        Raises:
+            ImportError: When `opentelemetry` isn't installed.
+        """
+        if not OPENTELEMETRY_AVAILABLE:
+            raise ImportError(
+                "OpenTelemetry hook requires the 'opentelemetry' extra "
+                "(`pip install pymonzo[opentelemetry]`)."
+            )
+
+        self.tracer = tracer or trace.get_tracer(
+            "pymonzo",
+            tracer_provider=tracer_provider,
+        )
+
+        self._spans: dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def on_request_start(self, event: RequestStartEvent) -> None:
+        """Start HTTP request span."""
+        method = event.method.upper()
+        attributes: dict[str, Any] = {
+            "http.request.method": method,
+            "url.path": event.endpoint,
+            "url.template": event.endpoint_template,
+        }
+        if event.attempt:
+            attributes["http.request.resend_count"] = event.attempt
+
+        span = self.tracer.start_span(
+            f"{method} {event.endpoint_template}",
+            kind=SpanKind.CLIENT,
+            attributes=attributes,
+        )
+
+        with self._lock:
+            self._spans[event.request_id] = span
+
+    def on_request_end(self, event: RequestEndEvent) -> None:
+        """End HTTP request span."""
+        with self._lock:
+            span = self._spans.pop(event.request_id, None)
+
+        if span is None:
+            return
+
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+            span.set_attribute("http.response.body.size", event.size)
+            if event.status_code >= 400:
+                span.set_status(Status(StatusCode.ERROR))
+
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+
+        span.end()
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Record retry span."""
+        method = event.method.upper()
+        endpoint_template = get_endpoint_template(event.endpoint)
+        attributes: dict[str, Any] = {
+            "http.request.method": method,
+            "url.template": endpoint_template,
+            "pymonzo.retry.attempt": event.attempt,
+            "pymonzo.retry.delay": event.delay,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+
+        span = self.tracer.start_span(
+            f"pymonzo retry {method} {endpoint_template}",
+            attributes=attributes,
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+
+        span.end()
+
+    def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        """Record token refresh span."""
+        span = self.tracer.start_span(
+            "pymonzo token refresh",
+            kind=SpanKind.CLIENT,
+            start_time=_start_time(event.latency),
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+
+        span.end()
+
+    def on_parse(self, event: ParseEvent) -> None:
+        """Record response parsing span."""
+        span = self.tracer.start_span(
+            f"pymonzo parse {event.endpoint_template}",
+            start_time=_start_time(event.duration),
+            attributes={
+                "url.template": event.endpoint_template,
+                "pymonzo.response.size": event.size,
+            },
+        )
+        span.end()
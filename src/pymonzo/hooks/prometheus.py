@@ -0,0 +1,141 @@
+"""pymonzo Prometheus hook.
+
+Requires the `prometheus` extra (`pip install pymonzo[prometheus]`).
+"""
+
+from typing import Any, Optional
+
+from pymonzo.hooks.base import (
+    Hook,
+    ParseEvent,
+    RequestEndEvent,
+    TokenRefreshEvent,
+    get_endpoint_template,
+)
+from pymonzo.retries import RetryEvent
+
+# Optional `prometheus_client` support
+try:
+    from prometheus_client import REGISTRY, Counter, Histogram
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+else:
+    PROMETHEUS_AVAILABLE = True
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+"""Response size histogram buckets (in bytes)."""
+
+
+class PrometheusHook(Hook):
+    """Hook that records API calls in Prometheus metrics.
+
+    Metrics are labeled with the HTTP method and endpoint template (e.g.
+    `/transactions/{id}`), so they can be used to find slow endpoints:
+
+    - `pymonzo_request_duration_seconds` (histogram, also labeled with `status`)
+    - `pymonzo_response_size_bytes` (histogram)
+    - `pymonzo_request_retries_total` (counter)
+    - `pymonzo_parse_duration_seconds` (histogram, only labeled with `endpoint`)
+    - `pymonzo_token_refresh_duration_seconds` (histogram, labeled with `outcome`)
+
+    Attributes:
+        request_duration: Request latency histogram.
+        response_size: Response size histogram.
+        retries: Retries counter.
+        parse_duration: Response parsing time histogram.
+        token_refresh_duration: Token refresh latency histogram.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[Any] = None,
+        *,
+        namespace: str = "pymonzo",
+        buckets: Optional[tuple[float, ...]] = None,
+    ) -> None:
+        """Initialize the hook and register its metrics.
+
+        Arguments:
+            registry: Prometheus collector registry. Defaults to the global one.
+            namespace: Metrics name prefix.
+            buckets: Latency histogram buckets (in seconds). Defaults to
+                `prometheus_client` defaults.
+
+        Raises:
+            ImportError: When `prometheus_client` isn't installed.
+        """
+        if not PROMETHEUS_AVAILABLE:
+            raise ImportError(
+                "Prometheus hook requires the 'prometheus' extra "
+                "(`pip install pymonzo[prometheus]`)."
+            )
+
+        if registry is None:
+            registry = REGISTRY
+
+        latency_kwargs: dict[str, Any] = {"namespace": namespace, "registry": registry}
+        if buckets is not None:
+            latency_kwargs["buckets"] = buckets
+
+        self.request_duration = Histogram(
+            "request_duration_seconds",
+            "Monzo API request latency.",
+            ["method", "endpoint", "status"],
+            **latency_kwargs,
+        )
+        self.response_size = Histogram(
+            "response_size_bytes",
+            "Monzo API response size.",
+            ["method", "endpoint"],
+            namespace=namespace,
+            registry=registry,
+            buckets=SIZE_BUCKETS,
+        )
+        self.retries = Counter(
+            "request_retries",
+            "Monzo API request retries.",
+            ["method", "endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.parse_duration = Histogram(
+            "parse_duration_seconds",
+            "Monzo API response parsing time.",
+            ["endpoint"],
+            **latency_kwargs,
+        )
+        self.token_refresh_duration = Histogram(
+            "token_refresh_duration_seconds",
+            "Monzo API access token refresh latency.",
+            ["outcome"],
+            **latency_kwargs,
+        )
+
+    def on_request_end(self, event: RequestEndEvent) -> None:
+        """Record request latency and response size."""
+        method = event.method.upper()
+        status = str(event.status_code) if event.status_code is not None else "error"
+
+        self.request_duration.labels(method, event.endpoint_template, status).observe(
+            event.latency
+        )
+
+        if event.status_code is not None:
+            self.response_size.labels(method, event.endpoint_template).observe(
+                event.size
+            )
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Count request retry."""
+        self.retries.labels(
+            event.method.upper(), get_endpoint_template(event.endpoint)
+        ).inc()
+
+    def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        """Record token refresh latency."""
+        outcome = "error" if event.error is not None else "success"
+        self.token_refresh_duration.labels(outcome).observe(event.latency)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        """Record response parsing time."""
+        self.parse_duration.labels(event.endpoint_template).observe(event.duration)
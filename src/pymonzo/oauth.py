@@ -0,0 +1,576 @@
+"""pymonzo OAuth 2 client related code.
+
+Monzo rotates the refresh token every time the access token is refreshed, so when
+several threads (or processes) sharing one settings file refresh the access token
+at the same time, they revoke each other's refresh tokens. To avoid that, token
+refresh is 'single-flight': it's guarded by an in-process lock and an advisory
+file lock next to the settings file, and before refreshing, the token is reloaded
+from disk in case another process already refreshed it.
+
+The access token can also be proactively refreshed in the background, before it
+expires, so API requests never have to wait for it.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Optional
+
+import anyio.to_thread
+from authlib.integrations.base_client import InvalidTokenError
+from authlib.integrations.httpx_client import AsyncOAuth2Client as BaseAsyncOAuth2Client
+from authlib.integrations.httpx_client import OAuth2Client as BaseOAuth2Client
+from authlib.oauth2.rfc6749 import OAuth2Token
+
+from pymonzo.hooks import Hooks, TokenRefreshEvent
+from pymonzo.settings import PyMonzoSettings
+
+# Advisory file locks are only supported on POSIX systems
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    FCNTL_AVAILABLE = False
+else:
+    FCNTL_AVAILABLE = True
+
+
+def get_lock_path(settings_path: Path) -> Path:
+    """Return lock file path for passed settings file.
+
+    The settings file itself can't be locked, because it's atomically replaced
+    (and so, is a different file) every time it's saved.
+
+    Arguments:
+        settings_path: Settings file path.
+
+    Returns:
+        Lock file path.
+    """
+    return settings_path.with_name(f"{settings_path.name}.lock")
+
+
+def _acquire_file_lock(path: Path) -> Optional[int]:
+    """Acquire (blocking) exclusive advisory lock on passed file.
+
+    Arguments:
+        path: Lock file path. It's created if it doesn't exist.
+
+    Returns:
+        Lock file descriptor, or `None` if file locks aren't supported.
+    """
+    if not FCNTL_AVAILABLE:  # pragma: no cover
+        return None
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+
+    return fd
+
+
+def _release_file_lock(fd: Optional[int]) -> None:
+    """Release advisory lock acquired with `_acquire_file_lock`.
+
+    Arguments:
+        fd: Lock file descriptor.
+    """
+    if fd is None:  # pragma: no cover
+        return
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def lock_file(path: Path) -> Iterator[None]:
+    """Hold exclusive advisory lock on passed file.
+
+    It's a no-op on systems that don't support `fcntl` file locks.
+
+    Arguments:
+        path: Lock file path. It's created if it doesn't exist.
+
+    Yields:
+        Nothing, the lock is held until the context manager exits.
+    """
+    fd = _acquire_file_lock(path)
+    try:
+        yield
+    finally:
+        _release_file_lock(fd)
+
+
+def _load_token(settings_path: Optional[Path]) -> Optional[OAuth2Token]:
+    """Load OAuth token from the settings file.
+
+    Arguments:
+        settings_path: Settings file path.
+
+    Returns:
+        Loaded OAuth token, or `None` if the settings file couldn't be loaded.
+    """
+    if settings_path is None:
+        return None
+
+    try:
+        settings = PyMonzoSettings.load_from_disk(settings_path)
+    except (OSError, ValueError):
+        return None
+
+    return OAuth2Token.from_dict(settings.token)
+
+
+def _is_fresh(token: Optional[OAuth2Token], leeway: float) -> bool:
+    """Return whether passed token exists and isn't (about to be) expired.
+
+    Arguments:
+        token: OAuth token.
+        leeway: Number of seconds before the expiry the token is considered expired.
+
+    Returns:
+        Whether passed token can be used as is.
+    """
+    # Tokens without expiry date (`is_expired` returns `None`) never expire
+    return bool(token) and not token.is_expired(leeway=leeway)  # type: ignore
+
+
+@contextmanager
+def _report_token_refresh(hooks: Hooks) -> Iterator[None]:
+    """Measure the token refresh and report it to passed hooks.
+
+    Arguments:
+        hooks: Observability hooks.
+
+    Yields:
+        Nothing, the token refresh is measured until the context manager exits.
+    """
+    if not hooks:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        hooks.on_token_refresh(
+            TokenRefreshEvent(latency=time.perf_counter() - started, error=e)
+        )
+        raise
+
+    hooks.on_token_refresh(TokenRefreshEvent(latency=time.perf_counter() - started))
+
+
+class OAuth2Client(BaseOAuth2Client):
+    """OAuth 2 client with single-flight (thread and process safe) token refresh.
+
+    Attributes:
+        settings_path: Settings file path, which the token is reloaded from (and
+            the lock file is kept next to). If it's not set, only the in-process
+            lock is used.
+    """
+
+    token: OAuth2Token
+
+    def __init__(
+        self,
+        *args: Any,
+        settings_path: Optional[Path] = None,
+        hooks: Optional[Hooks] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize OAuth 2 client.
+
+        Arguments:
+            *args: `authlib` OAuth 2 client args.
+            settings_path: Settings file path.
+            hooks: Observability hooks, which are notified about token refreshes.
+            **kwargs: `authlib` OAuth 2 client kwargs.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.settings_path = settings_path
+        self.hooks = hooks or Hooks()
+        self._token_refresh_lock = threading.Lock()
+
+    @contextmanager
+    def _refresh_lock(self) -> Iterator[None]:
+        """Hold the in-process lock and (if possible) the settings file lock.
+
+        Yields:
+            Nothing, the locks are held until the context manager exits.
+        """
+        with self._token_refresh_lock:
+            if self.settings_path is None or not self.settings_path.parent.exists():
+                yield
+                return
+
+            with lock_file(get_lock_path(self.settings_path)):
+                yield
+
+    def ensure_active_token(
+        self,
+        token: Optional[OAuth2Token] = None,
+        *,
+        leeway: Optional[float] = None,
+    ) -> bool:
+        """Make sure the access token is active, refreshing it if needed.
+
+        Arguments:
+            token: Ignored, the client token is always used.
+            leeway: Number of seconds before the expiry the token is considered
+                expired. Defaults to client `leeway`.
+
+        Returns:
+            Whether the access token is active.
+        """
+        leeway = self.leeway if leeway is None else leeway
+
+        if _is_fresh(self.token, leeway):
+            return True
+
+        with self._refresh_lock():
+            # Another thread might've refreshed the token while we were waiting
+            if _is_fresh(self.token, leeway):
+                return True
+
+            # Another process might've refreshed (and saved) the token
+            disk_token = _load_token(self.settings_path)
+            if _is_fresh(disk_token, leeway):
+                self.token = disk_token
+                return True
+
+            url = self.metadata.get("token_endpoint")
+            refresh_token = self.token.get("refresh_token")
+            if not (refresh_token and url):
+                return False
+
+            with _report_token_refresh(self.hooks):
+                self.refresh_token(url, refresh_token=refresh_token)
+
+            return True
+
+
+class AsyncOAuth2Client(BaseAsyncOAuth2Client):
+    """OAuth 2 async client with single-flight (task and process safe) token refresh.
+
+    Attributes:
+        settings_path: Settings file path, which the token is reloaded from (and
+            the lock file is kept next to). If it's not set, only the in-process
+            lock is used.
+    """
+
+    token: OAuth2Token
+
+    def __init__(
+        self,
+        *args: Any,
+        settings_path: Optional[Path] = None,
+        hooks: Optional[Hooks] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize OAuth 2 async client.
+
+        Arguments:
+            *args: `authlib` OAuth 2 client args.
+            settings_path: Settings file path.
+            hooks: Observability hooks, which are notified about token refreshes.
+            **kwargs: `authlib` OAuth 2 client kwargs.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.settings_path = settings_path
+        self.hooks = hooks or Hooks()
+
+    async def ensure_active_token(
+        self,
+        token: Optional[OAuth2Token] = None,
+        *,
+        leeway: Optional[float] = None,
+    ) -> bool:
+        """Make sure the access token is active, refreshing it if needed.
+
+        Arguments:
+            token: Ignored, the client token is always used.
+            leeway: Number of seconds before the expiry the token is considered
+                expired. Defaults to client `leeway`.
+
+        Returns:
+            Whether the access token is active.
+
+        Raises:
+            InvalidTokenError: When the access token is expired and can't be
+                refreshed.
+        """
+        leeway = self.leeway if leeway is None else leeway
+
+        if _is_fresh(self.token, leeway):
+            return True
+
+        async with self._token_refresh_lock:
+            # Another task might've refreshed the token while we were waiting
+            if _is_fresh(self.token, leeway):
+                return True
+
+            fd = None
+            if self.settings_path is not None and self.settings_path.parent.exists():
+                # Waiting for the file lock would block the event loop
+                fd = await anyio.to_thread.run_sync(
+                    _acquire_file_lock, get_lock_path(self.settings_path)
+                )
+
+            try:
+                # Another process might've refreshed (and saved) the token
+                disk_token = _load_token(self.settings_path)
+                if _is_fresh(disk_token, leeway):
+                    self.token = disk_token
+                    return True
+
+                url = self.metadata.get("token_endpoint")
+                refresh_token = self.token.get("refresh_token")
+                if not (refresh_token and url):
+                    raise InvalidTokenError()
+
+                with _report_token_refresh(self.hooks):
+                    await self.refresh_token(url, refresh_token=refresh_token)
+
+                return True
+            finally:
+                _release_file_lock(fd)
+
+
+def get_refresh_delay(token: Optional[OAuth2Token], margin: float) -> Optional[float]:
+    """Return number of seconds until passed token should be refreshed.
+
+    Arguments:
+        token: OAuth token.
+        margin: Number of seconds before the expiry the token should be refreshed.
+
+    Returns:
+        Number of seconds until the token should be refreshed (`0` if it should be
+        refreshed right away), or `None` if it can't be refreshed, because it
+        doesn't expire or there's no refresh token.
+    """
+    if not token or not token.get("refresh_token"):
+        return None
+
+    expires_at = token.get("expires_at")
+    if expires_at is None:
+        return None
+
+    return max(0.0, float(expires_at) - margin - time.time())
+
+
+class TokenRefresher:
+    """Background thread refreshing the access token before it expires.
+
+    By default, the access token is only refreshed when it's used after it
+    expired, which puts the token endpoint round trip on the critical path of
+    an API request. The refresher rotates it `margin` seconds before it expires
+    instead, using the same single-flight refresh as API requests.
+
+    It can be used as a context manager, which stops the thread on exit.
+
+    Attributes:
+        client: OAuth 2 client.
+        margin: Number of seconds before the expiry the token is refreshed.
+        retry_interval: Number of seconds to wait before retrying failed refresh.
+        on_error: Callback called when token refresh fails.
+    """
+
+    def __init__(
+        self,
+        client: OAuth2Client,
+        *,
+        margin: float = 300.0,
+        retry_interval: float = 30.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Initialize the token refresher.
+
+        Arguments:
+            client: OAuth 2 client.
+            margin: Number of seconds before the expiry the token is refreshed.
+            retry_interval: Number of seconds to wait before retrying failed refresh.
+            on_error: Callback called when token refresh fails.
+        """
+        self.client = client
+        self.margin = margin
+        self.retry_interval = retry_interval
+        self.on_error = on_error
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "TokenRefresher":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the context manager and stop the background thread."""
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "TokenRefresher":
+        """Start the background thread.
+
+        Returns:
+            The token refresher itself.
+        """
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="pymonzo-token-refresher",
+                daemon=True,
+            )
+            self._thread.start()
+
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread and wait for it to finish.
+
+        Arguments:
+            timeout: Maximum number of seconds to wait for the thread to finish.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def refresh(self) -> None:
+        """Refresh the access token, if it expires within the margin."""
+        self.client.ensure_active_token(leeway=self.margin)
+
+    def _run(self) -> None:
+        """Refresh the access token before it expires, until stopped."""
+        delay = get_refresh_delay(self.client.token, self.margin)
+        while delay is not None and not self._stopped.wait(delay):
+            try:
+                self.refresh()
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+                delay = self.retry_interval
+                continue
+
+            delay = get_refresh_delay(self.client.token, self.margin)
+            # Don't spin if the new token is shorter lived than the margin
+            if delay == 0:
+                delay = self.retry_interval
+
+
+class AsyncTokenRefresher:
+    """Background task refreshing the access token before it expires.
+
+    It's an `asyncio` version of [`pymonzo.oauth.TokenRefresher`][]. It can be
+    used as an async context manager, which stops the task on exit.
+
+    Attributes:
+        client: OAuth 2 async client.
+        margin: Number of seconds before the expiry the token is refreshed.
+        retry_interval: Number of seconds to wait before retrying failed refresh.
+        on_error: Callback called when token refresh fails.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOAuth2Client,
+        *,
+        margin: float = 300.0,
+        retry_interval: float = 30.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Initialize the token refresher.
+
+        Arguments:
+            client: OAuth 2 async client.
+            margin: Number of seconds before the expiry the token is refreshed.
+            retry_interval: Number of seconds to wait before retrying failed refresh.
+            on_error: Callback called when token refresh fails.
+        """
+        self.client = client
+        self.margin = margin
+        self.retry_interval = retry_interval
+        self.on_error = on_error
+
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncTokenRefresher":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the async context manager and stop the background task."""
+        await self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> "AsyncTokenRefresher":
+        """Start the background task. It needs to be called from a running loop.
+
+        Returns:
+            The token refresher itself.
+        """
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+        return self
+
+    async def stop(self) -> None:
+        """Stop the background task and wait for it to finish."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+    async def refresh(self) -> None:
+        """Refresh the access token, if it expires within the margin."""
+        await self.client.ensure_active_token(leeway=self.margin)
+
+    async def _run(self) -> None:
+        """Refresh the access token before it expires, until stopped."""
+        delay = get_refresh_delay(self.client.token, self.margin)
+        while delay is not None:
+            await asyncio.sleep(delay)
+
+            try:
+                await self.refresh()
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+                delay = self.retry_interval
+                continue
+
+            delay = get_refresh_delay(self.client.token, self.margin)
+            # Don't spin if the new token is shorter lived than the margin
+            if delay == 0:
+                delay = self.retry_interval
@@ -0,0 +1,333 @@
+"""pymonzo API response parsing related code.
+
+API responses are validated straight from the raw response bytes with
+`pydantic` (which parses JSON in Rust), instead of first building a Python dict
+tree with `json` and validating it again. Responses that aren't parsed into
+a schema are decoded with `orjson`, if it's installed.
+
+For bulk reads of trusted data, validation can be skipped altogether. Responses
+are then decoded with `pydantic_core.from_json` into light, named tuple based
+records, and only datetimes and nested objects (e.g. expanded merchants) are
+converted.
+"""
+
+import json
+from collections import namedtuple
+from datetime import datetime
+from functools import cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter, create_model
+from pydantic_core import from_json
+
+# Optional `orjson` support
+try:
+    import orjson
+except ImportError:
+    ORJSON_AVAILABLE = False
+else:
+    ORJSON_AVAILABLE = True
+
+
+def loads(content: Union[str, bytes]) -> Any:
+    """Decode JSON, using `orjson` if it's available.
+
+    Arguments:
+        content: JSON document.
+
+    Returns:
+        Decoded JSON document.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+@cache
+def get_type_adapter(type_: Any, key: Optional[str] = None) -> TypeAdapter:
+    """Return (cached) type adapter for passed type.
+
+    Building a type adapter means building its validator, so they're created
+    once per type and reused.
+
+    Arguments:
+        type_: Type to validate against, e.g. `list[MonzoTransaction]`.
+        key: Top level key the value is wrapped in, e.g. `transactions`.
+
+    Returns:
+        Type adapter.
+    """
+    if key is None:
+        return TypeAdapter(type_)
+
+    # The API wraps most responses in an object, e.g. `{"transactions": [...]}`
+    fields: dict[str, Any] = {key: (type_, ...)}
+    envelope = create_model(f"Envelope[{key}]", **fields)
+    return TypeAdapter(envelope)
+
+
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def parse_datetime(value: Union[datetime, str, None]) -> Optional[datetime]:
+    """Parse RFC 3339 datetime, as returned by the API.
+
+    Arguments:
+        value: RFC 3339 datetime string.
+
+    Returns:
+        Parsed datetime, or `None` if the value is empty.
+    """
+    if not value:
+        return None
+
+    if isinstance(value, datetime):
+        return value
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        # `datetime.fromisoformat` is stricter on older Python versions
+        return _datetime_adapter.validate_python(value)
+
+
+def parse_response(
+    content: Union[str, bytes],
+    type_: Any,
+    key: Optional[str] = None,
+) -> Any:
+    """Validate raw API response against passed type.
+
+    Arguments:
+        content: Raw API response body.
+        type_: Type to validate against, e.g. `list[MonzoTransaction]`.
+        key: Top level key the value is wrapped in, e.g. `transactions`.
+
+    Returns:
+        Validated value.
+
+    Raises:
+        ValidationError: When the response doesn't match passed type.
+    """
+    value = get_type_adapter(type_, key).validate_json(content)
+
+    if key is None:
+        return value
+
+    return getattr(value, key)
+
+
+class TrustedRecord:
+    """Light record built from trusted API data, without validation.
+
+    Records are named tuples with a field per schema field (see
+    [`pymonzo.parsing.get_record_type`][]), plus `model_extra` with the keys the
+    schema doesn't know about. Only datetimes and nested objects (e.g. expanded
+    merchants) are converted, everything else (including enums) is used as
+    returned by the API. Missing fields are set to their schema defaults
+    (or `None`).
+
+    Attributes:
+        model: Schema the record is built for.
+    """
+
+    __slots__ = ()
+
+    model: ClassVar[type[BaseModel]]
+    _spec: ClassVar[tuple[tuple[str, Any, Optional[Callable[[Any], Any]]], ...]]
+
+    if TYPE_CHECKING:
+        model_extra: dict[str, Any]
+
+        def __getattr__(self, name: str) -> Any:
+            """Schema fields are only known at runtime."""
+
+        def _asdict(self) -> dict[str, Any]:
+            """Return record fields as a dict."""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TrustedRecord":
+        """Build record from trusted (decoded API response) data.
+
+        Arguments:
+            data: Decoded API object. It's reused for the record `model_extra`, so
+                it shouldn't be used afterwards.
+
+        Returns:
+            Record.
+        """
+        # Known keys are popped, so only the extra ones are left
+        pop = data.pop
+        values = [
+            pop(name, default) if converter is None else converter(pop(name, default))
+            for name, default, converter in cls._spec
+        ]
+        values.append(data)
+
+        return tuple.__new__(cls, values)  # type: ignore[type-var]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return record fields (and extra keys) as a dict.
+
+        Returns:
+            Record fields, with nested records converted to dicts as well.
+        """
+        data = {
+            name: _to_python(value)
+            for name, value in self._asdict().items()
+            if name != "model_extra"
+        }
+        data.update(self.model_extra)
+
+        return data
+
+    def to_model(self) -> BaseModel:
+        """Validate record into its schema.
+
+        Returns:
+            Validated schema instance.
+
+        Raises:
+            ValidationError: When the record doesn't match its schema.
+        """
+        return self.model.model_validate(self.to_dict())
+
+
+def _to_python(value: Any) -> Any:
+    """Convert nested records to dicts.
+
+    Arguments:
+        value: Record field value.
+
+    Returns:
+        Value, with nested records converted to dicts.
+    """
+    if isinstance(value, TrustedRecord):
+        return value.to_dict()
+
+    if isinstance(value, list):
+        return [_to_python(item) for item in value]
+
+    return value
+
+
+def _build_nested(model: type[BaseModel], value: Any) -> Any:
+    """Build nested record, if the value is an object.
+
+    Arguments:
+        model: Nested object schema.
+        value: Trusted (decoded API response) value.
+
+    Returns:
+        Record, or passed value if it isn't an object (e.g. merchant ID).
+    """
+    if not isinstance(value, dict):
+        return value
+
+    # The API returns empty objects in place of missing ones (e.g. `counterparty`)
+    if not value:
+        return None
+
+    return get_record_type(model).from_dict(value)
+
+
+def _get_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Return record converter for passed field annotation.
+
+    Arguments:
+        annotation: Field annotation.
+
+    Returns:
+        Converter, or `None` if the value can be used as is.
+    """
+    if annotation is datetime:
+        return parse_datetime
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return partial(_build_nested, annotation)
+
+    if get_origin(annotation) is list:
+        (item_annotation,) = get_args(annotation) or (Any,)
+        item_converter = _get_converter(item_annotation)
+        if item_converter is None:
+            return None
+
+        return lambda value: (
+            [item_converter(item) for item in value] if value else value
+        )
+
+    # `Optional` / `Union`, e.g. `Union[MonzoTransactionMerchant, str, None]`
+    for arg in get_args(annotation):
+        converter = _get_converter(arg)
+        if converter is not None:
+            return converter
+
+    return None
+
+
+@cache
+def get_record_type(model: type[BaseModel]) -> type[TrustedRecord]:
+    """Return (cached) trusted record type for passed schema.
+
+    Arguments:
+        model: Schema, e.g. `MonzoTransaction`.
+
+    Returns:
+        Record type, named after the schema (e.g. `MonzoTransactionRecord`).
+    """
+    spec = []
+    for name, field in model.model_fields.items():
+        # Trusted data isn't expected to miss required fields
+        default = None if field.is_required() else field.get_default()
+        spec.append((name, default, _get_converter(field.annotation)))
+
+    name = f"{model.__name__}Record"
+    base = namedtuple(name, [*model.model_fields, "model_extra"])  # type: ignore
+    namespace = {
+        "__slots__": (),
+        "__module__": model.__module__,
+        "model": model,
+        "_spec": tuple(spec),
+    }
+    return type(name, (TrustedRecord, base), namespace)
+
+
+def parse_records(
+    content: Union[str, bytes],
+    type_: Any,
+    key: Optional[str] = None,
+) -> Any:
+    """Build trusted records from raw API response, without validating it.
+
+    It's a faster alternative to [`pymonzo.parsing.parse_response`][] for bulk
+    reads of trusted data (see [`pymonzo.parsing.TrustedRecord`][]).
+
+    Arguments:
+        content: Raw API response body.
+        type_: Schema (or a list of them) to build records for, e.g.
+            `list[MonzoTransaction]`.
+        key: Top level key the value is wrapped in, e.g. `transactions`.
+
+    Returns:
+        Record, or a list of records.
+    """
+    value = from_json(content)
+    if key is not None:
+        value = value[key]
+
+    if get_origin(type_) is list:
+        (model,) = get_args(type_)
+        from_dict = get_record_type(model).from_dict
+        return [from_dict(item) for item in value]
+
+    return get_record_type(type_).from_dict(value)
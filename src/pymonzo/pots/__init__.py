@@ -4,5 +4,5 @@ Note:
     Monzo API docs: https://monzo.com/docs/#pots
 """
 
-from .resources import PotsResource  # noqa
+from .resources import AsyncPotsResource, PotsResource  # noqa
 from .schemas import MonzoPot  # noqa
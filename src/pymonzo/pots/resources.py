@@ -1,15 +1,33 @@
 """Monzo API 'pots' resource."""
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from functools import partial
 from secrets import token_urlsafe
 from typing import Optional, Union
 
+from pymonzo.cache import ResponseCache
 from pymonzo.exceptions import CannotDetermineDefaultPot
+from pymonzo.fanout import (
+    DEFAULT_MAX_CONCURRENCY,
+    AccountResults,
+    async_fan_out,
+    fan_out,
+)
 from pymonzo.pots.schemas import MonzoPot
-from pymonzo.resources import BaseResource
+from pymonzo.resources import AsyncBaseResource, BaseResource
+
+
+def _invalidate_account_cache(cache: ResponseCache, account_id: str) -> None:
+    """Drop cached account pots and balance, after moving money between them.
+
+    Arguments:
+        cache: Response cache.
+        account_id: The ID of the account.
+    """
+    cache.invalidate("/pots", {"current_account_id": account_id})
+    cache.invalidate("/balance", {"account_id": account_id})
 
 
-@dataclass
 class PotsResource(BaseResource):
     """Monzo API 'pots' resource.
 
@@ -17,8 +35,6 @@ class PotsResource(BaseResource):
         Monzo API docs: https://monzo.com/docs/#pots
     """
 
-    _cached_pots: dict[str, list[MonzoPot]] = field(default_factory=dict)
-
     def get_default_pot(self, account_id: Optional[str] = None) -> MonzoPot:
         """If the user has only one (active) pot, treat it as the default pot.
 
@@ -54,6 +70,33 @@ class PotsResource(BaseResource):
             "You need to explicitly pass an 'pot_id' argument."
         )
 
+    def list_many(
+        self,
+        account_ids: Optional[Iterable[str]] = None,
+        *,
+        refresh: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AccountResults[list[MonzoPot]]:
+        """Return lists of pots of multiple accounts, concurrently.
+
+        Arguments:
+            account_ids: The IDs of the accounts. Defaults to all active accounts.
+            refresh: Whether to refresh the cached lists of pots.
+            max_concurrency: Maximum number of concurrent API calls.
+
+        Returns:
+            Lists of user's pots, keyed by account ID. Errors are reported per
+            account.
+        """
+        if account_ids is None:
+            account_ids = [account.id for account in self.client.accounts.list_active()]
+
+        return fan_out(
+            partial(self.list, refresh=refresh),
+            account_ids,
+            max_concurrency=max_concurrency,
+        )
+
     def list(
         self,
         account_id: Optional[str] = None,
@@ -63,7 +106,8 @@ class PotsResource(BaseResource):
         """Return a list of user's pots.
 
         It's often used when deciding whether to require explicit pot ID
-        or use the only active one, so we cache the response by default.
+        or use the only active one, so the response is cached by default (in the
+        `pots` cache namespace).
 
         Note:
             Monzo API docs: https://docs.monzo.com/#list-pots
@@ -83,15 +127,16 @@ class PotsResource(BaseResource):
         if not account_id:
             account_id = self.client.accounts.get_default_account().id
 
-        if not refresh and self._cached_pots.get(account_id):
-            return self._cached_pots[account_id]
-
         endpoint = "/pots"
         params = {"current_account_id": account_id}
-        response = self._get_response(method="get", endpoint=endpoint, params=params)
-
-        pots = [MonzoPot(**pot) for pot in response.json()["pots"]]
-        self._cached_pots[account_id] = pots
+        pots = self._get_cached(
+            endpoint,
+            list[MonzoPot],
+            "pots",
+            namespace="pots",
+            params=params,
+            refresh=refresh,
+        )
 
         return pots
 
@@ -141,9 +186,16 @@ class PotsResource(BaseResource):
             "amount": amount,
             "dedupe_id": dedupe_id,
         }
-        response = self._get_response(method="put", endpoint=endpoint, data=data)
+        # Deposits and withdrawals carry a `dedupe_id`, so they're safe to retry
+        response = self._get_response(
+            method="put",
+            endpoint=endpoint,
+            data=data,
+            idempotent=True,
+        )
 
-        pot = MonzoPot(**response.json())
+        pot = self._parse_response(response, MonzoPot)
+        _invalidate_account_cache(self.client.cache, account_id)
 
         return pot
 
@@ -193,8 +245,253 @@ class PotsResource(BaseResource):
             "amount": amount,
             "dedupe_id": dedupe_id,
         }
-        response = self._get_response(method="put", endpoint=endpoint, data=data)
+        # Deposits and withdrawals carry a `dedupe_id`, so they're safe to retry
+        response = self._get_response(
+            method="put",
+            endpoint=endpoint,
+            data=data,
+            idempotent=True,
+        )
+
+        pot = self._parse_response(response, MonzoPot)
+        _invalidate_account_cache(self.client.cache, account_id)
+
+        return pot
+
+
+class AsyncPotsResource(AsyncBaseResource):
+    """Monzo API 'pots' async resource.
+
+    Note:
+        Monzo API docs: https://monzo.com/docs/#pots
+    """
+
+    async def get_default_pot(self, account_id: Optional[str] = None) -> MonzoPot:
+        """If the user has only one (active) pot, treat it as the default pot.
+
+        Async version of [`pymonzo.pots.PotsResource.get_default_pot`][].
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+
+        Returns:
+            User's active pot.
+
+        Raises:
+            CannotDetermineDefaultPot: If user has more than one active pot.
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        pots = await self.list(account_id)
+
+        # If there is only one pot, return it
+        if len(pots) == 1:
+            return pots[0]
+
+        # Otherwise check if there is only one active (non-deleted) pot
+        active_pots = [pot for pot in pots if not pot.deleted]
+
+        if len(active_pots) == 1:
+            return active_pots[0]
+
+        raise CannotDetermineDefaultPot(
+            "Cannot determine default pot. "
+            "You need to explicitly pass an 'pot_id' argument."
+        )
+
+    async def list_many(
+        self,
+        account_ids: Optional[Iterable[str]] = None,
+        *,
+        refresh: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AccountResults[list[MonzoPot]]:
+        """Return lists of pots of multiple accounts, concurrently.
+
+        Async version of [`pymonzo.pots.PotsResource.list_many`][].
+
+        Arguments:
+            account_ids: The IDs of the accounts. Defaults to all active accounts.
+            refresh: Whether to refresh the cached lists of pots.
+            max_concurrency: Maximum number of concurrent API calls.
+
+        Returns:
+            Lists of user's pots, keyed by account ID. Errors are reported per
+            account.
+        """
+        if account_ids is None:
+            accounts = await self.client.accounts.list_active()
+            account_ids = [account.id for account in accounts]
+
+        return await async_fan_out(
+            partial(self.list, refresh=refresh),
+            account_ids,
+            max_concurrency=max_concurrency,
+        )
+
+    async def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        refresh: bool = False,
+    ) -> list[MonzoPot]:
+        """Return a list of user's pots.
+
+        Async version of [`pymonzo.pots.PotsResource.list`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#list-pots
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            refresh: Whether to refresh the cached list of pots.
+
+        Returns:
+            A list of user's pots.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        endpoint = "/pots"
+        params = {"current_account_id": account_id}
+        pots = await self._get_cached(
+            endpoint,
+            list[MonzoPot],
+            "pots",
+            namespace="pots",
+            params=params,
+            refresh=refresh,
+        )
+
+        return pots
+
+    async def deposit(
+        self,
+        amount: Union[int, float],
+        pot_id: Optional[str] = None,
+        *,
+        account_id: Optional[str] = None,
+        dedupe_id: Optional[str] = None,
+    ) -> MonzoPot:
+        """Move money from an account to a pot.
+
+        Async version of [`pymonzo.pots.PotsResource.deposit`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#deposit-into-a-pot
+
+        Arguments:
+            amount: The amount to deposit, as a 64bit integer in minor units of
+                the currency, eg. pennies for GBP, or cents for EUR and USD.
+            pot_id: The ID of the pot to deposit into.
+            account_id: The ID of the account to withdraw from. Can be omitted if
+                user has only one active account.
+            dedupe_id: A unique string used to de-duplicate deposits. Ensure this
+                remains static between retries to ensure only one deposit is created.
+                If omitted, a random 16 character string will be generated.
+
+        Returns:
+            A Monzo pot.
+
+        Raises:
+            CannotDetermineDefaultPot: If user has more than one active pot.
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        if not pot_id:
+            pot_id = (await self.get_default_pot(account_id)).id
+
+        if not dedupe_id:
+            dedupe_id = token_urlsafe(16)
+
+        endpoint = f"/pots/{pot_id}/deposit"
+        data = {
+            "source_account_id": account_id,
+            "amount": amount,
+            "dedupe_id": dedupe_id,
+        }
+        # Deposits and withdrawals carry a `dedupe_id`, so they're safe to retry
+        response = await self._get_response(
+            method="put",
+            endpoint=endpoint,
+            data=data,
+            idempotent=True,
+        )
+
+        pot = self._parse_response(response, MonzoPot)
+        _invalidate_account_cache(self.client.cache, account_id)
+
+        return pot
+
+    async def withdraw(
+        self,
+        amount: Union[int, float],
+        pot_id: Optional[str] = None,
+        *,
+        account_id: Optional[str] = None,
+        dedupe_id: Optional[str] = None,
+    ) -> MonzoPot:
+        """Withdraw money from a pot to an account.
+
+        Async version of [`pymonzo.pots.PotsResource.withdraw`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#withdraw-from-a-pot
+
+        Arguments:
+            amount: The amount to deposit, as a 64bit integer in minor units of
+                the currency, eg. pennies for GBP, or cents for EUR and USD.
+            pot_id: The ID of the pot to withdraw from.
+            account_id: The ID of the account to deposit into. Can be omitted if
+                user has only one active account.
+            dedupe_id: A unique string used to de-duplicate deposits. Ensure this
+                remains static between retries to ensure only one deposit is created.
+                If omitted, a random 16 character string will be generated.
+
+        Returns:
+            A Monzo pot.
+
+        Raises:
+            CannotDetermineDefaultPot: If user has more than one active pot.
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        if not pot_id:
+            pot_id = (await self.get_default_pot(account_id)).id
+
+        if not dedupe_id:
+            dedupe_id = token_urlsafe(16)
+
+        endpoint = f"/pots/{pot_id}/withdraw"
+        data = {
+            "destination_account_id": account_id,
+            "amount": amount,
+            "dedupe_id": dedupe_id,
+        }
+        # Deposits and withdrawals carry a `dedupe_id`, so they're safe to retry
+        response = await self._get_response(
+            method="put",
+            endpoint=endpoint,
+            data=data,
+            idempotent=True,
+        )
 
-        pot = MonzoPot(**response.json())
+        pot = self._parse_response(response, MonzoPot)
+        _invalidate_account_cache(self.client.cache, account_id)
 
         return pot
@@ -1,25 +1,14 @@
 """Monzo API 'pots' related schemas."""
 
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pydantic import BaseModel, ConfigDict
 
-# Optional `rich` support
-try:
-    from rich.table import Table
-
-    # Optional `babel` support
-    try:
-        from babel.dates import format_datetime
-        from babel.numbers import format_currency
-    except ImportError:
-        from pymonzo.utils import format_currency, format_datetime  # type: ignore
+from pymonzo.formatting import RICH_AVAILABLE, format_currency, format_datetime
 
-except ImportError:
-    RICH_AVAILABLE = False
-else:
-    RICH_AVAILABLE = True
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 class MonzoPot(BaseModel):
@@ -80,8 +69,10 @@ class MonzoPot(BaseModel):
 
     if RICH_AVAILABLE:
 
-        def __rich__(self) -> Table:
+        def __rich__(self) -> "Table":
             """Pretty printing support for `rich`."""
+            from rich.table import Table
+
             balance = format_currency(self.balance / 100, self.currency)
 
             grid = Table.grid(padding=(0, 5))
@@ -1,16 +1,196 @@
 """pymonzo base API resource related code."""
 
+import asyncio
 import json
+import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from functools import partial
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, overload
 
 import httpx
 from httpx import codes
 
-from pymonzo.exceptions import MonzoAccessDenied, MonzoAPIError
+from pymonzo.cache import make_cache_key
+from pymonzo.exceptions import (
+    MonzoAccessDenied,
+    MonzoAPIError,
+    MonzoRateLimitExceeded,
+)
+from pymonzo.hooks import Hooks, ParseEvent, get_endpoint_template
+from pymonzo.parsing import parse_records, parse_response
+from pymonzo.retries import RetryEvent, RetryPolicy, parse_retry_after
 
 if TYPE_CHECKING:
-    from pymonzo.client import MonzoAPI
+    from pymonzo.client import AsyncMonzoAPI, MonzoAPI
+
+ResourceT = TypeVar("ResourceT")
+
+
+def _build_request_kwargs(
+    method: str,
+    params: Optional[dict] = None,
+    data: Optional[dict] = None,
+) -> dict:
+    """Build `httpx` request kwargs for passed HTTP method.
+
+    Arguments:
+        method: HTTP method.
+        params: URL query parameters.
+        data: form encoded data.
+
+    Returns:
+        `httpx` request kwargs.
+    """
+    httpx_kwargs = {"params": params}
+    if method in ["post", "put", "patch"]:
+        httpx_kwargs["data"] = data
+
+    return httpx_kwargs
+
+
+def _get_retry_delay(
+    retry_policy: RetryPolicy,
+    method: str,
+    endpoint: str,
+    attempt: int,
+    *,
+    idempotent: bool = False,
+    response: Optional[httpx.Response] = None,
+    error: Optional[Exception] = None,
+    hooks: Optional[Hooks] = None,
+) -> Optional[float]:
+    """Decide whether to retry the request and notify the retry callback (and hooks).
+
+    Arguments:
+        retry_policy: Retry policy.
+        method: HTTP method.
+        endpoint: HTTP endpoint.
+        attempt: Retry number, starting from 1.
+        idempotent: Whether the request is safe to retry.
+        response: HTTP response (if there was one).
+        error: Transport error (if there was one).
+        hooks: Observability hooks.
+
+    Returns:
+        Number of seconds to wait before retrying, or `None` if the request
+        shouldn't be retried.
+    """
+    delay = retry_policy.get_retry_delay(
+        method,
+        attempt,
+        idempotent=idempotent,
+        response=response,
+    )
+
+    if delay is None or not (retry_policy.on_retry or hooks):
+        return delay
+
+    event = RetryEvent(
+        method=method,
+        endpoint=endpoint,
+        attempt=attempt,
+        delay=delay,
+        status_code=response.status_code if response is not None else None,
+        error=error,
+    )
+
+    if retry_policy.on_retry:
+        retry_policy.on_retry(event)
+
+    if hooks:
+        hooks.on_retry(event)
+
+    return delay
+
+
+def _parse_response(
+    hooks: Hooks,
+    response: httpx.Response,
+    type_: Any,
+    key: Optional[str] = None,
+    *,
+    validate: bool = True,
+) -> Any:
+    """Parse API response into passed type, reporting the parse time to hooks.
+
+    Arguments:
+        hooks: Observability hooks.
+        response: HTTP response.
+        type_: Type to parse the response into, e.g. `list[MonzoTransaction]`.
+        key: Top level key the value is wrapped in, e.g. `transactions`.
+        validate: Whether to validate the response. Otherwise, it's parsed into
+            trusted records (see [`pymonzo.parsing.parse_records`][]).
+
+    Returns:
+        Parsed value.
+    """
+    parse = parse_response if validate else parse_records
+    if not hooks:
+        return parse(response.content, type_, key)
+
+    started = time.perf_counter()
+    value = parse(response.content, type_, key)
+    duration = time.perf_counter() - started
+
+    endpoint = response.request.url.path
+    hooks.on_parse(
+        ParseEvent(
+            endpoint=endpoint,
+            endpoint_template=get_endpoint_template(endpoint),
+            duration=duration,
+            size=len(response.content),
+        )
+    )
+
+    return value
+
+
+def _raise_for_status(response: httpx.Response, *, retries: int = 0) -> None:
+    """Catch API errors.
+
+    Arguments:
+        response: HTTP response.
+        retries: How many times the request was retried.
+
+    Raises:
+        MonzoAccessDenied: When access to Monzo API was denied.
+        MonzoRateLimitExceeded: When Monzo API rate limit was exceeded.
+        MonzoAPIError: When Monzo API returned an error.
+    """
+    if response.status_code == codes.FORBIDDEN:
+        error = MonzoAccessDenied(
+            "Monzo API access denied (HTTP 403 Forbidden). "
+            "Make sure to (re)authenticate the OAuth app on your mobile device."
+        )
+        error.retries = retries
+        raise error
+
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        try:
+            content = response.json()
+        except json.decoder.JSONDecodeError:
+            content = {}
+
+        error = content.get("message")
+        code = content.get("code")
+
+        msg = f"{error} ({code})" if error and code else f"Something went wrong: {e}"
+
+        if retries:
+            msg = f"{msg} (after {retries} retries)"
+
+        api_error: MonzoAPIError
+        if response.status_code == codes.TOO_MANY_REQUESTS:
+            api_error = MonzoRateLimitExceeded(msg)
+            api_error.retry_after = parse_retry_after(response)
+        else:
+            api_error = MonzoAPIError(msg)
+
+        api_error.retries = retries
+        raise api_error from e
 
 
 @dataclass
@@ -29,50 +209,506 @@ class BaseResource:
         endpoint: str,
         params: Optional[dict] = None,
         data: Optional[dict] = None,
+        *,
+        idempotent: bool = False,
     ) -> httpx.Response:
         """Handle HTTP requests and catch API errors.
 
+        Failed requests are retried according to the client retry policy, and
+        identical concurrent GET requests share a single in-flight request (unless
+        request coalescing is disabled in the client).
+
         Arguments:
             method: HTTP method.
             endpoint: HTTP endpoint.
             params: URL query parameters.
             data: form encoded data.
+            idempotent: Whether the request is safe to retry regardless of its
+                HTTP method (e.g. because it carries a `dedupe_id`).
 
         Returns:
             HTTP response.
 
         Raises:
             MonzoAccessDenied: When access to Monzo API was denied.
+            MonzoRateLimitExceeded: When Monzo API rate limit was exceeded.
             MonzoAPIError: When Monzo API returned an error.
         """
-        httpx_kwargs = {"params": params}
-        if method in ["post", "put", "patch"]:
-            httpx_kwargs["data"] = data
+        single_flight = self.client.single_flight
+        if method == "get" and single_flight is not None:
+            # Identical concurrent GET requests share one in-flight request
+            return single_flight.do(
+                ("response", *make_cache_key(endpoint, params)),
+                partial(self._send_request, method, endpoint, params),
+            )
 
-        response = getattr(self.client.session, method)(endpoint, **httpx_kwargs)
+        return self._send_request(method, endpoint, params, data, idempotent=idempotent)
 
-        if response.status_code == codes.FORBIDDEN:
-            raise MonzoAccessDenied(
-                "Monzo API access denied (HTTP 403 Forbidden). "
-                "Make sure to (re)authenticate the OAuth app on your mobile device."
-            )
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        *,
+        idempotent: bool = False,
+    ) -> httpx.Response:
+        """Send HTTP request, retrying it according to the client retry policy.
 
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
+        Arguments:
+            method: HTTP method.
+            endpoint: HTTP endpoint.
+            params: URL query parameters.
+            data: form encoded data.
+            idempotent: Whether the request is safe to retry regardless of its
+                HTTP method.
+
+        Returns:
+            HTTP response.
+
+        Raises:
+            MonzoAccessDenied: When access to Monzo API was denied.
+            MonzoRateLimitExceeded: When Monzo API rate limit was exceeded.
+            MonzoAPIError: When Monzo API returned an error.
+        """
+        httpx_kwargs = _build_request_kwargs(method, params=params, data=data)
+
+        hooks = self.client.hooks
+
+        attempt = 0
+        while True:
+            timer = hooks.start_request(method, endpoint, attempt) if hooks else None
             try:
-                content = response.json()
-            except json.decoder.JSONDecodeError:
-                content = {}
+                response = getattr(self.client.session, method)(
+                    endpoint, **httpx_kwargs
+                )
+            except httpx.TransportError as e:
+                if timer:
+                    timer.end(error=e)
+
+                delay = _get_retry_delay(
+                    self.client.retry_policy,
+                    method,
+                    endpoint,
+                    attempt + 1,
+                    idempotent=idempotent,
+                    error=e,
+                    hooks=hooks,
+                )
+                if delay is None:
+                    raise
+            else:
+                if timer:
+                    timer.end(response=response)
+
+                delay = _get_retry_delay(
+                    self.client.retry_policy,
+                    method,
+                    endpoint,
+                    attempt + 1,
+                    idempotent=idempotent,
+                    response=response,
+                    hooks=hooks,
+                )
+                if delay is None:
+                    break
+
+            attempt += 1
+            time.sleep(delay)
+
+        _raise_for_status(response, retries=attempt)
+
+        return response
+
+    def _parse_response(
+        self,
+        response: httpx.Response,
+        type_: Any,
+        key: Optional[str] = None,
+        *,
+        validate: bool = True,
+    ) -> Any:
+        """Parse API response into passed type.
+
+        Arguments:
+            response: HTTP response.
+            type_: Type to parse the response into, e.g. `list[MonzoTransaction]`.
+            key: Top level key the value is wrapped in, e.g. `transactions`.
+            validate: Whether to validate the response. Otherwise, it's parsed
+                into trusted records (see [`pymonzo.parsing.parse_records`][]).
+
+        Returns:
+            Parsed value.
+        """
+        return _parse_response(
+            self.client.hooks,
+            response,
+            type_,
+            key,
+            validate=validate,
+        )
+
+    def _get_cached(
+        self,
+        endpoint: str,
+        type_: Any,
+        key: Optional[str] = None,
+        *,
+        namespace: str,
+        params: Optional[dict] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """Make a GET request and parse its response, using the response cache.
+
+        Arguments:
+            endpoint: HTTP endpoint.
+            type_: Type to parse the response into, e.g. `list[MonzoTransaction]`.
+            key: Top level key the value is wrapped in, e.g. `transactions`.
+            namespace: Cache namespace, which decides the cache TTL. For more
+                information see [`pymonzo.cache.ResponseCache`][].
+            params: URL query parameters.
+            refresh: Whether to skip the cached response (and cache a new one).
+
+        Returns:
+            Parsed (possibly cached) value.
+
+        Raises:
+            MonzoAccessDenied: When access to Monzo API was denied.
+            MonzoRateLimitExceeded: When Monzo API rate limit was exceeded.
+            MonzoAPIError: When Monzo API returned an error.
+        """
+        cache = self.client.cache
+        cache_key = make_cache_key(endpoint, params)
+
+        if not refresh and cache.is_enabled(namespace):
+            value = cache.get(cache_key)
+            if value is not None:
+                return value
+
+        fetch = partial(self._fetch_parsed, endpoint, type_, key, params=params)
+        single_flight = self.client.single_flight
+        if single_flight is None:
+            response, value = fetch()
+        else:
+            # Identical concurrent calls share one in-flight request and its result
+            response, value = single_flight.do(
+                ("parsed", *cache_key, type_, key), fetch
+            )
+
+        cache.set(cache_key, value, namespace=namespace, size=len(response.content))
+
+        return value
+
+    def _fetch_parsed(
+        self,
+        endpoint: str,
+        type_: Any,
+        key: Optional[str] = None,
+        *,
+        params: Optional[dict] = None,
+    ) -> tuple[httpx.Response, Any]:
+        """Make a GET request and parse its response.
+
+        Arguments:
+            endpoint: HTTP endpoint.
+            type_: Type to parse the response into, e.g. `list[MonzoTransaction]`.
+            key: Top level key the value is wrapped in, e.g. `transactions`.
+            params: URL query parameters.
+
+        Returns:
+            HTTP response and parsed value.
+        """
+        response = self._get_response(method="get", endpoint=endpoint, params=params)
+        value = self._parse_response(response, type_, key)
+
+        return response, value
+
+
+@dataclass
+class AsyncBaseResource:
+    """Base Monzo API async resource class.
+
+    Attributes:
+        client: Monzo API async client instance.
+    """
+
+    client: "AsyncMonzoAPI"
+
+    async def _get_response(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        *,
+        idempotent: bool = False,
+    ) -> httpx.Response:
+        """Handle async HTTP requests and catch API errors.
+
+        Failed requests are retried according to the client retry policy, and
+        identical concurrent GET requests share a single in-flight request (unless
+        request coalescing is disabled in the client).
+
+        Arguments:
+            method: HTTP method.
+            endpoint: HTTP endpoint.
+            params: URL query parameters.
+            data: form encoded data.
+            idempotent: Whether the request is safe to retry regardless of its
+                HTTP method (e.g. because it carries a `dedupe_id`).
+
+        Returns:
+            HTTP response.
+
+        Raises:
+            MonzoAccessDenied: When access to Monzo API was denied.
+            MonzoRateLimitExceeded: When Monzo API rate limit was exceeded.
+            MonzoAPIError: When Monzo API returned an error.
+        """
+        single_flight = self.client.single_flight
+        if method == "get" and single_flight is not None:
+            # Identical concurrent GET requests share one in-flight request
+            return await single_flight.do(
+                ("response", *make_cache_key(endpoint, params)),
+                partial(self._send_request, method, endpoint, params),
+            )
 
-            error = content.get("message")
-            code = content.get("code")
+        return await self._send_request(
+            method, endpoint, params, data, idempotent=idempotent
+        )
 
-            if error and code:
-                msg = f"{error} ({code})"
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        *,
+        idempotent: bool = False,
+    ) -> httpx.Response:
+        """Send HTTP request, retrying it according to the client retry policy.
+
+        Arguments:
+            method: HTTP method.
+            endpoint: HTTP endpoint.
+            params: URL query parameters.
+            data: form encoded data.
+            idempotent: Whether the request is safe to retry regardless of its
+                HTTP method.
+
+        Returns:
+            HTTP response.
+
+        Raises:
+            MonzoAccessDenied: When access to Monzo API was denied.
+            MonzoRateLimitExceeded: When Monzo API rate limit was exceeded.
+            MonzoAPIError: When Monzo API returned an error.
+        """
+        httpx_kwargs = _build_request_kwargs(method, params=params, data=data)
+
+        hooks = self.client.hooks
+
+        attempt = 0
+        while True:
+            timer = hooks.start_request(method, endpoint, attempt) if hooks else None
+            try:
+                response = await getattr(self.client.session, method)(
+                    endpoint, **httpx_kwargs
+                )
+            except httpx.TransportError as e:
+                if timer:
+                    timer.end(error=e)
+
+                delay = _get_retry_delay(
+                    self.client.retry_policy,
+                    method,
+                    endpoint,
+                    attempt + 1,
+                    idempotent=idempotent,
+                    error=e,
+                    hooks=hooks,
+                )
+                if delay is None:
+                    raise
             else:
-                msg = f"Something went wrong: {e}"
+                if timer:
+                    timer.end(response=response)
 
-            raise MonzoAPIError(msg) from e
+                delay = _get_retry_delay(
+                    self.client.retry_policy,
+                    method,
+                    endpoint,
+                    attempt + 1,
+                    idempotent=idempotent,
+                    response=response,
+                    hooks=hooks,
+                )
+                if delay is None:
+                    break
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+        _raise_for_status(response, retries=attempt)
 
         return response
+
+    def _parse_response(
+        self,
+        response: httpx.Response,
+        type_: Any,
+        key: Optional[str] = None,
+        *,
+        validate: bool = True,
+    ) -> Any:
+        """Parse API response into passed type.
+
+        Arguments:
+            response: HTTP response.
+            type_: Type to parse the response into, e.g. `list[MonzoTransaction]`.
+            key: Top level key the value is wrapped in, e.g. `transactions`.
+            validate: Whether to validate the response. Otherwise, it's parsed
+                into trusted records (see [`pymonzo.parsing.parse_records`][]).
+
+        Returns:
+            Parsed value.
+        """
+        return _parse_response(
+            self.client.hooks,
+            response,
+            type_,
+            key,
+            validate=validate,
+        )
+
+    async def _get_cached(
+        self,
+        endpoint: str,
+        type_: Any,
+        key: Optional[str] = None,
+        *,
+        namespace: str,
+        params: Optional[dict] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """Make a GET request and parse its response, using the response cache.
+
+        Arguments:
+            endpoint: HTTP endpoint.
+            type_: Type to parse the response into, e.g. `list[MonzoTransaction]`.
+            key: Top level key the value is wrapped in, e.g. `transactions`.
+            namespace: Cache namespace, which decides the cache TTL. For more
+                information see [`pymonzo.cache.ResponseCache`][].
+            params: URL query parameters.
+            refresh: Whether to skip the cached response (and cache a new one).
+
+        Returns:
+            Parsed (possibly cached) value.
+
+        Raises:
+            MonzoAccessDenied: When access to Monzo API was denied.
+            MonzoRateLimitExceeded: When Monzo API rate limit was exceeded.
+            MonzoAPIError: When Monzo API returned an error.
+        """
+        cache = self.client.cache
+        cache_key = make_cache_key(endpoint, params)
+
+        if not refresh and cache.is_enabled(namespace):
+            value = cache.get(cache_key)
+            if value is not None:
+                return value
+
+        fetch = partial(self._fetch_parsed, endpoint, type_, key, params=params)
+        single_flight = self.client.single_flight
+        if single_flight is None:
+            response, value = await fetch()
+        else:
+            # Identical concurrent calls share one in-flight request and its result
+            response, value = await single_flight.do(
+                ("parsed", *cache_key, type_, key), fetch
+            )
+
+        cache.set(cache_key, value, namespace=namespace, size=len(response.content))
+
+        return value
+
+    async def _fetch_parsed(
+        self,
+        endpoint: str,
+        type_: Any,
+        key: Optional[str] = None,
+        *,
+        params: Optional[dict] = None,
+    ) -> tuple[httpx.Response, Any]:
+        """Make a GET request and parse its response.
+
+        Arguments:
+            endpoint: HTTP endpoint.
+            type_: Type to parse the response into, e.g. `list[MonzoTransaction]`.
+            key: Top level key the value is wrapped in, e.g. `transactions`.
+            params: URL query parameters.
+
+        Returns:
+            HTTP response and parsed value.
+        """
+        response = await self._get_response(
+            method="get", endpoint=endpoint, params=params
+        )
+        value = self._parse_response(response, type_, key)
+
+        return response, value
+
+
+class MountedResource(Generic[ResourceT]):
+    """Lazily mounted API resource.
+
+    It's a (non-data) descriptor that imports and initializes the resource on
+    first access and caches it on the client instance, so constructing a client
+    is cheap and only the resources that are actually used get imported.
+
+    Attributes:
+        path: Resource class import path, e.g. `pymonzo.accounts:AccountsResource`.
+        attribute: Resource attribute to mount instead of the resource itself
+            (e.g. a method shortcut).
+        name: Name of the client attribute the resource is mounted as.
+    """
+
+    def __init__(self, path: str, *, attribute: Optional[str] = None) -> None:
+        """Initialize the descriptor.
+
+        Arguments:
+            path: Resource class import path, in `module:ClassName` format.
+            attribute: Resource attribute to mount instead of the resource itself.
+        """
+        self.path = path
+        self.attribute = attribute
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Save the client attribute name."""
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "MountedResource[ResourceT]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> ResourceT: ...
+
+    def __get__(
+        self,
+        instance: Optional[object],
+        owner: type,
+    ) -> Union["MountedResource[ResourceT]", ResourceT]:
+        """Initialize the resource and cache it on the client instance."""
+        if instance is None:
+            return self
+
+        module_name, class_name = self.path.split(":")
+        resource = getattr(import_module(module_name), class_name)(client=instance)
+        if self.attribute:
+            resource = getattr(resource, self.attribute)
+
+        # Cached in the instance `__dict__`, which takes precedence over (non-data)
+        # descriptors, so this is only called once per client. With concurrent
+        # first access, all callers end up with the same resource.
+        return instance.__dict__.setdefault(self.name, resource)
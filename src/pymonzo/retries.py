@@ -0,0 +1,160 @@
+"""pymonzo retry policy related code."""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import httpx
+from httpx import codes
+
+
+@dataclass(frozen=True)
+class RetryEvent:
+    """Information about a request that is about to be retried.
+
+    Attributes:
+        method: HTTP method.
+        endpoint: HTTP endpoint.
+        attempt: Retry number, starting from 1.
+        delay: Number of seconds we're going to wait before retrying.
+        status_code: HTTP status code of the failed response (if there was one).
+        error: Transport error that caused the retry (if there was one).
+    """
+
+    method: str
+    endpoint: str
+    attempt: int
+    delay: float
+    status_code: Optional[int] = None
+    error: Optional[Exception] = None
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Parse `Retry-After` HTTP header.
+
+    Arguments:
+        response: HTTP response.
+
+    Returns:
+        Number of seconds to wait before retrying, or `None` if the header is
+        missing or malformed.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy for failed Monzo API requests.
+
+    Failed requests are retried with exponential backoff (with 'full jitter', by
+    default), and the `Retry-After` header is honoured when present. Only
+    idempotent HTTP methods are retried, unless the request is explicitly marked
+    as safe to retry (like pot deposits and withdrawals, which carry a
+    `dedupe_id`).
+
+    Attributes:
+        max_retries: Maximum number of retries. `0` disables retrying.
+        backoff_factor: Base backoff (in seconds). The `n`-th retry waits up to
+            `backoff_factor * 2 ** (n - 1)` seconds.
+        max_backoff: Maximum backoff (in seconds). Requests which the API asks
+            (via `Retry-After`) to retry later than that aren't retried at all.
+        jitter: Whether to randomize the backoff.
+        retry_statuses: HTTP status codes that should be retried.
+        retry_methods: HTTP methods that are safe to retry.
+        on_retry: Callback called before every retry.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset(
+            {
+                codes.TOO_MANY_REQUESTS,
+                codes.INTERNAL_SERVER_ERROR,
+                codes.BAD_GATEWAY,
+                codes.SERVICE_UNAVAILABLE,
+                codes.GATEWAY_TIMEOUT,
+            }
+        )
+    )
+    retry_methods: frozenset[str] = frozenset({"get", "head", "options"})
+    on_retry: Optional[Callable[[RetryEvent], None]] = None
+
+    def get_backoff(self, attempt: int) -> float:
+        """Return backoff (in seconds) for passed retry number.
+
+        Arguments:
+            attempt: Retry number, starting from 1.
+
+        Returns:
+            Number of seconds to wait before retrying.
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)  # noqa: S311
+
+        return backoff
+
+    def get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        *,
+        idempotent: bool = False,
+        response: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+        """Decide whether a request should be retried and how long to wait.
+
+        Arguments:
+            method: HTTP method.
+            attempt: Retry number, starting from 1.
+            idempotent: Whether the request is safe to retry regardless of its
+                HTTP method.
+            response: HTTP response, or `None` if the request failed with
+                a transport error.
+
+        Returns:
+            Number of seconds to wait before retrying, or `None` if the request
+            shouldn't be retried.
+        """
+        if attempt > self.max_retries:
+            return None
+
+        if not idempotent and method.lower() not in self.retry_methods:
+            return None
+
+        if response is None:
+            return self.get_backoff(attempt)
+
+        if response.status_code not in self.retry_statuses:
+            return None
+
+        retry_after = parse_retry_after(response)
+        if retry_after is None:
+            return self.get_backoff(attempt)
+
+        if retry_after > self.max_backoff:
+            return None
+
+        return retry_after
@@ -3,7 +3,8 @@
 import json
 import os
 import sys
-from functools import partial
+import tempfile
+from contextlib import suppress
 from pathlib import Path
 from typing import Optional, Union
 
@@ -48,11 +49,26 @@ class PyMonzoSettings(BaseSettings):
     def save_to_disk(self, settings_path: Path) -> None:
         """Save pymonzo settings on disk.
 
+        The settings are written to a temporary file first, which then replaces
+        the settings file, so other processes never read a partially written file.
+
         Arguments:
             settings_path: Settings file path.
         """
-        # Make sure the file is not publicly accessible
-        # Source: https://github.com/python/cpython/issues/73400
-        os.umask(0o077)
-        with open(settings_path, "w", opener=partial(os.open, mode=0o600)) as f:
-            f.write(self.model_dump_json(indent=2))
+        # `mkstemp` makes sure the file is not publicly accessible
+        fd, temp_path = tempfile.mkstemp(
+            dir=settings_path.parent,
+            prefix=f".{settings_path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.model_dump_json(indent=2))
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, settings_path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
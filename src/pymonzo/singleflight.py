@@ -0,0 +1,133 @@
+"""pymonzo request coalescing related code.
+
+When many threads (or tasks) make the same API call at the same time, e.g. on
+a cold cache, only the first one actually calls the API, and all the others wait
+for (and share) its result.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Hashable
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """In-flight call, shared by all callers with the same key.
+
+    Attributes:
+        done: Set once the call finished.
+        result: Call result.
+        error: Exception raised by the call.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        """Initialize in-flight call."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent (thread) calls with the same key into a single call.
+
+    Attributes:
+        coalesced: Number of calls that shared another call result.
+    """
+
+    def __init__(self) -> None:
+        """Initialize request coalescing."""
+        self.coalesced = 0
+
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Call passed function, unless a call with the same key is in flight.
+
+        Arguments:
+            key: Call key, e.g. HTTP method, endpoint and URL query params.
+            fn: Function to call.
+
+        Returns:
+            Function result, possibly shared with other callers.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent (`asyncio` task) calls with the same key into one call.
+
+    The call runs in its own task, so cancelling one of the callers doesn't
+    cancel it for the others.
+
+    Attributes:
+        coalesced: Number of calls that shared another call result.
+    """
+
+    def __init__(self) -> None:
+        """Initialize request coalescing."""
+        self.coalesced = 0
+
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Call passed function, unless a call with the same key is in flight.
+
+        Arguments:
+            key: Call key, e.g. HTTP method, endpoint and URL query params.
+            fn: Async function to call.
+
+        Returns:
+            Function result, possibly shared with other callers.
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget finished call.
+
+        Arguments:
+            key: Call key.
+            task: Finished call task.
+        """
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+        # Mark the exception as retrieved, in case all callers were cancelled
+        if not task.cancelled():
+            task.exception()
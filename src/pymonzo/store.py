@@ -0,0 +1,549 @@
+"""pymonzo local transaction store.
+
+It keeps Monzo transactions in a local SQLite database, so they don't need to be
+re-downloaded on every run. Only transactions newer than the stored 'high-water
+mark' (and the ones that are still pending) are fetched on sync.
+
+The store also keeps track of the time windows it's known to hold all account
+transactions for (its 'coverage'), so missing windows can be fetched on their own.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from pymonzo.backfill import RECENT_HISTORY, Backfill, BackfillProgress
+from pymonzo.transactions import MonzoTransaction
+from pymonzo.transactions.resources import MAX_PAGE_SIZE
+from pymonzo.utils import as_utc
+
+if TYPE_CHECKING:
+    from pymonzo.client import MonzoAPI
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    account_id TEXT NOT NULL,
+    created TEXT NOT NULL,
+    settled TEXT,
+    pending INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_transactions_account_id_created
+    ON transactions (account_id, created);
+CREATE INDEX IF NOT EXISTS ix_transactions_account_id_pending
+    ON transactions (account_id, pending);
+CREATE TABLE IF NOT EXISTS coverage (
+    account_id TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_coverage_account_id
+    ON coverage (account_id);
+"""
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+"""Start of the coverage of a full transaction history sync."""
+
+
+def _format_datetime(dt: datetime) -> str:
+    """Format datetime as a (lexicographically sortable) UTC ISO 8601 string.
+
+    Naive datetimes are treated as UTC.
+
+    Arguments:
+        dt: Datetime to format.
+
+    Returns:
+        Formatted datetime.
+    """
+    return as_utc(dt).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse datetime formatted with `_format_datetime`.
+
+    Arguments:
+        value: Formatted datetime.
+
+    Returns:
+        Parsed (timezone aware) datetime.
+    """
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(
+        tzinfo=timezone.utc
+    )
+
+
+class TransactionStore:
+    """Local SQLite transaction store with incremental sync.
+
+    Transactions are keyed by their ID and indexed by account ID and creation
+    date. Each [`pymonzo.store.TransactionStore.sync`][] call only fetches
+    transactions created after the newest stored one, plus the ones that were
+    still pending (not yet settled, nor declined), so they get updated once they
+    settle.
+
+    It can be used as a context manager, which closes the database connection
+    on exit.
+
+    Attributes:
+        client: Monzo API client instance.
+        path: SQLite database file path.
+    """
+
+    def __init__(self, client: "MonzoAPI", path: Union[str, Path]) -> None:
+        """Open (and if needed, create) the SQLite database.
+
+        Arguments:
+            client: Monzo API client instance.
+            path: SQLite database file path. Use `":memory:"` for an in-memory
+                database.
+        """
+        self.client = client
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "TransactionStore":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the context manager and close the database connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def _fetch_value(self, query: str, params: tuple) -> Any:
+        """Execute passed query and return the first column of the first row.
+
+        Arguments:
+            query: SQL query.
+            params: SQL query parameters.
+
+        Returns:
+            First returned value, or `None` if nothing was returned.
+        """
+        with self._lock:
+            row = self._connection.execute(query, params).fetchone()
+
+        return row[0] if row is not None else None
+
+    def upsert(
+        self,
+        account_id: str,
+        transactions: Iterable[MonzoTransaction],
+    ) -> int:
+        """Insert or update passed transactions.
+
+        Arguments:
+            account_id: The ID of the account the transactions belong to.
+            transactions: Monzo transactions.
+
+        Returns:
+            Number of upserted transactions.
+        """
+        rows = [
+            (
+                transaction.id,
+                account_id,
+                _format_datetime(transaction.created),
+                _format_datetime(transaction.settled) if transaction.settled else None,
+                transaction.settled is None and not transaction.decline_reason,
+                transaction.model_dump_json(),
+            )
+            for transaction in transactions
+        ]
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO transactions "
+                "(id, account_id, created, settled, pending, data) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET "
+                "account_id = excluded.account_id, "
+                "created = excluded.created, "
+                "settled = excluded.settled, "
+                "pending = excluded.pending, "
+                "data = excluded.data",
+                rows,
+            )
+
+        return len(rows)
+
+    def get(self, transaction_id: str) -> Optional[MonzoTransaction]:
+        """Return a single stored transaction.
+
+        Arguments:
+            transaction_id: The ID of the transaction.
+
+        Returns:
+            Stored Monzo transaction, or `None` if it wasn't found.
+        """
+        data = self._fetch_value(
+            "SELECT data FROM transactions WHERE id = ?",
+            (transaction_id,),
+        )
+
+        if data is None:
+            return None
+
+        return MonzoTransaction.model_validate_json(data)
+
+    def iter_all(
+        self,
+        account_id: str,
+        *,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+    ) -> Iterator[MonzoTransaction]:
+        """Iterate over stored account transactions, oldest first.
+
+        Arguments:
+            account_id: The ID of the account.
+            since: Filter transactions by start time.
+            before: Filter transactions by end time.
+
+        Yields:
+            Stored Monzo transactions.
+        """
+        query = "SELECT data FROM transactions WHERE account_id = ?"
+        params: list[str] = [account_id]
+
+        if since:
+            query += " AND created >= ?"
+            params.append(_format_datetime(since))
+
+        if before:
+            query += " AND created < ?"
+            params.append(_format_datetime(before))
+
+        query += " ORDER BY created, id"
+
+        with self._lock:
+            cursor = self._connection.execute(query, params)
+
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(MAX_PAGE_SIZE)
+
+            if not rows:
+                return
+
+            for row in rows:
+                yield MonzoTransaction.model_validate_json(row[0])
+
+    def get_coverage(self, account_id: str) -> list[tuple[datetime, datetime]]:
+        """Return time windows the store holds all account transactions for.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            Sorted, non-overlapping time windows (start inclusive, end exclusive).
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT start_time, end_time FROM coverage "
+                "WHERE account_id = ? ORDER BY start_time",
+                (account_id,),
+            ).fetchall()
+
+        return [(_parse_datetime(start), _parse_datetime(end)) for start, end in rows]
+
+    def add_coverage(self, account_id: str, start: datetime, end: datetime) -> None:
+        """Record that the store holds all account transactions in a time window.
+
+        Overlapping and adjacent windows are merged.
+
+        Arguments:
+            account_id: The ID of the account.
+            start: Window start time (inclusive).
+            end: Window end time (exclusive).
+        """
+        if start >= end:
+            return
+
+        with self._lock, self._connection:
+            rows = self._connection.execute(
+                "SELECT start_time, end_time FROM coverage WHERE account_id = ?",
+                (account_id,),
+            ).fetchall()
+
+            windows = sorted(
+                [(_parse_datetime(start), _parse_datetime(end)) for start, end in rows]
+                + [(as_utc(start), as_utc(end))]
+            )
+            merged = [windows[0]]
+            for window_start, window_end in windows[1:]:
+                last_start, last_end = merged[-1]
+                if window_start <= last_end:
+                    merged[-1] = (last_start, max(last_end, window_end))
+                else:
+                    merged.append((window_start, window_end))
+
+            self._connection.execute(
+                "DELETE FROM coverage WHERE account_id = ?",
+                (account_id,),
+            )
+            self._connection.executemany(
+                "INSERT INTO coverage (account_id, start_time, end_time) "
+                "VALUES (?, ?, ?)",
+                [
+                    (account_id, _format_datetime(start), _format_datetime(end))
+                    for start, end in merged
+                ],
+            )
+
+    def get_gaps(
+        self,
+        account_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Return time windows the store isn't known to hold all transactions for.
+
+        Arguments:
+            account_id: The ID of the account.
+            start: Start time (inclusive) of the checked period.
+            end: End time (exclusive) of the checked period.
+
+        Returns:
+            Sorted gap windows (start inclusive, end exclusive) within the period.
+        """
+        start, end = as_utc(start), as_utc(end)
+
+        gaps = []
+        for window_start, window_end in self.get_coverage(account_id):
+            if window_end <= start:
+                continue
+
+            if window_start >= end:
+                break
+
+            if window_start > start:
+                gaps.append((start, window_start))
+
+            start = max(start, window_end)
+
+        if start < end:
+            gaps.append((start, end))
+
+        return gaps
+
+    def list(
+        self,
+        account_id: str,
+        *,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+    ) -> list[MonzoTransaction]:
+        """Return a list of stored account transactions, oldest first.
+
+        Arguments:
+            account_id: The ID of the account.
+            since: Filter transactions by start time.
+            before: Filter transactions by end time.
+
+        Returns:
+            Stored Monzo transactions.
+        """
+        return list(self.iter_all(account_id, since=since, before=before))
+
+    def count(self, account_id: str) -> int:
+        """Return the number of stored account transactions.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            Number of stored account transactions.
+        """
+        return self._fetch_value(
+            "SELECT COUNT(*) FROM transactions WHERE account_id = ?",
+            (account_id,),
+        )
+
+    def get_high_water_mark(self, account_id: str) -> Optional[datetime]:
+        """Return creation date of the newest stored account transaction.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            Creation date of the newest stored transaction, or `None` if there are
+            no stored transactions.
+        """
+        created = self._fetch_value(
+            "SELECT MAX(created) FROM transactions WHERE account_id = ?",
+            (account_id,),
+        )
+
+        return _parse_datetime(created) if created else None
+
+    def get_oldest_pending(self, account_id: str) -> Optional[datetime]:
+        """Return creation date of the oldest pending (unsettled) transaction.
+
+        Declined transactions never settle, so they're not considered pending.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            Creation date of the oldest pending transaction, or `None` if there
+            are no pending transactions.
+        """
+        created = self._fetch_value(
+            "SELECT MIN(created) FROM transactions WHERE account_id = ? AND pending",
+            (account_id,),
+        )
+
+        return _parse_datetime(created) if created else None
+
+    def get_sync_start(self, account_id: str) -> Optional[datetime]:
+        """Return the point in time from which transactions need to be re-fetched.
+
+        That's the oldest pending transaction or the newest stored transaction,
+        whichever is older.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            Point in time from which transactions need to be re-fetched, or `None`
+            if the full history needs to be fetched.
+        """
+        high_water_mark = self.get_high_water_mark(account_id)
+        oldest_pending = self.get_oldest_pending(account_id)
+
+        if high_water_mark and oldest_pending:
+            return min(high_water_mark, oldest_pending)
+
+        return high_water_mark
+
+    def sync(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+    ) -> int:
+        """Fetch new and pending account transactions and store them locally.
+
+        Transactions are fetched (and stored) one page at a time, so memory usage
+        stays flat even on the initial sync.
+
+        Only the fetched period is recorded in the store coverage. Unless older
+        transactions were returned, that's at most the last 90 days, which is all
+        the API returns once the full history stops being available.
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            expand_merchant: Whether to return expanded merchant information.
+
+        Returns:
+            Number of fetched (inserted or updated) transactions.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = self.client.accounts.get_default_account().id
+
+        since = self.get_sync_start(account_id)
+        started = datetime.now(timezone.utc)
+
+        page: list[MonzoTransaction] = []
+        synced = 0
+        oldest: Optional[datetime] = None
+        for transaction in self.client.transactions.iter_all(
+            account_id,
+            expand_merchant=expand_merchant,
+            since=since,
+        ):
+            if oldest is None or transaction.created < oldest:
+                oldest = transaction.created
+
+            page.append(transaction)
+            if len(page) >= MAX_PAGE_SIZE:
+                synced += self.upsert(account_id, page)
+                page = []
+
+        synced += self.upsert(account_id, page)
+
+        coverage_start = since or EPOCH
+        recent_history_start = started - RECENT_HISTORY
+        # Transactions older than the recent history mean it wasn't limited
+        if coverage_start < recent_history_start and (
+            oldest is None or as_utc(oldest) >= recent_history_start
+        ):
+            coverage_start = recent_history_start
+
+        self.add_coverage(account_id, coverage_start, started)
+
+        return synced
+
+    def backfill(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        max_concurrency: int = 4,
+        expand_merchant: bool = False,
+        on_progress: Optional[Callable[[BackfillProgress], Any]] = None,
+    ) -> BackfillProgress:
+        """Fetch the full account transaction history concurrently and store it.
+
+        It needs to be called within 5 minutes of authentication. For more
+        information see [`pymonzo.backfill.Backfill`][].
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            max_concurrency: Maximum number of concurrent API calls.
+            expand_merchant: Whether to return expanded merchant information.
+            on_progress: Callback called with the backfill progress after each
+                fetched time window.
+
+        Returns:
+            Final backfill progress, including the time windows that failed.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = self.client.accounts.get_default_account().id
+
+        backfill = Backfill(
+            self.client,
+            max_concurrency=max_concurrency,
+            expand_merchant=expand_merchant,
+        )
+        started = datetime.now(timezone.utc)
+
+        progress = backfill.run(
+            partial(self.upsert, account_id),
+            account_id,
+            before=started,
+            on_progress=on_progress,
+        )
+
+        if not progress.errors:
+            self.add_coverage(account_id, EPOCH, started)
+
+        return progress
@@ -0,0 +1,9 @@
+"""pymonzo testing utilities.
+
+It provides a local Monzo API emulator ([`pymonzo.testing.MonzoEmulator`][]),
+backed by a stateful in-memory ledger ([`pymonzo.testing.Ledger`][]) with seeded
+synthetic data, for offline development and load testing.
+"""
+
+from .emulator import EmulatorRequest, Faults, MonzoEmulator  # noqa
+from .ledger import EmulatorError, Ledger  # noqa
@@ -0,0 +1,800 @@
+"""Local Monzo API emulator, usable as an ASGI or WSGI app."""
+
+import json
+import math
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Iterable, MutableMapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import anyio
+import httpx
+
+from pymonzo.hooks.base import get_endpoint_template
+from pymonzo.testing.ledger import (
+    EmulatorError,
+    Ledger,
+    bad_param,
+    parse_datetime,
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+Handler = Callable[["EmulatorRequest"], Any]
+Response = tuple[int, list[tuple[str, str]], bytes]
+
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class Faults:
+    """Faults injected into emulated Monzo API responses.
+
+    Attributes:
+        latency: Number of seconds every response is delayed by.
+        latency_jitter: Mean number of seconds of (exponentially distributed)
+            extra latency, which gives the latency distribution a long tail.
+        error_rate: Fraction of requests that fail with one of
+            `error_status_codes`.
+        error_status_codes: HTTP status codes of injected errors.
+        rate_limit: Sustained number of requests per second allowed by the
+            emulated rate limiter (a token bucket). `None` disables it.
+        rate_limit_burst: Rate limiter bucket size.
+        throttle_rate: Fraction of requests that are (randomly) rejected with
+            HTTP 429, on top of the rate limiter.
+        retry_after: `Retry-After` header value (in seconds) sent with randomly
+            throttled requests. `None` omits the header.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status_codes: tuple[int, ...] = (500, 502, 503)
+    rate_limit: Optional[float] = None
+    rate_limit_burst: int = 10
+    throttle_rate: float = 0.0
+    retry_after: Optional[float] = 1.0
+
+
+@dataclass
+class EmulatorRequest:
+    """Request made to the emulated Monzo API.
+
+    Attributes:
+        method: HTTP method (upper case).
+        path: URL path.
+        params: URL query parameters.
+        data: Form encoded request body.
+        headers: Request headers (with lower case names).
+        path_params: Parameters captured from the URL path.
+    """
+
+    method: str
+    path: str
+    params: dict[str, str] = field(default_factory=dict)
+    data: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    path_params: list[str] = field(default_factory=list)
+
+    def require(self, name: str, *, source: Optional[dict[str, str]] = None) -> str:
+        """Return a required request parameter.
+
+        Arguments:
+            name: Parameter name.
+            source: Where to look for the parameter. Defaults to the request body
+                for requests with one, and to URL query parameters otherwise.
+
+        Returns:
+            Parameter value.
+
+        Raises:
+            EmulatorError: If the parameter is missing.
+        """
+        if source is None:
+            source = self.params if self.method in {"GET", "DELETE"} else self.data
+
+        value = source.get(name)
+        if not value:
+            raise EmulatorError(
+                400,
+                f"bad_request.missing_param.{name}",
+                f"Missing required parameter: {name}",
+            )
+
+        return value
+
+    def prefixed(self, prefix: str) -> dict[str, str]:
+        """Return request body parameters like `prefix[key]`, by key.
+
+        Arguments:
+            prefix: Parameter prefix (e.g. `metadata`).
+
+        Returns:
+            Matching parameters.
+        """
+        start = f"{prefix}["
+        return {
+            key[len(start) : -1]: value
+            for key, value in self.data.items()
+            if key.startswith(start) and key.endswith("]")
+        }
+
+
+def _json_response(status_code: int, content: Any) -> Response:
+    """Build JSON response.
+
+    Arguments:
+        status_code: HTTP status code.
+        content: Response content.
+
+    Returns:
+        HTTP status code, headers and body.
+    """
+    body = json.dumps(content, separators=(",", ":")).encode()
+    headers = [
+        ("content-type", "application/json"),
+        ("content-length", str(len(body))),
+    ]
+    return status_code, headers, body
+
+
+def _error_response(error: EmulatorError) -> Response:
+    """Build Monzo API error response.
+
+    Arguments:
+        error: Emulator error.
+
+    Returns:
+        HTTP status code, headers and body.
+    """
+    return _json_response(
+        error.status_code,
+        {"code": error.code, "message": error.message},
+    )
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI server handling every request in a separate thread."""
+
+    daemon_threads = True
+
+
+class _QuietWSGIRequestHandler(WSGIRequestHandler):
+    """WSGI request handler that doesn't log requests."""
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Don't log requests."""
+
+
+class MonzoEmulator:
+    """Local Monzo API emulator.
+
+    It implements the Monzo API endpoints used by pymonzo resources (including
+    OAuth token refresh) on top of a stateful [`pymonzo.testing.Ledger`][], and
+    injects configurable latency, errors and rate limiting, which makes it
+    possible to load test Monzo API integrations locally.
+
+    It can be used in-process, via [`pymonzo.testing.MonzoEmulator.transport`][]
+    (and its async counterpart), or served over HTTP as an ASGI
+    ([`pymonzo.testing.MonzoEmulator.asgi`][]) or WSGI
+    ([`pymonzo.testing.MonzoEmulator.wsgi`][]) app.
+
+    Attributes:
+        ledger: Emulated Monzo ledger.
+        faults: Injected faults.
+        client_id: OAuth client ID.
+        client_secret: OAuth client secret. If set, token requests need to use it.
+        access_tokens: Accepted access tokens (on top of the ones issued by the
+            emulator). `None` accepts any access token.
+        token_lifetime: Number of seconds the issued access tokens are valid for.
+        requests: Number of handled requests, by HTTP method, endpoint template
+            and response status code.
+    """
+
+    def __init__(
+        self,
+        ledger: Optional[Ledger] = None,
+        *,
+        faults: Optional[Faults] = None,
+        seed: int = 0,
+        client_id: str = "oauth2client_00009EMULATOR",
+        client_secret: Optional[str] = None,
+        access_tokens: Optional[Iterable[str]] = None,
+        token_lifetime: int = 21600,
+    ) -> None:
+        """Initialize the emulator.
+
+        Arguments:
+            ledger: Emulated Monzo ledger. Defaults to one generated with `seed`.
+            faults: Injected faults. Defaults to none.
+            seed: Random number generator seed, used for generating the ledger
+                and injecting faults.
+            client_id: OAuth client ID.
+            client_secret: OAuth client secret. If set, token requests need to
+                use it.
+            access_tokens: Accepted access tokens (on top of the ones issued by
+                the emulator). `None` accepts any access token.
+            token_lifetime: Number of seconds the issued access tokens are valid
+                for.
+        """
+        self.ledger = ledger if ledger is not None else Ledger.generate(seed)
+        self.faults = faults or Faults()
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.access_tokens = set(access_tokens) if access_tokens is not None else None
+        self.token_lifetime = token_lifetime
+        self.requests: Counter[tuple[str, str, int]] = Counter()
+
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._issued_tokens: dict[str, float] = {}
+        self._refresh_tokens: set[str] = set()
+        self._bucket_tokens = float(self.faults.rate_limit_burst)
+        self._bucket_updated = time.monotonic()
+
+        self._routes: list[tuple[str, str, Handler]] = [
+            ("GET", "/ping/whoami", self._whoami),
+            ("POST", "/oauth2/token", self._token),
+            ("GET", "/accounts", self._list_accounts),
+            ("GET", "/balance", self._get_balance),
+            ("GET", "/pots", self._list_pots),
+            ("PUT", "/pots/{id}/deposit", self._deposit),
+            ("PUT", "/pots/{id}/withdraw", self._withdraw),
+            ("GET", "/transactions", self._list_transactions),
+            ("GET", "/transactions/{id}", self._get_transaction),
+            ("PATCH", "/transactions/{id}", self._annotate_transaction),
+            ("GET", "/webhooks", self._list_webhooks),
+            ("POST", "/webhooks", self._register_webhook),
+            ("DELETE", "/webhooks/{id}", self._delete_webhook),
+            ("POST", "/feed", self._create_feed_item),
+            ("POST", "/attachment/upload", self._upload_attachment),
+            ("POST", "/attachment/register", self._register_attachment),
+            ("POST", "/attachment/deregister", self._deregister_attachment),
+        ]
+
+    def transport(self) -> httpx.WSGITransport:
+        """Return `httpx` transport that sends requests to the emulator in-process.
+
+        Returns:
+            `httpx` WSGI transport, for use with `MonzoAPI(transport=...)`.
+        """
+        return httpx.WSGITransport(app=self.wsgi)
+
+    def async_transport(self) -> httpx.ASGITransport:
+        """Return async `httpx` transport that sends requests to the emulator.
+
+        Returns:
+            `httpx` ASGI transport, for use with `AsyncMonzoAPI(transport=...)`.
+        """
+        return httpx.ASGITransport(app=self.asgi)
+
+    def make_server(self, host: str = "127.0.0.1", port: int = 0) -> WSGIServer:
+        """Return (multithreaded) HTTP server serving the emulator.
+
+        For higher concurrency, serve [`pymonzo.testing.MonzoEmulator.asgi`][]
+        with an ASGI server (e.g. `uvicorn`) instead.
+
+        Arguments:
+            host: Host to bind to.
+            port: Port to bind to. `0` picks a random free port.
+
+        Returns:
+            WSGI server. Start it with `serve_forever()`.
+        """
+        return make_server(
+            host,
+            port,
+            self.wsgi,
+            server_class=_ThreadingWSGIServer,
+            handler_class=_QuietWSGIRequestHandler,
+        )
+
+    def issue_token(self) -> dict[str, Any]:
+        """Issue OAuth access and refresh tokens.
+
+        Returns:
+            OAuth token.
+        """
+        access_token = secrets.token_urlsafe(32)
+        refresh_token = secrets.token_urlsafe(32)
+
+        with self._lock:
+            self._issued_tokens[access_token] = time.time() + self.token_lifetime
+            self._refresh_tokens.add(refresh_token)
+
+        return {
+            "access_token": access_token,
+            "client_id": self.client_id,
+            "expires_in": self.token_lifetime,
+            "refresh_token": refresh_token,
+            "token_type": "Bearer",
+            "user_id": self.ledger.user_id,
+        }
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: bytes = b"",
+        body: bytes = b"",
+        headers: Optional[dict[str, str]] = None,
+    ) -> Response:
+        """Handle a request, without injecting any faults.
+
+        Arguments:
+            method: HTTP method.
+            path: URL path.
+            query: URL query string.
+            body: Request body.
+            headers: Request headers (with lower case names).
+
+        Returns:
+            HTTP status code, headers and body.
+        """
+        request = EmulatorRequest(
+            method=method.upper(),
+            path=path.rstrip("/") or "/",
+            params=dict(parse_qsl(query.decode("latin-1"))),
+            data=dict(parse_qsl(body.decode(), keep_blank_values=True)),
+            headers=headers or {},
+        )
+
+        try:
+            handler = self._route(request)
+            if handler != self._token:
+                self._authenticate(request)
+            response = _json_response(200, handler(request))
+        except EmulatorError as e:
+            response = _error_response(e)
+
+        self._count(request.method, request.path, response[0])
+
+        return response
+
+    async def asgi(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI app entrypoint.
+
+        Arguments:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        delay, response = self._inject_faults(scope["method"], scope["path"])
+        if delay:
+            await anyio.sleep(delay)
+
+        if response is None:
+            headers = {
+                name.decode("latin-1").lower(): value.decode("latin-1")
+                for name, value in scope["headers"]
+            }
+            response = self.handle(
+                scope["method"],
+                scope["path"],
+                query=scope["query_string"],
+                body=body,
+                headers=headers,
+            )
+
+        status_code, response_headers, content = response
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (name.encode(), value.encode()) for name, value in response_headers
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def wsgi(
+        self,
+        environ: dict[str, Any],
+        start_response: Callable[..., Any],
+    ) -> Iterable[bytes]:
+        """WSGI app entrypoint.
+
+        Arguments:
+            environ: WSGI environment.
+            start_response: WSGI response callable.
+
+        Returns:
+            Response body.
+        """
+        content_length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(content_length) if content_length else b""
+
+        delay, response = self._inject_faults(
+            environ["REQUEST_METHOD"],
+            environ["PATH_INFO"],
+        )
+        if delay:
+            time.sleep(delay)
+
+        if response is None:
+            headers = {
+                key[5:].replace("_", "-").lower(): value
+                for key, value in environ.items()
+                if key.startswith("HTTP_")
+            }
+            response = self.handle(
+                environ["REQUEST_METHOD"],
+                environ["PATH_INFO"],
+                query=environ.get("QUERY_STRING", "").encode("latin-1"),
+                body=body,
+                headers=headers,
+            )
+
+        status_code, response_headers, content = response
+        start_response(
+            f"{status_code} {HTTPStatus(status_code).phrase}", response_headers
+        )
+
+        return [content]
+
+    def _route(self, request: EmulatorRequest) -> Handler:
+        """Find request handler, and capture URL path parameters.
+
+        Arguments:
+            request: Emulator request.
+
+        Returns:
+            Request handler.
+
+        Raises:
+            EmulatorError: If there's no matching endpoint.
+        """
+        template = get_endpoint_template(request.path)
+        handlers = {
+            method: handler
+            for method, route, handler in self._routes
+            if route == template
+        }
+        if not handlers:
+            raise EmulatorError(
+                404, "not_found", f"Endpoint '{request.path}' not found"
+            )
+        if request.method not in handlers:
+            raise EmulatorError(
+                405,
+                "method_not_allowed",
+                f"Method '{request.method}' not allowed",
+            )
+
+        request.path_params = [
+            part
+            for part, template_part in zip(
+                request.path.split("/"),
+                template.split("/"),
+            )
+            if template_part == "{id}"
+        ]
+
+        return handlers[request.method]
+
+    def _authenticate(self, request: EmulatorRequest) -> None:
+        """Check request access token.
+
+        Arguments:
+            request: Emulator request.
+
+        Raises:
+            EmulatorError: If the access token is missing, invalid or expired.
+        """
+        authorization = request.headers.get("authorization", "")
+        scheme, _, access_token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not access_token:
+            raise EmulatorError(
+                401,
+                "unauthorized.bad_access_token",
+                "Missing access token",
+            )
+
+        with self._lock:
+            expires_at = self._issued_tokens.get(access_token)
+
+        if expires_at is not None:
+            if expires_at < time.time():
+                raise EmulatorError(
+                    401,
+                    "unauthorized.bad_access_token.expired",
+                    "Access token has expired",
+                )
+        elif self.access_tokens is not None and access_token not in self.access_tokens:
+            raise EmulatorError(
+                401,
+                "unauthorized.bad_access_token",
+                "Invalid access token",
+            )
+
+    def _inject_faults(
+        self, method: str, path: str
+    ) -> tuple[float, Optional[Response]]:
+        """Decide what faults to inject into a request.
+
+        Arguments:
+            method: HTTP method.
+            path: URL path.
+
+        Returns:
+            Number of seconds to delay the response by and, if the request should
+            fail, the error response.
+        """
+        faults = self.faults
+
+        with self._lock:
+            delay = faults.latency
+            if faults.latency_jitter:
+                delay += self._random.expovariate(1 / faults.latency_jitter)
+
+            wait = self._take_rate_limit_token()
+            throttled = self._random.random() < faults.throttle_rate
+            failed = self._random.random() < faults.error_rate
+            error_status_code = self._random.choice(faults.error_status_codes)
+
+        response: Optional[Response] = None
+        if wait is not None or throttled:
+            response = _error_response(
+                EmulatorError(429, "too_many_requests", "Too many requests")
+            )
+            retry_after = wait if wait is not None else faults.retry_after
+            if retry_after is not None:
+                response[1].append(("retry-after", str(math.ceil(retry_after))))
+        elif failed:
+            response = _error_response(
+                EmulatorError(
+                    error_status_code,
+                    "internal_service",
+                    "Injected internal service error",
+                )
+            )
+
+        if response is not None:
+            self._count(method, path, response[0])
+
+        return delay, response
+
+    def _take_rate_limit_token(self) -> Optional[float]:
+        """Take a token from the rate limiter bucket. Must be called under lock.
+
+        Returns:
+            `None` if the request is allowed, or number of seconds until it will be.
+        """
+        rate_limit = self.faults.rate_limit
+        if rate_limit is None:
+            return None
+
+        now = time.monotonic()
+        self._bucket_tokens = min(
+            float(self.faults.rate_limit_burst),
+            self._bucket_tokens + (now - self._bucket_updated) * rate_limit,
+        )
+        self._bucket_updated = now
+
+        if self._bucket_tokens >= 1:
+            self._bucket_tokens -= 1
+            return None
+
+        return (1 - self._bucket_tokens) / rate_limit
+
+    def _count(self, method: str, path: str, status_code: int) -> None:
+        """Count handled request.
+
+        Arguments:
+            method: HTTP method.
+            path: URL path.
+            status_code: Response status code.
+        """
+        key = (method.upper(), get_endpoint_template(path), status_code)
+        with self._lock:
+            self.requests[key] += 1
+
+    def _whoami(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `GET /ping/whoami`."""
+        return {
+            "authenticated": True,
+            "client_id": self.client_id,
+            "user_id": self.ledger.user_id,
+        }
+
+    def _token(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `POST /oauth2/token`."""
+        client_id = request.require("client_id")
+        if client_id != self.client_id or (
+            self.client_secret is not None
+            and request.data.get("client_secret") != self.client_secret
+        ):
+            raise EmulatorError(
+                401,
+                "unauthorized.bad_client_credentials",
+                "Invalid client credentials",
+            )
+
+        grant_type = request.require("grant_type")
+        if grant_type == "refresh_token":
+            refresh_token = request.require("refresh_token")
+            with self._lock:
+                if refresh_token not in self._refresh_tokens:
+                    raise EmulatorError(
+                        401,
+                        "unauthorized.bad_refresh_token",
+                        "Invalid refresh token",
+                    )
+                # Refresh tokens are single use
+                self._refresh_tokens.remove(refresh_token)
+        elif grant_type == "authorization_code":
+            request.require("code")
+        else:
+            raise bad_param("grant_type", f"Unsupported grant type: {grant_type}")
+
+        return self.issue_token()
+
+    def _list_accounts(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `GET /accounts`."""
+        accounts = self.ledger.list_accounts(request.params.get("account_type"))
+        return {"accounts": accounts}
+
+    def _get_balance(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `GET /balance`."""
+        return self.ledger.get_balance(request.require("account_id"))
+
+    def _list_pots(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `GET /pots`."""
+        pots = self.ledger.list_pots(request.require("current_account_id"))
+        return {"pots": pots}
+
+    def _deposit(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `PUT /pots/{id}/deposit`."""
+        return self._move_money(request, "source_account_id", deposit=True)
+
+    def _withdraw(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `PUT /pots/{id}/withdraw`."""
+        return self._move_money(request, "destination_account_id", deposit=False)
+
+    def _move_money(
+        self,
+        request: EmulatorRequest,
+        account_param: str,
+        *,
+        deposit: bool,
+    ) -> dict[str, Any]:
+        """Handle pot deposits and withdrawals."""
+        amount = request.require("amount")
+        try:
+            amount_int = int(float(amount))
+        except ValueError:
+            raise bad_param("amount", f"Invalid amount: {amount}") from None
+
+        return self.ledger.move_money(
+            request.path_params[0],
+            request.require(account_param),
+            amount_int,
+            dedupe_id=request.require("dedupe_id"),
+            deposit=deposit,
+        )
+
+    def _list_transactions(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `GET /transactions`."""
+        before: Optional[datetime] = None
+        if "before" in request.params:
+            try:
+                before = parse_datetime(request.params["before"])
+            except ValueError:
+                raise bad_param("before", "Invalid datetime") from None
+
+        limit: Optional[int] = None
+        if "limit" in request.params:
+            try:
+                limit = int(request.params["limit"])
+            except ValueError:
+                limit = 0
+            if not 0 < limit <= MAX_PAGE_SIZE:
+                raise bad_param("limit", f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+
+        transactions = self.ledger.list_transactions(
+            request.require("account_id"),
+            since=request.params.get("since"),
+            before=before,
+            limit=limit,
+            expand_merchant=request.params.get("expand[]") == "merchant",
+        )
+        return {"transactions": transactions}
+
+    def _get_transaction(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `GET /transactions/{id}`."""
+        transaction = self.ledger.get_transaction(
+            request.path_params[0],
+            expand_merchant=request.params.get("expand[]") == "merchant",
+        )
+        return {"transaction": transaction}
+
+    def _annotate_transaction(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `PATCH /transactions/{id}`."""
+        transaction = self.ledger.annotate_transaction(
+            request.path_params[0],
+            request.prefixed("metadata"),
+        )
+        return {"transaction": transaction}
+
+    def _list_webhooks(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `GET /webhooks`."""
+        webhooks = self.ledger.list_webhooks(request.require("account_id"))
+        return {"webhooks": webhooks}
+
+    def _register_webhook(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `POST /webhooks`."""
+        webhook = self.ledger.register_webhook(
+            request.require("account_id"),
+            request.require("url"),
+        )
+        return {"webhook": webhook}
+
+    def _delete_webhook(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `DELETE /webhooks/{id}`."""
+        self.ledger.delete_webhook(request.path_params[0])
+        return {}
+
+    def _create_feed_item(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `POST /feed`."""
+        feed_item_type = request.require("type")
+        if feed_item_type != "basic":
+            raise bad_param("type", f"Unsupported feed item type: {feed_item_type}")
+
+        self.ledger.create_feed_item(
+            request.require("account_id"),
+            request.prefixed("params"),
+            url=request.data.get("url"),
+        )
+        return {}
+
+    def _upload_attachment(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `POST /attachment/upload`."""
+        request.require("content_length")
+        return self.ledger.upload_attachment(
+            request.require("file_name"),
+            request.require("file_type"),
+        )
+
+    def _register_attachment(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `POST /attachment/register`."""
+        attachment = self.ledger.register_attachment(
+            request.require("external_id"),
+            file_url=request.require("file_url"),
+            file_type=request.require("file_type"),
+        )
+        return {"attachment": attachment}
+
+    def _deregister_attachment(self, request: EmulatorRequest) -> dict[str, Any]:
+        """Handle `POST /attachment/deregister`."""
+        self.ledger.deregister_attachment(request.require("id"))
+        return {}
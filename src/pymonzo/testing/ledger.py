@@ -0,0 +1,985 @@
+"""Stateful in-memory Monzo ledger, with a seeded synthetic data generator."""
+
+import random
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from pymonzo.exceptions import PyMonzoError
+
+DEFAULT_CURRENCY = "GBP"
+INITIAL_TOP_UP = 100_000
+
+MERCHANTS = [
+    ("Tesco", "groceries", "🛒"),
+    ("Sainsbury's", "groceries", "🛒"),
+    ("Pret A Manger", "eating_out", "🥪"),
+    ("Dishoom", "eating_out", "🍛"),
+    ("Transport for London", "transport", "🚇"),
+    ("Trainline", "transport", "🚆"),
+    ("Amazon", "shopping", "📦"),
+    ("Uniqlo", "shopping", "👕"),
+    ("Spotify", "entertainment", "🎵"),
+    ("Odeon", "entertainment", "🎬"),
+    ("Thames Water", "bills", "🚰"),
+    ("Octopus Energy", "bills", "💡"),
+    ("Booking.com", "holidays", "🏨"),
+    ("Post Office", "cash", "💷"),
+]
+
+POT_NAMES = ["Savings", "Holiday", "Rainy day", "New laptop", "Bills", "Gifts"]
+
+
+class EmulatorError(PyMonzoError):
+    """Monzo API error returned by the emulator.
+
+    Attributes:
+        status_code: HTTP status code.
+        code: Monzo API error code.
+        message: Error message.
+    """
+
+    def __init__(self, status_code: int, code: str, message: str) -> None:
+        """Initialize the error.
+
+        Arguments:
+            status_code: HTTP status code.
+            code: Monzo API error code.
+            message: Error message.
+        """
+        super().__init__(message)
+
+        self.status_code = status_code
+        self.code = code
+        self.message = message
+
+
+def not_found(what: str, object_id: str) -> EmulatorError:
+    """Return 'not found' emulator error.
+
+    Arguments:
+        what: Name of the object type.
+        object_id: The ID of the object.
+
+    Returns:
+        Emulator error.
+    """
+    return EmulatorError(404, "not_found", f"{what} '{object_id}' not found")
+
+
+def bad_param(name: str, message: str) -> EmulatorError:
+    """Return 'bad parameter' emulator error.
+
+    Arguments:
+        name: Parameter name.
+        message: Error message.
+
+    Returns:
+        Emulator error.
+    """
+    return EmulatorError(400, f"bad_request.bad_param.{name}", message)
+
+
+def format_datetime(dt: datetime) -> str:
+    """Format datetime the way Monzo API does.
+
+    Arguments:
+        dt: Timezone aware datetime.
+
+    Returns:
+        Formatted datetime.
+    """
+    dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse RFC 3339 datetime passed in a Monzo API request.
+
+    Arguments:
+        value: Datetime to parse.
+
+    Returns:
+        Timezone aware datetime.
+
+    Raises:
+        ValueError: If passed value isn't a valid datetime.
+    """
+    if value.endswith(("Z", "z")):
+        value = f"{value[:-1]}+00:00"
+
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return dt
+
+
+def _utc_now() -> datetime:
+    """Return current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+class Ledger:
+    """Stateful in-memory Monzo ledger.
+
+    It keeps (Monzo API formatted) accounts, pots, transactions, webhooks and
+    attachments of a single user, and applies API operations to them: pot
+    deposits and withdrawals move money (and create transactions), annotations
+    update transaction metadata, etc.
+
+    All IDs are generated from a seeded random number generator, so the same
+    sequence of operations always results in the same data. It's thread safe.
+
+    Attributes:
+        random: Random number generator used for generating data.
+        clock: Callable returning current (timezone aware) time.
+        lock: Lock guarding the ledger state.
+        user_id: The ID of the user.
+        accounts: Accounts, by ID.
+        balances: Account balances, by account ID.
+        pots: Pots, by ID.
+        merchants: Merchants, by ID.
+        webhooks: Registered webhooks, by ID.
+        attachments: Registered attachments, by ID.
+        feed_items: Created feed items.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        *,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        """Initialize an empty ledger.
+
+        Arguments:
+            seed: Random number generator seed.
+            clock: Callable returning current (timezone aware) time.
+        """
+        self.random = random.Random(seed)  # noqa: S311
+        self.clock = clock
+        self.lock = threading.RLock()
+
+        self.user_id = self.new_id("user")
+        self.accounts: dict[str, dict[str, Any]] = {}
+        self.balances: dict[str, int] = {}
+        self.pots: dict[str, dict[str, Any]] = {}
+        self.merchants: dict[str, dict[str, Any]] = {}
+        self.webhooks: dict[str, dict[str, Any]] = {}
+        self.attachments: dict[str, dict[str, Any]] = {}
+        self.feed_items: list[dict[str, Any]] = []
+
+        # Transactions are kept per account, sorted by creation time (with their
+        # timestamps in a parallel list, for bisecting)
+        self._transactions: dict[str, list[dict[str, Any]]] = {}
+        self._timestamps: dict[str, list[float]] = {}
+        self._positions: dict[str, tuple[str, int]] = {}
+        self._pot_operations: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+        for name, category, emoji in MERCHANTS:
+            self.add_merchant(name, category=category, emoji=emoji)
+
+    @classmethod
+    def generate(
+        cls,
+        seed: int = 0,
+        *,
+        accounts: int = 1,
+        pots: int = 2,
+        transactions: int = 1000,
+        history: timedelta = timedelta(days=365),
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> "Ledger":
+        """Generate a ledger with synthetic data.
+
+        Every account starts with a top-up, followed by (mostly) card payments
+        and the occasional income, spread randomly over `history`. Payments that
+        would overdraw the account are declined.
+
+        Arguments:
+            seed: Random number generator seed.
+            accounts: Number of accounts.
+            pots: Number of pots per account.
+            transactions: Number of transactions per account.
+            history: How far back the transaction history goes.
+            clock: Callable returning current (timezone aware) time.
+
+        Returns:
+            Generated ledger.
+        """
+        ledger = cls(seed, clock=clock)
+        now = clock()
+
+        for _ in range(accounts):
+            account = ledger.add_account(created=now - history)
+            account_id = account["id"]
+
+            offsets = sorted(
+                ledger.random.uniform(0, history.total_seconds())
+                for _ in range(transactions)
+            )
+            for i, offset in enumerate(offsets):
+                created = now - history + timedelta(seconds=offset)
+                ledger._generate_transaction(account_id, created, first=i == 0)
+
+            for name in ledger.random.sample(POT_NAMES, min(pots, len(POT_NAMES))):
+                ledger.add_pot(account_id, name, balance=ledger.random.randint(0, 5000))
+
+        return ledger
+
+    def new_id(self, prefix: str) -> str:
+        """Generate Monzo API style object ID.
+
+        Arguments:
+            prefix: ID prefix (e.g. `tx` or `acc`).
+
+        Returns:
+            Object ID.
+        """
+        with self.lock:
+            return f"{prefix}_0000{self.random.getrandbits(72):018X}"
+
+    def add_account(
+        self,
+        *,
+        description: Optional[str] = None,
+        account_type: str = "uk_retail",
+        created: Optional[datetime] = None,
+    ) -> dict[str, Any]:
+        """Add an account.
+
+        Arguments:
+            description: Account description.
+            account_type: Account type.
+            created: Account creation date. Defaults to now.
+
+        Returns:
+            Added account.
+        """
+        with self.lock:
+            account_number = f"{self.random.randint(0, 99_999_999):08d}"
+            account: dict[str, Any] = {
+                "id": self.new_id("acc"),
+                "description": description or self.user_id,
+                "created": format_datetime(created or self.clock()),
+                "closed": False,
+                "type": account_type,
+                "currency": DEFAULT_CURRENCY,
+                "country_code": "GB",
+                "owners": [
+                    {
+                        "user_id": self.user_id,
+                        "preferred_name": "Jane Doe",
+                        "preferred_first_name": "Jane",
+                    }
+                ],
+                "account_number": account_number,
+                "sort_code": "040004",
+                "payment_details": {
+                    "locale_uk": {
+                        "account_number": account_number,
+                        "sort_code": "040004",
+                    }
+                },
+            }
+
+            self.accounts[account["id"]] = account
+            self.balances[account["id"]] = 0
+            self._transactions[account["id"]] = []
+            self._timestamps[account["id"]] = []
+
+        return account
+
+    def add_pot(
+        self,
+        account_id: str,
+        name: str,
+        *,
+        balance: int = 0,
+    ) -> dict[str, Any]:
+        """Add a pot to an account.
+
+        Arguments:
+            account_id: The ID of the account.
+            name: Pot name.
+            balance: Pot balance.
+
+        Returns:
+            Added pot.
+        """
+        with self.lock:
+            self.get_account(account_id)
+
+            created = format_datetime(self.clock())
+            pot: dict[str, Any] = {
+                "id": self.new_id("pot"),
+                "name": name,
+                "style": "",
+                "balance": balance,
+                "currency": DEFAULT_CURRENCY,
+                "created": created,
+                "updated": created,
+                "deleted": False,
+                "type": "flexible_savings",
+                "current_account_id": account_id,
+                "round_up": False,
+                "locked": False,
+            }
+            self.pots[pot["id"]] = pot
+
+        return pot
+
+    def add_merchant(
+        self,
+        name: str,
+        *,
+        category: str = "general",
+        emoji: str = "",
+    ) -> dict[str, Any]:
+        """Add a merchant.
+
+        Arguments:
+            name: Merchant name.
+            category: Merchant category.
+            emoji: Merchant emoji.
+
+        Returns:
+            Added merchant.
+        """
+        with self.lock:
+            merchant: dict[str, Any] = {
+                "id": self.new_id("merch"),
+                "group_id": self.new_id("grp"),
+                "name": name,
+                "logo": "",
+                "emoji": emoji,
+                "category": category,
+                "online": False,
+                "atm": category == "cash",
+                "address": {
+                    "address": "1 High Street",
+                    "city": "London",
+                    "country": "GBR",
+                    "latitude": 51.5074,
+                    "longitude": -0.1278,
+                    "postcode": "EC1A 1AA",
+                    "region": "Greater London",
+                    "formatted": "1 High Street, London EC1A 1AA",
+                    "short_formatted": "1 High Street, London EC1A 1AA",
+                },
+            }
+            self.merchants[merchant["id"]] = merchant
+
+        return merchant
+
+    def add_transaction(
+        self,
+        account_id: str,
+        amount: int,
+        *,
+        description: str = "",
+        merchant_id: Optional[str] = None,
+        category: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+        is_load: bool = False,
+        decline_reason: Optional[str] = None,
+        created: Optional[datetime] = None,
+    ) -> dict[str, Any]:
+        """Add a transaction and update the account balance.
+
+        Transactions are kept sorted by creation time, so ones created before the
+        latest account transaction are moved up to it.
+
+        Arguments:
+            account_id: The ID of the account.
+            amount: Transaction amount, in minor units of the currency.
+            description: Transaction description. Defaults to the merchant name.
+            merchant_id: The ID of the merchant.
+            category: Transaction category. Defaults to the merchant category.
+            metadata: Transaction metadata.
+            is_load: Whether the transaction is a top-up.
+            decline_reason: Decline reason. Declined transactions don't change
+                the account balance.
+            created: Transaction creation date. Defaults to now.
+
+        Returns:
+            Added transaction.
+
+        Raises:
+            EmulatorError: If the account or merchant doesn't exist.
+        """
+        with self.lock:
+            self.get_account(account_id)
+            merchant = self.merchants.get(merchant_id) if merchant_id else None
+            if merchant_id and merchant is None:
+                raise not_found("Merchant", merchant_id)
+
+            now = self.clock()
+            created = created or now
+            timestamps = self._timestamps[account_id]
+            if timestamps and created.timestamp() < timestamps[-1]:
+                created = datetime.fromtimestamp(timestamps[-1], timezone.utc)
+
+            settled = created + timedelta(days=1)
+            transaction: dict[str, Any] = {
+                "id": self.new_id("tx"),
+                "account_id": account_id,
+                "amount": amount,
+                "created": format_datetime(created),
+                "currency": DEFAULT_CURRENCY,
+                "description": description or (merchant["name"] if merchant else ""),
+                "merchant": merchant_id,
+                "metadata": dict(metadata or {}),
+                "notes": "",
+                "is_load": is_load,
+                "settled": (
+                    format_datetime(settled)
+                    if not decline_reason and settled <= now
+                    else ""
+                ),
+                "category": category or (merchant["category"] if merchant else None),
+                "counterparty": {},
+            }
+            if decline_reason:
+                transaction["decline_reason"] = decline_reason
+            else:
+                self.balances[account_id] += amount
+
+            transactions = self._transactions[account_id]
+            self._positions[transaction["id"]] = (account_id, len(transactions))
+            transactions.append(transaction)
+            timestamps.append(created.timestamp())
+
+        return transaction
+
+    def get_account(self, account_id: str) -> dict[str, Any]:
+        """Return an account.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            Account.
+
+        Raises:
+            EmulatorError: If the account doesn't exist.
+        """
+        try:
+            return self.accounts[account_id]
+        except KeyError:
+            raise not_found("Account", account_id) from None
+
+    def list_accounts(self, account_type: Optional[str] = None) -> list[dict[str, Any]]:
+        """Return a list of accounts.
+
+        Arguments:
+            account_type: Only return accounts of this type.
+
+        Returns:
+            List of accounts.
+        """
+        with self.lock:
+            return [
+                account
+                for account in self.accounts.values()
+                if not account_type or account["type"] == account_type
+            ]
+
+    def get_balance(self, account_id: str) -> dict[str, Any]:
+        """Return account balance.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            Account balance.
+
+        Raises:
+            EmulatorError: If the account doesn't exist.
+        """
+        with self.lock:
+            self.get_account(account_id)
+            balance = self.balances[account_id]
+            pots_balance = sum(
+                pot["balance"]
+                for pot in self.pots.values()
+                if pot["current_account_id"] == account_id and not pot["deleted"]
+            )
+
+            now = self.clock()
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            start = bisect_left(self._timestamps[account_id], midnight.timestamp())
+            spend_today = sum(
+                transaction["amount"]
+                for transaction in self._transactions[account_id][start:]
+                if transaction["amount"] < 0 and "decline_reason" not in transaction
+            )
+
+        return {
+            "balance": balance,
+            "total_balance": balance + pots_balance,
+            "balance_including_flexible_savings": balance + pots_balance,
+            "currency": DEFAULT_CURRENCY,
+            "spend_today": spend_today,
+            "local_currency": "",
+            "local_exchange_rate": 0,
+            "local_spend": [],
+        }
+
+    def get_pot(self, pot_id: str) -> dict[str, Any]:
+        """Return a pot.
+
+        Arguments:
+            pot_id: The ID of the pot.
+
+        Returns:
+            Pot.
+
+        Raises:
+            EmulatorError: If the pot doesn't exist.
+        """
+        try:
+            return self.pots[pot_id]
+        except KeyError:
+            raise not_found("Pot", pot_id) from None
+
+    def list_pots(self, account_id: str) -> list[dict[str, Any]]:
+        """Return a list of account pots.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            List of pots.
+
+        Raises:
+            EmulatorError: If the account doesn't exist.
+        """
+        with self.lock:
+            self.get_account(account_id)
+            return [
+                pot
+                for pot in self.pots.values()
+                if pot["current_account_id"] == account_id
+            ]
+
+    def move_money(
+        self,
+        pot_id: str,
+        account_id: str,
+        amount: int,
+        *,
+        dedupe_id: str,
+        deposit: bool,
+    ) -> dict[str, Any]:
+        """Deposit money into (or withdraw it from) a pot.
+
+        Repeated operations with the same `dedupe_id` are only applied once.
+
+        Arguments:
+            pot_id: The ID of the pot.
+            account_id: The ID of the source (or destination) account.
+            amount: The amount to move, in minor units of the currency.
+            dedupe_id: Unique string used to de-duplicate operations.
+            deposit: Whether to deposit (or withdraw) the money.
+
+        Returns:
+            Updated pot.
+
+        Raises:
+            EmulatorError: If the pot or account doesn't exist, or there aren't
+                enough funds.
+        """
+        operation = "deposit" if deposit else "withdraw"
+
+        with self.lock:
+            key = (pot_id, operation, dedupe_id)
+            if key in self._pot_operations:
+                return self._pot_operations[key]
+
+            pot = self.get_pot(pot_id)
+            self.get_account(account_id)
+            if pot["deleted"] or pot["current_account_id"] != account_id:
+                raise not_found("Pot", pot_id)
+            if amount <= 0:
+                raise bad_param("amount", "Amount must be positive")
+
+            available = self.balances[account_id] if deposit else pot["balance"]
+            if amount > available:
+                raise EmulatorError(
+                    400,
+                    "bad_request.insufficient_funds",
+                    "Insufficient funds",
+                )
+
+            pot = {
+                **pot,
+                "balance": pot["balance"] + (amount if deposit else -amount),
+                "updated": format_datetime(self.clock()),
+            }
+            self.pots[pot_id] = pot
+            self.add_transaction(
+                account_id,
+                -amount if deposit else amount,
+                description=pot_id,
+                category="savings",
+                metadata={"pot_id": pot_id, "trigger": "user"},
+            )
+            self._pot_operations[key] = pot
+
+        return pot
+
+    def get_transaction(
+        self,
+        transaction_id: str,
+        *,
+        expand_merchant: bool = False,
+    ) -> dict[str, Any]:
+        """Return a transaction.
+
+        Arguments:
+            transaction_id: The ID of the transaction.
+            expand_merchant: Whether to return expanded merchant information.
+
+        Returns:
+            Transaction.
+
+        Raises:
+            EmulatorError: If the transaction doesn't exist.
+        """
+        with self.lock:
+            try:
+                account_id, position = self._positions[transaction_id]
+            except KeyError:
+                raise not_found("Transaction", transaction_id) from None
+
+            transaction = self._transactions[account_id][position]
+            if expand_merchant:
+                transaction = self._expand_merchant(transaction)
+
+        return transaction
+
+    def list_transactions(
+        self,
+        account_id: str,
+        *,
+        since: Optional[str] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        expand_merchant: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Return a list of account transactions, oldest first.
+
+        Arguments:
+            account_id: The ID of the account.
+            since: Only return transactions created at or after this RFC 3339
+                datetime or, when it's a transaction ID, created after it.
+            before: Only return transactions created before this datetime.
+            limit: Maximum number of returned transactions.
+            expand_merchant: Whether to return expanded merchant information.
+
+        Returns:
+            List of transactions.
+
+        Raises:
+            EmulatorError: If the account (or `since` transaction) doesn't exist,
+                or `since` isn't a valid datetime.
+        """
+        with self.lock:
+            self.get_account(account_id)
+            transactions = self._transactions[account_id]
+            timestamps = self._timestamps[account_id]
+
+            start, end = 0, len(transactions)
+            if since and since.startswith("tx_"):
+                since_account_id, position = self._positions.get(since, ("", -1))
+                if since_account_id != account_id:
+                    raise not_found("Transaction", since)
+                start = position + 1
+            elif since:
+                try:
+                    since_dt = parse_datetime(since)
+                except ValueError:
+                    raise bad_param("since", f"Invalid datetime: {since}") from None
+                start = bisect_left(timestamps, since_dt.timestamp())
+
+            if before:
+                end = bisect_left(timestamps, before.timestamp())
+            if limit:
+                end = min(end, start + limit)
+
+            page = transactions[start:end]
+            if expand_merchant:
+                page = [self._expand_merchant(transaction) for transaction in page]
+
+        return page
+
+    def annotate_transaction(
+        self,
+        transaction_id: str,
+        metadata: dict[str, str],
+    ) -> dict[str, Any]:
+        """Update transaction metadata.
+
+        Arguments:
+            transaction_id: The ID of the transaction.
+            metadata: Metadata keys to update. Keys with empty values are deleted.
+
+        Returns:
+            Updated transaction.
+
+        Raises:
+            EmulatorError: If the transaction doesn't exist.
+        """
+        with self.lock:
+            transaction = self.get_transaction(transaction_id)
+            account_id, position = self._positions[transaction_id]
+
+            updated_metadata = {**transaction["metadata"], **metadata}
+            # Stored transactions are never mutated in place, so they can be
+            # safely returned (and serialized) outside the lock
+            transaction = {
+                **transaction,
+                "metadata": {
+                    key: value for key, value in updated_metadata.items() if value
+                },
+            }
+            self._transactions[account_id][position] = transaction
+
+        return transaction
+
+    def webhook_event(self, transaction_id: str) -> dict[str, Any]:
+        """Return `transaction.created` webhook event payload of a transaction.
+
+        Arguments:
+            transaction_id: The ID of the transaction.
+
+        Returns:
+            Webhook event payload.
+
+        Raises:
+            EmulatorError: If the transaction doesn't exist.
+        """
+        transaction = self.get_transaction(transaction_id, expand_merchant=True)
+        return {"type": "transaction.created", "data": transaction}
+
+    def list_webhooks(self, account_id: str) -> list[dict[str, Any]]:
+        """Return a list of webhooks registered for an account.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            List of webhooks.
+
+        Raises:
+            EmulatorError: If the account doesn't exist.
+        """
+        with self.lock:
+            self.get_account(account_id)
+            return [
+                webhook
+                for webhook in self.webhooks.values()
+                if webhook["account_id"] == account_id
+            ]
+
+    def register_webhook(self, account_id: str, url: str) -> dict[str, Any]:
+        """Register a webhook.
+
+        Arguments:
+            account_id: The ID of the account.
+            url: Webhook URL.
+
+        Returns:
+            Registered webhook.
+
+        Raises:
+            EmulatorError: If the account doesn't exist.
+        """
+        with self.lock:
+            self.get_account(account_id)
+            webhook = {
+                "id": self.new_id("webhook"),
+                "account_id": account_id,
+                "url": url,
+            }
+            self.webhooks[webhook["id"]] = webhook
+
+        return webhook
+
+    def delete_webhook(self, webhook_id: str) -> None:
+        """Delete a webhook.
+
+        Arguments:
+            webhook_id: The ID of the webhook.
+
+        Raises:
+            EmulatorError: If the webhook doesn't exist.
+        """
+        with self.lock:
+            if self.webhooks.pop(webhook_id, None) is None:
+                raise not_found("Webhook", webhook_id)
+
+    def create_feed_item(
+        self,
+        account_id: str,
+        params: dict[str, str],
+        *,
+        url: Optional[str] = None,
+    ) -> None:
+        """Create a (basic) feed item.
+
+        Arguments:
+            account_id: The ID of the account.
+            params: Feed item parameters.
+            url: URL opened when the feed item is tapped.
+
+        Raises:
+            EmulatorError: If the account doesn't exist or a required parameter
+                is missing.
+        """
+        for name in ("title", "image_url"):
+            if not params.get(name):
+                raise EmulatorError(
+                    400,
+                    f"bad_request.missing_param.params[{name}]",
+                    f"Missing required parameter: params[{name}]",
+                )
+
+        with self.lock:
+            self.get_account(account_id)
+            self.feed_items.append(
+                {
+                    "account_id": account_id,
+                    "type": "basic",
+                    "params": params,
+                    "url": url,
+                }
+            )
+
+    def upload_attachment(self, file_name: str, file_type: str) -> dict[str, Any]:
+        """Return attachment upload URLs.
+
+        Arguments:
+            file_name: The name of the file to be uploaded.
+            file_type: The content type of the file.
+
+        Returns:
+            Attachment upload response.
+        """
+        file_id = self.new_id("file")
+        return {
+            "file_url": f"https://attachments.monzo.test/{self.user_id}/{file_id}/"
+            f"{file_name}",
+            "upload_url": f"https://upload.monzo.test/{file_id}?type={file_type}",
+        }
+
+    def register_attachment(
+        self,
+        transaction_id: str,
+        *,
+        file_url: str,
+        file_type: str,
+    ) -> dict[str, Any]:
+        """Register an attachment.
+
+        Arguments:
+            transaction_id: The ID of the transaction.
+            file_url: The URL of the uploaded attachment.
+            file_type: The content type of the attachment.
+
+        Returns:
+            Registered attachment.
+
+        Raises:
+            EmulatorError: If the transaction doesn't exist.
+        """
+        with self.lock:
+            self.get_transaction(transaction_id)
+            attachment: dict[str, Any] = {
+                "id": self.new_id("attach"),
+                "user_id": self.user_id,
+                "external_id": transaction_id,
+                "file_url": file_url,
+                "file_type": file_type,
+                "created": format_datetime(self.clock()),
+            }
+            self.attachments[attachment["id"]] = attachment
+
+        return attachment
+
+    def deregister_attachment(self, attachment_id: str) -> None:
+        """Deregister an attachment.
+
+        Arguments:
+            attachment_id: The ID of the attachment.
+
+        Raises:
+            EmulatorError: If the attachment doesn't exist.
+        """
+        with self.lock:
+            if self.attachments.pop(attachment_id, None) is None:
+                raise not_found("Attachment", attachment_id)
+
+    def _generate_transaction(
+        self,
+        account_id: str,
+        created: datetime,
+        *,
+        first: bool = False,
+    ) -> None:
+        """Add a synthetic transaction.
+
+        Arguments:
+            account_id: The ID of the account.
+            created: Transaction creation date.
+            first: Whether it's the first account transaction (a top-up).
+        """
+        if first:
+            self.add_transaction(
+                account_id,
+                INITIAL_TOP_UP,
+                description="Top up",
+                category="mondo",
+                is_load=True,
+                created=created,
+            )
+        elif self.random.random() < 0.05:
+            self.add_transaction(
+                account_id,
+                self.random.randint(50_000, 100_000),
+                description="ACME LTD",
+                category="income",
+                created=created,
+            )
+        else:
+            amount = self.random.randint(100, 10_000)
+            merchant_id = self.random.choice(list(self.merchants))
+            decline_reason = (
+                "INSUFFICIENT_FUNDS" if amount > self.balances[account_id] else None
+            )
+            self.add_transaction(
+                account_id,
+                -amount,
+                merchant_id=merchant_id,
+                decline_reason=decline_reason,
+                created=created,
+            )
+
+    def _expand_merchant(self, transaction: dict[str, Any]) -> dict[str, Any]:
+        """Return transaction with expanded merchant information.
+
+        Arguments:
+            transaction: Transaction.
+
+        Returns:
+            Transaction copy with expanded merchant information.
+        """
+        merchant_id = transaction["merchant"]
+        if not merchant_id:
+            return transaction
+
+        return {**transaction, "merchant": self.merchants[merchant_id]}
@@ -4,8 +4,10 @@ Note:
     Monzo API docs: https://docs.monzo.com/#transactions
 """
 
+from .annotate import AnnotateReport  # noqa
 from .enums import MonzoTransactionCategory, MonzoTransactionDeclineReason  # noqa
-from .resources import TransactionsResource  # noqa
+from .frame import TransactionFrame  # noqa
+from .resources import AsyncTransactionsResource, TransactionsResource  # noqa
 from .schemas import (  # noqa
     MonzoTransaction,
     MonzoTransactionCounterparty,
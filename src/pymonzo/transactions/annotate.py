@@ -0,0 +1,100 @@
+"""pymonzo batch transaction annotation related code.
+
+Annotating transactions one at a time sends every passed metadata key, even
+when the transaction already has it. Batch annotation compares the wanted
+metadata with the already known one, skips no-op patches and only sends the
+changed keys.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Union
+
+from pymonzo.transactions.schemas import MonzoTransaction
+
+AnnotationUpdate = tuple[Union[MonzoTransaction, str], Mapping[str, str]]
+
+
+@dataclass
+class AnnotateReport:
+    """Batch transaction annotation report.
+
+    Attributes:
+        annotated: Annotated transactions, keyed by transaction ID.
+        skipped: The IDs of transactions that already had the wanted metadata.
+        errors: Exceptions raised while annotating transactions, keyed by
+            transaction ID.
+    """
+
+    annotated: dict[str, MonzoTransaction] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether all transactions were annotated."""
+        return not self.errors
+
+
+def diff_metadata(
+    current: Mapping[str, str],
+    wanted: Mapping[str, str],
+) -> dict[str, str]:
+    """Return metadata keys that need to be changed.
+
+    Missing keys are treated as empty, so deleting (setting to an empty string)
+    an already missing key is a no-op.
+
+    Arguments:
+        current: Current transaction metadata.
+        wanted: Wanted transaction metadata. Other keys are left as they are.
+
+    Returns:
+        Changed metadata keys and their wanted values.
+    """
+    return {
+        key: value for key, value in wanted.items() if current.get(key, "") != value
+    }
+
+
+def plan_annotations(
+    updates: Iterable[AnnotationUpdate],
+) -> tuple[dict[str, dict[str, str]], list[str]]:
+    """Compute metadata patches of passed annotation updates.
+
+    Updates of the same transaction are merged (later ones win). Transactions
+    passed by ID have no known metadata, so all their wanted keys are sent.
+
+    Arguments:
+        updates: Transactions (or transaction IDs) and their wanted metadata.
+
+    Returns:
+        Metadata patches, keyed by transaction ID, and the IDs of transactions
+        that don't need to be patched.
+    """
+    known: dict[str, Mapping[str, str]] = {}
+    wanted: dict[str, dict[str, str]] = {}
+
+    for transaction, metadata in updates:
+        if isinstance(transaction, MonzoTransaction):
+            transaction_id = transaction.id
+            known.setdefault(transaction_id, transaction.metadata)
+        else:
+            transaction_id = transaction
+
+        wanted.setdefault(transaction_id, {}).update(metadata)
+
+    patches: dict[str, dict[str, str]] = {}
+    skipped: list[str] = []
+    for transaction_id, metadata in wanted.items():
+        if transaction_id in known:
+            patch = diff_metadata(known[transaction_id], metadata)
+        else:
+            patch = metadata
+
+        if patch:
+            patches[transaction_id] = patch
+        else:
+            skipped.append(transaction_id)
+
+    return patches, skipped
@@ -0,0 +1,642 @@
+"""Columnar container for Monzo API transactions."""
+
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Union
+
+from pymonzo.parsing import loads, parse_datetime
+from pymonzo.transactions.schemas import MonzoTransaction
+
+# Optional `numpy` support
+try:
+    import numpy as np
+except ImportError:
+    NUMPY_AVAILABLE = False
+else:
+    NUMPY_AVAILABLE = True
+
+# Used in timestamp columns in place of `None`
+NULL_TIMESTAMP = -(2**63)
+
+# Transaction fields that are only stored in their own columns. Dates are kept in
+# the serialized rows as well, so they're recreated exactly as they were returned
+COLUMNS = ("id", "amount", "category", "currency", "description")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_timestamp(value: Union[datetime, str, None]) -> int:
+    """Convert datetime (or RFC 3339 string) to epoch microseconds.
+
+    Naive datetimes are treated as UTC.
+
+    Arguments:
+        value: Datetime or RFC 3339 string.
+
+    Returns:
+        Number of microseconds since epoch, or `NULL_TIMESTAMP` if the value
+        is empty.
+    """
+    dt = parse_datetime(value)
+    if dt is None:
+        return NULL_TIMESTAMP
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_timestamp(value: int) -> Optional[datetime]:
+    """Convert epoch microseconds to (timezone aware) datetime.
+
+    Arguments:
+        value: Number of microseconds since epoch.
+
+    Returns:
+        Datetime, or `None` if the value is `NULL_TIMESTAMP`.
+    """
+    if value == NULL_TIMESTAMP:
+        return None
+
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _as_indices(indices: Iterable[int]) -> Any:
+    """Return passed indices as an `int64` array (or a list, without `numpy`).
+
+    Arguments:
+        indices: Row indices.
+
+    Returns:
+        Row indices, which can be iterated over more than once.
+    """
+    if NUMPY_AVAILABLE:
+        return np.asarray(indices, dtype=np.int64)
+
+    return list(indices)
+
+
+def _to_array(values: Any) -> array:
+    """Return a new `int64` array with passed `numpy` values.
+
+    Arguments:
+        values: `numpy` array.
+
+    Returns:
+        New array.
+    """
+    result = array("q")
+    result.frombytes(values.astype(np.int64).tobytes())
+
+    return result
+
+
+def _take(values: array, indices: Iterable[int]) -> array:
+    """Return a new `int64` array with values at passed indices.
+
+    Arguments:
+        values: Source array.
+        indices: Value indices.
+
+    Returns:
+        New array.
+    """
+    if NUMPY_AVAILABLE:
+        indices = np.asarray(indices, dtype=np.int64)
+        if not len(values) or not len(indices):
+            return array("q")
+
+        return _to_array(np.frombuffer(values, dtype=np.int64)[indices])
+
+    return array("q", (values[i] for i in indices))
+
+
+class StringColumn:
+    """Variable length strings stored in a single bytes buffer.
+
+    Attributes:
+        offsets: Start offset of each string (plus the end offset of the last one).
+        data: UTF-8 encoded strings.
+    """
+
+    __slots__ = ("offsets", "data")
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self.offsets = array("q", [0])
+        self.data = bytearray()
+
+    def __len__(self) -> int:
+        """Return the number of stored strings."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        """Return `i`-th string."""
+        return self.get_bytes(i).decode("utf-8")
+
+    def get_bytes(self, i: int) -> bytes:
+        """Return `i`-th string as (UTF-8 encoded) bytes.
+
+        Arguments:
+            i: String index.
+
+        Returns:
+            Encoded string.
+        """
+        if i < 0:
+            i += len(self)
+
+        return bytes(self.data[self.offsets[i] : self.offsets[i + 1]])
+
+    def append(self, value: Union[str, bytes]) -> None:
+        """Append a string to the column.
+
+        Arguments:
+            value: String (or UTF-8 encoded bytes) to append.
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+
+        self.data += value
+        self.offsets.append(len(self.data))
+
+    def take(self, indices: Iterable[int]) -> "StringColumn":
+        """Return a new column with strings at passed indices.
+
+        Arguments:
+            indices: String indices.
+
+        Returns:
+            New column.
+        """
+        column = StringColumn()
+
+        if NUMPY_AVAILABLE:
+            indices = np.asarray(indices, dtype=np.int64)
+            if not len(indices):
+                return column
+
+            offsets = np.frombuffer(self.offsets, dtype=np.int64)
+            starts = offsets[indices]
+            lengths = offsets[indices + 1] - starts
+            new_offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+            # Position of every taken byte in the source buffer
+            positions = np.arange(new_offsets[-1]) + np.repeat(
+                starts - new_offsets[:-1], lengths
+            )
+            data = np.frombuffer(self.data, dtype=np.uint8)[positions]
+
+            column.offsets = _to_array(new_offsets)
+            column.data = bytearray(data.tobytes())
+            return column
+
+        for i in indices:
+            column.append(self.get_bytes(i))
+
+        return column
+
+
+class DictionaryColumn:
+    """Dictionary encoded (low cardinality) strings.
+
+    Attributes:
+        codes: Index of each value in `values`.
+        values: Unique values.
+    """
+
+    __slots__ = ("codes", "values", "_index")
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self.codes = array("q")
+        self.values: list[Optional[str]] = []
+        self._index: dict[Optional[str], int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored values."""
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        """Return `i`-th value."""
+        return self.values[self.codes[i]]
+
+    def used_codes(self) -> list[int]:
+        """Return dictionary codes that are used by at least one value.
+
+        Frames created with `take` share the dictionary with the source frame, so
+        some of its values might not be used at all.
+
+        Returns:
+            Sorted dictionary codes.
+        """
+        if NUMPY_AVAILABLE:
+            counts = np.bincount(
+                np.frombuffer(self.codes, dtype=np.int64),
+                minlength=len(self.values),
+            )
+            return np.flatnonzero(counts).tolist()
+
+        return sorted(set(self.codes))
+
+    def get_code(self, value: Optional[str]) -> Optional[int]:
+        """Return dictionary code of passed value.
+
+        Arguments:
+            value: Value to look up.
+
+        Returns:
+            Dictionary code, or `None` if the value isn't present in the column.
+        """
+        return self._index.get(value)
+
+    def append(self, value: Optional[str]) -> None:
+        """Append a value to the column.
+
+        Arguments:
+            value: Value to append.
+        """
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._index[value] = code
+
+        self.codes.append(code)
+
+    def take(self, indices: Iterable[int]) -> "DictionaryColumn":
+        """Return a new column with values at passed indices.
+
+        Arguments:
+            indices: Value indices.
+
+        Returns:
+            New column (sharing the same dictionary).
+        """
+        column = DictionaryColumn()
+        column.values = list(self.values)
+        column._index = dict(self._index)
+        column.codes = _take(self.codes, indices)
+
+        return column
+
+
+class TransactionFrame:
+    """Columnar container for Monzo transactions.
+
+    It holds transactions in compact arrays instead of a list of `pydantic`
+    models, which takes a fraction of the memory and allows vectorised filtering,
+    grouping and summing (backed by `numpy`, if it's installed). Rows are turned
+    back into [`pymonzo.transactions.MonzoTransaction`][] objects only when
+    they're explicitly accessed, from the columns and the rest of the (serialized)
+    transaction fields.
+
+    Attributes:
+        id: Transaction IDs.
+        amount: Transaction amounts, in minor units of currency.
+        created: Creation dates, as microseconds since epoch.
+        settled: Settlement dates, as microseconds since epoch (or
+            `NULL_TIMESTAMP` if the transaction hasn't settled).
+        category: Dictionary encoded transaction categories.
+        currency: Dictionary encoded transaction currencies.
+        description: Transaction descriptions.
+    """
+
+    __slots__ = (
+        "id",
+        "amount",
+        "created",
+        "settled",
+        "category",
+        "currency",
+        "description",
+        "_rest",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty frame."""
+        self.id = StringColumn()
+        self.amount = array("q")
+        self.created = array("q")
+        self.settled = array("q")
+        self.category = DictionaryColumn()
+        self.currency = DictionaryColumn()
+        self.description = StringColumn()
+        # Serialized fields that don't have their own columns, used to lazily
+        # recreate `MonzoTransaction` objects
+        self._rest = StringColumn()
+
+    @classmethod
+    def from_json(cls, content: Union[str, bytes]) -> "TransactionFrame":
+        """Build a frame from raw `/transactions` API response.
+
+        Arguments:
+            content: `/transactions` API response body.
+
+        Returns:
+            Transaction frame.
+        """
+        frame = cls()
+        frame.extend_json(content)
+
+        return frame
+
+    @classmethod
+    def from_dicts(cls, transactions: Iterable[dict]) -> "TransactionFrame":
+        """Build a frame from (unvalidated) API transaction dicts.
+
+        Arguments:
+            transactions: API transaction dicts.
+
+        Returns:
+            Transaction frame.
+        """
+        frame = cls()
+        frame.extend_dicts(transactions)
+
+        return frame
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Iterable[MonzoTransaction],
+    ) -> "TransactionFrame":
+        """Build a frame from Monzo transactions.
+
+        Arguments:
+            transactions: Monzo transactions.
+
+        Returns:
+            Transaction frame.
+        """
+        frame = cls()
+        frame.extend_dicts(
+            transaction.model_dump(mode="json") for transaction in transactions
+        )
+
+        return frame
+
+    def __len__(self) -> int:
+        """Return the number of transactions."""
+        return len(self.amount)
+
+    def __getitem__(self, i: int) -> MonzoTransaction:
+        """Return `i`-th transaction."""
+        data = loads(self._rest.get_bytes(i))
+        data.update(
+            id=self.id[i],
+            amount=self.amount[i],
+            category=self.category[i],
+            currency=self.currency[i],
+            description=self.description[i],
+        )
+
+        return MonzoTransaction.model_validate(data)
+
+    def __iter__(self) -> Iterator[MonzoTransaction]:
+        """Lazily iterate over transactions."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def extend_json(self, content: Union[str, bytes]) -> None:
+        """Append transactions from raw `/transactions` API response.
+
+        Arguments:
+            content: `/transactions` API response body.
+        """
+        self.extend_dicts(loads(content)["transactions"])
+
+    def extend_dicts(self, transactions: Iterable[dict]) -> None:
+        """Append (unvalidated) API transaction dicts.
+
+        Arguments:
+            transactions: API transaction dicts.
+        """
+        for transaction in transactions:
+            self.id.append(transaction["id"])
+            self.amount.append(transaction["amount"])
+            self.created.append(to_timestamp(transaction["created"]))
+            self.settled.append(to_timestamp(transaction.get("settled")))
+            self.category.append(transaction.get("category"))
+            self.currency.append(transaction["currency"])
+            self.description.append(transaction["description"])
+            rest = {
+                key: value for key, value in transaction.items() if key not in COLUMNS
+            }
+            self._rest.append(json.dumps(rest, separators=(",", ":")))
+
+    def take(self, indices: Iterable[int]) -> "TransactionFrame":
+        """Return a new frame with transactions at passed indices.
+
+        Arguments:
+            indices: Transaction indices.
+
+        Returns:
+            New transaction frame.
+        """
+        indices = _as_indices(indices)
+
+        frame = TransactionFrame()
+        frame.id = self.id.take(indices)
+        frame.amount = _take(self.amount, indices)
+        frame.created = _take(self.created, indices)
+        frame.settled = _take(self.settled, indices)
+        frame.category = self.category.take(indices)
+        frame.currency = self.currency.take(indices)
+        frame.description = self.description.take(indices)
+        frame._rest = self._rest.take(indices)
+
+        return frame
+
+    def mask(
+        self,
+        *,
+        category: Optional[str] = None,
+        currency: Optional[str] = None,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        min_amount: Optional[int] = None,
+        max_amount: Optional[int] = None,
+        settled: Optional[bool] = None,
+    ) -> list[bool]:
+        """Return a boolean mask of transactions matching all passed conditions.
+
+        Arguments:
+            category: Transaction category.
+            currency: Transaction currency.
+            since: Minimum creation date (inclusive).
+            before: Maximum creation date (exclusive).
+            min_amount: Minimum amount (inclusive).
+            max_amount: Maximum amount (inclusive).
+            settled: Whether the transaction has settled.
+
+        Returns:
+            Boolean mask, with one value per transaction.
+        """
+        result = self._mask(
+            category=category,
+            currency=currency,
+            since=since,
+            before=before,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            settled=settled,
+        )
+
+        return result if isinstance(result, list) else result.tolist()
+
+    def filter(self, **conditions: Any) -> "TransactionFrame":
+        """Return a new frame with transactions matching all passed conditions.
+
+        Arguments:
+            **conditions: Filter conditions. For more information see
+                [`pymonzo.transactions.TransactionFrame.mask`][].
+
+        Returns:
+            New transaction frame.
+        """
+        result = self._mask(**conditions)
+
+        if isinstance(result, list):
+            return self.take([i for i, matches in enumerate(result) if matches])
+
+        return self.take(np.flatnonzero(result))
+
+    def _mask(
+        self,
+        *,
+        category: Optional[str] = None,
+        currency: Optional[str] = None,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        min_amount: Optional[int] = None,
+        max_amount: Optional[int] = None,
+        settled: Optional[bool] = None,
+    ) -> Any:
+        """Return a boolean mask of transactions matching all passed conditions.
+
+        It's a `numpy` array if `numpy` is available, and a list otherwise. For
+        more information see [`pymonzo.transactions.TransactionFrame.mask`][].
+        """
+        # Values not present in the dictionary (code `-1`) can't match anything
+        category_code = self.category.get_code(category) if category else None
+        if category and category_code is None:
+            category_code = -1
+        currency_code = self.currency.get_code(currency) if currency else None
+        if currency and currency_code is None:
+            currency_code = -1
+
+        since_ts = to_timestamp(since) if since else None
+        before_ts = to_timestamp(before) if before else None
+
+        if NUMPY_AVAILABLE:
+            return self._numpy_mask(
+                category_code,
+                currency_code,
+                since_ts,
+                before_ts,
+                min_amount,
+                max_amount,
+                settled,
+            )
+
+        return [
+            (category_code is None or category_code == self.category.codes[i])
+            and (currency_code is None or currency_code == self.currency.codes[i])
+            and (since_ts is None or self.created[i] >= since_ts)
+            and (before_ts is None or self.created[i] < before_ts)
+            and (min_amount is None or self.amount[i] >= min_amount)
+            and (max_amount is None or self.amount[i] <= max_amount)
+            and (settled is None or (self.settled[i] != NULL_TIMESTAMP) is settled)
+            for i in range(len(self))
+        ]
+
+    def _numpy_mask(
+        self,
+        category_code: Optional[int],
+        currency_code: Optional[int],
+        since_ts: Optional[int],
+        before_ts: Optional[int],
+        min_amount: Optional[int],
+        max_amount: Optional[int],
+        settled: Optional[bool],
+    ) -> Any:
+        """Return a `numpy` boolean mask of transactions matching all conditions.
+
+        Dictionary encoded values and dates are passed as codes and timestamps.
+        """
+        result = np.ones(len(self), dtype=bool)
+        amount = np.frombuffer(self.amount, dtype=np.int64)
+        created = np.frombuffer(self.created, dtype=np.int64)
+
+        if category_code is not None:
+            result &= np.frombuffer(self.category.codes, dtype=np.int64) == (
+                category_code
+            )
+        if currency_code is not None:
+            result &= np.frombuffer(self.currency.codes, dtype=np.int64) == (
+                currency_code
+            )
+        if since_ts is not None:
+            result &= created >= since_ts
+        if before_ts is not None:
+            result &= created < before_ts
+        if min_amount is not None:
+            result &= amount >= min_amount
+        if max_amount is not None:
+            result &= amount <= max_amount
+        if settled is not None:
+            is_settled = np.frombuffer(self.settled, dtype=np.int64) != NULL_TIMESTAMP
+            result &= is_settled if settled else ~is_settled
+
+        return result
+
+    def sum(self) -> int:
+        """Return the sum of all transaction amounts.
+
+        Returns:
+            Sum of transaction amounts, in minor units of currency.
+        """
+        if NUMPY_AVAILABLE:
+            return int(np.frombuffer(self.amount, dtype=np.int64).sum())
+
+        return sum(self.amount)
+
+    def sum_by(self, column: str) -> dict[Optional[str], int]:
+        """Return the sum of transaction amounts, grouped by passed column.
+
+        Arguments:
+            column: Dictionary encoded column name (`category` or `currency`).
+
+        Returns:
+            Sum of transaction amounts per column value.
+
+        Raises:
+            ValueError: When passed column can't be grouped by.
+        """
+        if column not in ("category", "currency"):
+            raise ValueError(f"Can't group by '{column}' column.")
+
+        dictionary_column: DictionaryColumn = getattr(self, column)
+
+        if NUMPY_AVAILABLE:
+            sums = np.zeros(len(dictionary_column.values), dtype=np.int64)
+            np.add.at(
+                sums,
+                np.frombuffer(dictionary_column.codes, dtype=np.int64),
+                np.frombuffer(self.amount, dtype=np.int64),
+            )
+            totals = sums.tolist()
+        else:
+            totals = [0] * len(dictionary_column.values)
+            for code, amount in zip(dictionary_column.codes, self.amount):
+                totals[code] += amount
+
+        return {
+            dictionary_column.values[code]: totals[code]
+            for code in dictionary_column.used_codes()
+        }
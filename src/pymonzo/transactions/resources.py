@@ -1,11 +1,101 @@
 """Monzo API 'transactions' resource."""
 
-from datetime import datetime
-from typing import Optional
-
-from pymonzo.resources import BaseResource
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime, timezone
+from functools import partial
+from typing import Literal, Optional, Union, overload
+
+from pymonzo.fanout import (
+    DEFAULT_MAX_CONCURRENCY,
+    AccountResults,
+    RateLimiter,
+    async_fan_out,
+    fan_out,
+)
+from pymonzo.parsing import TrustedRecord
+from pymonzo.resources import AsyncBaseResource, BaseResource
+from pymonzo.transactions.annotate import (
+    AnnotateReport,
+    AnnotationUpdate,
+    plan_annotations,
+)
+from pymonzo.transactions.frame import TransactionFrame
 from pymonzo.transactions.schemas import MonzoTransaction
 
+# Maximum number of transactions that Monzo API returns per page
+MAX_PAGE_SIZE = 100
+
+# `list` is shadowed by the resources `list()` methods in their class bodies
+_Transactions = list[MonzoTransaction]
+_TransactionRecords = list[TrustedRecord]
+
+
+def _list_params(
+    account_id: str,
+    *,
+    expand_merchant: bool = False,
+    since: Union[datetime, str, None] = None,
+    before: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> dict:
+    """Build 'list transactions' URL query parameters.
+
+    Arguments:
+        account_id: The ID of the account.
+        expand_merchant: Whether to return expanded merchant information.
+        since: Filter transactions by start time or transaction ID.
+        before: Filter transactions by end time.
+        limit: Limits the number of results per-page.
+
+    Returns:
+        URL query parameters.
+    """
+    params = {"account_id": account_id}
+
+    if expand_merchant:
+        params["expand[]"] = "merchant"
+
+    if isinstance(since, datetime):
+        params["since"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+    elif since:
+        params["since"] = since
+
+    if before:
+        params["before"] = before.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    if limit:
+        params["limit"] = str(limit)
+
+    return params
+
+
+def _is_before(
+    transaction: Union[MonzoTransaction, TrustedRecord],
+    before: Optional[datetime],
+) -> bool:
+    """Check whether transaction was created before passed datetime.
+
+    Naive datetimes are treated as UTC, the same way they're sent to the API.
+
+    Arguments:
+        transaction: Monzo transaction (or its trusted record).
+        before: Datetime to compare against.
+
+    Returns:
+        Whether transaction was created before passed datetime.
+    """
+    if before is None:
+        return True
+
+    if before.tzinfo is None:
+        before = before.replace(tzinfo=timezone.utc)
+
+    created = transaction.created
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+
+    return created < before
+
 
 class TransactionsResource(BaseResource):
     """Monzo API 'transactions' resource.
@@ -19,6 +109,7 @@ class TransactionsResource(BaseResource):
         transaction_id: str,
         *,
         expand_merchant: bool = False,
+        refresh: bool = False,
     ) -> MonzoTransaction:
         """Return single transaction.
 
@@ -28,6 +119,8 @@ class TransactionsResource(BaseResource):
         Arguments:
             transaction_id: The ID of the transaction.
             expand_merchant: Whether to return expanded merchant information.
+            refresh: Whether to skip the cached transaction, if the `transactions`
+                cache namespace is enabled.
 
         Returns:
             A Monzo transaction.
@@ -37,9 +130,14 @@ class TransactionsResource(BaseResource):
         if expand_merchant:
             params["expand[]"] = "merchant"
 
-        response = self._get_response(method="get", endpoint=endpoint, params=params)
-
-        transaction = MonzoTransaction(**response.json()["transaction"])
+        transaction = self._get_cached(
+            endpoint,
+            MonzoTransaction,
+            "transaction",
+            namespace="transactions",
+            params=params,
+            refresh=refresh,
+        )
 
         return transaction
 
@@ -47,6 +145,8 @@ class TransactionsResource(BaseResource):
         self,
         transaction_id: str,
         metadata: dict[str, str],
+        *,
+        retry: bool = False,
     ) -> MonzoTransaction:
         """Annotate transaction with extra metadata.
 
@@ -57,6 +157,8 @@ class TransactionsResource(BaseResource):
             transaction_id: The ID of the transaction.
             metadata: Include each key you would like to modify. To delete a key,
                 set its value to an empty string.
+            retry: Whether to retry rate limited and failed requests. Setting
+                metadata keys is idempotent, so it's safe to do.
 
         Returns:
             Annotated Monzo transaction.
@@ -64,21 +166,144 @@ class TransactionsResource(BaseResource):
         endpoint = f"/transactions/{transaction_id}"
         data = {f"metadata[{key}]": value for key, value in metadata.items()}
 
-        response = self._get_response(method="patch", endpoint=endpoint, data=data)
+        response = self._get_response(
+            method="patch",
+            endpoint=endpoint,
+            data=data,
+            idempotent=retry,
+        )
 
-        transaction = MonzoTransaction(**response.json()["transaction"])
+        transaction = self._parse_response(response, MonzoTransaction, "transaction")
+        self.client.cache.invalidate(endpoint)
 
         return transaction
 
+    def annotate_many(
+        self,
+        updates: Iterable[AnnotationUpdate],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ) -> AnnotateReport:
+        """Annotate many transactions concurrently, sending only changed metadata.
+
+        The wanted metadata is compared with the already known transaction
+        metadata, so transactions that already have it are skipped, and only the
+        changed keys are sent (see
+        [`pymonzo.transactions.annotate.plan_annotations`][]). Rate limited and
+        failed API calls are retried.
+
+        Arguments:
+            updates: Transactions (or transaction IDs, in which case all wanted
+                keys are sent) and their wanted metadata. To delete a key, set its
+                value to an empty string.
+            max_concurrency: Maximum number of concurrent API calls.
+            rate_limit: Maximum number of API calls per second.
+
+        Returns:
+            Annotation report. Errors are reported per transaction.
+        """
+        patches, skipped = plan_annotations(updates)
+        rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        def annotate(transaction_id: str) -> MonzoTransaction:
+            if rate_limiter:
+                rate_limiter.wait()
+            return self.annotate(transaction_id, patches[transaction_id], retry=True)
+
+        results = fan_out(annotate, patches, max_concurrency=max_concurrency)
+
+        return AnnotateReport(
+            annotated=dict(results),
+            skipped=skipped,
+            errors=results.errors,
+        )
+
+    def list_many(
+        self,
+        account_ids: Optional[Iterable[str]] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AccountResults[list[MonzoTransaction]]:
+        """Return lists of transactions of multiple accounts, concurrently.
+
+        Arguments:
+            account_ids: The IDs of the accounts. Defaults to all active accounts.
+            expand_merchant: Whether to return expanded merchant information.
+            since: Filter transactions by start time.
+            before: Filter transactions by end time.
+            limit: Limits the number of results per-page. Maximum: 100.
+            max_concurrency: Maximum number of concurrent API calls.
+
+        Returns:
+            Lists of Monzo transactions, keyed by account ID. Errors are reported
+            per account.
+        """
+        if account_ids is None:
+            account_ids = [account.id for account in self.client.accounts.list_active()]
+
+        return fan_out(
+            partial(
+                self.list,
+                expand_merchant=expand_merchant,
+                since=since,
+                before=before,
+                limit=limit,
+            ),
+            account_ids,
+            max_concurrency=max_concurrency,
+        )
+
+    @overload
+    def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        validate: Literal[True] = True,
+    ) -> _Transactions: ...
+
+    @overload
+    def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        validate: Literal[False],
+    ) -> _TransactionRecords: ...
+
+    @overload
+    def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        validate: bool = True,
+    ) -> Union[_Transactions, _TransactionRecords]: ...
+
     def list(
         self,
         account_id: Optional[str] = None,
         *,
         expand_merchant: bool = False,
-        since: Optional[datetime] = None,
+        since: Union[datetime, str, None] = None,
         before: Optional[datetime] = None,
         limit: Optional[int] = None,
-    ) -> list[MonzoTransaction]:
+        validate: bool = True,
+    ) -> Union[_Transactions, _TransactionRecords]:
         """Return a list of account transactions.
 
         You can only fetch all transactions within 5 minutes of authentication.
@@ -91,12 +316,16 @@ class TransactionsResource(BaseResource):
             account_id: The ID of the account. Can be omitted if user has only one
                 active account.
             expand_merchant: Whether to return expanded merchant information.
-            since: Filter transactions by start time.
+            since: Filter transactions by start time. Can also be a transaction ID,
+                in which case only transactions after it are returned.
             before: Filter transactions by end time.
             limit: Limits the number of results per-page. Maximum: 100.
+            validate: Whether to validate the API response. Disabling it is faster
+                for bulk reads of trusted data, which are then returned as
+                [`pymonzo.parsing.TrustedRecord`][] instances.
 
         Returns:
-            List of Monzo transactions.
+            List of Monzo transactions (or their trusted records).
 
         Raises:
             CannotDetermineDefaultAccount: If no account ID was passed and default
@@ -106,25 +335,595 @@ class TransactionsResource(BaseResource):
             account_id = self.client.accounts.get_default_account().id
 
         endpoint = "/transactions"
-        params = {"account_id": account_id}
+        params = _list_params(
+            account_id,
+            expand_merchant=expand_merchant,
+            since=since,
+            before=before,
+            limit=limit,
+        )
+
+        response = self._get_response(method="get", endpoint=endpoint, params=params)
+
+        transactions = self._parse_response(
+            response,
+            list[MonzoTransaction],
+            "transactions",
+            validate=validate,
+        )
+
+        return transactions
+
+    def list_frame(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> TransactionFrame:
+        """Return account transactions as a columnar transaction frame.
+
+        It takes the same arguments as
+        [`pymonzo.transactions.TransactionsResource.list`][], but the response is
+        loaded straight into a [`pymonzo.transactions.TransactionFrame`][],
+        without creating a `MonzoTransaction` object per transaction.
 
+        Note:
+            Monzo API docs: https://docs.monzo.com/#list-transactions
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            expand_merchant: Whether to return expanded merchant information.
+            since: Filter transactions by start time or transaction ID.
+            before: Filter transactions by end time.
+            limit: Limits the number of results per-page. Maximum: 100.
+
+        Returns:
+            Transaction frame.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = self.client.accounts.get_default_account().id
+
+        endpoint = "/transactions"
+        params = _list_params(
+            account_id,
+            expand_merchant=expand_merchant,
+            since=since,
+            before=before,
+            limit=limit,
+        )
+
+        response = self._get_response(method="get", endpoint=endpoint, params=params)
+
+        return TransactionFrame.from_json(response.content)
+
+    @overload
+    def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: Literal[True] = True,
+    ) -> Iterator[MonzoTransaction]: ...
+
+    @overload
+    def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: Literal[False],
+    ) -> Iterator[TrustedRecord]: ...
+
+    @overload
+    def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: bool = True,
+    ) -> Iterator[Union[MonzoTransaction, TrustedRecord]]: ...
+
+    def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: bool = True,
+    ) -> Iterator[Union[MonzoTransaction, TrustedRecord]]:
+        """Iterate over all account transactions, following the pagination cursor.
+
+        Transactions are fetched one page at a time (using the last transaction ID
+        as the `since` cursor for the next page), so memory usage stays flat
+        regardless of the account history length.
+
+        You can only fetch all transactions within 5 minutes of authentication.
+        After that, you can query your last 90 days.
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#pagination
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            expand_merchant: Whether to return expanded merchant information.
+            since: Filter transactions by start time or transaction ID.
+            before: Filter transactions by end time. Iteration stops as soon as
+                it's reached.
+            limit: Number of transactions fetched per page. Maximum: 100.
+            validate: Whether to validate the API responses. Disabling it is
+                faster for bulk reads of trusted data, which are then yielded as
+                [`pymonzo.parsing.TrustedRecord`][] instances.
+
+        Yields:
+            Monzo transactions (or their trusted records), oldest first.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+            ValueError: If the page limit is out of range.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page limit needs to be between 1 and {MAX_PAGE_SIZE}.")
+
+        if not account_id:
+            account_id = self.client.accounts.get_default_account().id
+
+        while True:
+            transactions = self.list(
+                account_id,
+                expand_merchant=expand_merchant,
+                since=since,
+                before=before,
+                limit=limit,
+                validate=validate,
+            )
+
+            for transaction in transactions:
+                if not _is_before(transaction, before):
+                    return
+
+                yield transaction
+
+            if not transactions or len(transactions) < limit:
+                return
+
+            since = transactions[-1].id
+
+
+class AsyncTransactionsResource(AsyncBaseResource):
+    """Monzo API 'transactions' async resource.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/#transactions
+    """
+
+    async def get(
+        self,
+        transaction_id: str,
+        *,
+        expand_merchant: bool = False,
+        refresh: bool = False,
+    ) -> MonzoTransaction:
+        """Return single transaction.
+
+        Async version of [`pymonzo.transactions.TransactionsResource.get`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#retrieve-transaction
+
+        Arguments:
+            transaction_id: The ID of the transaction.
+            expand_merchant: Whether to return expanded merchant information.
+            refresh: Whether to skip the cached transaction, if the `transactions`
+                cache namespace is enabled.
+
+        Returns:
+            A Monzo transaction.
+        """
+        endpoint = f"/transactions/{transaction_id}"
+        params = {}
         if expand_merchant:
             params["expand[]"] = "merchant"
 
-        if since:
-            params["since"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+        transaction = await self._get_cached(
+            endpoint,
+            MonzoTransaction,
+            "transaction",
+            namespace="transactions",
+            params=params,
+            refresh=refresh,
+        )
+
+        return transaction
+
+    async def annotate(
+        self,
+        transaction_id: str,
+        metadata: dict[str, str],
+        *,
+        retry: bool = False,
+    ) -> MonzoTransaction:
+        """Annotate transaction with extra metadata.
 
-        if before:
-            params["before"] = before.strftime("%Y-%m-%dT%H:%M:%SZ")
+        Async version of [`pymonzo.transactions.TransactionsResource.annotate`][].
 
-        if limit:
-            params["limit"] = str(limit)
+        Note:
+            Monzo API docs: https://docs.monzo.com/#annotate-transaction
 
-        response = self._get_response(method="get", endpoint=endpoint, params=params)
+        Arguments:
+            transaction_id: The ID of the transaction.
+            metadata: Include each key you would like to modify. To delete a key,
+                set its value to an empty string.
+            retry: Whether to retry rate limited and failed requests. Setting
+                metadata keys is idempotent, so it's safe to do.
+
+        Returns:
+            Annotated Monzo transaction.
+        """
+        endpoint = f"/transactions/{transaction_id}"
+        data = {f"metadata[{key}]": value for key, value in metadata.items()}
+
+        response = await self._get_response(
+            method="patch",
+            endpoint=endpoint,
+            data=data,
+            idempotent=retry,
+        )
+
+        transaction = self._parse_response(response, MonzoTransaction, "transaction")
+        self.client.cache.invalidate(endpoint)
+
+        return transaction
+
+    async def annotate_many(
+        self,
+        updates: Iterable[AnnotationUpdate],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ) -> AnnotateReport:
+        """Annotate many transactions concurrently, sending only changed metadata.
+
+        Async version of
+        [`pymonzo.transactions.TransactionsResource.annotate_many`][].
+
+        Arguments:
+            updates: Transactions (or transaction IDs, in which case all wanted
+                keys are sent) and their wanted metadata. To delete a key, set its
+                value to an empty string.
+            max_concurrency: Maximum number of concurrent API calls.
+            rate_limit: Maximum number of API calls per second.
+
+        Returns:
+            Annotation report. Errors are reported per transaction.
+        """
+        patches, skipped = plan_annotations(updates)
+        rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        async def annotate(transaction_id: str) -> MonzoTransaction:
+            if rate_limiter:
+                await rate_limiter.async_wait()
+            return await self.annotate(
+                transaction_id, patches[transaction_id], retry=True
+            )
+
+        results = await async_fan_out(
+            annotate,
+            patches,
+            max_concurrency=max_concurrency,
+        )
+
+        return AnnotateReport(
+            annotated=dict(results),
+            skipped=skipped,
+            errors=results.errors,
+        )
+
+    async def list_many(
+        self,
+        account_ids: Optional[Iterable[str]] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AccountResults[list[MonzoTransaction]]:
+        """Return lists of transactions of multiple accounts, concurrently.
+
+        Async version of
+        [`pymonzo.transactions.TransactionsResource.list_many`][].
+
+        Arguments:
+            account_ids: The IDs of the accounts. Defaults to all active accounts.
+            expand_merchant: Whether to return expanded merchant information.
+            since: Filter transactions by start time.
+            before: Filter transactions by end time.
+            limit: Limits the number of results per-page. Maximum: 100.
+            max_concurrency: Maximum number of concurrent API calls.
+
+        Returns:
+            Lists of Monzo transactions, keyed by account ID. Errors are reported
+            per account.
+        """
+        if account_ids is None:
+            accounts = await self.client.accounts.list_active()
+            account_ids = [account.id for account in accounts]
+
+        return await async_fan_out(
+            partial(
+                self.list,
+                expand_merchant=expand_merchant,
+                since=since,
+                before=before,
+                limit=limit,
+            ),
+            account_ids,
+            max_concurrency=max_concurrency,
+        )
+
+    @overload
+    async def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        validate: Literal[True] = True,
+    ) -> _Transactions: ...
+
+    @overload
+    async def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        validate: Literal[False],
+    ) -> _TransactionRecords: ...
+
+    @overload
+    async def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        validate: bool = True,
+    ) -> Union[_Transactions, _TransactionRecords]: ...
+
+    async def list(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        validate: bool = True,
+    ) -> Union[_Transactions, _TransactionRecords]:
+        """Return a list of account transactions.
+
+        Async version of [`pymonzo.transactions.TransactionsResource.list`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#list-transactions
 
-        transactions = [
-            MonzoTransaction(**transaction)
-            for transaction in response.json()["transactions"]
-        ]
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            expand_merchant: Whether to return expanded merchant information.
+            since: Filter transactions by start time. Can also be a transaction ID,
+                in which case only transactions after it are returned.
+            before: Filter transactions by end time.
+            limit: Limits the number of results per-page. Maximum: 100.
+            validate: Whether to validate the API response. Disabling it is faster
+                for bulk reads of trusted data, which are then returned as
+                [`pymonzo.parsing.TrustedRecord`][] instances.
+
+        Returns:
+            List of Monzo transactions (or their trusted records).
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        endpoint = "/transactions"
+        params = _list_params(
+            account_id,
+            expand_merchant=expand_merchant,
+            since=since,
+            before=before,
+            limit=limit,
+        )
+
+        response = await self._get_response(
+            method="get", endpoint=endpoint, params=params
+        )
+
+        transactions = self._parse_response(
+            response,
+            list[MonzoTransaction],
+            "transactions",
+            validate=validate,
+        )
 
         return transactions
+
+    async def list_frame(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> TransactionFrame:
+        """Return account transactions as a columnar transaction frame.
+
+        Async version of [`pymonzo.transactions.TransactionsResource.list_frame`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#list-transactions
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            expand_merchant: Whether to return expanded merchant information.
+            since: Filter transactions by start time or transaction ID.
+            before: Filter transactions by end time.
+            limit: Limits the number of results per-page. Maximum: 100.
+
+        Returns:
+            Transaction frame.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        endpoint = "/transactions"
+        params = _list_params(
+            account_id,
+            expand_merchant=expand_merchant,
+            since=since,
+            before=before,
+            limit=limit,
+        )
+
+        response = await self._get_response(
+            method="get", endpoint=endpoint, params=params
+        )
+
+        return TransactionFrame.from_json(response.content)
+
+    @overload
+    def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: Literal[True] = True,
+    ) -> AsyncIterator[MonzoTransaction]: ...
+
+    @overload
+    def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: Literal[False],
+    ) -> AsyncIterator[TrustedRecord]: ...
+
+    @overload
+    def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: bool = True,
+    ) -> AsyncIterator[Union[MonzoTransaction, TrustedRecord]]: ...
+
+    async def iter_all(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        expand_merchant: bool = False,
+        since: Union[datetime, str, None] = None,
+        before: Optional[datetime] = None,
+        limit: int = MAX_PAGE_SIZE,
+        validate: bool = True,
+    ) -> AsyncIterator[Union[MonzoTransaction, TrustedRecord]]:
+        """Iterate over all account transactions, following the pagination cursor.
+
+        Async version of [`pymonzo.transactions.TransactionsResource.iter_all`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#pagination
+
+        Arguments:
+            account_id: The ID of the account. Can be omitted if user has only one
+                active account.
+            expand_merchant: Whether to return expanded merchant information.
+            since: Filter transactions by start time or transaction ID.
+            before: Filter transactions by end time. Iteration stops as soon as
+                it's reached.
+            limit: Number of transactions fetched per page. Maximum: 100.
+            validate: Whether to validate the API responses. Disabling it is
+                faster for bulk reads of trusted data, which are then yielded as
+                [`pymonzo.parsing.TrustedRecord`][] instances.
+
+        Yields:
+            Monzo transactions (or their trusted records), oldest first.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+            ValueError: If the page limit is out of range.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page limit needs to be between 1 and {MAX_PAGE_SIZE}.")
+
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        while True:
+            transactions = await self.list(
+                account_id,
+                expand_merchant=expand_merchant,
+                since=since,
+                before=before,
+                limit=limit,
+                validate=validate,
+            )
+
+            for transaction in transactions:
+                if not _is_before(transaction, before):
+                    return
+
+                yield transaction
+
+            if not transactions or len(transactions) < limit:
+                return
+
+            since = transactions[-1].id
@@ -1,32 +1,20 @@
 """Monzo API 'transactions' related schemas."""
 
 from datetime import datetime
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from pymonzo.formatting import RICH_AVAILABLE, format_currency, format_datetime
 from pymonzo.transactions.enums import (
     MonzoTransactionCategory,
     MonzoTransactionDeclineReason,
 )
 from pymonzo.utils import empty_dict_to_none, empty_str_to_none
 
-# Optional `rich` support
-try:
+if TYPE_CHECKING:
     from rich.table import Table
 
-    # Optional `babel` support
-    try:
-        from babel.dates import format_datetime
-        from babel.numbers import format_currency
-    except ImportError:
-        from pymonzo.utils import format_currency, format_datetime  # type: ignore
-
-except ImportError:
-    RICH_AVAILABLE = False
-else:
-    RICH_AVAILABLE = True
-
 
 class MonzoTransactionMerchantAddress(BaseModel):
     """API schema for a 'transaction merchant address' object.
@@ -104,8 +92,10 @@ class MonzoTransactionMerchant(BaseModel):
 
     if RICH_AVAILABLE:
 
-        def __rich__(self) -> Table:
+        def __rich__(self) -> "Table":
             """Pretty printing support for `rich`."""
+            from rich.table import Table
+
             grid = Table.grid(padding=(0, 5))
             grid.title = f"{self.emoji} | {self.name}"
             grid.title_style = "bold yellow"
@@ -146,8 +136,10 @@ class MonzoTransactionCounterparty(BaseModel):
 
     if RICH_AVAILABLE:
 
-        def __rich__(self) -> Table:
+        def __rich__(self) -> "Table":
             """Pretty printing support for `rich`."""
+            from rich.table import Table
+
             grid = Table.grid(padding=(0, 5))
             grid.title = f"{self.name}"
             grid.title_style = "bold yellow"
@@ -237,8 +229,10 @@ class MonzoTransaction(BaseModel):
 
     if RICH_AVAILABLE:
 
-        def __rich__(self) -> Table:
+        def __rich__(self) -> "Table":
             """Pretty printing support for `rich`."""
+            from rich.table import Table
+
             amount = format_currency(self.amount / 100, self.currency)
             amount_color = "green" if self.amount > 0 else "red"
 
@@ -264,7 +258,8 @@ class MonzoTransaction(BaseModel):
             if self.decline_reason:
                 grid.add_row("Decline reason:", self.decline_reason)
             grid.add_row("Created:", format_datetime(self.created))
-            grid.add_row("Settled:", format_datetime(self.settled))
+            if self.settled:
+                grid.add_row("Settled:", format_datetime(self.settled))
             if isinstance(self.merchant, MonzoTransactionMerchant):
                 grid.add_row("Merchant:", self.merchant)
 
@@ -1,7 +1,7 @@
 """pymonzo utils."""
 
 import locale
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
 from wsgiref.simple_server import make_server
 from wsgiref.util import request_uri
@@ -21,6 +21,30 @@ def n_days_ago(n: int) -> datetime:
     return today - delta
 
 
+def utc_now() -> datetime:
+    """Return current (timezone aware) UTC time.
+
+    Returns:
+        Current UTC time.
+    """
+    return datetime.now(tz=timezone.utc)
+
+
+def as_utc(dt: datetime) -> datetime:
+    """Convert passed datetime to UTC. Naive datetimes are treated as UTC.
+
+    Arguments:
+        dt: Datetime.
+
+    Returns:
+        Timezone aware UTC datetime.
+    """
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+
+    return dt.astimezone(timezone.utc)
+
+
 def empty_str_to_none(v: Any) -> Any:
     """Return `None` passed value is an empty string, otherwise do nothing.
 
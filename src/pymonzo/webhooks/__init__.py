@@ -4,9 +4,13 @@ Note:
     Monzo API docs: https://docs.monzo.com/#webhooks
 """
 
-from .resources import WebhooksResource  # noqa
+from .bridge import WebhookStoreBridge  # noqa
+from .log import WebhookEventLog  # noqa
+from .resources import AsyncWebhooksResource, WebhooksResource  # noqa
 from .schemas import (  # noqa
     MonzoWebhook,
     MonzoWebhookEvent,
     MonzoWebhookTransactionEvent,
 )
+from .server import WebhookReceiver, WebhookReceiverStats  # noqa
+from .sync import WebhookChange, WebhookSyncReport  # noqa
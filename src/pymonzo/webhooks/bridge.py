@@ -0,0 +1,277 @@
+"""pymonzo webhook to transaction store bridge.
+
+Incoming webhook events are applied to a local
+[`pymonzo.store.TransactionStore`][] as they arrive, instead of polling
+`transactions.list` to keep it fresh. Webhooks aren't guaranteed to be delivered
+though (e.g. while the receiver is down, or when it rejects or fails to handle
+them), and they're only sent when transactions are created. A low-frequency
+reconciliation sweep therefore fetches the time windows the store isn't known
+to hold all transactions for, and a short trailing window of recent (and still
+pending) transactions, but not the rest of the already covered history.
+"""
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import TracebackType
+from typing import Callable, Optional
+
+from pymonzo.store import TransactionStore
+from pymonzo.transactions import MonzoTransaction
+from pymonzo.transactions.resources import MAX_PAGE_SIZE
+from pymonzo.utils import as_utc, utc_now
+from pymonzo.webhooks.schemas import MonzoWebhookEvent
+
+
+def event_to_transaction(event: MonzoWebhookEvent) -> MonzoTransaction:
+    """Convert `transaction.created` webhook event to a Monzo transaction.
+
+    Webhook events don't always include transaction metadata and notes, which
+    then default to empty values.
+
+    Arguments:
+        event: Webhook event.
+
+    Returns:
+        Monzo transaction.
+    """
+    data = event.data.model_dump()
+    data.setdefault("metadata", {})
+    data.setdefault("notes", "")
+
+    return MonzoTransaction.model_validate(data)
+
+
+@dataclass
+class ReconcileResult:
+    """Reconciliation sweep result.
+
+    Attributes:
+        windows: Fetched time windows (start inclusive, end exclusive), keyed by
+            account ID.
+        transactions: Number of fetched (inserted or updated) transactions.
+        errors: Exceptions raised while reconciling accounts, keyed by account ID.
+    """
+
+    windows: dict[str, list[tuple[datetime, datetime]]] = field(default_factory=dict)
+    transactions: int = 0
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+class WebhookStoreBridge:
+    """Apply webhook events to a local transaction store.
+
+    `handle()` upserts the event transaction and invalidates cached balances of
+    its account. It can be passed directly as a
+    [`pymonzo.webhooks.WebhookReceiver`][] handler.
+
+    Webhook events are never recorded in the store coverage, as some of them
+    might have been missed. Instead, `reconcile()` fetches the coverage gaps
+    from the last `lookback` period (up to `delivery_grace` ago), and
+    transactions created in the last `resweep` period or since the oldest
+    still pending transaction, so their settlement (and other updates) are
+    picked up. Only the fetched windows are recorded in the store coverage.
+    It can be run periodically in a background thread with `start()`, and the
+    bridge can be used as a context manager, which stops the thread on exit.
+
+    Attributes:
+        store: Local transaction store.
+        account_ids: The IDs of reconciled accounts. Defaults to all active
+            accounts.
+        delivery_grace: How long webhook delivery can take.
+        lookback: How far back the reconciliation sweep looks for gaps.
+        resweep: How far back the reconciliation sweep fetches transactions
+            again, even if they're already covered.
+        interval: Number of seconds between reconciliation sweeps.
+        on_error: Callback called when a reconciliation sweep fails.
+    """
+
+    def __init__(
+        self,
+        store: TransactionStore,
+        *,
+        account_ids: Optional[Iterable[str]] = None,
+        delivery_grace: timedelta = timedelta(minutes=5),
+        lookback: timedelta = timedelta(days=7),
+        resweep: timedelta = timedelta(days=1),
+        interval: float = 3600.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Initialize the bridge.
+
+        Arguments:
+            store: Local transaction store.
+            account_ids: The IDs of reconciled accounts. Defaults to all active
+                accounts.
+            delivery_grace: How long webhook delivery can take.
+            lookback: How far back the reconciliation sweep looks for gaps.
+            resweep: How far back the reconciliation sweep fetches transactions
+                again, even if they're already covered.
+            interval: Number of seconds between reconciliation sweeps.
+            on_error: Callback called when a reconciliation sweep fails.
+        """
+        self.store = store
+        self.account_ids = list(account_ids) if account_ids is not None else None
+        self.delivery_grace = delivery_grace
+        self.lookback = lookback
+        self.resweep = resweep
+        self.interval = interval
+        self.on_error = on_error
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "WebhookStoreBridge":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the context manager and stop the background thread."""
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def handle(self, event: MonzoWebhookEvent) -> MonzoTransaction:
+        """Apply webhook event to the store.
+
+        Arguments:
+            event: `transaction.created` webhook event.
+
+        Returns:
+            Upserted Monzo transaction.
+        """
+        transaction = event_to_transaction(event)
+        account_id = event.data.account_id
+
+        self.store.upsert(account_id, [transaction])
+        self.store.client.cache.invalidate("/balance", {"account_id": account_id})
+
+        return transaction
+
+    def reconcile(self, now: Optional[datetime] = None) -> ReconcileResult:
+        """Fetch missed, recent and still pending account transactions.
+
+        Arguments:
+            now: Current time. Defaults to now.
+
+        Returns:
+            Reconciliation sweep result.
+        """
+        now = as_utc(now) if now is not None else utc_now()
+        end = now - self.delivery_grace
+        start = now - self.lookback
+        recent = min(now - self.resweep, end)
+
+        account_ids = self.account_ids
+        if account_ids is None:
+            account_ids = [
+                account.id for account in self.store.client.accounts.list_active()
+            ]
+
+        result = ReconcileResult()
+        for account_id in account_ids:
+            try:
+                self._reconcile_account(account_id, start, recent, end, result)
+            except Exception as e:
+                result.errors[account_id] = e
+
+        return result
+
+    def start(self) -> "WebhookStoreBridge":
+        """Start the background reconciliation thread.
+
+        Returns:
+            The bridge itself.
+        """
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="pymonzo-store-reconciler",
+                daemon=True,
+            )
+            self._thread.start()
+
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread and wait for it to finish.
+
+        Arguments:
+            timeout: Maximum number of seconds to wait for the thread to finish.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _reconcile_account(
+        self,
+        account_id: str,
+        start: datetime,
+        recent: datetime,
+        end: datetime,
+        result: ReconcileResult,
+    ) -> None:
+        """Fetch missed, recent and still pending account transactions.
+
+        Arguments:
+            account_id: The ID of the account.
+            start: Start time of the checked period.
+            recent: Start time of the period that's fetched even if it's covered.
+            end: End time of the checked period.
+            result: Reconciliation sweep result to update.
+        """
+        oldest_pending = self.store.get_oldest_pending(account_id)
+        if oldest_pending is not None:
+            recent = min(recent, oldest_pending)
+
+        windows = self.store.get_gaps(account_id, start, recent)
+        if windows and windows[-1][1] == recent:
+            windows[-1] = (windows[-1][0], end)
+        elif recent < end:
+            windows.append((recent, end))
+
+        if not windows:
+            return
+
+        result.windows[account_id] = windows
+        for window_start, window_end in windows:
+            page: list[MonzoTransaction] = []
+            for transaction in self.store.client.transactions.iter_all(
+                account_id,
+                since=window_start,
+                before=window_end,
+            ):
+                page.append(transaction)
+                if len(page) >= MAX_PAGE_SIZE:
+                    result.transactions += self.store.upsert(account_id, page)
+                    page = []
+
+            result.transactions += self.store.upsert(account_id, page)
+            self.store.add_coverage(account_id, window_start, window_end)
+
+        self.store.client.cache.invalidate("/balance", {"account_id": account_id})
+
+    def _run(self) -> None:
+        """Run reconciliation sweeps, until stopped."""
+        while not self._stopped.is_set():
+            try:
+                result = self.reconcile()
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+            else:
+                for error in result.errors.values():
+                    if self.on_error:
+                        self.on_error(error)
+
+            self._stopped.wait(self.interval)
@@ -0,0 +1,209 @@
+"""pymonzo webhook event deduplication.
+
+Monzo can deliver the same webhook event more than once. Seen transaction IDs
+are kept in a compact on-disk seen-set (an append-only file of 8 byte hashes),
+fronted by an in-memory bloom filter, so most lookups (i.e. new events) never
+touch the disk, and memory usage doesn't grow with the number of seen events.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Union
+
+DIGEST_SIZE = 8
+
+
+def get_digest(key: str) -> bytes:
+    """Return the seen-set digest of a key.
+
+    Arguments:
+        key: Key, e.g. a transaction ID.
+
+    Returns:
+        8 byte BLAKE2b digest.
+    """
+    return hashlib.blake2b(key.encode(), digest_size=DIGEST_SIZE).digest()
+
+
+class BloomFilter:
+    """In-memory bloom filter of seen-set digests.
+
+    It can answer "definitely not seen" or "maybe seen". It's sized for
+    `capacity` items at `error_rate` false positive rate, which grows if more
+    items are added.
+
+    Attributes:
+        capacity: Expected number of items.
+        error_rate: False positive rate at `capacity` items.
+        num_bits: Number of bits in the filter.
+        num_hashes: Number of hash functions.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        """Initialize the bloom filter.
+
+        Arguments:
+            capacity: Expected number of items.
+            error_rate: False positive rate at `capacity` items.
+
+        Raises:
+            ValueError: If `capacity` or `error_rate` are out of range.
+        """
+        if capacity < 1:
+            raise ValueError("Bloom filter capacity needs to be positive.")
+
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate needs to be between 0 and 1.")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, digest: bytes) -> list[int]:
+        """Return bit positions of a digest (using double hashing)."""
+        h1 = int.from_bytes(digest[:4], "little")
+        h2 = int.from_bytes(digest[4:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, digest: bytes) -> None:
+        """Add a digest to the bloom filter.
+
+        Arguments:
+            digest: Seen-set digest.
+        """
+        for position in self._positions(digest):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        """Return whether a digest was (maybe) added to the bloom filter."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(digest)
+        )
+
+
+class SeenSet:
+    """On-disk set of seen keys (e.g. transaction IDs), fronted by a bloom filter.
+
+    Keys are stored as 8 byte digests appended to a file, which is loaded into
+    the bloom filter when opened. Disk is only read when the bloom filter
+    reports a (possibly false positive) match. It's thread safe.
+
+    Attributes:
+        path: Seen-set file path.
+        bloom_filter: In-memory bloom filter.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        fsync: bool = False,
+    ) -> None:
+        """Open (or create) the seen-set.
+
+        Arguments:
+            path: Seen-set file path.
+            capacity: Expected number of keys, used to size the bloom filter.
+            error_rate: Bloom filter false positive rate at `capacity` keys.
+            fsync: Whether to `fsync()` the file after every added key.
+        """
+        self.path = Path(path)
+        self.bloom_filter = BloomFilter(capacity, error_rate)
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a+b")  # noqa: SIM115
+
+        # Drop a partially written digest, left by a crash
+        size = os.fstat(self._file.fileno()).st_size
+        if size % DIGEST_SIZE:
+            size -= size % DIGEST_SIZE
+            self._file.truncate(size)
+
+        self._len = size // DIGEST_SIZE
+
+        self._file.seek(0)
+        while chunk := self._file.read(DIGEST_SIZE * 8192):
+            for i in range(0, len(chunk), DIGEST_SIZE):
+                self.bloom_filter.add(chunk[i : i + DIGEST_SIZE])
+
+    def __enter__(self) -> "SeenSet":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the context manager and close the seen-set file."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of keys in the seen-set."""
+        return self._len
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether a key is in the seen-set."""
+        digest = get_digest(key)
+        with self._lock:
+            return self._contains(digest)
+
+    def add(self, key: str) -> bool:
+        """Add a key to the seen-set.
+
+        Arguments:
+            key: Key, e.g. a transaction ID.
+
+        Returns:
+            Whether the key was added, i.e. it wasn't seen before.
+        """
+        digest = get_digest(key)
+
+        with self._lock:
+            if self._contains(digest):
+                return False
+
+            self._file.write(digest)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+            self.bloom_filter.add(digest)
+            self._len += 1
+
+        return True
+
+    def close(self) -> None:
+        """Close the seen-set file."""
+        self._file.close()
+
+    def _contains(self, digest: bytes) -> bool:
+        """Return whether a digest is in the seen-set file.
+
+        The file is only searched when the bloom filter reports a match.
+        """
+        if digest not in self.bloom_filter:
+            return False
+
+        with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position = mm.find(digest)
+            while position != -1:
+                if position % DIGEST_SIZE == 0:
+                    return True
+
+                position = mm.find(digest, position + 1)
+
+        return False
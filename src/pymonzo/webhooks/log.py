@@ -0,0 +1,373 @@
+"""pymonzo webhook event log.
+
+Raw webhook event bytes are appended to a segmented, append-only log, so
+handlers can be replayed from an offset (e.g. after a crash) without asking the
+Monzo API for anything again. Combined with [`pymonzo.webhooks.dedupe.SeenSet`][]
+it makes sure each transaction event is only logged (and handled) once.
+"""
+
+import bisect
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections.abc import Iterator
+from contextlib import suppress
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Optional, Union
+
+from pymonzo.webhooks.dedupe import SeenSet
+from pymonzo.webhooks.schemas import MonzoWebhookEvent
+
+# Record header: payload length and CRC32 checksum
+RECORD_HEADER = struct.Struct(">II")
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+SEGMENT_SUFFIX = ".log"
+
+
+class SegmentLog:
+    """Append-only log of raw records, split into segment files.
+
+    Every record gets a sequential offset. Segments are named after the offset
+    of their first record and a new one is started when the current one grows
+    over `segment_size`. A partially written record (e.g. after a crash) at the
+    end of the last segment is discarded when the log is opened.
+
+    Attributes:
+        directory: Log directory.
+        segment_size: Segment file size (in bytes) after which a new one is
+            started.
+        fsync: Whether to `fsync()` the segment file after every append.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        fsync: bool = False,
+    ) -> None:
+        """Open (or create) the log.
+
+        Arguments:
+            directory: Log directory.
+            segment_size: Segment file size (in bytes) after which a new one is
+                started.
+            fsync: Whether to `fsync()` the segment file after every append.
+        """
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.fsync = fsync
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._segments = sorted(
+            int(path.stem)
+            for path in self.directory.glob(f"*{SEGMENT_SUFFIX}")
+            if path.stem.isdigit()
+        )
+
+        if not self._segments:
+            self._segments.append(0)
+
+        base_offset = self._segments[-1]
+        path = self._get_segment_path(base_offset)
+
+        count, size = 0, 0
+        if path.exists():
+            with open(path, "rb") as f:
+                for _, position in self._read_records(f):
+                    count += 1
+                    size = position
+
+        self._next_offset = base_offset + count
+        self._file = open(path, "ab")  # noqa: SIM115
+        # Drop a partially written record, left by a crash
+        self._file.truncate(size)
+        self._file.seek(size)
+
+    def __enter__(self) -> "SegmentLog":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the context manager and close the log."""
+        self.close()
+
+    @property
+    def next_offset(self) -> int:
+        """The offset of the next appended record."""
+        return self._next_offset
+
+    @property
+    def segments(self) -> list[Path]:
+        """Segment file paths."""
+        return [self._get_segment_path(offset) for offset in self._segments]
+
+    def append(self, data: bytes) -> int:
+        """Append a record to the log.
+
+        Arguments:
+            data: Record data.
+
+        Returns:
+            The offset of the appended record.
+        """
+        record = RECORD_HEADER.pack(len(data), zlib.crc32(data)) + data
+
+        with self._lock:
+            if self._file.tell() >= self.segment_size:
+                self._file.close()
+                self._segments.append(self._next_offset)
+                self._file = open(  # noqa: SIM115
+                    self._get_segment_path(self._next_offset),
+                    "ab",
+                )
+
+            self._file.write(record)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+            offset = self._next_offset
+            self._next_offset += 1
+
+        return offset
+
+    def replay(self, offset: int = 0) -> Iterator[tuple[int, bytes]]:
+        """Iterate over log records, starting from an offset.
+
+        Arguments:
+            offset: The offset of the first returned record.
+
+        Yields:
+            Record offsets and data.
+        """
+        with self._lock:
+            segments = self._segments.copy()
+            end_offset = self._next_offset
+
+        index = max(bisect.bisect_right(segments, offset) - 1, 0)
+        for base_offset in segments[index:]:
+            with open(self._get_segment_path(base_offset), "rb") as f:
+                for record_offset, (data, _) in enumerate(
+                    self._read_records(f),
+                    start=base_offset,
+                ):
+                    if record_offset >= end_offset:
+                        return
+
+                    if record_offset >= offset:
+                        yield record_offset, data
+
+    def close(self) -> None:
+        """Close the log."""
+        self._file.close()
+
+    def _get_segment_path(self, base_offset: int) -> Path:
+        """Return segment file path."""
+        return self.directory / f"{base_offset:020d}{SEGMENT_SUFFIX}"
+
+    @staticmethod
+    def _read_records(f: BinaryIO) -> Iterator[tuple[bytes, int]]:
+        """Read valid records from a segment file.
+
+        Reading stops at the first partially written (or corrupted) record.
+
+        Arguments:
+            f: Segment file.
+
+        Yields:
+            Record data and file position after the record.
+        """
+        while header := f.read(RECORD_HEADER.size):
+            if len(header) < RECORD_HEADER.size:
+                return
+
+            length, checksum = RECORD_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length or zlib.crc32(data) != checksum:
+                return
+
+            yield data, f.tell()
+
+
+class WebhookEventLog:
+    """Deduplicated, durable log of webhook events.
+
+    Raw event bytes are appended to a [`SegmentLog`][pymonzo.webhooks.log.SegmentLog]
+    (in `<directory>/segments`), unless the event transaction ID is already in
+    the [`SeenSet`][pymonzo.webhooks.dedupe.SeenSet] (`<directory>/seen`). It's
+    thread safe.
+
+    The offset up to which events were handled can be saved as a checkpoint
+    (`<directory>/checkpoint`), so handlers can be replayed from it after a
+    crash.
+
+    Attributes:
+        directory: Event log directory.
+        seen: Seen transaction IDs.
+        segments: Raw event log.
+        duplicates: Number of duplicated events since the log was opened.
+        checkpoint: The offset of the first not (yet) handled event.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        fsync: bool = False,
+    ) -> None:
+        """Open (or create) the event log.
+
+        Arguments:
+            directory: Event log directory.
+            capacity: Expected number of events, used to size the bloom filter.
+            error_rate: Bloom filter false positive rate at `capacity` events.
+            segment_size: Segment file size (in bytes) after which a new one is
+                started.
+            fsync: Whether to `fsync()` files after every appended event.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.segments = SegmentLog(
+            self.directory / "segments",
+            segment_size=segment_size,
+            fsync=fsync,
+        )
+        self.seen = SeenSet(
+            self.directory / "seen",
+            capacity=capacity,
+            error_rate=error_rate,
+            fsync=fsync,
+        )
+        self.duplicates = 0
+
+        try:
+            self.checkpoint = int(self._get_checkpoint_path().read_text())
+        except FileNotFoundError:
+            self.checkpoint = 0
+
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "WebhookEventLog":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the context manager and close the event log."""
+        self.close()
+
+    def __contains__(self, transaction_id: str) -> bool:
+        """Return whether an event of a transaction was logged."""
+        return transaction_id in self.seen
+
+    @property
+    def next_offset(self) -> int:
+        """The offset of the next logged event."""
+        return self.segments.next_offset
+
+    def append(
+        self,
+        body: bytes,
+        event: Optional[MonzoWebhookEvent] = None,
+    ) -> Optional[int]:
+        """Log a webhook event, unless it's a duplicate.
+
+        The event is logged before its transaction ID is marked as seen, so a
+        crash in between can lead to a duplicate in the log, but never to a lost
+        event.
+
+        Arguments:
+            body: Raw webhook event bytes.
+            event: Validated webhook event. Parsed from `body` if not passed.
+
+        Returns:
+            The offset of the logged event, or `None` if it's a duplicate.
+        """
+        if event is None:
+            event = MonzoWebhookEvent.model_validate_json(body)
+
+        transaction_id = event.data.id
+
+        with self._lock:
+            if transaction_id in self.seen:
+                self.duplicates += 1
+                return None
+
+            offset = self.segments.append(body)
+            self.seen.add(transaction_id)
+
+        return offset
+
+    def save_checkpoint(self, offset: int) -> None:
+        """Atomically save checkpoint to disk.
+
+        Arguments:
+            offset: The offset of the first not (yet) handled event.
+        """
+        path = self._get_checkpoint_path()
+        fd, temp_path = tempfile.mkstemp(
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(str(offset))
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
+
+        self.checkpoint = offset
+
+    def replay(
+        self,
+        offset: Optional[int] = None,
+    ) -> Iterator[tuple[int, MonzoWebhookEvent]]:
+        """Iterate over logged events, starting from an offset.
+
+        Arguments:
+            offset: The offset of the first returned event. Defaults to the
+                saved checkpoint.
+
+        Yields:
+            Event offsets and webhook events.
+        """
+        if offset is None:
+            offset = self.checkpoint
+
+        for record_offset, body in self.segments.replay(offset):
+            yield record_offset, MonzoWebhookEvent.model_validate_json(body)
+
+    def close(self) -> None:
+        """Close the event log."""
+        self.segments.close()
+        self.seen.close()
+
+    def _get_checkpoint_path(self) -> Path:
+        """Return checkpoint file path."""
+        return self.directory / "checkpoint"
@@ -1,9 +1,15 @@
 """Monzo API 'webhooks' resource."""
 
+from collections.abc import Iterable, Mapping
+from dataclasses import replace
+from functools import partial
 from typing import Optional
 
-from pymonzo.resources import BaseResource
+from pymonzo.fanout import DEFAULT_MAX_CONCURRENCY, async_fan_out, fan_out
+from pymonzo.parsing import loads
+from pymonzo.resources import AsyncBaseResource, BaseResource
 from pymonzo.webhooks.schemas import MonzoWebhook
+from pymonzo.webhooks.sync import WebhookSyncReport, diff_webhooks
 
 
 class WebhooksResource(BaseResource):
@@ -13,6 +19,85 @@ class WebhooksResource(BaseResource):
         Monzo API docs: https://docs.monzo.com/#webhooks
     """
 
+    def sync(
+        self,
+        desired: Mapping[str, Iterable[str]],
+        *,
+        dry_run: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> WebhookSyncReport:
+        """Register and delete webhooks, so accounts have exactly the desired URLs.
+
+        Accounts are processed concurrently: their webhooks are listed, compared
+        with the desired URLs (see [`pymonzo.webhooks.sync.diff_webhooks`][]),
+        and only the needed changes are applied. Accounts that aren't passed
+        aren't changed.
+
+        Arguments:
+            desired: Desired webhook URLs, keyed by account ID. An empty set of
+                URLs deletes all account webhooks.
+            dry_run: Whether to only plan the changes, without applying them.
+            max_concurrency: Maximum number of concurrently processed accounts.
+
+        Returns:
+            Webhook sync report. Errors are reported per change (and per account,
+            if its webhooks couldn't be listed).
+        """
+        results = fan_out(
+            partial(self._sync_account, desired, dry_run=dry_run),
+            desired,
+            max_concurrency=max_concurrency,
+        )
+
+        report = WebhookSyncReport(account_errors=results.errors)
+        for account_report in results.values():
+            report.update(account_report)
+
+        return report
+
+    def _sync_account(
+        self,
+        desired: Mapping[str, Iterable[str]],
+        account_id: str,
+        *,
+        dry_run: bool = False,
+    ) -> WebhookSyncReport:
+        """Register and delete account webhooks, so it has exactly the desired URLs.
+
+        Arguments:
+            desired: Desired webhook URLs, keyed by account ID.
+            account_id: The ID of the account.
+            dry_run: Whether to only plan the changes, without applying them.
+
+        Returns:
+            Account webhook sync report.
+        """
+        changes, unchanged = diff_webhooks(
+            account_id,
+            desired[account_id],
+            self.list(account_id),
+        )
+        report = WebhookSyncReport(unchanged=unchanged, planned=changes)
+
+        if dry_run:
+            return report
+
+        for change in changes:
+            try:
+                if change.action == "register":
+                    webhook = self.register(change.url, account_id)
+                    applied = replace(change, webhook_id=webhook.id)
+                else:
+                    assert change.webhook_id is not None
+                    self.delete(change.webhook_id)
+                    applied = change
+            except Exception as e:
+                report.errors[change] = e
+            else:
+                report.applied.append(applied)
+
+        return report
+
     def list(self, account_id: Optional[str] = None) -> list[MonzoWebhook]:
         """List all webhooks.
 
@@ -38,7 +123,7 @@ class WebhooksResource(BaseResource):
 
         response = self._get_response(method="get", endpoint=endpoint, params=params)
 
-        webhooks = [MonzoWebhook(**webhook) for webhook in response.json()["webhooks"]]
+        webhooks = self._parse_response(response, list[MonzoWebhook], "webhooks")
 
         return webhooks
 
@@ -74,7 +159,7 @@ class WebhooksResource(BaseResource):
         }
         response = self._get_response(method="post", endpoint=endpoint, data=data)
 
-        webhook = MonzoWebhook(**response.json()["webhook"])
+        webhook = self._parse_response(response, MonzoWebhook, "webhook")
 
         return webhook
 
@@ -94,4 +179,181 @@ class WebhooksResource(BaseResource):
 
         response = self._get_response(method="delete", endpoint=endpoint)
 
-        return response.json()
+        return loads(response.content)
+
+
+class AsyncWebhooksResource(AsyncBaseResource):
+    """Monzo API 'webhooks' async resource.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/#webhooks
+    """
+
+    async def sync(
+        self,
+        desired: Mapping[str, Iterable[str]],
+        *,
+        dry_run: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> WebhookSyncReport:
+        """Register and delete webhooks, so accounts have exactly the desired URLs.
+
+        Async version of [`pymonzo.webhooks.WebhooksResource.sync`][].
+
+        Arguments:
+            desired: Desired webhook URLs, keyed by account ID. An empty set of
+                URLs deletes all account webhooks.
+            dry_run: Whether to only plan the changes, without applying them.
+            max_concurrency: Maximum number of concurrently processed accounts.
+
+        Returns:
+            Webhook sync report. Errors are reported per change (and per account,
+            if its webhooks couldn't be listed).
+        """
+        results = await async_fan_out(
+            partial(self._sync_account, desired, dry_run=dry_run),
+            desired,
+            max_concurrency=max_concurrency,
+        )
+
+        report = WebhookSyncReport(account_errors=results.errors)
+        for account_report in results.values():
+            report.update(account_report)
+
+        return report
+
+    async def _sync_account(
+        self,
+        desired: Mapping[str, Iterable[str]],
+        account_id: str,
+        *,
+        dry_run: bool = False,
+    ) -> WebhookSyncReport:
+        """Register and delete account webhooks, so it has exactly the desired URLs.
+
+        Async version of `WebhooksResource._sync_account()`.
+
+        Arguments:
+            desired: Desired webhook URLs, keyed by account ID.
+            account_id: The ID of the account.
+            dry_run: Whether to only plan the changes, without applying them.
+
+        Returns:
+            Account webhook sync report.
+        """
+        changes, unchanged = diff_webhooks(
+            account_id,
+            desired[account_id],
+            await self.list(account_id),
+        )
+        report = WebhookSyncReport(unchanged=unchanged, planned=changes)
+
+        if dry_run:
+            return report
+
+        for change in changes:
+            try:
+                if change.action == "register":
+                    webhook = await self.register(change.url, account_id)
+                    applied = replace(change, webhook_id=webhook.id)
+                else:
+                    assert change.webhook_id is not None
+                    await self.delete(change.webhook_id)
+                    applied = change
+            except Exception as e:
+                report.errors[change] = e
+            else:
+                report.applied.append(applied)
+
+        return report
+
+    async def list(self, account_id: Optional[str] = None) -> list[MonzoWebhook]:
+        """List all webhooks.
+
+        Async version of [`pymonzo.webhooks.WebhooksResource.list`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#list-webhooks
+
+        Arguments:
+            account_id: The account to list registered webhooks for. Can be omitted
+                if user has only one active account.
+
+        Returns:
+            List of Monzo webhooks.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        endpoint = "/webhooks"
+        params = {"account_id": account_id}
+
+        response = await self._get_response(
+            method="get", endpoint=endpoint, params=params
+        )
+
+        webhooks = self._parse_response(response, list[MonzoWebhook], "webhooks")
+
+        return webhooks
+
+    async def register(
+        self,
+        url: str,
+        account_id: Optional[str] = None,
+    ) -> MonzoWebhook:
+        """Register a webhook.
+
+        Async version of [`pymonzo.webhooks.WebhooksResource.register`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#registering-a-webhook
+
+        Arguments:
+            account_id: The account to receive notifications for. Can be omitted
+                if user has only one active account.
+            url: The URL we will send notifications to.
+
+        Returns:
+            Registered Monzo webhook.
+
+        Raises:
+            CannotDetermineDefaultAccount: If no account ID was passed and default
+                account cannot be determined.
+        """
+        if not account_id:
+            account_id = (await self.client.accounts.get_default_account()).id
+
+        endpoint = "/webhooks"
+        data = {
+            "account_id": account_id,
+            "url": url,
+        }
+        response = await self._get_response(method="post", endpoint=endpoint, data=data)
+
+        webhook = self._parse_response(response, MonzoWebhook, "webhook")
+
+        return webhook
+
+    async def delete(self, webhook_id: str) -> dict:
+        """Delete a webhook.
+
+        Async version of [`pymonzo.webhooks.WebhooksResource.delete`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#deleting-a-webhook
+
+        Arguments:
+            webhook_id: The ID of the webhook.
+
+        Returns:
+            API response.
+        """
+        endpoint = f"/webhooks/{webhook_id}"
+
+        response = await self._get_response(method="delete", endpoint=endpoint)
+
+        return loads(response.content)
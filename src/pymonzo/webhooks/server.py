@@ -0,0 +1,555 @@
+"""pymonzo webhook receiver.
+
+An ASGI app that receives Monzo webhook events, validates them and acknowledges
+them straight away. Events are then handed to a bounded queue, which is served
+by a pool of worker tasks, so slow handlers never hold up Monzo's requests, and
+bursts of events (e.g. around payday) are absorbed by the queue.
+
+Optionally, events can be deduplicated and durably logged with
+[`pymonzo.webhooks.WebhookEventLog`][] before they're acknowledged, so handlers
+can be replayed after a crash.
+
+It can be served with any ASGI server, e.g. `uvicorn`:
+
+    receiver = WebhookReceiver(handle_event, workers=8)
+    uvicorn.run(receiver)
+
+Note:
+    Monzo API docs: https://docs.monzo.com/#webhooks
+"""
+
+import asyncio
+import inspect
+import json
+import time
+from collections.abc import Awaitable, MutableMapping
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from types import TracebackType
+from typing import Any, Callable, Optional, Union
+
+from pydantic import ValidationError
+
+from pymonzo.webhooks.log import WebhookEventLog
+from pymonzo.webhooks.schemas import MonzoWebhookEvent
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+WebhookHandler = Callable[[MonzoWebhookEvent], Union[Awaitable[Any], Any]]
+
+DEFAULT_EVENT_TYPES = frozenset({"transaction.created"})
+MAX_BODY_SIZE = 1024 * 1024
+
+
+@dataclass
+class _QueuedEvent:
+    """Queued webhook event."""
+
+    event: MonzoWebhookEvent
+    queued_at: float = field(default_factory=time.perf_counter)
+    offset: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class WebhookReceiverStats:
+    """Webhook receiver statistics.
+
+    Attributes:
+        received: Number of received requests.
+        accepted: Number of events accepted (and queued).
+        invalid: Number of requests rejected because of an invalid body.
+        ignored: Number of acknowledged events of an unhandled type.
+        duplicates: Number of acknowledged, already logged events.
+        rejected: Number of events rejected because the queue was full.
+        processed: Number of events successfully handled.
+        failed: Number of events whose handler raised an exception.
+        queue_size: Number of events waiting in the queue.
+        max_queue_size: Queue capacity.
+        queue_high_water_mark: Largest number of events seen waiting in the queue.
+        queue_wait: Total number of seconds events spent waiting in the queue.
+        handler_time: Total number of seconds spent in the handler.
+    """
+
+    received: int
+    accepted: int
+    invalid: int
+    ignored: int
+    duplicates: int
+    rejected: int
+    processed: int
+    failed: int
+    queue_size: int
+    max_queue_size: int
+    queue_high_water_mark: int
+    queue_wait: float
+    handler_time: float
+
+
+class WebhookReceiver:
+    """ASGI app receiving Monzo webhook events.
+
+    `POST` requests are validated (straight from the raw body) as
+    [`pymonzo.webhooks.MonzoWebhookEvent`][], acknowledged immediately and put in
+    a bounded queue served by `workers` worker tasks, which call the handler.
+    When the queue is full, the request waits up to `enqueue_timeout` seconds
+    for a free slot, and is rejected with HTTP 503 (which makes Monzo retry it
+    later) if none frees up. `GET` requests return receiver statistics.
+
+    When an `event_log` is passed, events are deduplicated (by transaction ID)
+    and durably logged before they're acknowledged. Handled events (including
+    the ones passed to `on_error`) advance the event log checkpoint, which is
+    saved every `checkpoint_interval` events and when the workers are stopped.
+    `replay()` re-queues events logged after it, e.g. after a crash. Logging
+    happens in the event loop, so consider the cost of enabling `fsync`.
+
+    Workers are started on ASGI lifespan startup (or on the first request, if
+    the server doesn't support lifespan events) and the queue is drained on
+    shutdown. They can also be managed explicitly with `start()` and `stop()`,
+    or by using the receiver as an async context manager.
+
+    Attributes:
+        handler: Webhook event handler. It can be a regular function (which is
+            run in a worker thread) or a coroutine function.
+        workers: Number of worker tasks.
+        max_queue_size: Queue capacity.
+        enqueue_timeout: Number of seconds a request waits for a free queue slot
+            before it's rejected.
+        event_types: Handled event types. Other events are acknowledged, but
+            ignored.
+        on_error: Callback called when the handler raises an exception.
+        event_log: Event log used for deduplication and replays.
+        checkpoint_interval: Number of handled events after which the event log
+            checkpoint is saved.
+    """
+
+    def __init__(
+        self,
+        handler: WebhookHandler,
+        *,
+        workers: int = 4,
+        max_queue_size: int = 10_000,
+        enqueue_timeout: float = 0.0,
+        event_types: frozenset[str] = DEFAULT_EVENT_TYPES,
+        on_error: Optional[Callable[[MonzoWebhookEvent, Exception], None]] = None,
+        event_log: Optional[WebhookEventLog] = None,
+        checkpoint_interval: int = 100,
+    ) -> None:
+        """Initialize the webhook receiver.
+
+        Arguments:
+            handler: Webhook event handler. It can be a regular function (which
+                is run in a worker thread) or a coroutine function.
+            workers: Number of worker tasks.
+            max_queue_size: Queue capacity.
+            enqueue_timeout: Number of seconds a request waits for a free queue
+                slot before it's rejected.
+            event_types: Handled event types. Other events are acknowledged, but
+                ignored.
+            on_error: Callback called when the handler raises an exception.
+            event_log: Event log used for deduplication and replays.
+            checkpoint_interval: Number of handled events after which the event
+                log checkpoint is saved.
+        """
+        self.handler = handler
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.event_types = event_types
+        self.on_error = on_error
+        self.event_log = event_log
+        self.checkpoint_interval = checkpoint_interval
+
+        self._is_async_handler = inspect.iscoroutinefunction(handler)
+        self._queue: Optional[asyncio.Queue[_QueuedEvent]] = None
+        # Free queue slots. The queue itself is unbounded, so a slot can be
+        # reserved before an event is logged, and it's then queued without
+        # yielding to the workers in between.
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: list[asyncio.Task] = []
+        self._counters = dict.fromkeys(
+            ("received", "accepted", "invalid", "ignored", "duplicates", "rejected"),
+            0,
+        )
+        self._counters.update(processed=0, failed=0, queue_high_water_mark=0)
+        self._queue_wait = 0.0
+        self._handler_time = 0.0
+
+        # Offsets of handled events, after the first not handled one. Starting
+        # from the saved checkpoint means that events handled before the backlog
+        # is replayed don't move the checkpoint past it.
+        self._handled_offsets: set[int] = set()
+        self._checkpoint = event_log.checkpoint if event_log else 0
+        self._unsaved_checkpoints = 0
+
+    async def __aenter__(self) -> "WebhookReceiver":
+        """Enter the async context manager and start the workers."""
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the async context manager and stop the workers."""
+        await self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers are running."""
+        return any(not task.done() for task in self._tasks)
+
+    @property
+    def stats(self) -> WebhookReceiverStats:
+        """Return webhook receiver statistics."""
+        return WebhookReceiverStats(
+            **self._counters,
+            queue_size=self._queue.qsize() if self._queue is not None else 0,
+            max_queue_size=self.max_queue_size,
+            queue_wait=self._queue_wait,
+            handler_time=self._handler_time,
+        )
+
+    def start(self) -> "WebhookReceiver":
+        """Start the workers. It needs to be called from a running loop.
+
+        Returns:
+            The webhook receiver itself.
+        """
+        if self.running:
+            return self
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_queue_size)
+
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._work()) for _ in range(self.workers)]
+
+        return self
+
+    async def stop(
+        self, *, drain: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Stop the workers.
+
+        Arguments:
+            drain: Whether to wait for the queued events to be handled first.
+            timeout: Maximum number of seconds to wait for the queue to drain.
+        """
+        if drain and self._queue is not None and self.running:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._queue.join(), timeout)
+
+        for task in self._tasks:
+            task.cancel()
+
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+        self._tasks = []
+
+        if self.event_log is not None and self._unsaved_checkpoints:
+            self.event_log.save_checkpoint(self._checkpoint)
+            self._unsaved_checkpoints = 0
+
+    async def replay(self, offset: Optional[int] = None) -> int:
+        """Queue logged events again, e.g. after a crash.
+
+        Replayed events aren't deduplicated, and the request waits for free
+        queue slots.
+
+        Arguments:
+            offset: The offset of the first replayed event. Defaults to the event
+                log checkpoint.
+
+        Returns:
+            Number of replayed events.
+
+        Raises:
+            ValueError: If the receiver doesn't have an event log.
+        """
+        if self.event_log is None:
+            raise ValueError("Only receivers with an event log can replay events.")
+
+        if not self.running:
+            self.start()
+
+        assert self._slots is not None
+
+        if offset is None:
+            offset = self.event_log.checkpoint
+
+        if offset > self._checkpoint:
+            # Events before the offset are explicitly skipped
+            self._handled_offsets = {o for o in self._handled_offsets if o >= offset}
+            self._checkpoint = offset
+            self._unsaved_checkpoints += 1
+        else:
+            self._checkpoint = offset
+
+        count = 0
+        for event_offset, event in self.event_log.replay(offset):
+            await self._slots.acquire()
+            self._put(_QueuedEvent(event, offset=event_offset))
+            count += 1
+
+        return count
+
+    async def join(self) -> None:
+        """Wait until all queued events are handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI app entrypoint.
+
+        Arguments:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
+        """
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":  # pragma: no cover
+            return
+
+        if scope["method"] == "GET":
+            await self._respond(send, 200, asdict(self.stats))
+            return
+
+        if scope["method"] != "POST":
+            await self._respond(send, 405, {"error": "Method not allowed"})
+            return
+
+        await self._receive_event(receive, send)
+
+    async def _receive_event(self, receive: Receive, send: Send) -> None:
+        """Validate, deduplicate, log and queue a webhook event.
+
+        Arguments:
+            receive: ASGI receive channel.
+            send: ASGI send channel.
+        """
+        self._counters["received"] += 1
+
+        body = await self._read_body(receive)
+        if body is None:
+            self._counters["invalid"] += 1
+            await self._respond(send, 413, {"error": "Request body too large"})
+            return
+
+        try:
+            event = MonzoWebhookEvent.model_validate_json(body)
+        except ValidationError as e:
+            self._counters["invalid"] += 1
+            await self._respond(
+                send,
+                400,
+                {
+                    "error": "Invalid webhook event",
+                    # Untrusted input (e.g. invalid JSON bytes) isn't echoed back
+                    "detail": e.errors(
+                        include_url=False,
+                        include_input=False,
+                        include_context=False,
+                    ),
+                },
+            )
+            return
+
+        if event.type not in self.event_types:
+            self._counters["ignored"] += 1
+            await self._respond(send, 200, {})
+            return
+
+        if self.event_log is not None and event.data.id in self.event_log:
+            self._counters["duplicates"] += 1
+            await self._respond(send, 200, {})
+            return
+
+        if not await self._reserve_slot():
+            self._counters["rejected"] += 1
+            await self._respond(
+                send,
+                503,
+                {"error": "Webhook queue is full"},
+                headers=[(b"retry-after", b"1")],
+            )
+            return
+
+        offset = None
+        if self.event_log is not None:
+            offset = self.event_log.append(body, event)
+            # Another request could have logged the event in the meantime
+            if offset is None:
+                assert self._slots is not None
+                self._slots.release()
+                self._counters["duplicates"] += 1
+                await self._respond(send, 200, {})
+                return
+
+        self._put(_QueuedEvent(event, offset=offset))
+        self._counters["accepted"] += 1
+        await self._respond(send, 200, {})
+
+    async def _reserve_slot(self) -> bool:
+        """Reserve a queue slot, waiting up to `enqueue_timeout` for a free one.
+
+        Returns:
+            Whether a slot was reserved.
+        """
+        if not self.running:
+            self.start()
+
+        assert self._slots is not None
+
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return True
+
+        if self.enqueue_timeout <= 0:
+            return False
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    def _put(self, item: _QueuedEvent) -> None:
+        """Put event in the queue (in an already reserved slot).
+
+        Arguments:
+            item: Queued event.
+        """
+        assert self._queue is not None
+
+        self._queue.put_nowait(item)
+        self._counters["queue_high_water_mark"] = max(
+            self._counters["queue_high_water_mark"],
+            self._queue.qsize(),
+        )
+
+    async def _work(self) -> None:
+        """Handle queued events, until cancelled."""
+        assert self._queue is not None
+        assert self._slots is not None
+
+        while True:
+            item = await self._queue.get()
+            self._slots.release()
+
+            event = item.event
+            started_at = time.perf_counter()
+            self._queue_wait += started_at - item.queued_at
+
+            try:
+                if self._is_async_handler:
+                    await self.handler(event)
+                else:
+                    await asyncio.to_thread(self.handler, event)
+            except Exception as e:
+                self._counters["failed"] += 1
+                if self.on_error:
+                    self.on_error(event, e)
+            else:
+                self._counters["processed"] += 1
+            finally:
+                self._handler_time += time.perf_counter() - started_at
+                if item.offset is not None:
+                    self._mark_handled(item.offset)
+                self._queue.task_done()
+
+    def _mark_handled(self, offset: int) -> None:
+        """Mark logged event as handled and advance the checkpoint.
+
+        Arguments:
+            offset: The offset of the handled event.
+        """
+        assert self.event_log is not None
+
+        self._handled_offsets.add(offset)
+        while self._checkpoint in self._handled_offsets:
+            self._handled_offsets.remove(self._checkpoint)
+            self._checkpoint += 1
+            self._unsaved_checkpoints += 1
+
+        if self._unsaved_checkpoints >= self.checkpoint_interval:
+            self.event_log.save_checkpoint(self._checkpoint)
+            self._unsaved_checkpoints = 0
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Handle ASGI lifespan events."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> Optional[bytes]:
+        """Read request body.
+
+        Arguments:
+            receive: ASGI receive channel.
+
+        Returns:
+            Request body, or `None` if it's larger than `MAX_BODY_SIZE`.
+        """
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_SIZE:
+                return None
+
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _respond(
+        send: Send,
+        status_code: int,
+        content: Any,
+        *,
+        headers: Optional[list[tuple[bytes, bytes]]] = None,
+    ) -> None:
+        """Send JSON response.
+
+        Arguments:
+            send: ASGI send channel.
+            status_code: HTTP status code.
+            content: Response content.
+            headers: Extra response headers.
+        """
+        body = json.dumps(content).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    *(headers or []),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,107 @@
+"""pymonzo declarative webhook sync related code.
+
+Instead of registering and deleting webhooks one by one, the desired webhook
+URLs of each account are declared, and only the webhooks that differ are
+registered or deleted.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+
+from pymonzo.webhooks.schemas import MonzoWebhook
+
+
+@dataclass(frozen=True)
+class WebhookChange:
+    """Webhook change, needed to reach the desired state.
+
+    Attributes:
+        action: Whether the webhook is registered or deleted.
+        account_id: The ID of the account.
+        url: Webhook URL.
+        webhook_id: The ID of the webhook. For registrations, it's only known
+            once it's applied.
+    """
+
+    action: Literal["register", "delete"]
+    account_id: str
+    url: str
+    webhook_id: Optional[str] = None
+
+
+@dataclass
+class WebhookSyncReport:
+    """Webhook sync report.
+
+    Attributes:
+        unchanged: Webhooks that were already in the desired state.
+        planned: Changes needed to reach the desired state.
+        applied: Successfully applied changes.
+        errors: Exceptions raised while applying changes, keyed by change.
+        account_errors: Exceptions raised while listing account webhooks, keyed
+            by account ID. These accounts weren't changed.
+    """
+
+    unchanged: list[MonzoWebhook] = field(default_factory=list)
+    planned: list[WebhookChange] = field(default_factory=list)
+    applied: list[WebhookChange] = field(default_factory=list)
+    errors: dict[WebhookChange, Exception] = field(default_factory=dict)
+    account_errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether all accounts reached the desired state."""
+        return not self.errors and not self.account_errors
+
+    def update(self, other: "WebhookSyncReport") -> None:
+        """Merge another (e.g. single account) report into this one.
+
+        Arguments:
+            other: Webhook sync report.
+        """
+        self.unchanged.extend(other.unchanged)
+        self.planned.extend(other.planned)
+        self.applied.extend(other.applied)
+        self.errors.update(other.errors)
+        self.account_errors.update(other.account_errors)
+
+
+def diff_webhooks(
+    account_id: str,
+    urls: Iterable[str],
+    webhooks: Iterable[MonzoWebhook],
+) -> tuple[list[WebhookChange], list[MonzoWebhook]]:
+    """Compute changes needed to reach the desired account webhook URLs.
+
+    Webhooks with undesired URLs (and duplicates of the desired ones) are
+    deleted, missing URLs are registered. Registrations come first, so replaced
+    URLs don't leave the account without a webhook.
+
+    Arguments:
+        account_id: The ID of the account.
+        urls: Desired webhook URLs.
+        webhooks: Currently registered account webhooks.
+
+    Returns:
+        Needed changes and unchanged webhooks.
+    """
+    desired = set(urls)
+    kept: set[str] = set()
+    unchanged: list[MonzoWebhook] = []
+    deletions: list[WebhookChange] = []
+
+    for webhook in webhooks:
+        if webhook.url in desired and webhook.url not in kept:
+            kept.add(webhook.url)
+            unchanged.append(webhook)
+        else:
+            deletions.append(
+                WebhookChange("delete", account_id, webhook.url, webhook.id)
+            )
+
+    registrations = [
+        WebhookChange("register", account_id, url) for url in sorted(desired - kept)
+    ]
+
+    return registrations + deletions, unchanged
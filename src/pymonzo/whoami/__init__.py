@@ -4,5 +4,5 @@ Note:
     Monzo API docs: https://docs.monzo.com/#authenticating-requests
 """
 
-from .resources import WhoAmIResource  # noqa
+from .resources import AsyncWhoAmIResource, WhoAmIResource  # noqa
 from .schemas import MonzoWhoAmI  # noqa
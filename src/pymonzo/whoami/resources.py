@@ -1,6 +1,6 @@
 """Monzo API 'whoami' resource."""
 
-from pymonzo.resources import BaseResource
+from pymonzo.resources import AsyncBaseResource, BaseResource
 from pymonzo.whoami.schemas import MonzoWhoAmI
 
 
@@ -21,8 +21,30 @@ class WhoAmIResource(BaseResource):
             Information about the access token.
         """
         endpoint = "/ping/whoami"
-        response = self._get_response(method="get", endpoint=endpoint)
+        who_am_i = self._get_cached(endpoint, MonzoWhoAmI, namespace="whoami")
 
-        who_am_i = MonzoWhoAmI(**response.json())
+        return who_am_i
+
+
+class AsyncWhoAmIResource(AsyncBaseResource):
+    """Monzo API 'whoami' async resource.
+
+    Note:
+        Monzo API docs: https://docs.monzo.com/#authenticating-requests
+    """
+
+    async def whoami(self) -> MonzoWhoAmI:
+        """Return information about the access token.
+
+        Async version of [`pymonzo.whoami.WhoAmIResource.whoami`][].
+
+        Note:
+            Monzo API docs: https://docs.monzo.com/#authenticating-requests
+
+        Returns:
+            Information about the access token.
+        """
+        endpoint = "/ping/whoami"
+        who_am_i = await self._get_cached(endpoint, MonzoWhoAmI, namespace="whoami")
 
         return who_am_i
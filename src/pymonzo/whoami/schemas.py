@@ -1,14 +1,13 @@
 """Monzo API 'whoami' related schemas."""
 
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, ConfigDict
 
-# Optional `rich` support
-try:
+from pymonzo.formatting import RICH_AVAILABLE
+
+if TYPE_CHECKING:
     from rich.table import Table
-except ImportError:
-    RICH_AVAILABLE = False
-else:
-    RICH_AVAILABLE = True
 
 
 class MonzoWhoAmI(BaseModel):
@@ -31,8 +30,10 @@ class MonzoWhoAmI(BaseModel):
 
     if RICH_AVAILABLE:
 
-        def __rich__(self) -> Table:
+        def __rich__(self) -> "Table":
             """Pretty printing support for `rich`."""
+            from rich.table import Table
+
             grid = Table.grid(padding=(0, 5))
             grid.add_column(style="bold yellow")
             grid.add_column()
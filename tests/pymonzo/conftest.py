@@ -7,7 +7,7 @@ from dotenv import load_dotenv
 from vcr import VCR
 from vcrpy_encrypt import BaseEncryptedPersister
 
-from pymonzo import MonzoAPI
+from pymonzo import AsyncMonzoAPI, MonzoAPI
 
 load_dotenv()
 
@@ -29,3 +29,15 @@ def pytest_recording_configure(config: pytest.Config, vcr: VCR) -> None:
 def monzo_api() -> MonzoAPI:
     """Return a `MonzoAPI` instance."""
     return MonzoAPI(access_token="FIXTURE_TEST_TOKEN")  # noqa
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run async tests (marked with `pytest.mark.anyio`) only with `asyncio`."""
+    return "asyncio"
+
+
+@pytest.fixture()
+def async_monzo_api() -> AsyncMonzoAPI:
+    """Return an `AsyncMonzoAPI` instance."""
+    return AsyncMonzoAPI(access_token="FIXTURE_TEST_TOKEN")  # noqa
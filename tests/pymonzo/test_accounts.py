@@ -23,7 +23,7 @@ class MonzoAccountFactory(ModelFactory[MonzoAccount]):
 
 
 # TODO: What should be resources fixture scope?
-#   With `module`, `_cached_accounts` value persisted between functions / tests.
+#   With `module`, cached accounts persisted between functions / tests.
 @pytest.fixture()
 def accounts_resource(monzo_api: MonzoAPI) -> AccountsResource:
     """Initialize `AccountsResource` resource with `monzo_api` fixture."""
@@ -181,7 +181,7 @@ class TestAccountsResource:
         accounts_resource: AccountsResource,
     ) -> None:
         """API response is parsed into expected schema."""
-        assert accounts_resource._cached_accounts == []
+        accounts_resource.client.cache.clear()
         _get_response_spy = mocker.spy(accounts_resource, "_get_response")
 
         accounts_list = accounts_resource.list()
@@ -195,7 +195,7 @@ class TestAccountsResource:
             assert isinstance(account, MonzoAccount)
 
         # Check that response was cached
-        assert accounts_resource._cached_accounts == accounts_list
+        assert accounts_resource.client.cache.get(("/accounts", ())) is accounts_list
 
         accounts_list2 = accounts_resource.list()
 
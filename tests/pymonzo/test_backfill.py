@@ -0,0 +1,205 @@
+"""Test `pymonzo.backfill` module."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from pymonzo import MonzoAPI
+from pymonzo.backfill import (
+    Backfill,
+    BackfillProgress,
+    BackfillWindow,
+    get_authenticated_at,
+)
+from pymonzo.store import TransactionStore
+from pymonzo.transactions import MonzoTransaction
+
+from .test_accounts import MonzoAccountFactory
+from .test_transactions import MonzoTransactionFactory
+
+CREATED = datetime(2020, 1, 1, tzinfo=timezone.utc)
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeTransactionsAPI:
+    """Fake 'list transactions' endpoint, which supports time and ID filtering."""
+
+    def __init__(self, transactions: list[MonzoTransaction]) -> None:
+        """Initialize the fake endpoint."""
+        self.transactions = sorted(transactions, key=lambda t: t.created)
+        self.account = MonzoAccountFactory.build(created=CREATED, closed=False)
+        self.fail_before: datetime = CREATED
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Handle HTTP request."""
+        if request.url.path == "/accounts":
+            return httpx.Response(
+                200, json={"accounts": [self.account.model_dump(mode="json")]}
+            )
+
+        params = request.url.params
+        before = _parse(params["before"])
+        since = params["since"]
+        limit = int(params["limit"])
+
+        if since.startswith("tx_"):
+            ids = [t.id for t in self.transactions]
+            transactions = self.transactions[ids.index(since) + 1 :]
+        else:
+            transactions = [t for t in self.transactions if t.created >= _parse(since)]
+            if _parse(since) < self.fail_before:
+                return httpx.Response(
+                    403, json={"code": "forbidden", "message": "Too old"}
+                )
+
+        transactions = [t for t in transactions if t.created < before][:limit]
+        return httpx.Response(
+            200,
+            json={"transactions": [t.model_dump(mode="json") for t in transactions]},
+        )
+
+
+def _parse(value: str) -> datetime:
+    """Parse datetime sent as URL query parameter."""
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+
+def build_transactions() -> list[MonzoTransaction]:
+    """Build sparse transaction history with a dense 3-day period."""
+    sparse = [CREATED + timedelta(days=7 * i, hours=1) for i in range(200)]
+    dense = [
+        datetime(2022, 6, 1, tzinfo=timezone.utc) + timedelta(minutes=10 * i)
+        for i in range(400)
+    ]
+    # Transactions sharing the same second need paging by ID
+    burst = [datetime(2023, 3, 1, 12, tzinfo=timezone.utc)] * 150
+
+    transaction = MonzoTransactionFactory.build()
+    return [
+        transaction.model_copy(update={"id": f"tx_{i:05}", "created": created})
+        for i, created in enumerate(sparse + dense + burst)
+    ]
+
+
+def build_monzo_api(fake_api: FakeTransactionsAPI) -> MonzoAPI:
+    """Initialize `MonzoAPI` that talks to passed fake API."""
+    return MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(fake_api),
+    )
+
+
+def test_backfill_window_split() -> None:
+    """Rest of the window is split into equal parts."""
+    window = BackfillWindow(CREATED, CREATED + timedelta(days=10))
+
+    assert window.split(CREATED + timedelta(days=2)) == [
+        BackfillWindow(CREATED + timedelta(days=2), CREATED + timedelta(days=6)),
+        BackfillWindow(CREATED + timedelta(days=6), CREATED + timedelta(days=10)),
+    ]
+
+
+def test_get_authenticated_at() -> None:
+    """Authentication time is based on the token expiry."""
+    token = {"expires_at": 1_700_003_600, "expires_in": 3600}
+
+    assert get_authenticated_at(token) == datetime.fromtimestamp(
+        1_700_000_000, tz=timezone.utc
+    )
+    assert get_authenticated_at({"access_token": "TEST"}) is None
+
+
+def test_time_left() -> None:
+    """Time left is counted from the authentication time."""
+    fake_api = FakeTransactionsAPI([])
+    monzo_api = build_monzo_api(fake_api)
+
+    assert Backfill(monzo_api).time_left is None
+
+    authenticated_at = datetime.now(tz=timezone.utc) - timedelta(minutes=1)
+    time_left = Backfill(monzo_api, authenticated_at=authenticated_at).time_left
+
+    assert time_left is not None
+    assert 235 < time_left <= 240
+
+    authenticated_at = datetime.now(tz=timezone.utc) - timedelta(minutes=10)
+    assert Backfill(monzo_api, authenticated_at=authenticated_at).time_left == 0
+
+
+def test_run() -> None:
+    """Full history is fetched, with dense windows split, and deduplicated."""
+    transactions = build_transactions()
+    fake_api = FakeTransactionsAPI(transactions)
+    monzo_api = build_monzo_api(fake_api)
+
+    fetched: list[MonzoTransaction] = []
+    reports: list[int] = []
+
+    backfill = Backfill(monzo_api, window=timedelta(days=90))
+    progress = backfill.run(
+        fetched.extend,
+        before=NOW,
+        on_progress=lambda p: reports.append(p.windows_done),
+    )
+
+    assert sorted(t.id for t in fetched) == [t.id for t in transactions]
+    assert progress.transactions == len(transactions)
+    assert progress.splits > 0
+    assert progress.windows > len(backfill.plan(CREATED, NOW))
+    assert progress.done
+    assert progress.errors == {}
+    assert reports == sorted(reports)
+    assert reports[-1] == progress.windows_done
+
+
+def test_run_errors() -> None:
+    """Failed time windows are reported, without failing the others."""
+    transactions = build_transactions()
+    fake_api = FakeTransactionsAPI(transactions)
+    fake_api.fail_before = CREATED + timedelta(days=365 * 2)
+    monzo_api = build_monzo_api(fake_api)
+
+    fetched: list[MonzoTransaction] = []
+    progress = Backfill(monzo_api, window=timedelta(days=365)).run(
+        fetched.extend,
+        fake_api.account.id,
+        before=NOW,
+    )
+
+    assert sorted(window.start for window in progress.errors) == [
+        CREATED,
+        CREATED + timedelta(days=365),
+    ]
+    assert progress.done
+    assert {t.id for t in fetched} == {
+        t.id for t in transactions if t.created >= fake_api.fail_before
+    }
+
+    with pytest.raises(ValueError, match="Account 'acc_00009NOPE' not found"):
+        Backfill(monzo_api).run(fetched.extend, "acc_00009NOPE")
+
+
+def test_transaction_store_backfill() -> None:
+    """Backfilled transactions are stored."""
+    transactions = build_transactions()
+    fake_api = FakeTransactionsAPI(transactions)
+    monzo_api = build_monzo_api(fake_api)
+
+    with TransactionStore(monzo_api, ":memory:") as store:
+        progress = store.backfill(max_concurrency=2)
+
+        assert isinstance(progress, BackfillProgress)
+        assert store.count(fake_api.account.id) == len(transactions)
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 8])
+def test_run_max_concurrency(max_concurrency: int) -> None:
+    """Result doesn't depend on the number of concurrent API calls."""
+    transactions = build_transactions()
+    monzo_api = build_monzo_api(FakeTransactionsAPI(transactions))
+
+    fetched: list[MonzoTransaction] = []
+    Backfill(monzo_api, max_concurrency=max_concurrency).run(fetched.extend)
+
+    assert len(fetched) == len(transactions)
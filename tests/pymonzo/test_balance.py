@@ -8,8 +8,8 @@ import respx
 from polyfactory.factories.pydantic_factory import ModelFactory
 from pytest_mock import MockerFixture
 
-from pymonzo import MonzoAPI
-from pymonzo.balance import BalanceResource, MonzoBalance
+from pymonzo import AsyncMonzoAPI, MonzoAPI
+from pymonzo.balance import AsyncBalanceResource, BalanceResource, MonzoBalance
 
 from .test_accounts import MonzoAccountFactory
 
@@ -28,6 +28,12 @@ def balance_resource(monzo_api: MonzoAPI) -> BalanceResource:
     return BalanceResource(client=monzo_api)
 
 
+@pytest.fixture()
+def async_balance_resource(async_monzo_api: AsyncMonzoAPI) -> AsyncBalanceResource:
+    """Initialize `AsyncBalanceResource` resource with `async_monzo_api` fixture."""
+    return AsyncBalanceResource(client=async_monzo_api)
+
+
 class TestBalanceResource:
     """Test `BalanceResource` class."""
 
@@ -97,3 +103,42 @@ class TestBalanceResource:
         balance = balance_resource.get()
 
         assert isinstance(balance, MonzoBalance)
+
+
+class TestAsyncBalanceResource:
+    """Test `AsyncBalanceResource` class."""
+
+    @pytest.mark.anyio()
+    @pytest.mark.respx(base_url=MonzoAPI.api_url)
+    async def test_get_respx(
+        self,
+        mocker: MockerFixture,
+        respx_mock: respx.MockRouter,
+        async_balance_resource: AsyncBalanceResource,
+    ) -> None:
+        """Correct API response is sent, API response is parsed into expected schema."""
+        balance = MonzoBalanceFactory.build()
+
+        account = MonzoAccountFactory.build()
+        mocked_get_default_account = mocker.patch.object(
+            async_balance_resource.client.accounts,
+            "get_default_account",
+        )
+        mocked_get_default_account.return_value = account
+
+        mocked_route = respx_mock.get(
+            "/balance", params={"account_id": account.id}
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json=balance.model_dump(mode="json"),
+            )
+        )
+
+        balance_get_response = await async_balance_resource.get()
+
+        mocked_get_default_account.assert_awaited_once_with()
+
+        assert isinstance(balance_get_response, MonzoBalance)
+        assert balance_get_response == balance
+        assert mocked_route.called
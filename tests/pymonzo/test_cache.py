@@ -0,0 +1,214 @@
+"""Test `pymonzo.cache` module."""
+
+import httpx
+import pytest
+import respx
+from pytest_mock import MockerFixture
+
+from pymonzo import MonzoAPI
+from pymonzo.cache import CacheStats, ResponseCache, make_cache_key
+
+from .test_balance import MonzoBalanceFactory
+from .test_pots import MonzoPotFactory
+from .test_transactions import MonzoTransactionFactory
+
+
+def test_make_cache_key() -> None:
+    """Cache key doesn't depend on the order of URL query parameters."""
+    assert make_cache_key("/accounts") == ("/accounts", ())
+    assert make_cache_key("/accounts", {}) == ("/accounts", ())
+    assert make_cache_key("/pots", {"b": 2, "a": "1"}) == (
+        "/pots",
+        (("a", "1"), ("b", "2")),
+    )
+    assert make_cache_key("/pots", {"a": 1, "b": 2}) == make_cache_key(
+        "/pots", {"b": 2, "a": 1}
+    )
+
+
+def test_cache_stats_hit_rate() -> None:
+    """Hit rate is a ratio of cache hits to all lookups."""
+    assert CacheStats().hit_rate == 0
+    assert CacheStats(hits=3, misses=1).hit_rate == 0.75
+
+
+class TestResponseCache:
+    """Test `ResponseCache` class."""
+
+    def test_get_set(self) -> None:
+        """Values are cached per namespace, with hit / miss statistics."""
+        cache = ResponseCache(ttls={"balance": 10})
+        key = make_cache_key("/balance", {"account_id": "acc_1"})
+
+        assert cache.get(key) is None
+
+        cache.set(key, "BALANCE", namespace="balance", size=7)
+
+        assert cache.get(key) == "BALANCE"
+        assert len(cache) == 1
+        assert cache.size == 7
+        assert cache.stats == CacheStats(hits=1, misses=1)
+
+        # Overwriting an entry doesn't count its size twice
+        cache.set(key, "NEW_BALANCE", namespace="balance", size=11)
+
+        assert cache.get(key) == "NEW_BALANCE"
+        assert cache.size == 11
+
+    def test_disabled_namespace(self) -> None:
+        """Namespaces without (positive) TTL aren't cached."""
+        cache = ResponseCache(ttls={"pots": 0})
+        key = make_cache_key("/pots")
+
+        assert cache.is_enabled("accounts")
+        assert not cache.is_enabled("pots")
+        assert not cache.is_enabled("balance")
+        assert not cache.is_enabled("UNKNOWN")
+
+        cache.set(key, "POTS", namespace="pots")
+
+        assert cache.get(key) is None
+
+    def test_ttl(self, mocker: MockerFixture) -> None:
+        """Cached values expire after their namespace TTL."""
+        mocked_monotonic = mocker.patch("pymonzo.cache.time.monotonic")
+        mocked_monotonic.return_value = 100
+
+        cache = ResponseCache(ttls={"balance": 10})
+        key = make_cache_key("/balance")
+        cache.set(key, "BALANCE", namespace="balance", size=7)
+
+        mocked_monotonic.return_value = 109.9
+        assert cache.get(key) == "BALANCE"
+
+        mocked_monotonic.return_value = 110
+        assert cache.get(key) is None
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_lru_eviction(self) -> None:
+        """Least recently used entries are evicted when the cache is full."""
+        cache = ResponseCache(ttls={"balance": 10}, max_entries=2)
+        key1, key2, key3 = (make_cache_key(f"/balance/{i}") for i in range(3))
+
+        cache.set(key1, 1, namespace="balance")
+        cache.set(key2, 2, namespace="balance")
+        cache.get(key1)
+        cache.set(key3, 3, namespace="balance")
+
+        assert cache.get(key1) == 1
+        assert cache.get(key2) is None
+        assert cache.get(key3) == 3
+        assert cache.stats.evictions == 1
+
+    def test_size_eviction(self) -> None:
+        """Entries are evicted when the cache size limit is exceeded."""
+        cache = ResponseCache(ttls={"balance": 10}, max_size=100)
+        key1, key2, key3 = (make_cache_key(f"/balance/{i}") for i in range(3))
+
+        cache.set(key1, 1, namespace="balance", size=60)
+        cache.set(key2, 2, namespace="balance", size=30)
+        cache.set(key3, 3, namespace="balance", size=30)
+
+        assert cache.get(key1) is None
+        assert cache.get(key2) == 2
+        assert cache.get(key3) == 3
+        assert cache.size == 60
+
+        # Values bigger than the whole cache aren't cached at all
+        cache.set(key1, 1, namespace="balance", size=101)
+
+        assert cache.get(key1) is None
+        assert len(cache) == 2
+
+    def test_invalidate(self) -> None:
+        """Entries are invalidated by endpoint and (a subset of) URL query params."""
+        cache = ResponseCache(ttls={"balance": 10, "pots": 10})
+        balance1 = make_cache_key("/balance", {"account_id": "acc_1"})
+        balance2 = make_cache_key("/balance", {"account_id": "acc_2"})
+        pots1 = make_cache_key("/pots", {"current_account_id": "acc_1"})
+        for key in (balance1, balance2):
+            cache.set(key, "BALANCE", namespace="balance")
+        cache.set(pots1, "POTS", namespace="pots")
+
+        assert cache.invalidate("/balance", {"account_id": "acc_1"}) == 1
+        assert cache.get(balance1) is None
+        assert cache.get(balance2) == "BALANCE"
+
+        assert cache.invalidate("/balance") == 1
+        assert cache.get(balance2) is None
+        assert cache.get(pots1) == "POTS"
+        assert cache.stats.invalidations == 2
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+@pytest.mark.respx(base_url=MonzoAPI.api_url)
+def test_write_invalidation(respx_mock: respx.MockRouter) -> None:
+    """Writes invalidate the cached responses they make stale."""
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        cache=ResponseCache(ttls={"balance": 60, "transactions": 60}),
+    )
+    account_id = "TEST_ACCOUNT_ID"
+    pot = MonzoPotFactory.build()
+    transaction = MonzoTransactionFactory.build()
+
+    balance_route = respx_mock.get("/balance", params={"account_id": account_id}).mock(
+        return_value=httpx.Response(
+            200, json=MonzoBalanceFactory.build().model_dump(mode="json")
+        )
+    )
+    pots_route = respx_mock.get(
+        "/pots", params={"current_account_id": account_id}
+    ).mock(return_value=httpx.Response(200, json={"pots": []}))
+    respx_mock.put(f"/pots/{pot.id}/deposit").mock(
+        return_value=httpx.Response(200, json=pot.model_dump(mode="json"))
+    )
+    transaction_route = respx_mock.get(f"/transactions/{transaction.id}").mock(
+        return_value=httpx.Response(
+            200, json={"transaction": transaction.model_dump(mode="json")}
+        )
+    )
+    respx_mock.patch(f"/transactions/{transaction.id}").mock(
+        return_value=httpx.Response(
+            200, json={"transaction": transaction.model_dump(mode="json")}
+        )
+    )
+
+    # Reads are cached
+    balance = monzo_api.balance.get(account_id)
+    assert monzo_api.balance.get(account_id) is balance
+    monzo_api.pots.list(account_id)
+    monzo_api.pots.list(account_id)
+    monzo_api.transactions.get(transaction.id)
+    monzo_api.transactions.get(transaction.id)
+
+    assert balance_route.call_count == 1
+    assert pots_route.call_count == 1
+    assert transaction_route.call_count == 1
+
+    # `refresh` skips the cache
+    monzo_api.balance.get(account_id, refresh=True)
+
+    assert balance_route.call_count == 2
+
+    # Moving money drops cached pots and balance of that account
+    monzo_api.pots.deposit(42, pot.id, account_id=account_id)
+    monzo_api.balance.get(account_id)
+    monzo_api.pots.list(account_id)
+
+    assert balance_route.call_count == 3
+    assert pots_route.call_count == 2
+
+    # Annotating a transaction drops it from the cache
+    monzo_api.transactions.annotate(transaction.id, {"foo": "bar"})
+    monzo_api.transactions.get(transaction.id)
+
+    assert transaction_route.call_count == 2
+
+    assert monzo_api.cache.stats.hits == 3
+    assert monzo_api.cache.stats.invalidations == 3
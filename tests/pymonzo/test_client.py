@@ -1,21 +1,44 @@
 """Test `pymonzo.client` module."""
 
 import json
+import ssl
 import types
 from pathlib import Path
+from typing import Union
 
+import httpx
 import pytest
 from pytest_mock import MockerFixture
 
-from pymonzo.accounts import AccountsResource
-from pymonzo.attachments import AttachmentsResource
-from pymonzo.balance import BalanceResource
-from pymonzo.client import MonzoAPI
+from pymonzo.accounts import AccountsResource, AsyncAccountsResource
+from pymonzo.attachments import AsyncAttachmentsResource, AttachmentsResource
+from pymonzo.balance import AsyncBalanceResource, BalanceResource
+from pymonzo.client import AsyncMonzoAPI, MonzoAPI, _get_ssl_context
 from pymonzo.exceptions import NoSettingsFile
-from pymonzo.feed import FeedResource
-from pymonzo.pots import PotsResource
-from pymonzo.transactions import TransactionsResource
-from pymonzo.webhooks import WebhooksResource
+from pymonzo.feed import AsyncFeedResource, FeedResource
+from pymonzo.oauth import AsyncTokenRefresher, TokenRefresher
+from pymonzo.pots import AsyncPotsResource, PotsResource
+from pymonzo.resources import MountedResource
+from pymonzo.transactions import AsyncTransactionsResource, TransactionsResource
+from pymonzo.webhooks import AsyncWebhooksResource, WebhooksResource
+
+
+def get_alpn_protocols(client: Union[httpx.Client, httpx.AsyncClient]) -> list[str]:
+    """Return ALPN protocols advertised by the client in a TLS ClientHello."""
+    ssl_context = client._transport._pool._ssl_context  # type: ignore
+    outgoing = ssl.MemoryBIO()
+    ssl_object = ssl_context.wrap_bio(
+        ssl.MemoryBIO(), outgoing, server_hostname="api.monzo.com"
+    )
+    with pytest.raises(ssl.SSLWantReadError):
+        ssl_object.do_handshake()
+
+    client_hello = outgoing.read()
+    return [
+        protocol
+        for protocol in ("http/1.1", "h2")
+        if bytes([len(protocol)]) + protocol.encode() in client_hello
+    ]
 
 
 class TestMonzoAPI:
@@ -68,6 +91,9 @@ class TestMonzoAPI:
             token_endpoint_auth_method="client_secret_post",  # noqa
             update_token=monzo_api._update_token,
             base_url=monzo_api.api_url,
+            settings_path=settings_path,
+            hooks=monzo_api.hooks,
+            verify=_get_ssl_context(False),
         )
 
         # This is a shortcut to the underlying method
@@ -94,6 +120,27 @@ class TestMonzoAPI:
         assert isinstance(monzo_api.webhooks, WebhooksResource)
         assert monzo_api.webhooks.client is monzo_api
 
+    def test_lazy_resources(self) -> None:
+        """Resources are mounted on first access and then reused."""
+        monzo_api = MonzoAPI(access_token="TEST_ACCESS_TOKEN")  # noqa
+
+        assert "accounts" not in vars(monzo_api)
+        assert isinstance(MonzoAPI.accounts, MountedResource)
+
+        accounts = monzo_api.accounts
+
+        assert vars(monzo_api)["accounts"] is accounts
+        assert monzo_api.accounts is accounts
+        assert "pots" not in vars(monzo_api)
+
+        # Resources aren't shared between clients
+        other_monzo_api = MonzoAPI(access_token="TEST_ACCESS_TOKEN")  # noqa
+        assert other_monzo_api.accounts is not accounts
+        assert other_monzo_api.accounts.client is other_monzo_api
+
+        # Loading CA certificates is slow, so the SSL context is shared
+        assert _get_ssl_context(False) is _get_ssl_context(False)
+
     def test_init_with_arguments(self, mocker: MockerFixture) -> None:
         """Client is initialized with settings from passed arguments."""
         access_token = "EXPLICIT_TEST_ACCESS_TOKEN"  # noqa
@@ -121,6 +168,9 @@ class TestMonzoAPI:
             token_endpoint_auth_method="client_secret_post",  # noqa
             update_token=monzo_api._update_token,
             base_url=monzo_api.api_url,
+            settings_path=None,
+            hooks=monzo_api.hooks,
+            verify=_get_ssl_context(False),
         )
 
         # This is a shortcut to the underlying method
@@ -147,6 +197,70 @@ class TestMonzoAPI:
         assert isinstance(monzo_api.webhooks, WebhooksResource)
         assert monzo_api.webhooks.client is monzo_api
 
+    def test_init_with_http_options(self, mocker: MockerFixture) -> None:
+        """HTTP client options are passed to the underlying HTTP client."""
+        mocked_OAuth2Client = mocker.patch(  # noqa
+            "pymonzo.client.OAuth2Client",
+            autospec=True,
+        )
+
+        limits = httpx.Limits(max_connections=42, keepalive_expiry=60)
+        timeout = httpx.Timeout(10, connect=5)
+        transport = httpx.HTTPTransport(retries=1)
+
+        monzo_api = MonzoAPI(
+            access_token="TEST_ACCESS_TOKEN",  # noqa
+            limits=limits,
+            timeout=timeout,
+            transport=transport,
+        )
+
+        mocked_OAuth2Client.assert_called_once_with(
+            client_id=None,
+            client_secret=None,
+            token={"access_token": "TEST_ACCESS_TOKEN"},
+            authorization_endpoint=monzo_api.authorization_endpoint,
+            token_endpoint=monzo_api.token_endpoint,
+            token_endpoint_auth_method="client_secret_post",  # noqa
+            update_token=monzo_api._update_token,
+            base_url=monzo_api.api_url,
+            settings_path=None,
+            hooks=monzo_api.hooks,
+            limits=limits,
+            timeout=timeout,
+            transport=transport,
+        )
+
+    def test_init_with_http2(self) -> None:
+        """HTTP/2 clients advertise HTTP/2 support, while sharing SSL contexts."""
+        pytest.importorskip("h2")
+
+        monzo_api = MonzoAPI(access_token="TEST_ACCESS_TOKEN")  # noqa
+        http2_monzo_api = MonzoAPI(access_token="TEST_ACCESS_TOKEN", http2=True)  # noqa
+        async_monzo_api = AsyncMonzoAPI(
+            access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+            http2=True,
+        )
+
+        assert get_alpn_protocols(monzo_api.session) == ["http/1.1"]
+        assert get_alpn_protocols(http2_monzo_api.session) == ["http/1.1", "h2"]
+        assert get_alpn_protocols(async_monzo_api.session) == ["http/1.1", "h2"]
+        assert _get_ssl_context(True) is _get_ssl_context(True)
+        assert _get_ssl_context(True) is not _get_ssl_context(False)
+
+    def test_init_with_transport(self) -> None:
+        """Custom transport is used for API requests."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"path": request.url.path})
+        )
+
+        monzo_api = MonzoAPI(
+            access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+            transport=transport,
+        )
+
+        assert monzo_api.session.get("/foo").json() == {"path": "/foo"}
+
     def test_authorize(self, tmp_path: Path, mocker: MockerFixture) -> None:
         """Auth flow is executed to get API access token."""
         settings_path = tmp_path / "pymonzo_test"
@@ -236,3 +350,139 @@ class TestMonzoAPI:
             loaded_settings = json.load(f)
 
         assert loaded_settings["token"] == new_token
+
+    def test_start_token_refresher(self, monzo_api: MonzoAPI) -> None:
+        """Background token refresher is started (and restarted)."""
+        token_refresher = monzo_api.start_token_refresher(margin=60)
+
+        assert isinstance(token_refresher, TokenRefresher)
+        assert token_refresher.client is monzo_api.session
+        assert token_refresher.margin == 60
+        assert monzo_api.token_refresher is token_refresher
+
+        new_token_refresher = monzo_api.start_token_refresher()
+
+        assert monzo_api.token_refresher is new_token_refresher
+        assert not token_refresher.running
+
+        new_token_refresher.stop()
+
+
+class TestAsyncMonzoAPI:
+    """Test `AsyncMonzoAPI` class."""
+
+    def test_init(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """Client is initialized with settings loaded from disk."""
+        settings_path = tmp_path / "pymonzo_test"
+        AsyncMonzoAPI.settings_path = settings_path
+
+        # Settings file doesn't exist
+        with pytest.raises(NoSettingsFile, match=r"No settings file found.*"):
+            AsyncMonzoAPI()
+
+        # Settings file exists
+        settings = {
+            "client_id": "TEST_CLIENT_ID",
+            "client_secret": "TEST_CLIENT_SECRET",
+            "token": {
+                "access_token": "TEST_ACCESS_TOKEN",
+            },
+        }
+
+        with open(settings_path, "w") as f:
+            json.dump(settings, f, indent=4)
+
+        mocked_AsyncOAuth2Client = mocker.patch(  # noqa
+            "pymonzo.client.AsyncOAuth2Client",
+            autospec=True,
+        )
+
+        monzo_api = AsyncMonzoAPI()
+
+        assert monzo_api._settings.model_dump() == settings
+        assert monzo_api.session is mocked_AsyncOAuth2Client.return_value
+
+        mocked_AsyncOAuth2Client.assert_called_once_with(
+            client_id=settings["client_id"],
+            client_secret=settings["client_secret"],
+            token=settings["token"],
+            authorization_endpoint=monzo_api.authorization_endpoint,
+            token_endpoint=monzo_api.token_endpoint,
+            token_endpoint_auth_method="client_secret_post",  # noqa
+            update_token=monzo_api._update_token,
+            base_url=monzo_api.api_url,
+            settings_path=settings_path,
+            hooks=monzo_api.hooks,
+            verify=_get_ssl_context(False),
+        )
+
+        # This is a shortcut to the underlying method
+        assert isinstance(monzo_api.whoami, types.MethodType)
+
+        assert isinstance(monzo_api.accounts, AsyncAccountsResource)
+        assert monzo_api.accounts.client is monzo_api
+
+        assert isinstance(monzo_api.attachments, AsyncAttachmentsResource)
+        assert monzo_api.attachments.client is monzo_api
+
+        assert isinstance(monzo_api.balance, AsyncBalanceResource)
+        assert monzo_api.balance.client is monzo_api
+
+        assert isinstance(monzo_api.feed, AsyncFeedResource)
+        assert monzo_api.feed.client is monzo_api
+
+        assert isinstance(monzo_api.pots, AsyncPotsResource)
+        assert monzo_api.pots.client is monzo_api
+
+        assert isinstance(monzo_api.transactions, AsyncTransactionsResource)
+        assert monzo_api.transactions.client is monzo_api
+
+        assert isinstance(monzo_api.webhooks, AsyncWebhooksResource)
+        assert monzo_api.webhooks.client is monzo_api
+
+    @pytest.mark.anyio()
+    async def test_context_manager(self, async_monzo_api: AsyncMonzoAPI) -> None:
+        """Underlying HTTP client is closed when exiting the context manager."""
+        async with async_monzo_api as monzo_api:
+            assert monzo_api is async_monzo_api
+            assert not monzo_api.session.is_closed
+
+        assert async_monzo_api.session.is_closed
+
+    @pytest.mark.anyio()
+    async def test_update_token(
+        self,
+        tmp_path: Path,
+        async_monzo_api: AsyncMonzoAPI,
+    ) -> None:
+        """Settings are updated and saved to the disk."""
+        settings_path = tmp_path / "pymonzo_test"
+        new_token = {"access_token": "NEW_TEST_TOKEN"}
+
+        async_monzo_api._settings.save_to_disk(settings_path)
+
+        async_monzo_api.settings_path = settings_path
+        await async_monzo_api._update_token(new_token)
+
+        assert async_monzo_api._settings.token == new_token
+
+        with open(settings_path) as f:
+            loaded_settings = json.load(f)
+
+        assert loaded_settings["token"] == new_token
+
+    @pytest.mark.anyio()
+    async def test_start_token_refresher(
+        self,
+        async_monzo_api: AsyncMonzoAPI,
+    ) -> None:
+        """Background token refresher is started and stopped with the client."""
+        async with async_monzo_api as monzo_api:
+            token_refresher = await monzo_api.start_token_refresher(margin=60)
+
+            assert isinstance(token_refresher, AsyncTokenRefresher)
+            assert token_refresher.client is monzo_api.session
+            assert token_refresher.margin == 60
+            assert monzo_api.token_refresher is token_refresher
+
+        assert not token_refresher.running
@@ -0,0 +1,175 @@
+"""Test `pymonzo.export` module."""
+
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+
+import pytest
+import zstandard
+from pytest_mock import MockerFixture
+
+from pymonzo import MonzoAPI
+from pymonzo.cli import main
+from pymonzo.export import (
+    CSV_FIELDS,
+    ExportMarker,
+    export_transactions,
+    get_resume_marker_path,
+    infer_compression,
+)
+from pymonzo.testing import Ledger, MonzoEmulator
+from pymonzo.transactions import MonzoTransaction
+
+
+@pytest.fixture()
+def emulated_api() -> MonzoAPI:
+    """Return a `MonzoAPI` instance talking to the emulator."""
+    emulator = MonzoEmulator(Ledger.generate(seed=1, transactions=250))
+    return MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.transport(),
+    )
+
+
+def read_ndjson(content: bytes) -> list[MonzoTransaction]:
+    """Parse NDJSON export."""
+    return [MonzoTransaction.model_validate_json(line) for line in content.splitlines()]
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("export.ndjson", None),
+        ("export.ndjson.gz", "gzip"),
+        ("export.csv.zst", "zstd"),
+    ],
+)
+def test_infer_compression(path: str, expected: str) -> None:
+    """Compression is inferred from the file extension."""
+    assert infer_compression(path) == expected
+
+
+def test_export_ndjson(emulated_api: MonzoAPI, tmp_path: Path) -> None:
+    """Transactions are exported as NDJSON, and a resume marker is saved."""
+    path = tmp_path / "export.ndjson"
+
+    result = export_transactions(emulated_api, path)
+
+    transactions = emulated_api.transactions.list()
+    assert read_ndjson(path.read_bytes()) == transactions
+    assert result.count == result.total == 250
+    assert result.last_id == transactions[-1].id
+    assert result.resumed is False
+
+    marker = ExportMarker.load(get_resume_marker_path(path))
+    assert marker is not None
+    assert marker.last_id == transactions[-1].id
+    assert marker.offset == path.stat().st_size
+
+
+def test_export_csv_stream(emulated_api: MonzoAPI) -> None:
+    """Transactions can be exported as CSV to a binary stream."""
+    output = io.BytesIO()
+
+    result = export_transactions(
+        emulated_api,
+        output,
+        export_format="csv",
+        expand_merchant=True,
+    )
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue().decode())))
+    transactions = emulated_api.transactions.list(expand_merchant=True)
+
+    assert result.count == len(rows) == 250
+    assert tuple(rows[0]) == CSV_FIELDS
+    assert [row["id"] for row in rows] == [tx.id for tx in transactions]
+    assert rows[0]["is_load"] == "True"
+    assert any(row["merchant_name"] for row in rows)
+
+    with pytest.raises(ValueError, match="Only file exports can be resumed"):
+        export_transactions(emulated_api, output, resume=True)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_export_resume(
+    emulated_api: MonzoAPI,
+    tmp_path: Path,
+    compression: str,
+) -> None:
+    """Interrupted exports are truncated to the last checkpoint and resumed."""
+    path = tmp_path / "export.csv"
+    transactions = emulated_api.transactions.list()
+
+    result = export_transactions(
+        emulated_api,
+        path,
+        export_format="csv",
+        compression=compression,
+        before=transactions[120].created,
+        checkpoint_interval=50,
+    )
+    assert result.count == 120
+
+    # Simulate data written after the last checkpoint
+    with open(path, "ab") as f:
+        f.write(b"PARTIALLY WRITTEN PAGE")
+
+    result = export_transactions(
+        emulated_api,
+        path,
+        export_format="csv",
+        compression=compression,
+        resume=True,
+        checkpoint_interval=50,
+    )
+    assert result.resumed is True
+    assert result.count == 130
+    assert result.total == 250
+
+    if compression == "gzip":
+        content = gzip.decompress(path.read_bytes())
+    else:
+        with zstandard.ZstdDecompressor().stream_reader(
+            path.read_bytes(),
+            read_across_frames=True,
+        ) as reader:
+            content = reader.read()
+
+    rows = list(csv.DictReader(io.StringIO(content.decode())))
+    assert [row["id"] for row in rows] == [tx.id for tx in transactions]
+
+    with pytest.raises(ValueError, match="doesn't match the export"):
+        export_transactions(emulated_api, path, resume=True)
+
+
+def test_cli(
+    emulated_api: MonzoAPI,
+    tmp_path: Path,
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """`pymonzo export transactions` streams transactions to a file or stdout."""
+    mocker.patch("pymonzo.MonzoAPI", return_value=emulated_api)
+    path = tmp_path / "export.ndjson.gz"
+    transactions = emulated_api.transactions.list()
+
+    assert main(["export", "transactions", "--output", str(path)]) == 0
+    assert read_ndjson(gzip.decompress(path.read_bytes())) == transactions
+    assert "250 transactions written" in capsys.readouterr().err
+
+    assert main(["export", "transactions", "-o", str(path), "--resume"]) == 0
+    assert "Resumed export: 0 transactions" in capsys.readouterr().err
+
+    since = transactions[-10].id
+    assert main(["export", "transactions", "--since", since]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [
+        tx.id for tx in transactions[-9:]
+    ]
+
+    assert main(["export", "transactions", "--resume"]) == 2
+    assert main(["export", "transactions", "--account-id", "acc_00009NOPE"]) == 1
+    assert "not found" in capsys.readouterr().err
@@ -0,0 +1,151 @@
+"""Test `pymonzo.fanout` module."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pymonzo import AsyncMonzoAPI, MonzoAPI
+from pymonzo.fanout import AccountResults, RateLimiter, async_fan_out, fan_out
+
+from .test_accounts import MonzoAccountFactory
+from .test_balance import MonzoBalanceFactory
+from .test_pots import MonzoPotFactory
+
+
+def test_fan_out() -> None:
+    """Function is called concurrently (but bounded) for every account."""
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def fn(account_id: str) -> str:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+        if account_id == "acc_error":
+            raise ValueError("TEST")
+        return account_id.upper()
+
+    account_ids = ["acc_1", "acc_2", "acc_error", "acc_3", "acc_1", "acc_4"]
+    results = fan_out(fn, account_ids, max_concurrency=2)
+
+    assert results == {
+        "acc_1": "ACC_1",
+        "acc_2": "ACC_2",
+        "acc_3": "ACC_3",
+        "acc_4": "ACC_4",
+    }
+    assert list(results.errors) == ["acc_error"]
+    assert isinstance(results.errors["acc_error"], ValueError)
+    assert max_running == 2
+
+    assert fan_out(fn, []) == AccountResults()
+
+
+@pytest.mark.anyio()
+async def test_async_fan_out() -> None:
+    """Async function is called concurrently (but bounded) for every account."""
+    running = 0
+    max_running = 0
+
+    async def fn(account_id: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+        if account_id == "acc_error":
+            raise ValueError("TEST")
+        return account_id.upper()
+
+    account_ids = ["acc_1", "acc_2", "acc_error", "acc_3", "acc_1"]
+    results = await async_fan_out(fn, account_ids, max_concurrency=2)
+
+    assert results == {"acc_1": "ACC_1", "acc_2": "ACC_2", "acc_3": "ACC_3"}
+    assert list(results.errors) == ["acc_error"]
+    assert max_running == 2
+
+
+def test_account_results_repr() -> None:
+    """Representation includes both results and errors."""
+    error = ValueError("TEST")
+    results = AccountResults({"acc_1": 1}, errors={"acc_2": error})
+
+    assert (
+        repr(results)
+        == f"AccountResults({{'acc_1': 1}}, errors={{'acc_2': {error!r}}})"
+    )
+
+
+def test_rate_limiter() -> None:
+    """Calls are spaced out to the passed rate."""
+    rate_limiter = RateLimiter(100)
+
+    start = time.monotonic()
+    for _ in range(6):
+        rate_limiter.wait()
+
+    assert time.monotonic() - start >= 0.05
+
+    with pytest.raises(ValueError, match="positive"):
+        RateLimiter(0)
+
+
+def test_get_many() -> None:
+    """Balances of all active accounts are fetched, with errors per account."""
+    active_account = MonzoAccountFactory.build(closed=False)
+    failing_account = MonzoAccountFactory.build(closed=False)
+    closed_account = MonzoAccountFactory.build(closed=True)
+    balance = MonzoBalanceFactory.build()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/accounts":
+            accounts = [active_account, failing_account, closed_account]
+            return httpx.Response(
+                200, json={"accounts": [a.model_dump(mode="json") for a in accounts]}
+            )
+
+        if request.url.params["account_id"] == failing_account.id:
+            return httpx.Response(403, json={"code": "forbidden", "message": "TEST"})
+        return httpx.Response(200, json=balance.model_dump(mode="json"))
+
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+    )
+
+    balances = monzo_api.balance.get_many()
+
+    assert balances == {active_account.id: balance}
+    assert list(balances.errors) == [failing_account.id]
+
+
+@pytest.mark.anyio()
+async def test_async_list_many() -> None:
+    """Pots of passed accounts are fetched concurrently."""
+    pots = {account_id: MonzoPotFactory.batch(2) for account_id in ("acc_1", "acc_2")}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        account_pots = pots[request.url.params["current_account_id"]]
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200, json={"pots": [p.model_dump(mode="json") for p in account_pots]}
+        )
+
+    async with AsyncMonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+    ) as monzo_api:
+        results = await monzo_api.pots.list_many(["acc_1", "acc_2"])
+
+    assert results == pots
+    assert results.errors == {}
@@ -0,0 +1,26 @@
+"""Test `pymonzo.formatting` module."""
+
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pymonzo import formatting, utils
+
+
+@pytest.mark.parametrize("babel_available", [True, False], ids=["babel", "fallback"])
+def test_formatters(mocker: MockerFixture, babel_available: bool) -> None:
+    """Amounts and dates are formatted with `babel` or the fallback formatters."""
+    if babel_available and not formatting.BABEL_AVAILABLE:
+        pytest.skip("babel isn't installed")
+
+    mocker.patch.object(formatting, "BABEL_AVAILABLE", babel_available)
+    format_datetime_fallback = mocker.spy(utils, "format_datetime")
+    format_currency_fallback = mocker.spy(utils, "format_currency")
+
+    dt = datetime(2024, 1, 1, 12, 30)
+
+    assert "2024" in formatting.format_datetime(dt)
+    assert "12.50" in formatting.format_currency(12.5, "GBP")
+    assert format_datetime_fallback.called is not babel_available
+    assert format_currency_fallback.called is not babel_available
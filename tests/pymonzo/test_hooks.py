@@ -0,0 +1,296 @@
+"""Test `pymonzo.hooks` module."""
+
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from pymonzo import MonzoAPI
+from pymonzo.exceptions import MonzoAPIError
+from pymonzo.hooks import (
+    Hook,
+    Hooks,
+    ParseEvent,
+    RequestEndEvent,
+    RequestStartEvent,
+    RetryEvent,
+    TokenRefreshEvent,
+    get_endpoint_template,
+)
+from pymonzo.retries import RetryPolicy
+
+from .test_transactions import MonzoTransactionFactory
+
+
+class RecordingHook(Hook):
+    """Hook that records all events."""
+
+    def __init__(self) -> None:
+        """Initialize the hook."""
+        self.events: list[Any] = []
+
+    def on_request_start(self, event: RequestStartEvent) -> None:
+        """Record event."""
+        self.events.append(event)
+
+    def on_request_end(self, event: RequestEndEvent) -> None:
+        """Record event."""
+        self.events.append(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Record event."""
+        self.events.append(event)
+
+    def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        """Record event."""
+        self.events.append(event)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        """Record event."""
+        self.events.append(event)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "expected"),
+    [
+        ("/accounts", "/accounts"),
+        ("/ping/whoami", "/ping/whoami"),
+        ("/transactions/tx_00009ABCDEF", "/transactions/{id}"),
+        ("/pots/pot_00009ABCDEF/deposit", "/pots/{id}/deposit"),
+        ("/webhooks/webhook_00009ABCDEF", "/webhooks/{id}"),
+        ("/attachment/upload", "/attachment/upload"),
+    ],
+)
+def test_get_endpoint_template(endpoint: str, expected: str) -> None:
+    """Object IDs are replaced with a placeholder."""
+    assert get_endpoint_template(endpoint) == expected
+
+
+def test_hooks() -> None:
+    """Events are passed to all registered hooks, in order."""
+    hook1, hook2 = RecordingHook(), RecordingHook()
+    hooks = Hooks([hook1])
+
+    assert hooks
+    assert not Hooks()
+
+    hooks.add(hook2)
+    event = TokenRefreshEvent(latency=0.1)
+    hooks.on_token_refresh(event)
+
+    hooks.remove(hook1)
+    hooks.on_token_refresh(event)
+
+    assert hook1.events == [event]
+    assert hook2.events == [event, event]
+
+
+def test_api_call_events() -> None:
+    """API calls emit request, retry and parse events."""
+    transaction = MonzoTransactionFactory.build(id="tx_00009TEST")
+    content = {"transaction": transaction.model_dump(mode="json")}
+    responses = iter(
+        [httpx.Response(503), httpx.Response(200, json=content)],
+    )
+
+    hook = RecordingHook()
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(lambda request: next(responses)),
+        retry_policy=RetryPolicy(max_retries=1, backoff_factor=0),
+        hooks=[hook],
+    )
+
+    monzo_api.transactions.get(transaction.id)
+
+    start1, end1, retry, start2, end2, parse = hook.events
+
+    assert start1 == RequestStartEvent(
+        request_id=start1.request_id,
+        method="get",
+        endpoint="/transactions/tx_00009TEST",
+        endpoint_template="/transactions/{id}",
+        attempt=0,
+    )
+    assert isinstance(end1, RequestEndEvent)
+    assert end1.request_id == start1.request_id
+    assert end1.status_code == 503
+    assert end1.latency > 0
+
+    assert isinstance(retry, RetryEvent)
+    assert retry.attempt == 1
+
+    assert start2.attempt == 1
+    assert start2.request_id != start1.request_id
+    assert end2.status_code == 200
+    assert end2.size == len(httpx.Response(200, json=content).content)
+
+    assert isinstance(parse, ParseEvent)
+    assert parse.endpoint_template == "/transactions/{id}"
+    assert parse.size == end2.size
+
+
+def test_transport_error_event() -> None:
+    """Transport errors are reported in the request end event."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("TEST", request=request)
+
+    hook = RecordingHook()
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+        hooks=[hook],
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        monzo_api.whoami()
+
+    _, end = hook.events
+
+    assert end.status_code is None
+    assert isinstance(end.error, httpx.ConnectError)
+
+
+def test_prometheus_hook() -> None:
+    """Prometheus metrics are labeled with method and endpoint template."""
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from pymonzo.hooks.prometheus import PrometheusHook
+
+    registry = prometheus_client.CollectorRegistry()
+    hook = PrometheusHook(registry)
+
+    hook.on_request_end(
+        RequestEndEvent(
+            request_id=1,
+            method="get",
+            endpoint="/transactions/tx_00009TEST",
+            endpoint_template="/transactions/{id}",
+            attempt=0,
+            latency=0.25,
+            status_code=200,
+            size=1024,
+        )
+    )
+    hook.on_retry(
+        RetryEvent(method="get", endpoint="/pots/pot_00009TEST", attempt=1, delay=1)
+    )
+    hook.on_parse(
+        ParseEvent(
+            endpoint="/accounts",
+            endpoint_template="/accounts",
+            duration=0.01,
+            size=100,
+        )
+    )
+    hook.on_token_refresh(TokenRefreshEvent(latency=0.5, error=ValueError()))
+
+    labels = {"method": "GET", "endpoint": "/transactions/{id}", "status": "200"}
+    assert (
+        registry.get_sample_value("pymonzo_request_duration_seconds_sum", labels)
+        == 0.25
+    )
+    assert (
+        registry.get_sample_value(
+            "pymonzo_response_size_bytes_sum",
+            {"method": "GET", "endpoint": "/transactions/{id}"},
+        )
+        == 1024
+    )
+    assert (
+        registry.get_sample_value(
+            "pymonzo_request_retries_total",
+            {"method": "GET", "endpoint": "/pots/{id}"},
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "pymonzo_parse_duration_seconds_count", {"endpoint": "/accounts"}
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "pymonzo_token_refresh_duration_seconds_count", {"outcome": "error"}
+        )
+        == 1
+    )
+
+
+def test_opentelemetry_hook() -> None:
+    """API calls are recorded as OpenTelemetry spans."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+    from opentelemetry.trace import SpanKind, StatusCode
+
+    from pymonzo.hooks.otel import OpenTelemetryHook
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(lambda request: httpx.Response(404)),
+        hooks=[OpenTelemetryHook(tracer_provider)],
+    )
+
+    with pytest.raises(MonzoAPIError, match="404"):
+        monzo_api.transactions.get("tx_00009TEST")
+
+    (span,) = exporter.get_finished_spans()
+
+    assert span.name == "GET /transactions/{id}"
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes is not None
+    assert span.attributes["url.template"] == "/transactions/{id}"
+    assert span.attributes["http.response.status_code"] == 404
+    assert span.status.status_code == StatusCode.ERROR
+
+
+def test_opentelemetry_hook_retries(mocker: MockerFixture) -> None:
+    """Retries are recorded as their own spans, without an ambient span."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from pymonzo.hooks.otel import OpenTelemetryHook
+
+    mocker.patch("pymonzo.resources.time.sleep", autospec=True)
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    responses = iter([httpx.Response(503), httpx.Response(404)])
+
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(lambda request: next(responses)),
+        retry_policy=RetryPolicy(max_retries=1, jitter=False),
+        hooks=[OpenTelemetryHook(tracer_provider)],
+    )
+
+    with pytest.raises(MonzoAPIError, match="404"):
+        monzo_api.transactions.get("tx_00009TEST")
+
+    first, retry, second = exporter.get_finished_spans()
+
+    assert first.name == second.name == "GET /transactions/{id}"
+    assert first.attributes is not None
+    assert "http.request.resend_count" not in first.attributes
+    assert second.attributes is not None
+    assert second.attributes["http.request.resend_count"] == 1
+
+    assert retry.name == "pymonzo retry GET /transactions/{id}"
+    assert retry.attributes is not None
+    assert retry.attributes["url.template"] == "/transactions/{id}"
+    assert retry.attributes["pymonzo.retry.attempt"] == 1
+    assert retry.attributes["http.response.status_code"] == 503
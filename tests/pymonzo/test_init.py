@@ -0,0 +1,36 @@
+"""Test `pymonzo` package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pymonzo
+from pymonzo.client import AsyncMonzoAPI, MonzoAPI
+
+
+def test_lazy_attributes() -> None:
+    """Client classes are importable from the top level package."""
+    assert pymonzo.MonzoAPI is MonzoAPI
+    assert pymonzo.AsyncMonzoAPI is AsyncMonzoAPI
+    assert {"MonzoAPI", "AsyncMonzoAPI", "__version__"} <= set(dir(pymonzo))
+
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        pymonzo.foo  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    ("statement", "not_imported"),
+    [
+        ("import pymonzo", ["pymonzo.client", "httpx", "authlib", "rich", "babel"]),
+        ("import pymonzo.transactions.schemas", ["pymonzo.client", "babel"]),
+    ],
+)
+def test_lazy_imports(statement: str, not_imported: list[str]) -> None:
+    """Heavy (and optional) dependencies aren't imported until they're needed."""
+    code = f"{statement}; import sys; print(' '.join(sys.modules))"
+    args = [sys.executable, "-c", code]
+    output = subprocess.check_output(args, text=True)  # noqa: S603
+
+    imported = set(output.split())
+    assert not imported & set(not_imported)
@@ -0,0 +1,374 @@
+"""Test `pymonzo.oauth` module."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+import anyio
+import httpx
+import pytest
+from authlib.oauth2.rfc6749 import OAuth2Token
+
+from pymonzo.hooks import Hook, Hooks, TokenRefreshEvent
+from pymonzo.oauth import (
+    AsyncOAuth2Client,
+    AsyncTokenRefresher,
+    OAuth2Client,
+    TokenRefresher,
+    get_lock_path,
+    get_refresh_delay,
+    lock_file,
+)
+from pymonzo.settings import PyMonzoSettings
+
+TOKEN_ENDPOINT = "https://api.monzo.com/oauth2/token"  # noqa: S105
+
+
+def build_token(access_token: str, expires_in: int) -> dict:
+    """Build OAuth token expiring in passed number of seconds."""
+    return {
+        "access_token": access_token,
+        "refresh_token": f"{access_token}_REFRESH",
+        "token_type": "Bearer",
+        "expires_at": int(time.time()) + expires_in,
+    }
+
+
+class TokenEndpoint:
+    """Fake Monzo API, counting token refreshes."""
+
+    def __init__(self) -> None:
+        """Initialize fake Monzo API."""
+        self.refreshes = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Handle request."""
+        if request.url == TOKEN_ENDPOINT:
+            self.refreshes += 1
+            # Make the race between threads more likely
+            time.sleep(0.05)
+            token = build_token(f"REFRESHED_{self.refreshes}", 3600)
+            return httpx.Response(200, json={**token, "expires_in": 3600})
+
+        return httpx.Response(
+            200, json={"authorization": request.headers["Authorization"]}
+        )
+
+
+def build_client_kwargs(settings_path: Path, **kwargs: Any) -> dict:
+    """Build OAuth 2 client kwargs."""
+    settings = PyMonzoSettings.load_from_disk(settings_path)
+
+    return {
+        "client_id": settings.client_id,
+        "client_secret": settings.client_secret,
+        "token": settings.token,
+        "token_endpoint": TOKEN_ENDPOINT,
+        "token_endpoint_auth_method": "client_secret_post",
+        "base_url": "https://api.monzo.com",
+        "settings_path": settings_path,
+        **kwargs,
+    }
+
+
+@pytest.fixture()
+def settings_path(tmp_path: Path) -> Path:
+    """Return path of a settings file with an expired token."""
+    settings_path = tmp_path / ".pymonzo"
+    settings = PyMonzoSettings(
+        client_id="TEST_CLIENT_ID",
+        client_secret="TEST_CLIENT_SECRET",  # noqa: S106
+        token=build_token("EXPIRED", -60),
+    )
+    settings.save_to_disk(settings_path)
+
+    return settings_path
+
+
+def test_lock_file(tmp_path: Path) -> None:
+    """Lock file is created next to the settings file and can be re-acquired."""
+    settings_path = tmp_path / ".pymonzo"
+    lock_path = get_lock_path(settings_path)
+
+    assert lock_path == tmp_path / ".pymonzo.lock"
+
+    with lock_file(lock_path):
+        assert lock_path.exists()
+
+    with lock_file(lock_path):
+        pass
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    """Wait until passed condition is met."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition wasn't met in time"
+        time.sleep(0.01)
+
+
+def test_get_refresh_delay() -> None:
+    """Refresh delay is based on token expiry date and refresh margin."""
+    token = OAuth2Token.from_dict(build_token("TEST", 600))
+
+    assert 299 <= get_refresh_delay(token, 300) <= 300  # type: ignore
+    assert get_refresh_delay(token, 900) == 0
+
+    # Tokens that can't be refreshed
+    assert get_refresh_delay(None, 300) is None
+    assert get_refresh_delay(OAuth2Token({"access_token": "TEST"}), 300) is None
+    assert (
+        get_refresh_delay(
+            OAuth2Token({"refresh_token": "TEST", "access_token": "TEST"}), 300
+        )
+        is None
+    )
+
+
+class TestOAuth2Client:
+    """Test `OAuth2Client` class."""
+
+    def test_single_flight_refresh(self, settings_path: Path) -> None:
+        """Concurrent requests with an expired token refresh it only once."""
+        token_endpoint = TokenEndpoint()
+        saved_tokens = []
+
+        def update_token(token: dict, **kwargs: Any) -> None:
+            saved_tokens.append(token)
+            PyMonzoSettings(token=token).save_to_disk(settings_path)
+
+        client = OAuth2Client(
+            **build_client_kwargs(
+                settings_path,
+                update_token=update_token,
+                transport=httpx.MockTransport(token_endpoint),
+            )
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda _: client.get("/ping"), range(8)))
+
+        assert token_endpoint.refreshes == 1
+        assert len(saved_tokens) == 1
+        assert {response.json()["authorization"] for response in responses} == {
+            "Bearer REFRESHED_1"
+        }
+
+    def test_reload_token_from_disk(self, settings_path: Path) -> None:
+        """Token refreshed by another process is reloaded instead of refreshed."""
+        token_endpoint = TokenEndpoint()
+
+        client = OAuth2Client(
+            **build_client_kwargs(
+                settings_path,
+                transport=httpx.MockTransport(token_endpoint),
+            )
+        )
+
+        # Another process refreshes the token
+        settings = PyMonzoSettings.load_from_disk(settings_path)
+        settings.token = build_token("ROTATED_ELSEWHERE", 3600)
+        settings.save_to_disk(settings_path)
+
+        response = client.get("/ping")
+
+        assert token_endpoint.refreshes == 0
+        assert response.json()["authorization"] == "Bearer ROTATED_ELSEWHERE"
+        assert client.token["access_token"] == "ROTATED_ELSEWHERE"  # noqa: S105
+
+    def test_no_settings_path(self, settings_path: Path) -> None:
+        """Token is refreshed without the settings file, using in-process lock."""
+        token_endpoint = TokenEndpoint()
+
+        client_kwargs = build_client_kwargs(
+            settings_path,
+            transport=httpx.MockTransport(token_endpoint),
+        )
+        client_kwargs["settings_path"] = None
+        client = OAuth2Client(**client_kwargs)
+
+        response = client.get("/ping")
+
+        assert token_endpoint.refreshes == 1
+        assert response.json()["authorization"] == "Bearer REFRESHED_1"
+
+
+class TestAsyncOAuth2Client:
+    """Test `AsyncOAuth2Client` class."""
+
+    @pytest.mark.anyio()
+    async def test_single_flight_refresh(self, settings_path: Path) -> None:
+        """Concurrent requests with an expired token refresh it only once."""
+        token_endpoint = TokenEndpoint()
+        saved_tokens = []
+
+        async def update_token(token: dict, **kwargs: Any) -> None:
+            saved_tokens.append(token)
+            PyMonzoSettings(token=token).save_to_disk(settings_path)
+
+        client = AsyncOAuth2Client(
+            **build_client_kwargs(
+                settings_path,
+                update_token=update_token,
+                transport=httpx.MockTransport(token_endpoint),
+            )
+        )
+
+        authorizations = set()
+
+        async def ping() -> None:
+            response = await client.get("/ping")
+            authorizations.add(response.json()["authorization"])
+
+        async with anyio.create_task_group() as task_group:
+            for _ in range(8):
+                task_group.start_soon(ping)
+
+        assert token_endpoint.refreshes == 1
+        assert len(saved_tokens) == 1
+        assert authorizations == {"Bearer REFRESHED_1"}
+
+    @pytest.mark.anyio()
+    async def test_reload_token_from_disk(self, settings_path: Path) -> None:
+        """Token refreshed by another process is reloaded instead of refreshed."""
+        token_endpoint = TokenEndpoint()
+
+        client = AsyncOAuth2Client(
+            **build_client_kwargs(
+                settings_path,
+                transport=httpx.MockTransport(token_endpoint),
+            )
+        )
+
+        # Another process refreshes the token
+        with open(settings_path) as f:
+            settings = json.load(f)
+        settings["token"] = build_token("ROTATED_ELSEWHERE", 3600)
+        PyMonzoSettings(**settings).save_to_disk(settings_path)
+
+        response = await client.get("/ping")
+
+        assert token_endpoint.refreshes == 0
+        assert response.json()["authorization"] == "Bearer ROTATED_ELSEWHERE"
+
+
+class TestTokenRefresher:
+    """Test `TokenRefresher` class."""
+
+    def test_refresh_before_expiry(self, settings_path: Path) -> None:
+        """Token is refreshed in the background before it expires."""
+        settings = PyMonzoSettings.load_from_disk(settings_path)
+        settings.token = build_token("EXPIRING", 2)
+        settings.save_to_disk(settings_path)
+
+        token_endpoint = TokenEndpoint()
+        client = OAuth2Client(
+            **build_client_kwargs(
+                settings_path,
+                transport=httpx.MockTransport(token_endpoint),
+            )
+        )
+
+        with TokenRefresher(client, margin=1.9) as token_refresher:
+            token_refresher.start()
+            assert token_refresher.running
+
+            refreshed_token = "REFRESHED_1"  # noqa: S105
+            wait_for(lambda: client.token["access_token"] == refreshed_token)
+
+        assert not token_refresher.running
+
+        # API requests don't need to refresh the token anymore
+        response = client.get("/ping")
+
+        assert token_endpoint.refreshes == 1
+        assert response.json()["authorization"] == "Bearer REFRESHED_1"
+
+    def test_refresh_error(self, settings_path: Path) -> None:
+        """Failed token refresh is reported and retried."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        client = OAuth2Client(
+            **build_client_kwargs(settings_path, transport=httpx.MockTransport(handler))
+        )
+        errors: list[Exception] = []
+
+        with TokenRefresher(
+            client, retry_interval=0.01, on_error=errors.append
+        ) as token_refresher:
+            token_refresher.start()
+            wait_for(lambda: len(errors) >= 2)
+
+        assert all(isinstance(e, httpx.ConnectError) for e in errors)
+
+    def test_no_expiry(self, settings_path: Path) -> None:
+        """Tokens without expiry date aren't refreshed."""
+        client_kwargs = build_client_kwargs(settings_path)
+        client_kwargs["token"] = {"access_token": "TEST_ACCESS_TOKEN"}
+        client = OAuth2Client(**client_kwargs)
+
+        token_refresher = TokenRefresher(client).start()
+        wait_for(lambda: not token_refresher.running)
+
+
+class TestAsyncTokenRefresher:
+    """Test `AsyncTokenRefresher` class."""
+
+    @pytest.mark.anyio()
+    async def test_refresh_before_expiry(self, settings_path: Path) -> None:
+        """Token is refreshed in the background before it expires."""
+        settings = PyMonzoSettings.load_from_disk(settings_path)
+        settings.token = build_token("EXPIRING", 2)
+        settings.save_to_disk(settings_path)
+
+        token_endpoint = TokenEndpoint()
+        client = AsyncOAuth2Client(
+            **build_client_kwargs(
+                settings_path,
+                transport=httpx.MockTransport(token_endpoint),
+            )
+        )
+
+        async with AsyncTokenRefresher(client, margin=1.9) as token_refresher:
+            token_refresher.start()
+            assert token_refresher.running
+
+            with anyio.fail_after(5):
+                while client.token["access_token"] != "REFRESHED_1":  # noqa: S105
+                    await anyio.sleep(0.01)
+
+        assert token_endpoint.refreshes == 1
+
+        assert not token_refresher.running
+
+
+def test_token_refresh_event(settings_path: Path) -> None:
+    """Token refresh emits an event."""
+    events: list[TokenRefreshEvent] = []
+
+    class RecordingHook(Hook):
+        """Hook that records token refresh events."""
+
+        def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+            """Record event."""
+            events.append(event)
+
+    client = OAuth2Client(
+        **build_client_kwargs(
+            settings_path,
+            transport=httpx.MockTransport(TokenEndpoint()),
+            hooks=Hooks([RecordingHook()]),
+        )
+    )
+
+    client.get("/ping/whoami")
+
+    (event,) = events
+
+    assert isinstance(event, TokenRefreshEvent)
+    assert event.error is None
+    assert event.latency > 0
@@ -0,0 +1,128 @@
+"""Test `pymonzo.parsing` module."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+from pytest_mock import MockerFixture
+
+from pymonzo import parsing
+from pymonzo.accounts import MonzoAccount, MonzoAccountOwner
+from pymonzo.parsing import (
+    TrustedRecord,
+    get_record_type,
+    get_type_adapter,
+    loads,
+    parse_records,
+    parse_response,
+)
+from pymonzo.transactions import MonzoTransaction
+
+from .test_accounts import MonzoAccountFactory
+from .test_transactions import (
+    MonzoTransactionFactory,
+    MonzoTransactionMerchantFactory,
+)
+
+
+@pytest.mark.parametrize("orjson_available", [True, False], ids=["orjson", "json"])
+def test_loads(mocker: MockerFixture, orjson_available: bool) -> None:
+    """JSON is decoded with `orjson` (if available) or `json`."""
+    if orjson_available and not parsing.ORJSON_AVAILABLE:
+        pytest.skip("orjson isn't installed")
+
+    mocker.patch.object(parsing, "ORJSON_AVAILABLE", orjson_available)
+
+    assert loads(b'{"foo": [1, "bar", null]}') == {"foo": [1, "bar", None]}
+    assert loads('{"foo": true}') == {"foo": True}
+
+
+def test_parse_response() -> None:
+    """Raw API response is validated into expected type."""
+    transaction = MonzoTransactionFactory.build(merchant="TEST_MERCHANT")
+    transaction2 = MonzoTransactionFactory.build(merchant="TEST_MERCHANT")
+
+    content = json.dumps(
+        {
+            "transactions": [
+                transaction.model_dump(mode="json"),
+                transaction2.model_dump(mode="json"),
+            ],
+            "other_key": "ignored",
+        }
+    ).encode()
+    transactions = parse_response(content, list[MonzoTransaction], "transactions")
+    assert transactions == [transaction, transaction2]
+
+    content = json.dumps(transaction.model_dump(mode="json")).encode()
+    assert parse_response(content, MonzoTransaction) == transaction
+
+    content = json.dumps({"transaction": {"id": "tx_123"}}).encode()
+    with pytest.raises(ValidationError):
+        parse_response(content, MonzoTransaction, "transaction")
+
+
+def test_get_type_adapter_cached() -> None:
+    """Type adapters are only built once per type."""
+    adapter = get_type_adapter(list[MonzoTransaction], "transactions")
+
+    assert get_type_adapter(list[MonzoTransaction], "transactions") is adapter
+    assert get_type_adapter(list[MonzoTransaction]) is not adapter
+
+
+def test_parse_records() -> None:
+    """Trusted records are built without validation, converting nested objects."""
+    merchant = MonzoTransactionMerchantFactory.build()
+    transaction = MonzoTransactionFactory.build(merchant=merchant, counterparty=None)
+    transaction2 = MonzoTransactionFactory.build(merchant="TEST_MERCHANT")
+    transaction_json = {
+        **transaction.model_dump(mode="json"),
+        "counterparty": {},
+        "undocumented": 1,
+    }
+
+    content = json.dumps(
+        {"transactions": [transaction_json, transaction2.model_dump(mode="json")]}
+    ).encode()
+    record, record2 = parse_records(content, list[MonzoTransaction], "transactions")
+
+    assert isinstance(record, TrustedRecord)
+    assert type(record).__name__ == "MonzoTransactionRecord"
+    assert record.id == transaction.id
+    assert record.created == transaction.created
+    assert record.merchant.name == merchant.name
+    assert record.merchant.address.city == merchant.address.city
+    assert record.counterparty is None
+    assert record.model_extra == {"undocumented": 1}
+    assert record.to_model() == transaction.model_copy(update={"undocumented": 1})
+    assert record2.merchant == "TEST_MERCHANT"
+    assert record2.to_model() == transaction2
+
+    # Values are used as returned by the API
+    content = json.dumps({"transaction": {"id": "tx_123", "amount": "1.5"}}).encode()
+    record = parse_records(content, MonzoTransaction, "transaction")
+
+    assert record.amount == "1.5"
+    assert record.created is None
+    assert record.category is None
+    with pytest.raises(ValidationError):
+        record.to_model()
+
+    account = MonzoAccountFactory.build(
+        owners=[MonzoAccountOwner(user_id="TEST_USER_ID")],
+        payment_details=None,
+    )
+    content = json.dumps({"accounts": [account.model_dump(mode="json")]}).encode()
+    (record,) = parse_records(content, list[MonzoAccount], "accounts")
+
+    assert record.owners[0].user_id == "TEST_USER_ID"
+    assert record.to_model() == account
+
+
+def test_get_record_type_cached() -> None:
+    """Record types are only built once per schema."""
+    record_type = get_record_type(MonzoTransaction)
+
+    assert get_record_type(MonzoTransaction) is record_type
+    assert record_type.model is MonzoTransaction
+    assert record_type.__slots__ == ()
@@ -3,10 +3,16 @@
 import httpx
 import pytest
 import respx
+from pytest_mock import MockerFixture
 
-from pymonzo import MonzoAPI
-from pymonzo.exceptions import MonzoAccessDenied, MonzoAPIError
-from pymonzo.resources import BaseResource
+from pymonzo import AsyncMonzoAPI, MonzoAPI
+from pymonzo.exceptions import (
+    MonzoAccessDenied,
+    MonzoAPIError,
+    MonzoRateLimitExceeded,
+)
+from pymonzo.resources import AsyncBaseResource, BaseResource
+from pymonzo.retries import RetryEvent, RetryPolicy
 
 
 @pytest.fixture(scope="module")
@@ -15,6 +21,12 @@ def base_resource(monzo_api: MonzoAPI) -> BaseResource:
     return BaseResource(client=monzo_api)
 
 
+@pytest.fixture()
+def async_base_resource(async_monzo_api: AsyncMonzoAPI) -> AsyncBaseResource:
+    """Initialize `AsyncBaseResource` resource with `async_monzo_api` fixture."""
+    return AsyncBaseResource(client=async_monzo_api)
+
+
 class TestBaseResource:
     """Test `BaseResource` class."""
 
@@ -73,3 +85,145 @@ class TestBaseResource:
             base_resource._get_response(method="get", endpoint="/http500")
 
         assert mocked_route.called
+
+    def test__get_response_retries(
+        self,
+        mocker: MockerFixture,
+        respx_mock: respx.MockRouter,
+        base_resource: BaseResource,
+    ) -> None:
+        """Failed requests are retried according to the client retry policy."""
+        mocked_sleep = mocker.patch("pymonzo.resources.time.sleep", autospec=True)
+        retry_events: list[RetryEvent] = []
+        mocker.patch.object(
+            base_resource.client,
+            "retry_policy",
+            RetryPolicy(max_retries=2, jitter=False, on_retry=retry_events.append),
+        )
+
+        # Transient errors are retried
+        mocked_route = respx_mock.get("/foo").mock(
+            side_effect=[
+                httpx.ConnectError("Connection error"),
+                httpx.Response(503),
+                httpx.Response(200, json={}),
+            ]
+        )
+
+        response = base_resource._get_response(method="get", endpoint="/foo")
+
+        assert response.status_code == 200
+        assert mocked_route.call_count == 3
+        assert [call.args for call in mocked_sleep.call_args_list] == [(0.5,), (1,)]
+        assert [(e.attempt, e.status_code) for e in retry_events] == [
+            (1, None),
+            (2, 503),
+        ]
+        assert isinstance(retry_events[0].error, httpx.ConnectError)
+
+        # Retries are exhausted
+        mocked_route = respx_mock.get("/rate-limited").mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "2"}),
+        )
+
+        with pytest.raises(
+            MonzoRateLimitExceeded, match=r".*after 2 retries"
+        ) as rate_limit_exc:
+            base_resource._get_response(method="get", endpoint="/rate-limited")
+
+        assert rate_limit_exc.value.retries == 2
+        assert rate_limit_exc.value.retry_after == 2
+        assert mocked_route.call_count == 3
+
+        # Non-idempotent requests aren't retried...
+        mocked_route = respx_mock.post("/bar").mock(return_value=httpx.Response(503))
+
+        with pytest.raises(MonzoAPIError) as e:
+            base_resource._get_response(method="post", endpoint="/bar")
+
+        assert e.value.retries == 0
+        assert mocked_route.call_count == 1
+
+        # ...unless explicitly marked as safe to retry
+        mocked_route = respx_mock.put("/baz").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={})]
+        )
+
+        base_resource._get_response(method="put", endpoint="/baz", idempotent=True)
+
+        assert mocked_route.call_count == 2
+
+
+class TestAsyncBaseResource:
+    """Test `AsyncBaseResource` class."""
+
+    @pytest.mark.anyio()
+    async def test__get_response(
+        self,
+        respx_mock: respx.MockRouter,
+        async_base_resource: AsyncBaseResource,
+    ) -> None:
+        """Correct request is sent, response errors are raised."""
+        data = {"response": "TEST_RESPONSE"}
+        form_data = {"foo": "TEST_FOO"}
+
+        mocked_route = respx_mock.put("/foo/bar", data=form_data).mock(
+            return_value=httpx.Response(200, json=data)
+        )
+
+        response = await async_base_resource._get_response(
+            method="put",
+            endpoint="/foo/bar",
+            data=form_data,
+        )
+
+        assert response.json() == data
+        assert mocked_route.called
+
+        # HTTP 403
+        mocked_route = respx_mock.get("/http403").mock(return_value=httpx.Response(403))
+
+        with pytest.raises(MonzoAccessDenied):
+            await async_base_resource._get_response(method="get", endpoint="/http403")
+
+        assert mocked_route.called
+
+        # HTTP 404 with JSON response
+        mocked_route = respx_mock.get("/http404").mock(
+            return_value=httpx.Response(
+                404,
+                json={"code": "404", "message": "Error message"},
+            )
+        )
+
+        with pytest.raises(MonzoAPIError, match=r"Error message \(404\)"):
+            await async_base_resource._get_response(method="get", endpoint="/http404")
+
+        assert mocked_route.called
+
+    @pytest.mark.anyio()
+    async def test__get_response_retries(
+        self,
+        mocker: MockerFixture,
+        respx_mock: respx.MockRouter,
+        async_base_resource: AsyncBaseResource,
+    ) -> None:
+        """Failed requests are retried according to the client retry policy."""
+        mocked_sleep = mocker.patch("pymonzo.resources.asyncio.sleep", autospec=True)
+        async_base_resource.client.retry_policy = RetryPolicy(jitter=False)
+
+        mocked_route = respx_mock.get("/foo").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "3"}),
+                httpx.Response(200, json={}),
+            ]
+        )
+
+        response = await async_base_resource._get_response(
+            method="get",
+            endpoint="/foo",
+        )
+
+        assert response.status_code == 200
+        assert mocked_route.call_count == 2
+        mocked_sleep.assert_awaited_once_with(3)
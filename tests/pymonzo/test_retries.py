@@ -0,0 +1,90 @@
+"""Test `pymonzo.retries` module."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from freezegun import freeze_time
+
+from pymonzo.retries import RetryPolicy, parse_retry_after
+
+
+@freeze_time("2024-01-14 12:00:00")
+def test_parse_retry_after() -> None:
+    """`Retry-After` header is parsed, both in seconds and HTTP date formats."""
+    assert parse_retry_after(httpx.Response(429)) is None
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "7"})) == 7
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "-1"})) == 0
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "?"})) is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=42)
+    response = httpx.Response(
+        429,
+        headers={"Retry-After": format_datetime(retry_at, usegmt=True)},
+    )
+    assert parse_retry_after(response) == 42
+
+
+class TestRetryPolicy:
+    """Test `RetryPolicy` class."""
+
+    def test_get_backoff(self) -> None:
+        """Backoff grows exponentially, is capped and (optionally) jittered."""
+        retry_policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        assert retry_policy.get_backoff(1) == 1
+        assert retry_policy.get_backoff(2) == 2
+        assert retry_policy.get_backoff(3) == 4
+        assert retry_policy.get_backoff(4) == 5
+
+        retry_policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=True)
+
+        for attempt in range(1, 10):
+            assert 0 <= retry_policy.get_backoff(attempt) <= 5
+
+    @pytest.mark.parametrize(
+        ("method", "attempt", "idempotent", "response", "expected"),
+        [
+            # Retryable status codes
+            ("get", 1, False, httpx.Response(429), 1),
+            ("get", 2, False, httpx.Response(503), 2),
+            ("get", 1, False, None, 1),
+            # Max retries
+            ("get", 4, False, httpx.Response(503), None),
+            # Non retryable status codes
+            ("get", 1, False, httpx.Response(400), None),
+            ("get", 1, False, httpx.Response(404), None),
+            # Non idempotent methods
+            ("post", 1, False, httpx.Response(503), None),
+            ("put", 1, False, None, None),
+            ("put", 1, True, httpx.Response(503), 1),
+            # `Retry-After` header
+            ("get", 1, False, httpx.Response(429, headers={"Retry-After": "3"}), 3),
+            ("get", 1, False, httpx.Response(429, headers={"Retry-After": "60"}), None),
+        ],
+    )
+    def test_get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        idempotent: bool,
+        response: httpx.Response,
+        expected: float,
+    ) -> None:
+        """Only retryable requests are retried."""
+        retry_policy = RetryPolicy(
+            max_retries=3,
+            backoff_factor=1,
+            max_backoff=10,
+            jitter=False,
+        )
+
+        delay = retry_policy.get_retry_delay(
+            method,
+            attempt,
+            idempotent=idempotent,
+            response=response,
+        )
+
+        assert delay == expected
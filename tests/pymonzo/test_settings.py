@@ -50,3 +50,16 @@ class TestPyMonzoSettings:
             loaded_settings = json.load(f)
 
         assert loaded_settings == settings.model_dump(mode="json")
+
+    def test_save_to_disk_atomic(self, tmp_path: Path) -> None:
+        """Settings file is atomically replaced and not publicly accessible."""
+        settings_path = tmp_path / ".pymonzo-test"
+        settings_path.write_text("OLD")
+
+        settings = PyMonzoSettingsFactory.build()
+        settings.save_to_disk(settings_path)
+
+        # Only the settings file is left behind
+        assert list(tmp_path.iterdir()) == [settings_path]
+        assert settings_path.stat().st_mode & 0o777 == 0o600
+        assert PyMonzoSettings.load_from_disk(settings_path) == settings
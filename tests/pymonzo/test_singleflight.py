@@ -0,0 +1,169 @@
+"""Test `pymonzo.singleflight` module."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from pymonzo import AsyncMonzoAPI, MonzoAPI
+from pymonzo.singleflight import AsyncSingleFlight, SingleFlight
+
+from .test_accounts import MonzoAccountFactory
+from .test_balance import MonzoBalanceFactory
+
+
+class TestSingleFlight:
+    """Test `SingleFlight` class."""
+
+    def test_do(self) -> None:
+        """Concurrent calls with the same key share a single call."""
+        single_flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def fn() -> object:
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(single_flight.do, "KEY", fn)
+            started.wait()
+            followers = [executor.submit(single_flight.do, "KEY", fn) for _ in range(3)]
+            results = [leader.result(), *[f.result() for f in followers]]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert single_flight.coalesced == 3
+
+        # Calls that aren't concurrent aren't coalesced
+        assert single_flight.do("KEY", fn) is not results[0]
+        assert len(calls) == 2
+
+    def test_do_error(self) -> None:
+        """Errors are shared with all waiting callers."""
+        single_flight = SingleFlight()
+        started = threading.Event()
+
+        def fn() -> None:
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("TEST")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "KEY", fn)
+            started.wait()
+            follower = executor.submit(single_flight.do, "KEY", fn)
+
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match="TEST"):
+                    future.result()
+
+
+class TestAsyncSingleFlight:
+    """Test `AsyncSingleFlight` class."""
+
+    @pytest.mark.anyio()
+    async def test_do(self) -> None:
+        """Concurrent calls with the same key share a single call."""
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn() -> object:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(
+            *[single_flight.do("KEY", fn) for _ in range(4)],
+            single_flight.do("OTHER_KEY", fn),
+        )
+
+        assert len(calls) == 2
+        assert all(result is results[0] for result in results[:4])
+        assert results[4] is not results[0]
+        assert single_flight.coalesced == 3
+
+    @pytest.mark.anyio()
+    async def test_do_cancelled(self) -> None:
+        """Cancelling the first caller doesn't cancel the call for the others."""
+        single_flight = AsyncSingleFlight()
+
+        async def fn() -> str:
+            await asyncio.sleep(0.05)
+            return "RESULT"
+
+        leader = asyncio.ensure_future(single_flight.do("KEY", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("KEY", fn))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "RESULT"
+        assert leader.cancelled()
+
+
+def test_client_coalesces_requests() -> None:
+    """Identical concurrent API calls share a single HTTP request."""
+    accounts = MonzoAccountFactory.batch(2)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        time.sleep(0.2)
+        return httpx.Response(
+            200, json={"accounts": [a.model_dump(mode="json") for a in accounts]}
+        )
+
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: monzo_api.accounts.list(), range(8)))
+
+    assert len(requests) == 1
+    assert all(result is results[0] for result in results)
+
+    # Request coalescing can be disabled
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+        coalesce_requests=False,
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda _: monzo_api.accounts.list(), range(2)))
+
+    assert len(requests) == 3
+
+
+@pytest.mark.anyio()
+async def test_async_client_coalesces_requests() -> None:
+    """Identical concurrent API calls share a single HTTP request."""
+    balance = MonzoBalanceFactory.build()
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=balance.model_dump(mode="json"))
+
+    async with AsyncMonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+    ) as monzo_api:
+        results = await asyncio.gather(
+            *[monzo_api.balance.get("TEST_ACCOUNT_ID") for _ in range(8)],
+            monzo_api.balance.get("OTHER_ACCOUNT_ID"),
+        )
+
+    assert len(requests) == 2
+    assert all(result is results[0] for result in results[:8])
+    assert results[0] == balance
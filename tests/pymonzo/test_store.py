@@ -0,0 +1,225 @@
+"""Test `pymonzo.store` module."""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pymonzo import MonzoAPI
+from pymonzo.store import TransactionStore
+from pymonzo.transactions import MonzoTransactionDeclineReason
+
+from .test_accounts import MonzoAccountFactory
+from .test_transactions import MonzoTransactionFactory
+
+START = datetime(2024, 1, 14, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def transaction_store(monzo_api: MonzoAPI) -> Iterator[TransactionStore]:
+    """Initialize in-memory `TransactionStore` with `monzo_api` fixture."""
+    with TransactionStore(monzo_api, ":memory:") as store:
+        yield store
+
+
+class TestTransactionStore:
+    """Test `TransactionStore` class."""
+
+    def test_upsert(self, transaction_store: TransactionStore) -> None:
+        """Transactions are inserted, updated and queried by account and date."""
+        account_id = "TEST_ACCOUNT_ID"
+        transactions = [
+            MonzoTransactionFactory.build(
+                merchant="TEST_MERCHANT",
+                created=START + timedelta(days=i),
+                settled=None,
+            )
+            for i in range(3)
+        ]
+
+        assert transaction_store.upsert(account_id, transactions) == 3
+        assert transaction_store.count(account_id) == 3
+        assert transaction_store.count("OTHER_ACCOUNT_ID") == 0
+
+        assert transaction_store.get(transactions[0].id) == transactions[0]
+        assert transaction_store.get("UNKNOWN_ID") is None
+
+        assert transaction_store.list(account_id) == transactions
+        assert transaction_store.list(
+            account_id,
+            since=START + timedelta(days=1),
+            before=START + timedelta(days=2),
+        ) == [transactions[1]]
+
+        # Existing transactions are updated
+        settled = transactions[0].model_copy(update={"settled": START})
+        transaction_store.upsert(account_id, [settled])
+
+        assert transaction_store.count(account_id) == 3
+        assert transaction_store.get(settled.id) == settled
+
+    def test_sync_start(self, transaction_store: TransactionStore) -> None:
+        """Sync starts at the oldest pending or the newest stored transaction."""
+        account_id = "TEST_ACCOUNT_ID"
+
+        assert transaction_store.get_high_water_mark(account_id) is None
+        assert transaction_store.get_oldest_pending(account_id) is None
+        assert transaction_store.get_sync_start(account_id) is None
+
+        settled = MonzoTransactionFactory.build(
+            merchant="TEST_MERCHANT",
+            created=START,
+            settled=START,
+        )
+        declined = MonzoTransactionFactory.build(
+            merchant="TEST_MERCHANT",
+            created=START + timedelta(days=1),
+            settled=None,
+            decline_reason=MonzoTransactionDeclineReason.INSUFFICIENT_FUNDS,
+        )
+        pending = MonzoTransactionFactory.build(
+            merchant="TEST_MERCHANT",
+            created=START + timedelta(days=2),
+            settled=None,
+            decline_reason=None,
+        )
+        newest = MonzoTransactionFactory.build(
+            merchant="TEST_MERCHANT",
+            created=START + timedelta(days=3),
+            settled=START + timedelta(days=3),
+        )
+
+        transaction_store.upsert(account_id, [settled, declined, newest])
+
+        assert transaction_store.get_high_water_mark(account_id) == newest.created
+        assert transaction_store.get_oldest_pending(account_id) is None
+        assert transaction_store.get_sync_start(account_id) == newest.created
+
+        transaction_store.upsert(account_id, [pending])
+
+        assert transaction_store.get_oldest_pending(account_id) == pending.created
+        assert transaction_store.get_sync_start(account_id) == pending.created
+
+    def test_coverage(self, transaction_store: TransactionStore) -> None:
+        """Covered time windows are merged, gaps are computed from them."""
+        account_id = "TEST_ACCOUNT_ID"
+        end = START + timedelta(days=10)
+
+        assert transaction_store.get_gaps(account_id, START, end) == [(START, end)]
+
+        transaction_store.add_coverage(
+            account_id,
+            START + timedelta(days=1),
+            START + timedelta(days=2),
+        )
+        transaction_store.add_coverage(
+            account_id,
+            START + timedelta(days=5),
+            START + timedelta(days=6),
+        )
+        # Overlapping windows are merged
+        transaction_store.add_coverage(
+            account_id,
+            START + timedelta(days=1, hours=12),
+            START + timedelta(days=3),
+        )
+
+        assert transaction_store.get_coverage(account_id) == [
+            (START + timedelta(days=1), START + timedelta(days=3)),
+            (START + timedelta(days=5), START + timedelta(days=6)),
+        ]
+        assert transaction_store.get_gaps(account_id, START, end) == [
+            (START, START + timedelta(days=1)),
+            (START + timedelta(days=3), START + timedelta(days=5)),
+            (START + timedelta(days=6), end),
+        ]
+        assert transaction_store.get_gaps("OTHER_ACCOUNT_ID", START, end) == [
+            (START, end)
+        ]
+
+    def test_sync(
+        self,
+        mocker: MockerFixture,
+        transaction_store: TransactionStore,
+    ) -> None:
+        """Only new and pending transactions are fetched."""
+        account = MonzoAccountFactory.build()
+        mocked_get_default_account = mocker.patch.object(
+            transaction_store.client.accounts,
+            "get_default_account",
+        )
+        mocked_get_default_account.return_value = account
+
+        transactions = [
+            MonzoTransactionFactory.build(
+                merchant="TEST_MERCHANT",
+                created=START + timedelta(minutes=i),
+                settled=START,
+            )
+            for i in range(150)
+        ]
+        mocked_iter_all = mocker.patch.object(
+            transaction_store.client.transactions,
+            "iter_all",
+        )
+        mocked_iter_all.return_value = iter(transactions)
+
+        # Full history is fetched on the first sync
+        assert transaction_store.sync() == 150
+        assert transaction_store.count(account.id) == 150
+
+        mocked_iter_all.assert_called_once_with(
+            account.id,
+            expand_merchant=False,
+            since=None,
+        )
+        mocked_iter_all.reset_mock()
+        # Synced period is covered
+        assert (
+            transaction_store.get_gaps(account.id, START, START + timedelta(days=1))
+            == []
+        )
+
+        # Only new transactions are fetched on subsequent syncs
+        new_transaction = MonzoTransactionFactory.build(
+            merchant="TEST_MERCHANT",
+            created=START + timedelta(days=1),
+            settled=None,
+            decline_reason=None,
+        )
+        mocked_iter_all.return_value = iter([transactions[-1], new_transaction])
+
+        assert transaction_store.sync(account.id, expand_merchant=True) == 2
+        assert transaction_store.count(account.id) == 151
+
+        mocked_iter_all.assert_called_once_with(
+            account.id,
+            expand_merchant=True,
+            since=transactions[-1].created,
+        )
+
+    def test_sync_recent_history(
+        self,
+        mocker: MockerFixture,
+        transaction_store: TransactionStore,
+    ) -> None:
+        """Only the recent history is covered, unless older transactions came."""
+        account_id = "TEST_ACCOUNT_ID"
+        now = datetime.now(timezone.utc)
+        recent = MonzoTransactionFactory.build(
+            merchant="TEST_MERCHANT",
+            created=now - timedelta(days=10),
+            settled=now - timedelta(days=10),
+        )
+        mocked_iter_all = mocker.patch.object(
+            transaction_store.client.transactions,
+            "iter_all",
+        )
+        mocked_iter_all.return_value = iter([recent])
+
+        transaction_store.sync(account_id)
+
+        [(start, end)] = transaction_store.get_coverage(account_id)
+        assert now - timedelta(days=91) < start < now - timedelta(days=89)
+        assert end >= now
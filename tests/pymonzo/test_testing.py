@@ -0,0 +1,294 @@
+"""Test `pymonzo.testing` module."""
+
+import threading
+
+import httpx
+import pytest
+
+from pymonzo import AsyncMonzoAPI, MonzoAPI
+from pymonzo.exceptions import MonzoAPIError, MonzoRateLimitExceeded
+from pymonzo.retries import RetryPolicy
+from pymonzo.testing import Faults, Ledger, MonzoEmulator
+from pymonzo.webhooks import MonzoWebhookEvent
+
+
+@pytest.fixture()
+def emulator() -> MonzoEmulator:
+    """Return a `MonzoEmulator` instance."""
+    return MonzoEmulator(Ledger.generate(seed=1, accounts=2, transactions=300))
+
+
+@pytest.fixture()
+def emulated_api(emulator: MonzoEmulator) -> MonzoAPI:
+    """Return a `MonzoAPI` instance talking to the emulator."""
+    return MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.transport(),
+        retry_policy=RetryPolicy(max_retries=0),
+    )
+
+
+def test_ledger_generate() -> None:
+    """Generated data only depends on the seed."""
+    ledger1 = Ledger.generate(seed=1, transactions=50)
+    ledger2 = Ledger.generate(seed=1, transactions=50)
+    ledger3 = Ledger.generate(seed=2, transactions=50)
+
+    (account_id,) = ledger1.accounts
+    transactions = ledger1.list_transactions(account_id)
+
+    assert list(ledger2.accounts) == [account_id]
+    assert [tx["id"] for tx in ledger2.list_transactions(account_id)] == [
+        tx["id"] for tx in transactions
+    ]
+    assert list(ledger3.accounts) != [account_id]
+
+    assert len(transactions) == 50
+    assert transactions[0]["is_load"] is True
+    assert [tx["created"] for tx in transactions] == sorted(
+        tx["created"] for tx in transactions
+    )
+    assert ledger1.balances[account_id] == sum(
+        tx["amount"] for tx in transactions if "decline_reason" not in tx
+    )
+    assert len(ledger1.list_pots(account_id)) == 2
+
+
+def test_emulated_endpoints(emulated_api: MonzoAPI) -> None:
+    """Emulated endpoints work with pymonzo resources."""
+    assert emulated_api.whoami().authenticated is True
+
+    account1, account2 = emulated_api.accounts.list()
+
+    pots = emulated_api.pots.list(account1.id)
+    assert all(pot.current_account_id == account1.id for pot in pots)
+
+    transactions = emulated_api.transactions.list(account2.id, expand_merchant=True)
+    assert len(transactions) == 300
+    assert all(tx.account_id == account2.id for tx in transactions)  # type: ignore
+
+    webhook = emulated_api.webhooks.register("https://example.com", account1.id)
+    assert emulated_api.webhooks.list(account1.id) == [webhook]
+    assert emulated_api.webhooks.list(account2.id) == []
+    assert emulated_api.webhooks.delete(webhook.id) == {}
+
+    upload = emulated_api.attachments.upload(
+        file_name="receipt.png",
+        file_type="image/png",
+        content_length=1024,
+    )
+    attachment = emulated_api.attachments.register(
+        transactions[0].id,
+        file_url=upload.file_url,
+        file_type="image/png",
+    )
+    assert attachment.external_id == transactions[0].id
+    assert emulated_api.attachments.deregister(attachment.id) == {}
+
+    with pytest.raises(MonzoAPIError, match="not_found"):
+        emulated_api.webhooks.delete(webhook.id)
+
+    with pytest.raises(MonzoAPIError, match="not_found"):
+        emulated_api.balance.get("acc_00009UNKNOWN")
+
+
+def test_pot_money_movements(emulated_api: MonzoAPI, emulator: MonzoEmulator) -> None:
+    """Pot deposits and withdrawals move money, and are deduplicated."""
+    account_id = next(iter(emulator.ledger.accounts))
+    pot = emulated_api.pots.list(account_id)[0]
+    balance = emulated_api.balance.get(account_id)
+
+    deposited = emulated_api.pots.deposit(
+        1000, pot.id, account_id=account_id, dedupe_id="TEST"
+    )
+    emulated_api.pots.deposit(1000, pot.id, account_id=account_id, dedupe_id="TEST")
+    withdrawn = emulated_api.pots.withdraw(300, pot.id, account_id=account_id)
+
+    assert deposited.balance == pot.balance + 1000
+    assert withdrawn.balance == pot.balance + 700
+
+    new_balance = emulated_api.balance.get(account_id)
+    assert new_balance.balance == balance.balance - 700
+    assert new_balance.total_balance == balance.total_balance
+
+    transaction = emulated_api.transactions.list(account_id)[-1]
+    assert transaction.amount == 300
+    assert transaction.metadata["pot_id"] == pot.id
+
+    with pytest.raises(MonzoAPIError, match="insufficient_funds"):
+        emulated_api.pots.withdraw(10**9, pot.id, account_id=account_id)
+
+
+def test_transactions_pagination(
+    emulated_api: MonzoAPI,
+    emulator: MonzoEmulator,
+) -> None:
+    """Transactions can be paginated by time and transaction ID."""
+    account_id = next(iter(emulator.ledger.accounts))
+    transactions = emulated_api.transactions.list(account_id)
+
+    page = emulated_api.transactions.list(
+        account_id, since=transactions[99].id, limit=100
+    )
+    assert page == transactions[100:200]
+
+    page = emulated_api.transactions.list(
+        account_id,
+        since=transactions[10].created,
+        before=transactions[20].created,
+    )
+    assert page == transactions[10:20]
+
+    assert list(emulated_api.transactions.iter_all(account_id)) == transactions
+
+    with pytest.raises(MonzoAPIError, match="bad_param.limit"):
+        emulated_api.transactions.list(account_id, limit=1000)
+
+
+def test_annotate_transaction(
+    emulated_api: MonzoAPI,
+    emulator: MonzoEmulator,
+) -> None:
+    """Transaction metadata keys are updated and deleted."""
+    account_id = next(iter(emulator.ledger.accounts))
+    transaction = emulated_api.transactions.list(account_id)[-1]
+
+    emulated_api.transactions.annotate(transaction.id, {"a": "1", "b": "2"})
+    annotated = emulated_api.transactions.annotate(transaction.id, {"a": ""})
+
+    assert annotated.metadata == {**transaction.metadata, "b": "2"}
+    assert emulated_api.transactions.get(transaction.id) == annotated
+
+
+def test_webhook_event(emulator: MonzoEmulator) -> None:
+    """Webhook events can be generated for card payments."""
+    ledger = emulator.ledger
+    account_id = next(iter(ledger.accounts))
+    merchant_id = next(iter(ledger.merchants))
+    transaction = ledger.add_transaction(account_id, -100, merchant_id=merchant_id)
+
+    event = MonzoWebhookEvent.model_validate(ledger.webhook_event(transaction["id"]))
+
+    assert event.type == "transaction.created"
+    assert event.data.id == transaction["id"]
+    assert event.data.merchant.id == merchant_id
+
+
+def test_authentication(emulator: MonzoEmulator) -> None:
+    """Only accepted and issued access tokens can be used."""
+    emulator.access_tokens = {"VALID_ACCESS_TOKEN"}
+
+    with httpx.Client(
+        base_url=MonzoAPI.api_url,
+        transport=emulator.transport(),
+    ) as client:
+        assert client.get("/ping/whoami").status_code == 401
+        response = client.get(
+            "/ping/whoami", headers={"Authorization": "Bearer INVALID"}
+        )
+        assert response.json()["code"] == "unauthorized.bad_access_token"
+        response = client.get(
+            "/ping/whoami", headers={"Authorization": "Bearer VALID_ACCESS_TOKEN"}
+        )
+        assert response.status_code == 200
+
+        response = client.post(
+            "/oauth2/token",
+            data={
+                "grant_type": "authorization_code",
+                "code": "TEST_CODE",
+                "client_id": emulator.client_id,
+            },
+        )
+        token = response.json()
+        response = client.get(
+            "/ping/whoami",
+            headers={"Authorization": f"Bearer {token['access_token']}"},
+        )
+        assert response.status_code == 200
+
+        data = {
+            "grant_type": "refresh_token",
+            "refresh_token": token["refresh_token"],
+            "client_id": emulator.client_id,
+        }
+        assert client.post("/oauth2/token", data=data).status_code == 200
+        # Refresh tokens can only be used once
+        assert client.post("/oauth2/token", data=data).status_code == 401
+
+
+def test_injected_errors(emulated_api: MonzoAPI, emulator: MonzoEmulator) -> None:
+    """Injected errors and throttling are returned and counted."""
+    emulator.faults = Faults(error_rate=1, error_status_codes=(503,))
+
+    with pytest.raises(MonzoAPIError, match="internal_service"):
+        emulated_api.accounts.list()
+
+    emulator.faults = Faults(throttle_rate=1, retry_after=7)
+
+    with pytest.raises(MonzoRateLimitExceeded) as e:
+        emulated_api.accounts.list()
+
+    assert e.value.retry_after == 7
+    assert emulator.requests[("GET", "/accounts", 503)] == 1
+    assert emulator.requests[("GET", "/accounts", 429)] == 1
+
+
+def test_rate_limit(emulator: MonzoEmulator) -> None:
+    """Requests over the rate limit are rejected, with a `Retry-After` header."""
+    emulator = MonzoEmulator(
+        emulator.ledger,
+        faults=Faults(rate_limit=0.5, rate_limit_burst=3),
+    )
+
+    with httpx.Client(
+        base_url=MonzoAPI.api_url,
+        transport=emulator.transport(),
+        headers={"Authorization": "Bearer TEST_ACCESS_TOKEN"},
+    ) as client:
+        responses = [client.get("/ping/whoami") for _ in range(5)]
+
+    assert [response.status_code for response in responses] == [
+        200,
+        200,
+        200,
+        429,
+        429,
+    ]
+    assert responses[-1].headers["Retry-After"] == "2"
+
+
+@pytest.mark.anyio()
+async def test_asgi(emulator: MonzoEmulator) -> None:
+    """Emulator can be used as an ASGI app, with injected latency."""
+    emulator.faults = Faults(latency=0.01, latency_jitter=0.01)
+
+    async with AsyncMonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.async_transport(),
+    ) as monzo_api:
+        accounts = await monzo_api.accounts.list()
+        balance = await monzo_api.balance.get(accounts[0].id)
+
+    assert len(accounts) == 2
+    assert balance.balance == emulator.ledger.balances[accounts[0].id]
+
+
+def test_make_server(emulator: MonzoEmulator) -> None:
+    """Emulator can be served over HTTP."""
+    server = emulator.make_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        host, port = server.server_address[:2]
+        response = httpx.get(
+            f"http://{host!s}:{port}/accounts",
+            headers={"Authorization": "Bearer TEST_ACCESS_TOKEN"},
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert len(response.json()["accounts"]) == 2
@@ -1,20 +1,30 @@
 """Test `pymonzo.transactions` module."""
 
-from datetime import datetime
+import io
+import json
+from datetime import datetime, timedelta, timezone
 
 import httpx
 import pytest
 import respx
 from polyfactory.factories.pydantic_factory import ModelFactory
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
-from pymonzo import MonzoAPI
+from pymonzo import AsyncMonzoAPI, MonzoAPI, formatting
+from pymonzo.exceptions import MonzoAPIError
+from pymonzo.parsing import TrustedRecord
+from pymonzo.retries import RetryPolicy
 from pymonzo.transactions import (
+    AsyncTransactionsResource,
     MonzoTransaction,
+    MonzoTransactionCategory,
     MonzoTransactionCounterparty,
     MonzoTransactionMerchant,
+    TransactionFrame,
     TransactionsResource,
 )
+from pymonzo.transactions import frame as frame_module
 
 from .test_accounts import MonzoAccountFactory
 
@@ -37,6 +47,14 @@ def transactions_resource(monzo_api: MonzoAPI) -> TransactionsResource:
     return TransactionsResource(client=monzo_api)
 
 
+@pytest.fixture()
+def async_transactions_resource(
+    async_monzo_api: AsyncMonzoAPI,
+) -> AsyncTransactionsResource:
+    """Initialize `AsyncTransactionsResource` resource with `async_monzo_api`."""
+    return AsyncTransactionsResource(client=async_monzo_api)
+
+
 class TestTransactionsResource:
     """Test `TransactionsResource` class."""
 
@@ -132,6 +150,7 @@ class TestTransactionsResource:
 
     def test_annotate_respx(
         self,
+        mocker: MockerFixture,
         respx_mock: respx.MockRouter,
         transactions_resource: TransactionsResource,
     ) -> None:
@@ -162,6 +181,36 @@ class TestTransactionsResource:
         assert transaction_response == transaction
         assert mocked_route.called
 
+        # Failed requests are only retried when asked to
+        mocked_sleep = mocker.patch("pymonzo.resources.time.sleep", autospec=True)
+        mocker.patch.object(
+            transactions_resource.client,
+            "retry_policy",
+            RetryPolicy(max_retries=2, jitter=False),
+        )
+        mocked_route.side_effect = [
+            httpx.Response(503),
+            httpx.Response(503),
+            httpx.Response(
+                200,
+                json={"transaction": transaction.model_dump(mode="json")},
+            ),
+        ]
+        mocked_route.reset()
+
+        with pytest.raises(MonzoAPIError):
+            transactions_resource.annotate(transaction.id, metadata)
+
+        assert mocked_route.call_count == 1
+
+        transaction_response = transactions_resource.annotate(
+            transaction.id, metadata, retry=True
+        )
+
+        assert transaction_response == transaction
+        assert mocked_route.call_count == 3
+        mocked_sleep.assert_called_once()
+
     def test_list_respx(
         self,
         mocker: MockerFixture,
@@ -240,3 +289,507 @@ class TestTransactionsResource:
             assert isinstance(item, MonzoTransaction)
         assert transactions_list_response == [transaction]
         assert mocked_route.called
+
+    def test_iter_all_respx(
+        self,
+        respx_mock: respx.MockRouter,
+        transactions_resource: TransactionsResource,
+    ) -> None:
+        """Pages are fetched with the last transaction ID as the `since` cursor."""
+        account_id = "TEST_ACCOUNT_ID"
+        start = datetime(2022, 1, 14, tzinfo=timezone.utc)
+        transactions = [
+            MonzoTransactionFactory.build(
+                id=f"tx_{i}",
+                merchant="TEST_MERCHANT",
+                created=start + timedelta(hours=i),
+            )
+            for i in range(5)
+        ]
+
+        first_page_route = respx_mock.get(
+            "/transactions",
+            params__eq={"account_id": account_id, "limit": "2"},
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        t.model_dump(mode="json") for t in transactions[0:2]
+                    ]
+                },
+            )
+        )
+        second_page_route = respx_mock.get(
+            "/transactions",
+            params__eq={"account_id": account_id, "limit": "2", "since": "tx_1"},
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        t.model_dump(mode="json") for t in transactions[2:4]
+                    ]
+                },
+            )
+        )
+        last_page_route = respx_mock.get(
+            "/transactions",
+            params__eq={"account_id": account_id, "limit": "2", "since": "tx_3"},
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        t.model_dump(mode="json") for t in transactions[4:]
+                    ]
+                },
+            )
+        )
+
+        transactions_iterator = transactions_resource.iter_all(account_id, limit=2)
+
+        # Nothing is fetched until the iterator is consumed
+        assert not first_page_route.called
+
+        assert list(transactions_iterator) == transactions
+        assert first_page_route.call_count == 1
+        assert second_page_route.call_count == 1
+        assert last_page_route.call_count == 1
+
+        # Iteration stops early when `before` is reached
+        respx_mock.reset()
+        before = start + timedelta(hours=1)
+
+        first_page_route = respx_mock.get(
+            "/transactions",
+            params={
+                "account_id": account_id,
+                "limit": "2",
+                "before": before.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            },
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        t.model_dump(mode="json") for t in transactions[0:2]
+                    ]
+                },
+            )
+        )
+
+        transactions_list = list(
+            transactions_resource.iter_all(account_id, before=before, limit=2)
+        )
+
+        assert transactions_list == transactions[0:1]
+        assert first_page_route.call_count == 1
+
+        # Iteration stops on an empty page
+        respx_mock.reset()
+        empty_page_route = respx_mock.get(
+            "/transactions",
+            params__eq={"account_id": account_id, "limit": "2"},
+        ).mock(return_value=httpx.Response(200, json={"transactions": []}))
+
+        assert list(transactions_resource.iter_all(account_id, limit=2)) == []
+        assert empty_page_route.call_count == 1
+
+    @pytest.mark.parametrize("limit", [0, -1, 101])
+    def test_iter_all_limit(
+        self,
+        transactions_resource: TransactionsResource,
+        limit: int,
+    ) -> None:
+        """Page limit needs to be within the API bounds."""
+        with pytest.raises(ValueError, match="between 1 and 100"):
+            list(transactions_resource.iter_all("TEST_ACCOUNT_ID", limit=limit))
+
+    def test_list_trusted_respx(
+        self,
+        respx_mock: respx.MockRouter,
+        transactions_resource: TransactionsResource,
+    ) -> None:
+        """Trusted API responses are parsed into records, without validation."""
+        transactions = [
+            MonzoTransactionFactory.build(id=f"tx_{i}", merchant="TEST_MERCHANT")
+            for i in range(3)
+        ]
+        account_id = "TEST_ACCOUNT_ID"
+
+        respx_mock.get("/transactions", params={"account_id": account_id}).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        {**t.model_dump(mode="json"), "amount": "1.5"}
+                        for t in transactions
+                    ]
+                },
+            )
+        )
+
+        records = transactions_resource.list(account_id, validate=False)
+
+        assert all(isinstance(record, TrustedRecord) for record in records)
+        assert [record.id for record in records] == ["tx_0", "tx_1", "tx_2"]
+        assert [record.amount for record in records] == ["1.5"] * 3
+        assert [record.created for record in records] == [
+            t.created for t in transactions
+        ]
+
+        records = list(
+            transactions_resource.iter_all(account_id, limit=5, validate=False)
+        )
+
+        assert [record.id for record in records] == ["tx_0", "tx_1", "tx_2"]
+
+    def test_list_validate_respx(
+        self,
+        respx_mock: respx.MockRouter,
+        transactions_resource: TransactionsResource,
+    ) -> None:
+        """Invalid API responses raise a validation error."""
+        transaction = MonzoTransactionFactory.build(merchant="TEST_MERCHANT")
+        transaction_json = {**transaction.model_dump(mode="json"), "amount": "1.5"}
+        account_id = "TEST_ACCOUNT_ID"
+
+        respx_mock.get("/transactions", params={"account_id": account_id}).mock(
+            return_value=httpx.Response(
+                200,
+                json={"transactions": [transaction_json]},
+            )
+        )
+
+        with pytest.raises(ValidationError):
+            transactions_resource.list(account_id)
+
+    def test_list_frame_respx(
+        self,
+        respx_mock: respx.MockRouter,
+        transactions_resource: TransactionsResource,
+    ) -> None:
+        """API response is loaded into a transaction frame."""
+        transactions = MonzoTransactionFactory.batch(3, merchant="TEST_MERCHANT")
+        account_id = "TEST_ACCOUNT_ID"
+
+        mocked_route = respx_mock.get(
+            "/transactions",
+            params__eq={"account_id": account_id, "limit": "3"},
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [t.model_dump(mode="json") for t in transactions]
+                },
+            )
+        )
+
+        frame = transactions_resource.list_frame(account_id, limit=3)
+
+        assert isinstance(frame, TransactionFrame)
+        assert list(frame) == transactions
+        assert mocked_route.called
+
+
+class TestAsyncTransactionsResource:
+    """Test `AsyncTransactionsResource` class."""
+
+    @pytest.mark.anyio()
+    async def test_list_respx(
+        self,
+        respx_mock: respx.MockRouter,
+        async_transactions_resource: AsyncTransactionsResource,
+    ) -> None:
+        """Correct API response is sent, API response is parsed into expected schema."""
+        transaction = MonzoTransactionFactory.build(merchant="TEST_MERCHANT")
+        transaction2 = MonzoTransactionFactory.build(merchant="TEST_MERCHANT")
+
+        account_id = "TEST_ACCOUNT_ID"
+        since = datetime(2022, 1, 14)
+
+        mocked_route = respx_mock.get(
+            "/transactions",
+            params={
+                "account_id": account_id,
+                "since": since.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            },
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        transaction.model_dump(mode="json"),
+                        transaction2.model_dump(mode="json"),
+                    ]
+                },
+            )
+        )
+
+        transactions_list_response = await async_transactions_resource.list(
+            account_id=account_id,
+            since=since,
+        )
+
+        assert transactions_list_response == [transaction, transaction2]
+        assert mocked_route.called
+
+    @pytest.mark.anyio()
+    async def test_list_frame_respx(
+        self,
+        respx_mock: respx.MockRouter,
+        async_transactions_resource: AsyncTransactionsResource,
+    ) -> None:
+        """API response is loaded into a transaction frame."""
+        transactions = MonzoTransactionFactory.batch(2, merchant="TEST_MERCHANT")
+        account_id = "TEST_ACCOUNT_ID"
+
+        mocked_route = respx_mock.get(
+            "/transactions", params__eq={"account_id": account_id}
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [t.model_dump(mode="json") for t in transactions]
+                },
+            )
+        )
+
+        frame = await async_transactions_resource.list_frame(account_id)
+
+        assert list(frame) == transactions
+        assert mocked_route.called
+
+    @pytest.mark.anyio()
+    async def test_iter_all_respx(
+        self,
+        respx_mock: respx.MockRouter,
+        async_transactions_resource: AsyncTransactionsResource,
+    ) -> None:
+        """Pages are fetched with the last transaction ID as the `since` cursor."""
+        account_id = "TEST_ACCOUNT_ID"
+        transactions = [
+            MonzoTransactionFactory.build(id=f"tx_{i}", merchant="TEST_MERCHANT")
+            for i in range(3)
+        ]
+
+        first_page_route = respx_mock.get(
+            "/transactions",
+            params__eq={"account_id": account_id, "limit": "2"},
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        t.model_dump(mode="json") for t in transactions[0:2]
+                    ]
+                },
+            )
+        )
+        last_page_route = respx_mock.get(
+            "/transactions",
+            params__eq={"account_id": account_id, "limit": "2", "since": "tx_1"},
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "transactions": [
+                        t.model_dump(mode="json") for t in transactions[2:]
+                    ]
+                },
+            )
+        )
+
+        transactions_list = [
+            transaction
+            async for transaction in async_transactions_resource.iter_all(
+                account_id,
+                limit=2,
+            )
+        ]
+
+        assert transactions_list == transactions
+        assert first_page_route.call_count == 1
+        assert last_page_route.call_count == 1
+
+    @pytest.mark.anyio()
+    @pytest.mark.parametrize("limit", [0, -1, 101])
+    async def test_iter_all_limit(
+        self,
+        async_transactions_resource: AsyncTransactionsResource,
+        limit: int,
+    ) -> None:
+        """Page limit needs to be within the API bounds."""
+        with pytest.raises(ValueError, match="between 1 and 100"):
+            async for _ in async_transactions_resource.iter_all(
+                "TEST_ACCOUNT_ID",
+                limit=limit,
+            ):
+                pass
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "stdlib"])
+def numpy_available(request: pytest.FixtureRequest, mocker: MockerFixture) -> bool:
+    """Run test both with and without the `numpy` fast path."""
+    if request.param and not frame_module.NUMPY_AVAILABLE:
+        pytest.skip("numpy isn't installed")
+
+    mocker.patch.object(frame_module, "NUMPY_AVAILABLE", request.param)
+
+    return request.param
+
+
+class TestTransactionFrame:
+    """Test `TransactionFrame` class."""
+
+    @pytest.fixture()
+    def transactions(self) -> list[MonzoTransaction]:
+        """Return a few transactions with known amounts, categories and dates."""
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return [
+            MonzoTransactionFactory.build(
+                id="tx_0",
+                amount=-500,
+                currency="GBP",
+                category=MonzoTransactionCategory.GROCERIES,
+                created=created,
+                settled=created + timedelta(days=1),
+                merchant="TEST_MERCHANT",
+            ),
+            MonzoTransactionFactory.build(
+                id="tx_1",
+                amount=-1500,
+                currency="GBP",
+                category=MonzoTransactionCategory.EATING_OUT,
+                created=created + timedelta(days=1),
+                settled=None,
+                merchant="TEST_MERCHANT",
+            ),
+            MonzoTransactionFactory.build(
+                id="tx_2",
+                amount=-250,
+                currency="EUR",
+                category=MonzoTransactionCategory.GROCERIES,
+                created=created + timedelta(days=2),
+                settled=created + timedelta(days=3),
+                merchant="TEST_MERCHANT",
+            ),
+        ]
+
+    def test_from_json(self, transactions: list[MonzoTransaction]) -> None:
+        """Frame is built straight from the API response and rows are recreated."""
+        content = json.dumps(
+            {"transactions": [t.model_dump(mode="json") for t in transactions]}
+        )
+
+        frame = TransactionFrame.from_json(content)
+
+        assert len(frame) == 3
+        assert list(frame.amount) == [-500, -1500, -250]
+        assert frame.id[1] == "tx_1"
+        assert frame.description[2] == transactions[2].description
+        assert frame.currency.values == ["GBP", "EUR"]
+        assert list(frame.currency.codes) == [0, 0, 1]
+        assert frame.settled[1] == frame_module.NULL_TIMESTAMP
+        assert frame[0] == transactions[0]
+        assert frame[-1] == transactions[-1]
+        assert list(frame) == transactions
+
+    def test_from_transactions(self, transactions: list[MonzoTransaction]) -> None:
+        """Frame is built from `MonzoTransaction` objects."""
+        frame = TransactionFrame.from_transactions(transactions)
+
+        assert list(frame) == transactions
+
+    def test_filter(
+        self,
+        numpy_available: bool,
+        transactions: list[MonzoTransaction],
+    ) -> None:
+        """Transactions are filtered by all passed conditions."""
+        frame = TransactionFrame.from_transactions(transactions)
+
+        filtered = frame.filter(category="groceries")
+        assert list(filtered) == [transactions[0], transactions[2]]
+
+        filtered = frame.filter(category="groceries", currency="GBP")
+        assert list(filtered) == [transactions[0]]
+
+        filtered = frame.filter(
+            since=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            before=datetime(2024, 1, 3),
+        )
+        assert list(filtered) == [transactions[1]]
+
+        filtered = frame.filter(min_amount=-1000, max_amount=-300)
+        assert list(filtered) == [transactions[0]]
+
+        assert list(frame.filter(settled=False)) == [transactions[1]]
+        assert len(frame.filter(settled=True)) == 2
+        assert len(frame.filter(category="transport")) == 0
+        assert len(frame.filter()) == 3
+
+    def test_take(
+        self,
+        numpy_available: bool,
+        transactions: list[MonzoTransaction],
+    ) -> None:
+        """Transactions are taken (in passed order) from every column."""
+        frame = TransactionFrame.from_transactions(transactions)
+
+        taken = frame.take([2, 0, 2])
+
+        assert [taken.id[i] for i in range(3)] == ["tx_2", "tx_0", "tx_2"]
+        assert list(taken.amount) == [-250, -500, -250]
+        assert list(taken) == [transactions[2], transactions[0], transactions[2]]
+        assert len(frame.take([])) == 0
+        assert list(frame.take([]).id.offsets) == [0]
+
+    def test_sum(
+        self,
+        numpy_available: bool,
+        transactions: list[MonzoTransaction],
+    ) -> None:
+        """Transaction amounts are summed, optionally grouped by a column."""
+        frame = TransactionFrame.from_transactions(transactions)
+
+        assert frame.sum() == -2250
+        assert frame.sum_by("category") == {"groceries": -750, "eating_out": -1500}
+        assert frame.sum_by("currency") == {"GBP": -2000, "EUR": -250}
+        assert frame.filter(currency="EUR").sum_by("currency") == {"EUR": -250}
+        assert TransactionFrame().sum() == 0
+        assert TransactionFrame().sum_by("category") == {}
+
+        with pytest.raises(ValueError, match="Can't group by 'description'"):
+            frame.sum_by("description")
+
+
+class TestMonzoTransaction:
+    """Test `MonzoTransaction` class."""
+
+    @pytest.mark.parametrize(
+        "babel_available", [True, False], ids=["babel", "fallback"]
+    )
+    @pytest.mark.parametrize("settled", [True, False], ids=["settled", "pending"])
+    def test_rich(
+        self, mocker: MockerFixture, babel_available: bool, settled: bool
+    ) -> None:
+        """Settled date is only rendered for settled transactions."""
+        rich_console = pytest.importorskip("rich.console")
+        if babel_available and not formatting.BABEL_AVAILABLE:
+            pytest.skip("babel isn't installed")
+
+        mocker.patch.object(formatting, "BABEL_AVAILABLE", babel_available)
+        created = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        transaction = MonzoTransactionFactory.build(
+            created=created,
+            settled=created + timedelta(days=1) if settled else None,
+        )
+
+        console = rich_console.Console(file=io.StringIO(), width=200)
+        console.print(transaction)
+        output = console.file.getvalue()
+
+        assert "Created:" in output
+        assert ("Settled:" in output) is settled
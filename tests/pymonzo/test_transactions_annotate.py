@@ -0,0 +1,132 @@
+"""Test `pymonzo.transactions.annotate` module."""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pymonzo import AsyncMonzoAPI, MonzoAPI
+from pymonzo.exceptions import MonzoAPIError
+from pymonzo.testing import Ledger, MonzoEmulator
+from pymonzo.transactions import MonzoTransaction
+from pymonzo.transactions.annotate import diff_metadata, plan_annotations
+
+
+@pytest.fixture()
+def emulator() -> MonzoEmulator:
+    """Return a `MonzoEmulator` instance."""
+    return MonzoEmulator(Ledger.generate(seed=1, transactions=20))
+
+
+@pytest.fixture()
+def transactions(emulator: MonzoEmulator) -> list[MonzoTransaction]:
+    """Return annotatable (one with existing metadata) emulator transactions."""
+    ledger = emulator.ledger
+    account_id = next(iter(ledger.accounts))
+    merchant_id = next(iter(ledger.merchants))
+
+    transactions = [
+        ledger.add_transaction(account_id, -i, merchant_id=merchant_id)
+        for i in range(1, 5)
+    ]
+    ledger.annotate_transaction(transactions[0]["id"], {"note": "lunch"})
+
+    return [
+        MonzoTransaction.model_validate(ledger.get_transaction(transaction["id"]))
+        for transaction in transactions
+    ]
+
+
+def test_diff_metadata() -> None:
+    """Only changed keys are returned, missing keys are treated as empty."""
+    current = {"note": "lunch", "tag": "food"}
+
+    assert diff_metadata(current, {"note": "lunch", "tag": "work"}) == {"tag": "work"}
+    assert diff_metadata(current, {"note": "", "other": ""}) == {"note": ""}
+    assert diff_metadata(current, {"note": "lunch"}) == {}
+
+
+def test_plan_annotations(transactions: list[MonzoTransaction]) -> None:
+    """Updates are merged per transaction and diffed against known metadata."""
+    first, second, *_ = transactions
+
+    patches, skipped = plan_annotations(
+        [
+            (first, {"note": "lunch"}),
+            (second, {"note": "dinner", "tag": "food"}),
+            (second, {"tag": "work"}),
+            ("tx_00009UNKNOWN", {"note": "lunch"}),
+        ]
+    )
+
+    assert patches == {
+        second.id: {"note": "dinner", "tag": "work"},
+        "tx_00009UNKNOWN": {"note": "lunch"},
+    }
+    assert skipped == [first.id]
+
+
+def test_annotate_many(
+    mocker: MockerFixture,
+    emulator: MonzoEmulator,
+    transactions: list[MonzoTransaction],
+) -> None:
+    """No-op patches are skipped, only changed keys are sent."""
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.transport(),
+    )
+    annotate_transaction = mocker.spy(emulator.ledger, "annotate_transaction")
+    first, second, third, _ = transactions
+
+    report = monzo_api.transactions.annotate_many(
+        [
+            (first, {"note": "lunch"}),
+            (second, {"note": "lunch"}),
+            (third.id, {"note": "dinner"}),
+            ("tx_00009UNKNOWN", {"note": "lunch"}),
+        ],
+        max_concurrency=2,
+        rate_limit=100,
+    )
+
+    assert report.ok is False
+    assert report.skipped == [first.id]
+    assert sorted(report.annotated) == sorted([second.id, third.id])
+    assert report.annotated[second.id].metadata == {"note": "lunch"}
+    assert list(report.errors) == ["tx_00009UNKNOWN"]
+    assert isinstance(report.errors["tx_00009UNKNOWN"], MonzoAPIError)
+    assert dict(call.args for call in annotate_transaction.call_args_list) == {
+        second.id: {"note": "lunch"},
+        third.id: {"note": "dinner"},
+        "tx_00009UNKNOWN": {"note": "lunch"},
+    }
+
+    # Everything is already annotated
+    annotated = [(report.annotated[second.id], {"note": "lunch"})]
+    assert monzo_api.transactions.annotate_many(annotated).skipped == [second.id]
+    assert annotate_transaction.call_count == 3
+
+
+@pytest.mark.anyio()
+async def test_async_annotate_many(
+    emulator: MonzoEmulator,
+    transactions: list[MonzoTransaction],
+) -> None:
+    """No-op patches are skipped, other transactions are annotated concurrently."""
+    first, *others = transactions
+
+    async with AsyncMonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.async_transport(),
+    ) as monzo_api:
+        report = await monzo_api.transactions.annotate_many(
+            [(transaction, {"note": "lunch", "tag": "food"}) for transaction in others]
+            + [(first, {"note": "lunch"})],
+            rate_limit=100,
+        )
+
+    assert report.ok is True
+    assert report.skipped == [first.id]
+    assert {
+        transaction_id: transaction.metadata
+        for transaction_id, transaction in report.annotated.items()
+    } == {transaction.id: {"note": "lunch", "tag": "food"} for transaction in others}
@@ -1,12 +1,18 @@
 """Test `pymonzo.utils` module."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pytest
 from freezegun import freeze_time
 
-from pymonzo.utils import empty_dict_to_none, empty_str_to_none, n_days_ago
+from pymonzo.utils import (
+    as_utc,
+    empty_dict_to_none,
+    empty_str_to_none,
+    n_days_ago,
+    utc_now,
+)
 
 
 @pytest.mark.parametrize(
@@ -23,6 +29,34 @@ def test_n_days_ago(today: datetime, n: int, output: datetime) -> None:
         assert n_days_ago(n) == output
 
 
+def test_utc_now() -> None:
+    """Should return current, timezone aware UTC time."""
+    with freeze_time(datetime(2024, 1, 14, 12, 30)):
+        assert utc_now() == datetime(2024, 1, 14, 12, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("dt", "output"),
+    [
+        (datetime(2024, 1, 14, 12, 30), datetime(2024, 1, 14, 12, 30)),
+        (
+            datetime(2024, 1, 14, 12, 30, tzinfo=timezone.utc),
+            datetime(2024, 1, 14, 12, 30),
+        ),
+        (
+            datetime(2024, 1, 14, 14, 30, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2024, 1, 14, 12, 30),
+        ),
+    ],
+)
+def test_as_utc(dt: datetime, output: datetime) -> None:
+    """Should convert datetime to UTC, treating naive datetimes as UTC."""
+    converted = as_utc(dt)
+
+    assert converted.tzinfo is timezone.utc
+    assert converted.replace(tzinfo=None) == output
+
+
 @pytest.mark.parametrize(
     ("value", "output"),
     [
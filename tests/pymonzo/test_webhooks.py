@@ -6,8 +6,10 @@ import respx
 from polyfactory.factories.pydantic_factory import ModelFactory
 from pytest_mock import MockerFixture
 
-from pymonzo import MonzoAPI
-from pymonzo.webhooks import MonzoWebhook, WebhooksResource
+from pymonzo import AsyncMonzoAPI, MonzoAPI
+from pymonzo.testing import Ledger, MonzoEmulator
+from pymonzo.webhooks import MonzoWebhook, WebhookChange, WebhooksResource
+from pymonzo.webhooks.sync import diff_webhooks
 
 from .test_accounts import MonzoAccountFactory
 
@@ -171,3 +173,107 @@ class TestWebhooksResource:
 
         assert webhooks_delete_response == {}
         assert mocked_route.called
+
+
+def test_diff_webhooks() -> None:
+    """Missing URLs are registered first, undesired and duplicated ones deleted."""
+    webhooks = [
+        MonzoWebhook(id="webhook_1", account_id="acc_1", url="https://a"),
+        MonzoWebhook(id="webhook_2", account_id="acc_1", url="https://b"),
+        MonzoWebhook(id="webhook_3", account_id="acc_1", url="https://a"),
+    ]
+
+    changes, unchanged = diff_webhooks("acc_1", {"https://a", "https://c"}, webhooks)
+
+    assert unchanged == [webhooks[0]]
+    assert changes == [
+        WebhookChange("register", "acc_1", "https://c"),
+        WebhookChange("delete", "acc_1", "https://b", "webhook_2"),
+        WebhookChange("delete", "acc_1", "https://a", "webhook_3"),
+    ]
+
+
+def test_sync() -> None:
+    """Only needed changes are applied, errors are reported per account."""
+    ledger = Ledger.generate(seed=1, accounts=3, transactions=0)
+    emulator = MonzoEmulator(ledger)
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.transport(),
+    )
+    account_ids = list(ledger.accounts)
+    kept = ledger.register_webhook(account_ids[0], "https://a")
+    ledger.register_webhook(account_ids[1], "https://old")
+    desired = {
+        account_ids[0]: {"https://a"},
+        account_ids[1]: {"https://a", "https://b"},
+        account_ids[2]: set(),
+        "acc_00009NOPE": {"https://a"},
+    }
+
+    plan = monzo_api.webhooks.sync(desired, dry_run=True)
+
+    assert len(plan.planned) == 3
+    assert plan.applied == []
+    assert len(ledger.webhooks) == 2
+
+    report = monzo_api.webhooks.sync(desired, max_concurrency=2)
+
+    assert [webhook.id for webhook in report.unchanged] == [kept["id"]]
+    assert report.planned == plan.planned
+    assert [(change.action, change.url) for change in report.applied] == [
+        ("register", "https://a"),
+        ("register", "https://b"),
+        ("delete", "https://old"),
+    ]
+    assert all(change.webhook_id for change in report.applied)
+    assert list(report.account_errors) == ["acc_00009NOPE"]
+    assert report.errors == {}
+    assert report.ok is False
+
+    assert sorted(
+        (webhook["account_id"], webhook["url"]) for webhook in ledger.webhooks.values()
+    ) == sorted(
+        (account_id, url)
+        for account_id, urls in desired.items()
+        if account_id in ledger.accounts
+        for url in urls
+    )
+
+    del desired["acc_00009NOPE"]
+    report = monzo_api.webhooks.sync(desired)
+
+    assert report.planned == []
+    assert report.ok is True
+
+
+@pytest.mark.anyio()
+async def test_async_sync() -> None:
+    """Only needed changes are applied, errors are reported per change."""
+    ledger = Ledger.generate(seed=1, accounts=2, transactions=0)
+    emulator = MonzoEmulator(ledger)
+    account_ids = list(ledger.accounts)
+    ledger.register_webhook(account_ids[0], "https://old")
+
+    async with AsyncMonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.async_transport(),
+    ) as monzo_api:
+        # Simulate a webhook deleted in the meantime
+        original_list = ledger.list_webhooks
+
+        def list_webhooks(account_id: str) -> list[dict]:
+            webhooks = original_list(account_id)
+            if account_id == account_ids[0]:
+                ledger.webhooks.clear()
+            return webhooks
+
+        ledger.list_webhooks = list_webhooks  # type: ignore[method-assign]
+
+        report = await monzo_api.webhooks.sync(
+            {account_ids[0]: {"https://a"}, account_ids[1]: {"https://a"}},
+        )
+
+    assert len(report.applied) == 2
+    assert [change.action for change in report.errors] == ["delete"]
+    assert report.account_errors == {}
@@ -0,0 +1,160 @@
+"""Test `pymonzo.webhooks.bridge` module."""
+
+import threading
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pymonzo import MonzoAPI
+from pymonzo.cache import ResponseCache
+from pymonzo.store import TransactionStore
+from pymonzo.testing import Ledger, MonzoEmulator
+from pymonzo.webhooks import MonzoWebhookEvent, WebhookStoreBridge
+from pymonzo.webhooks.bridge import event_to_transaction
+
+
+@pytest.fixture()
+def emulator() -> MonzoEmulator:
+    """Return a `MonzoEmulator` instance."""
+    return MonzoEmulator(Ledger.generate(seed=1, transactions=500))
+
+
+@pytest.fixture()
+def store(emulator: MonzoEmulator) -> Iterator[TransactionStore]:
+    """Return an in-memory `TransactionStore` talking to the emulator."""
+    monzo_api = MonzoAPI(
+        access_token="TEST_ACCESS_TOKEN",  # noqa: S106
+        transport=emulator.transport(),
+        cache=ResponseCache({"balance": 60}),
+    )
+    with TransactionStore(monzo_api, ":memory:") as store:
+        yield store
+
+
+def count_requests(emulator: MonzoEmulator, endpoint: str) -> int:
+    """Return number of emulator requests to passed endpoint."""
+    return sum(
+        count for (_, path, _), count in emulator.requests.items() if path == endpoint
+    )
+
+
+def test_handle(emulator: MonzoEmulator, store: TransactionStore) -> None:
+    """Webhook events are upserted and cached account balance is invalidated."""
+    ledger = emulator.ledger
+    account_id = next(iter(ledger.accounts))
+    merchant_id = next(iter(ledger.merchants))
+    bridge = WebhookStoreBridge(store)
+
+    balance = store.client.balance.get(account_id)
+    transaction = ledger.add_transaction(account_id, -250, merchant_id=merchant_id)
+    event = MonzoWebhookEvent.model_validate(ledger.webhook_event(transaction["id"]))
+
+    stored = bridge.handle(event)
+
+    assert stored == event_to_transaction(event)
+    assert store.get(transaction["id"]) == stored
+    assert stored.settled is None
+    assert store.client.balance.get(account_id).balance == balance.balance - 250
+    assert count_requests(emulator, "/balance") == 2
+
+
+def test_reconcile(emulator: MonzoEmulator, store: TransactionStore) -> None:
+    """Coverage gaps, recent and still pending transactions are fetched."""
+    ledger = emulator.ledger
+    account_id = next(iter(ledger.accounts))
+    merchant_id = next(iter(ledger.merchants))
+    now = datetime.now(timezone.utc)
+    bridge = WebhookStoreBridge(
+        store,
+        lookback=timedelta(days=30),
+        resweep=timedelta(hours=1),
+    )
+
+    result = bridge.reconcile(now)
+
+    assert result.windows == {
+        account_id: [(now - timedelta(days=30), now - timedelta(minutes=5))]
+    }
+    assert result.errors == {}
+    assert result.transactions == store.count(account_id) > 0
+
+    # Nothing is assumed to be delivered by webhooks
+    result = bridge.reconcile(now + timedelta(hours=2))
+
+    assert result.windows == {
+        account_id: [(now - timedelta(minutes=5), now + timedelta(minutes=115))]
+    }
+
+    # Recent transactions are fetched again, even if they're covered
+    result = bridge.reconcile(now + timedelta(minutes=150))
+
+    assert result.windows == {
+        account_id: [(now + timedelta(minutes=90), now + timedelta(minutes=145))]
+    }
+
+    # Delivered transaction is updated later, and another delivery failed
+    pending = ledger.add_transaction(
+        account_id,
+        -100,
+        merchant_id=merchant_id,
+        created=now + timedelta(minutes=150),
+    )
+    bridge.handle(MonzoWebhookEvent.model_validate(ledger.webhook_event(pending["id"])))
+    ledger.annotate_transaction(pending["id"], {"note": "lunch"})
+    dropped = ledger.add_transaction(
+        account_id,
+        -200,
+        merchant_id=merchant_id,
+        created=now + timedelta(minutes=160),
+    )
+
+    result = bridge.reconcile(now + timedelta(hours=4))
+
+    assert result.windows == {
+        account_id: [(now + timedelta(minutes=145), now + timedelta(minutes=235))]
+    }
+    assert result.transactions == 2
+    assert store.get(dropped["id"]) is not None
+    stored = store.get(pending["id"])
+    assert stored is not None
+    assert stored.metadata == {"note": "lunch"}
+
+    # Still pending transactions are fetched again, until they're settled
+    result = bridge.reconcile(now + timedelta(hours=6))
+
+    assert result.windows == {
+        account_id: [(stored.created, now + timedelta(minutes=355))]
+    }
+    assert [tx.id for tx in store.list(account_id)] == [
+        tx.id
+        for tx in store.client.transactions.list(
+            account_id,
+            since=now - timedelta(days=30),
+            before=now + timedelta(minutes=355),
+        )
+    ]
+
+
+def test_start(store: TransactionStore) -> None:
+    """Reconciliation sweeps can be run in a background thread."""
+    errors: list[Exception] = []
+    failed = threading.Event()
+
+    def on_error(e: Exception) -> None:
+        errors.append(e)
+        failed.set()
+
+    bridge = WebhookStoreBridge(
+        store,
+        account_ids=["acc_00009NOPE"],
+        interval=0.01,
+        on_error=on_error,
+    )
+
+    with bridge.start():
+        assert bridge.running is True
+        assert failed.wait(5)
+
+    assert bridge.running is False
+    assert "not found" in str(errors[0])
@@ -0,0 +1,104 @@
+"""Test `pymonzo.webhooks.log` and `pymonzo.webhooks.dedupe` modules."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pymonzo.testing import Ledger
+from pymonzo.webhooks import WebhookEventLog
+from pymonzo.webhooks.dedupe import BloomFilter, SeenSet, get_digest
+from pymonzo.webhooks.log import SegmentLog
+
+
+@pytest.fixture(scope="module")
+def payloads() -> list[bytes]:
+    """Return a list of `transaction.created` webhook event payloads."""
+    ledger = Ledger.generate(seed=1, transactions=0)
+    account_id = next(iter(ledger.accounts))
+    merchant_id = next(iter(ledger.merchants))
+
+    payloads = []
+    for i in range(10):
+        transaction = ledger.add_transaction(account_id, -i, merchant_id=merchant_id)
+        payloads.append(json.dumps(ledger.webhook_event(transaction["id"])).encode())
+
+    return payloads
+
+
+def test_bloom_filter() -> None:
+    """Added digests are always found, other ones rarely."""
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [get_digest(f"tx_{i}") for i in range(1000)]
+    for digest in added:
+        bloom_filter.add(digest)
+
+    false_positives = sum(
+        get_digest(f"other_{i}") in bloom_filter for i in range(10_000)
+    )
+
+    assert all(digest in bloom_filter for digest in added)
+    assert false_positives < 300
+
+    with pytest.raises(ValueError, match="error rate"):
+        BloomFilter(error_rate=1)
+
+
+def test_seen_set(tmp_path: Path) -> None:
+    """Seen keys are persisted on disk and loaded into the bloom filter."""
+    path = tmp_path / "seen"
+
+    with SeenSet(path, capacity=100) as seen:
+        assert seen.add("tx_1") is True
+        assert seen.add("tx_2") is True
+        assert seen.add("tx_1") is False
+        assert "tx_1" in seen
+        assert "tx_3" not in seen
+
+    # Simulate a partially written digest
+    with open(path, "ab") as f:
+        f.write(b"\x00\x01")
+
+    with SeenSet(path, capacity=100) as seen:
+        assert len(seen) == 2
+        assert "tx_2" in seen
+        assert seen.add("tx_3") is True
+
+    assert path.stat().st_size == 3 * 8
+
+
+def test_segment_log(tmp_path: Path) -> None:
+    """Records are appended to rolling segments and can be replayed."""
+    with SegmentLog(tmp_path, segment_size=50) as log:
+        offsets = [log.append(f"record {i}".encode()) for i in range(10)]
+
+        assert offsets == list(range(10))
+        assert len(log.segments) == 3
+        assert [offset for offset, _ in log.replay(7)] == [7, 8, 9]
+
+    # Simulate a partially written record
+    with open(log.segments[-1], "ab") as f:
+        f.write(b"\x00\x00\x00\x09\x00")
+
+    with SegmentLog(tmp_path, segment_size=50) as log:
+        assert log.next_offset == 10
+        assert log.append(b"record 10") == 10
+        assert list(log.replay(9)) == [(9, b"record 9"), (10, b"record 10")]
+
+
+def test_webhook_event_log(tmp_path: Path, payloads: list[bytes]) -> None:
+    """Duplicated events aren't logged, logged events can be replayed."""
+    with WebhookEventLog(tmp_path) as event_log:
+        offsets = [event_log.append(payload) for payload in payloads]
+        assert offsets == list(range(10))
+        assert event_log.append(payloads[3]) is None
+        assert event_log.duplicates == 1
+
+        event_log.save_checkpoint(8)
+
+    with WebhookEventLog(tmp_path) as event_log:
+        assert event_log.append(payloads[0]) is None
+        assert event_log.checkpoint == 8
+        assert [(offset, event.data.id) for offset, event in event_log.replay()] == [
+            (offset, json.loads(payloads[offset])["data"]["id"]) for offset in (8, 9)
+        ]
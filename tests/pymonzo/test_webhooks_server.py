@@ -0,0 +1,244 @@
+"""Test `pymonzo.webhooks.server` module."""
+
+import asyncio
+import json
+import threading
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from pymonzo.testing import Ledger
+from pymonzo.webhooks import MonzoWebhookEvent, WebhookEventLog, WebhookReceiver
+from pymonzo.webhooks.server import MAX_BODY_SIZE
+
+
+@pytest.fixture(scope="module")
+def payloads() -> list[bytes]:
+    """Return a list of `transaction.created` webhook event payloads."""
+    ledger = Ledger.generate(seed=1, transactions=0)
+    account_id = next(iter(ledger.accounts))
+    merchant_id = next(iter(ledger.merchants))
+
+    payloads = []
+    for i in range(20):
+        transaction = ledger.add_transaction(account_id, -i, merchant_id=merchant_id)
+        event = ledger.webhook_event(transaction["id"])
+        payloads.append(json.dumps(event).encode())
+
+    return payloads
+
+
+def client(receiver: WebhookReceiver) -> httpx.AsyncClient:
+    """Return an HTTP client talking to the webhook receiver."""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=receiver),
+        base_url="http://testserver",
+    )
+
+
+@pytest.mark.anyio()
+async def test_receive(payloads: list[bytes]) -> None:
+    """Events are acknowledged, validated and handled by the workers."""
+    events: list[MonzoWebhookEvent] = []
+
+    async def handler(event: MonzoWebhookEvent) -> None:
+        await asyncio.sleep(0)
+        events.append(event)
+
+    receiver = WebhookReceiver(handler, workers=3)
+    async with receiver, client(receiver) as http_client:
+        responses = await asyncio.gather(
+            *(http_client.post("/", content=payload) for payload in payloads)
+        )
+        assert [r.status_code for r in responses] == [200] * len(payloads)
+        assert receiver.running is True
+
+        await receiver.join()
+
+        stats = (await http_client.get("/")).json()
+
+    assert receiver.running is False
+    assert sorted(event.data.id for event in events) == sorted(
+        MonzoWebhookEvent.model_validate_json(payload).data.id for payload in payloads
+    )
+    assert stats["received"] == stats["accepted"] == stats["processed"] == 20
+    assert stats["queue_size"] == 0
+    assert stats["queue_high_water_mark"] >= 1
+
+
+@pytest.mark.anyio()
+async def test_invalid_requests(payloads: list[bytes]) -> None:
+    """Invalid, too large and ignored events aren't queued."""
+    receiver = WebhookReceiver(lambda event: None)
+
+    async with receiver, client(receiver) as http_client:
+        response = await http_client.post("/", content=b'{"type": "foo"}')
+        assert response.status_code == 400
+        assert response.json()["error"] == "Invalid webhook event"
+
+        # Malformed bodies aren't echoed back
+        for body in (b"not json", b'{"type": "\xff\xfe'):
+            response = await http_client.post("/", content=body)
+            assert response.status_code == 400
+            assert all("input" not in error for error in response.json()["detail"])
+
+        response = await http_client.post("/", content=b"x" * (MAX_BODY_SIZE + 1))
+        assert response.status_code == 413
+
+        ignored = json.loads(payloads[0])
+        ignored["type"] = "transaction.updated"
+        response = await http_client.post("/", json=ignored)
+        assert response.status_code == 200
+
+        response = await http_client.put("/", content=payloads[0])
+        assert response.status_code == 405
+
+    stats = receiver.stats
+    assert stats.received == 5
+    assert stats.invalid == 4
+    assert stats.ignored == 1
+    assert stats.accepted == 0
+
+
+@pytest.mark.anyio()
+async def test_backpressure(payloads: list[bytes]) -> None:
+    """Events are rejected with HTTP 503 when the queue is full."""
+    release = threading.Event()
+    errors = []
+
+    def handler(event: MonzoWebhookEvent) -> None:
+        release.wait(5)
+        raise ValueError(event.data.id)
+
+    receiver = WebhookReceiver(
+        handler,
+        workers=1,
+        max_queue_size=2,
+        on_error=lambda event, e: errors.append(e),
+    )
+    async with client(receiver) as http_client:
+        statuses = []
+        for payload in payloads[:5]:
+            response = await http_client.post("/", content=payload)
+            statuses.append(response.status_code)
+            await asyncio.sleep(0.01)
+
+        assert statuses == [200, 200, 200, 503, 503]
+        assert response.headers["retry-after"] == "1"
+
+        release.set()
+        await receiver.stop()
+
+    stats = receiver.stats
+    assert stats.accepted == 3
+    assert stats.rejected == 2
+    assert stats.failed == 3
+    assert stats.queue_high_water_mark == 2
+    assert len(errors) == 3
+
+
+@pytest.mark.anyio()
+async def test_event_log(payloads: list[bytes], tmp_path: Path) -> None:
+    """Duplicated events are acknowledged but not handled, and can be replayed."""
+    handled: list[str] = []
+
+    def handler(event: MonzoWebhookEvent) -> None:
+        if event.data.amount == -3:
+            raise RuntimeError("Crash")
+        handled.append(event.data.id)
+
+    with WebhookEventLog(tmp_path) as event_log:
+        receiver = WebhookReceiver(
+            handler,
+            workers=1,
+            event_log=event_log,
+            checkpoint_interval=1,
+        )
+        async with receiver, client(receiver) as http_client:
+            for payload in [*payloads[:5], payloads[1], payloads[4]]:
+                response = await http_client.post("/", content=payload)
+                assert response.status_code == 200
+
+            await receiver.join()
+
+        stats = receiver.stats
+        assert stats.accepted == 5
+        assert stats.duplicates == 2
+        assert len(handled) == 4
+        # Handled (including failed) events advance the checkpoint
+        assert event_log.checkpoint == 5
+
+    handled.clear()
+    with WebhookEventLog(tmp_path) as event_log:
+        receiver = WebhookReceiver(handler, event_log=event_log)
+        async with receiver:
+            assert await receiver.replay(2) == 3
+            await receiver.join()
+
+        assert len(handled) == 2
+        assert event_log.checkpoint == 5
+
+    with pytest.raises(ValueError, match="event log"):
+        await WebhookReceiver(handler).replay()
+
+
+@pytest.mark.anyio()
+async def test_event_log_restart(payloads: list[bytes], tmp_path: Path) -> None:
+    """Events handled before the backlog is replayed don't skip the backlog."""
+    handled: list[str] = []
+
+    def handler(event: MonzoWebhookEvent) -> None:
+        handled.append(event.data.id)
+
+    # Crash after logging the events, but before handling them
+    with WebhookEventLog(tmp_path) as event_log:
+        for payload in payloads[:3]:
+            event_log.append(payload)
+
+    # Restart, new events arrive before the backlog is replayed
+    with WebhookEventLog(tmp_path) as event_log:
+        receiver = WebhookReceiver(handler, event_log=event_log, checkpoint_interval=1)
+        async with receiver, client(receiver) as http_client:
+            for payload in payloads[3:5]:
+                response = await http_client.post("/", content=payload)
+                assert response.status_code == 200
+
+            await receiver.join()
+
+        assert len(handled) == 2
+        assert event_log.checkpoint == 0
+
+    # Restart again, the backlog is still replayed
+    handled.clear()
+    with WebhookEventLog(tmp_path) as event_log:
+        receiver = WebhookReceiver(handler, event_log=event_log)
+        async with receiver:
+            assert await receiver.replay() == 5
+            await receiver.join()
+
+        assert len(handled) == 5
+        assert event_log.checkpoint == 5
+
+
+@pytest.mark.anyio()
+async def test_lifespan() -> None:
+    """Workers are started and stopped with ASGI lifespan events."""
+    receiver = WebhookReceiver(lambda event: None, workers=2)
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent = []
+
+    async def receive() -> MutableMapping[str, Any]:
+        return next(messages)
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        sent.append((message["type"], receiver.running))
+
+    await receiver({"type": "lifespan"}, receive, send)
+
+    assert sent == [
+        ("lifespan.startup.complete", True),
+        ("lifespan.shutdown.complete", False),
+    ]